@@ -5,10 +5,11 @@ This module provides a Container class for interacting with Docker containers,
 including performing operations like starting, stopping, exec, etc.
 """
 
+import logging
 from typing import Dict, List, Optional, Any
-from python_on_whales import DockerClient
 
-from src.common.logging import log_call, debug, info, error
+from src.common.logging import log_call, logger, debug, info, error, format_result
+from src.common.tracing import span
 
 
 class Container:
@@ -21,6 +22,10 @@ class Container:
         Args:
             name: Name of the container
         """
+        # python_on_whales (and pydantic with it) is slow to import, so it
+        # is only loaded once a container is actually used
+        from python_on_whales import DockerClient
+
         self.name = name
         self.docker = DockerClient()
 
@@ -141,16 +146,19 @@ class Container:
         """
         try:
             # Add user option if provided
-            exec_result = self.docker.container.execute(
-                self.name,
-                command=cmd,
-                workdir=workdir,
-                tty=False,
-                interactive=False,
-                user=user,
-                envs=envs or {}
-            )
-            debug(f"📤 Output from container.exec: {exec_result!r}")
+            with span(f"docker exec {self.name} {cmd[0]}", "docker"):
+                exec_result = self.docker.container.execute(
+                    self.name,
+                    command=cmd,
+                    workdir=workdir,
+                    tty=False,
+                    interactive=False,
+                    user=user,
+                    envs=envs or {}
+                )
+            # The output can be large, so it is only formatted when it is logged
+            if logger.isEnabledFor(logging.DEBUG):
+                debug(f"📤 Output from container.exec: {format_result(exec_result)}")
 
             return exec_result
         except Exception as e:
@@ -188,7 +196,8 @@ class Container:
         """
         try:
             container = self.docker.container.inspect(self.name)
-            debug(f"📋 Container {self.name} info: {container}")
+            if logger.isEnabledFor(logging.DEBUG):
+                debug(f"📋 Container {self.name} info: {format_result(container)}")
             return container
         except Exception as e:
             error(f"❌ Error inspecting container {self.name}: {e}")
@@ -0,0 +1,120 @@
+"""
+Incremental ownership and permission fixing inside containers.
+
+``chown -R`` rewrites every inode it visits, so on a large uploads tree it
+takes minutes and bumps the ctime of every file, which also defeats tools
+that rely on ctime/mtime to find changed files. The fixer here walks the
+tree once with ``find``, only touches entries whose owner, group or mode
+is wrong, and processes the top-level subtrees in parallel. The script is
+plain POSIX sh, so it also works in BusyBox-based containers.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.common.logging import log_call, debug, info, error
+from src.common.containers.container import Container
+
+# Top-level subtrees processed at the same time
+DEFAULT_PARALLEL = 4
+
+FIX_SCRIPT = r'''
+root="$1"; user="$2"; group="$3"; dmode="$4"; fmode="$5"; jobs="$6"
+fix() {
+    o=$(find "$1" $2 \( ! -user "$user" -o ! -group "$group" \) -print -exec chown -h "$user:$group" {} + | wc -l)
+    d=0; f=0
+    if [ -n "$dmode" ]; then
+        d=$(find "$1" $2 -type d ! -perm "$dmode" -print -exec chmod "$dmode" {} + | wc -l)
+    fi
+    if [ -n "$fmode" ]; then
+        f=$(find "$1" $2 -type f ! -perm "$fmode" -print -exec chmod "$fmode" {} + | wc -l)
+    fi
+    echo "$o $d $f"
+}
+[ -e "$root" ] || { echo "missing: $root" >&2; exit 1; }
+fix "$root" "-maxdepth 0"
+[ -d "$root" ] || exit 0
+n=0
+for entry in "$root"/* "$root"/.[!.]* "$root"/..?*; do
+    [ -e "$entry" ] || [ -L "$entry" ] || continue
+    fix "$entry" "" &
+    n=$((n + 1))
+    if [ "$n" -ge "$jobs" ]; then wait; n=0; fi
+done
+wait
+'''
+
+
+@dataclass
+class OwnershipResult:
+    """Entries changed by an ownership fix."""
+
+    path: str
+    owner_changed: int = 0
+    mode_changed: int = 0
+
+    @property
+    def changed(self) -> int:
+        return self.owner_changed + self.mode_changed
+
+
+def parse_fix_output(path: str, output: str) -> OwnershipResult:
+    """
+    Sum the per-subtree counts printed by FIX_SCRIPT.
+
+    Args:
+        path: Path that was fixed
+        output: Output of FIX_SCRIPT
+
+    Returns:
+        OwnershipResult: Number of entries changed
+    """
+    result = OwnershipResult(path=path)
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3 or not all(p.isdigit() for p in parts):
+            continue
+        result.owner_changed += int(parts[0])
+        result.mode_changed += int(parts[1]) + int(parts[2])
+    return result
+
+
+@log_call
+def fix_ownership(container_name: str, path: str, user: str = "www-data",
+                  group: Optional[str] = None, dir_mode: Optional[str] = None,
+                  file_mode: Optional[str] = None,
+                  parallel: int = DEFAULT_PARALLEL) -> Optional[OwnershipResult]:
+    """
+    Give a path inside a container the expected owner and modes, recursively.
+
+    Entries that already have them are not touched.
+
+    Args:
+        container_name: Name of the container
+        path: Path inside the container
+        user: Owner user
+        group: Owner group (defaults to the user)
+        dir_mode: Octal mode for directories (e.g. "755"), or None to keep modes
+        file_mode: Octal mode for regular files (e.g. "644"), or None to keep modes
+        parallel: Top-level subtrees processed at the same time
+
+    Returns:
+        Optional[OwnershipResult]: Entries changed, or None if the fix failed
+    """
+    container = Container(name=container_name)
+    output = container.exec(
+        ["sh", "-c", FIX_SCRIPT, "fix_ownership", path.rstrip("/") or "/", user,
+         group or user, dir_mode or "", file_mode or "", str(max(1, parallel))],
+        user="root",
+    )
+    if output is None:
+        error(f"❌ Could not fix ownership of {path} in container {container_name}")
+        return None
+
+    result = parse_fix_output(path, output)
+    if result.changed:
+        info(f"🔐 Fixed {result.owner_changed} owner(s) and {result.mode_changed} mode(s) "
+             f"under {path} in {container_name}")
+    else:
+        debug(f"Ownership of {path} in {container_name} already correct")
+    return result
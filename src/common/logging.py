@@ -4,7 +4,7 @@ Logging utilities for consistent log formatting and management.
 This module provides standardized logging functionality including:
 - Colored and formatted logging
 - Convenience functions for different log levels
-- Function call logging decorator
+- Function call logging decorator, with optional tracing spans
 - Module-specific logging via the Debug class
 - Uncaught exception handling
 """
@@ -13,10 +13,11 @@ import os
 import sys
 import logging
 import functools
-import inspect
+import reprlib
 from typing import Any, Callable, List, Optional, TypeVar, Union, cast
 
 from src.common.utils.environment import env_required, env
+from src.common.tracing import tracer
 
 # Required environment variables
 env_required(["DEBUG_MODE"])
@@ -122,11 +123,31 @@ def success(msg: str) -> None:
 # Type variables for decorator
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Return values logged by log_call are cut down to this size
+_result_repr = reprlib.Repr()
+_result_repr.maxlevel = 3
+_result_repr.maxdict = 10
+_result_repr.maxlist = 10
+_result_repr.maxstring = 200
+_result_repr.maxother = 200
+
+
+def format_result(result: Any) -> str:
+    """Format a return value for the log, truncating large containers."""
+    try:
+        return _result_repr.repr(result)
+    except Exception:
+        return f"<{type(result).__name__}>"
+
 
 def log_call(_func: Optional[F] = None, *, log_vars: Optional[List[str]] = None) -> Union[F, Callable[[F], F]]:
     """
     Decorator to automatically log function calls.
 
+    When neither DEBUG logging nor tracing is enabled the call goes straight
+    to the function: no frame is inspected and nothing is formatted. With
+    tracing enabled the call is also recorded as a span (see src.common.tracing).
+
     Args:
         _func: The function to decorate (used internally)
         log_vars: List of result dictionary keys to log
@@ -135,25 +156,36 @@ def log_call(_func: Optional[F] = None, *, log_vars: Optional[List[str]] = None)
         Decorated function
     """
     def decorator(func: F) -> F:
+        span_name = f"{func.__module__}.{func.__qualname__}"
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            frame = inspect.currentframe()
-            if frame and frame.f_back:
-                caller_file = os.path.basename(frame.f_back.f_code.co_filename)
-                logger.debug(
-                    f"{DIM}CALL {func.__name__}() [{caller_file}]{RESET}")
-
-            result = func(*args, **kwargs)
-
-            # Log specific variables if specified
-            if log_vars and isinstance(result, dict):
-                for var_name in log_vars:
-                    value = result.get(var_name, "❓ not found")
-                    logger.debug(f"{DIM}  ↳ {var_name} = {value}{RESET}")
-
-            if frame and frame.f_back:
+            if not tracer.enabled and not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                caller_file = os.path.basename(sys._getframe(1).f_code.co_filename)
+                logger.debug(f"{DIM}CALL {func.__name__}() [{caller_file}]{RESET}")
+
+            handle = tracer.start(span_name) if tracer.enabled else None
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                if handle:
+                    tracer.finish(handle, "error", type(e).__name__)
+                raise
+            if handle:
+                tracer.finish(handle)
+
+            if debug_enabled:
+                # Log specific variables if specified
+                if log_vars and isinstance(result, dict):
+                    for var_name in log_vars:
+                        value = result.get(var_name, "❓ not found")
+                        logger.debug(f"{DIM}  ↳ {var_name} = {format_result(value)}{RESET}")
                 logger.debug(
-                    f"{DIM}DONE {func.__name__} → {result} [{caller_file}]{RESET}")
+                    f"{DIM}DONE {func.__name__} → {format_result(result)} [{caller_file}]{RESET}")
             return result
         return cast(F, wrapper)
 
@@ -0,0 +1,253 @@
+"""
+Opt-in profiling of menu and CLI commands.
+
+Setting WPDOCKER_PROFILE (or PROFILE_MODE in core.env) to "1" makes every
+command run under profile_command: its spans are traced to a file in
+DATA_DIR/profiles, and when it finishes a table of wall time per step,
+split into docker exec, WP-CLI, network and file I/O time, is printed and
+a collapsed-stack file for flamegraph.pl or speedscope is written next to
+the trace. Setting it to "cprofile" also records a cProfile dump that can
+be opened with pstats or snakeviz.
+"""
+
+import functools
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+from src.common.tracing import tracer, span, load_spans, summarize_trace, print_trace_report
+from src.common.utils.environment import env
+
+PROFILE_MODE = (os.environ.get("WPDOCKER_PROFILE") or env.get("PROFILE_MODE") or "").lower()
+
+# Span categories reported as columns; the rest of a step's time is "other"
+CATEGORIES = ["docker", "wpcli", "network", "file_io"]
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_active = False
+
+
+def is_profiling_enabled() -> bool:
+    return PROFILE_MODE not in ("", "0", "false", "no")
+
+
+def get_profile_dir() -> str:
+    return os.path.join(env["DATA_DIR"], "profiles")
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "command"
+
+
+def _children(spans: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for s in spans:
+        children.setdefault(s.get("parent"), []).append(s)
+    return children
+
+
+def category_times(root: Dict[str, Any],
+                   children: Dict[str, List[Dict[str, Any]]]) -> Dict[str, float]:
+    """
+    Split a span's wall time by the category of the work below it.
+
+    Only the outermost categorized span of each branch counts, so a docker
+    exec made by a WP-CLI call is reported as WP-CLI time.
+
+    Args:
+        root: Span to break down
+        children: Spans grouped by parent id
+
+    Returns:
+        Dict[str, float]: Seconds per category, plus "other"
+    """
+    times = {category: 0.0 for category in CATEGORIES}
+    stack = list(children.get(root["id"], []))
+    while stack:
+        s = stack.pop()
+        if s.get("category") in times:
+            times[s["category"]] += s["duration"]
+        else:
+            stack.extend(children.get(s["id"], []))
+    times["other"] = max(0.0, root["duration"] - sum(times.values()))
+    return times
+
+
+def write_folded_stacks(spans: List[Dict[str, Any]], path: str) -> None:
+    """
+    Write spans as collapsed stacks ("a;b;c <microseconds>" per line).
+
+    Args:
+        spans: Spans of one or more commands
+        path: Output file, readable by flamegraph.pl and speedscope
+    """
+    by_id = {s["id"]: s for s in spans}
+    children = _children(spans)
+    folded: Dict[str, int] = {}
+    for s in spans:
+        names = []
+        node: Optional[Dict[str, Any]] = s
+        while node is not None and len(names) < 256:
+            names.append(node["name"].replace(";", ":").replace(" ", "_"))
+            node = by_id.get(node.get("parent"))
+        child_time = sum(c["duration"] for c in children.get(s["id"], []))
+        self_us = int(max(0.0, s["duration"] - child_time) * 1_000_000)
+        if self_us:
+            stack = ";".join(reversed(names))
+            folded[stack] = folded.get(stack, 0) + self_us
+    with open(path, "w") as f:
+        for stack, value in sorted(folded.items()):
+            f.write(f"{stack} {value}\n")
+
+
+def print_profile_summary(spans: List[Dict[str, Any]], command_id: str) -> None:
+    """
+    Print the wall time of a command per step and per kind of work.
+
+    Args:
+        spans: Spans from the command's trace file
+        command_id: Id of the command's top-level span
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    by_id = {s["id"]: s for s in spans}
+    command = by_id.get(command_id)
+    if command is None:
+        return
+    children = _children(spans)
+
+    def under_command(s: Dict[str, Any]) -> bool:
+        while s.get("parent") in by_id:
+            s = by_id[s["parent"]]
+        return s["id"] == command_id
+
+    steps = sorted((s for s in spans if s.get("category") == "step" and under_command(s)),
+                   key=lambda s: s["start"])
+
+    table = Table(title=f"⏱️ Profile: {command['name']}", header_style="bold cyan")
+    table.add_column("Step", style="bold white")
+    table.add_column("Wall ms", justify="right")
+    for category in CATEGORIES + ["other"]:
+        table.add_column(category, justify="right")
+    for s in steps + [command]:
+        times = category_times(s, children)
+        label = "total" if s is command else s["name"]
+        if s.get("outcome") == "error":
+            label += " [red](failed)[/red]"
+        table.add_row(label, f"{s['duration'] * 1000:.0f}",
+                      *[f"{times[c] * 1000:.0f}" if times[c] else "-"
+                        for c in CATEGORIES + ["other"]],
+                      style="bold" if s is command else None)
+    Console(stderr=True).print(table)
+
+
+@contextmanager
+def profile_command(name: str) -> Iterator[None]:
+    """
+    Profile a command when profiling is enabled.
+
+    Nested commands (a CLI entry point called from a menu) are recorded as
+    spans of the outer one. Does nothing when profiling is disabled.
+
+    Args:
+        name: Command name, e.g. "website create"
+    """
+    global _active
+    if not is_profiling_enabled():
+        yield
+        return
+    if _active:
+        with span(name, "command"):
+            yield
+        return
+
+    profile_dir = get_profile_dir()
+    os.makedirs(profile_dir, exist_ok=True)
+    base = os.path.join(profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{_slug(name)}")
+    previous = (tracer.enabled, tracer.path)
+    tracer.enable(f"{base}.trace.jsonl")
+    profiler = None
+    if PROFILE_MODE == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+
+    _active = True
+    handle = tracer.start(name, "command")
+    outcome, error_name = "ok", None
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            outcome, error_name = "error", "SystemExit"
+        raise
+    except BaseException as e:
+        outcome, error_name = "error", type(e).__name__
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(f"{base}.prof")
+        tracer.finish(handle, outcome, error_name)
+        tracer.flush()
+        _active = False
+        if previous[0]:
+            tracer.enable(previous[1])
+        else:
+            tracer.disable()
+        _write_profile_report(base, handle[0])
+
+
+def _write_profile_report(base: str, command_id: str) -> None:
+    try:
+        spans = load_spans(f"{base}.trace.jsonl")
+        write_folded_stacks(spans, f"{base}.folded")
+        print_profile_summary(spans, command_id)
+        print_trace_report(summarize_trace(spans), top=10, stderr=True)
+        outputs = [f"{base}.trace.jsonl", f"{base}.folded"]
+        if os.path.exists(f"{base}.prof"):
+            outputs.append(f"{base}.prof")
+        print("Profile written to:\n  " + "\n  ".join(outputs), file=sys.stderr)
+    except Exception as e:
+        # Reporting must never change the outcome of the profiled command
+        print(f"Could not write profile report: {e}", file=sys.stderr)
+
+
+def _command_name(feature: str, args: Any) -> str:
+    if hasattr(args, "command"):
+        subcommand = getattr(args, "command", None)
+    else:
+        argv = args if isinstance(args, (list, tuple)) else sys.argv[1:]
+        subcommand = next((a for a in argv if not str(a).startswith("-")), None)
+    return f"{feature} {subcommand}" if subcommand else feature
+
+
+def profiled(feature: str) -> Callable[[F], F]:
+    """
+    Decorator to profile a CLI entry point when profiling is enabled.
+
+    The command is named after the feature and the first positional
+    argument, e.g. "website create"; option values are never recorded.
+
+    Args:
+        feature: Feature name
+
+    Returns:
+        Decorator for the entry point
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not is_profiling_enabled():
+                return func(*args, **kwargs)
+            cli_args = args[0] if args else kwargs.get("args")
+            with profile_command(_command_name(feature, cli_args)):
+                return func(*args, **kwargs)
+        return cast(F, wrapper)
+    return decorator
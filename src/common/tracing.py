@@ -0,0 +1,303 @@
+"""
+Structured tracing of function calls.
+
+Functions decorated with log_call become spans when tracing is enabled.
+Each finished span is written as one JSON line with its name, start,
+duration, parent and outcome; the report helpers here turn a trace file
+into a per-command time breakdown. Tracing is enabled by pointing the
+WPDOCKER_TRACE environment variable (or TRACE_FILE in core.env) at a file,
+and costs a single attribute check per call when it is not.
+"""
+
+import atexit
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.common.utils.environment import env
+
+# Finished spans kept in memory before they are appended to the trace file
+FLUSH_EVERY = 256
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("wpdocker_span", default=None)
+
+
+class Tracer:
+    """Collects spans and appends them to a JSON lines file."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            path: Trace file (tracing stays disabled if None)
+        """
+        self.path = path
+        self.enabled = bool(path)
+        self.lock = threading.Lock()
+        self.buffer: List[Dict[str, Any]] = []
+        self.ids = itertools.count(1)
+        self.prefix = f"{os.getpid():x}"
+        # Span running on the main thread; worker thread spans without a
+        # parent of their own are attributed to it
+        self.main_span: Optional[str] = None
+        atexit.register(self.flush)
+
+    def enable(self, path: str) -> None:
+        """Start writing spans to a file."""
+        self.flush()
+        self.path = path
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop tracing and write out the spans collected so far."""
+        self.flush()
+        self.enabled = False
+
+    def start(self, name: str,
+              category: Optional[str] = None) -> Tuple[str, Optional[str], float, float, Any]:
+        """
+        Open a span as a child of the current one.
+
+        Args:
+            name: Span name, usually the function's qualified name
+            category: Kind of work, e.g. "docker" or "network"
+
+        Returns:
+            Tuple: Handle to pass to finish()
+        """
+        span_id = f"{self.prefix}-{next(self.ids)}"
+        parent = _current_span.get()
+        on_main = threading.current_thread() is threading.main_thread()
+        if parent is None and not on_main:
+            parent = self.main_span
+        token = _current_span.set(span_id)
+        if on_main:
+            self.main_span = span_id
+        return span_id, parent, time.time(), time.perf_counter(), (name, category, token, on_main)
+
+    def finish(self, handle: Tuple[str, Optional[str], float, float, Any],
+               outcome: str = "ok", error: Optional[str] = None) -> None:
+        """
+        Close a span and queue it for writing.
+
+        Args:
+            handle: Handle returned by start()
+            outcome: "ok" or "error"
+            error: Exception type name when the span failed
+        """
+        span_id, parent, started, counter, (name, category, token, on_main) = handle
+        duration = time.perf_counter() - counter
+        _current_span.reset(token)
+        if on_main:
+            self.main_span = parent
+        record = {
+            "id": span_id,
+            "parent": parent,
+            "name": name,
+            "start": round(started, 6),
+            "duration": round(duration, 6),
+            "outcome": outcome,
+            "thread": threading.current_thread().name,
+        }
+        if category:
+            record["category"] = category
+        if error:
+            record["error"] = error
+        with self.lock:
+            self.buffer.append(record)
+            flush = parent is None or len(self.buffer) >= FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the queued spans to the trace file."""
+        with self.lock:
+            records, self.buffer = self.buffer, []
+        if not records or not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(r) + "\n" for r in records))
+        except OSError:
+            # Tracing must never break the traced command
+            pass
+
+
+tracer = Tracer(os.environ.get("WPDOCKER_TRACE") or env.get("TRACE_FILE") or None)
+
+
+def enable_tracing(path: str) -> None:
+    """
+    Write spans of log_call-decorated functions to a file.
+
+    Args:
+        path: Trace file, appended to
+    """
+    tracer.enable(path)
+
+
+def disable_tracing() -> None:
+    """Stop tracing."""
+    tracer.disable()
+
+
+@contextmanager
+def span(name: str, category: Optional[str] = None) -> Iterator[None]:
+    """
+    Trace a block of code as a span.
+
+    Args:
+        name: Span name
+        category: Kind of work, e.g. "docker" or "network"
+    """
+    if not tracer.enabled:
+        yield
+        return
+    handle = tracer.start(name, category)
+    try:
+        yield
+    except BaseException as e:
+        tracer.finish(handle, "error", type(e).__name__)
+        raise
+    tracer.finish(handle)
+
+
+@dataclass
+class SpanStats:
+    """Time spent in one function within a command."""
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+
+
+@dataclass
+class CommandBreakdown:
+    """Where the time of one traced command went."""
+
+    name: str
+    start: float
+    duration: float
+    outcome: str
+    spans: List[SpanStats] = field(default_factory=list)
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the spans of a trace file, skipping lines that are not valid.
+
+    Args:
+        path: Trace file
+
+    Returns:
+        List[Dict[str, Any]]: Spans in the order they finished
+    """
+    spans = []
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def summarize_trace(spans: List[Dict[str, Any]]) -> List[CommandBreakdown]:
+    """
+    Group spans by the top-level command they ran under.
+
+    Self time is a span's duration minus that of its direct children, so
+    the self times of a command add up to its duration (children that run
+    in parallel threads can make it smaller).
+
+    Args:
+        spans: Spans from load_spans
+
+    Returns:
+        List[CommandBreakdown]: One breakdown per top-level span, in start order
+    """
+    by_id = {s["id"]: s for s in spans}
+    child_time: Dict[str, float] = {}
+    for s in spans:
+        if s.get("parent") in by_id:
+            child_time[s["parent"]] = child_time.get(s["parent"], 0.0) + s["duration"]
+
+    def root_of(s: Dict[str, Any]) -> Dict[str, Any]:
+        seen = set()
+        while s.get("parent") in by_id and s["id"] not in seen:
+            seen.add(s["id"])
+            s = by_id[s["parent"]]
+        return s
+
+    commands: Dict[str, CommandBreakdown] = {}
+    stats: Dict[str, Dict[str, SpanStats]] = {}
+    for s in spans:
+        root = root_of(s)
+        if root["id"] not in commands:
+            commands[root["id"]] = CommandBreakdown(
+                name=root["name"], start=root["start"],
+                duration=root["duration"], outcome=root.get("outcome", "ok"))
+            stats[root["id"]] = {}
+        entry = stats[root["id"]].setdefault(s["name"], SpanStats(name=s["name"]))
+        entry.calls += 1
+        entry.errors += s.get("outcome") == "error"
+        entry.total += s["duration"]
+        entry.self_time += max(0.0, s["duration"] - child_time.get(s["id"], 0.0))
+
+    for root_id, command in commands.items():
+        command.spans = sorted(stats[root_id].values(), key=lambda e: e.self_time, reverse=True)
+    return sorted(commands.values(), key=lambda c: c.start)
+
+
+def print_trace_report(commands: List[CommandBreakdown], top: int = 10,
+                       stderr: bool = False) -> None:
+    """
+    Print the time breakdown of traced commands.
+
+    Args:
+        commands: Breakdowns from summarize_trace
+        top: Functions listed per command, by self time
+        stderr: Whether to print to stderr, keeping stdout for command output
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(stderr=stderr)
+    if not commands:
+        console.print("No spans recorded.", style="bold yellow")
+        return
+
+    for command in commands:
+        style = "green" if command.outcome == "ok" else "red"
+        title = (f"⏱️ {command.name} — {command.duration * 1000:.1f} ms "
+                 f"[{style}]{command.outcome}[/{style}]")
+        table = Table(title=title, header_style="bold cyan")
+        table.add_column("Function", style="bold white")
+        table.add_column("Calls", justify="right")
+        table.add_column("Self ms", justify="right")
+        table.add_column("Total ms", justify="right")
+        table.add_column("Self %", justify="right")
+        table.add_column("Errors", justify="right")
+        for entry in command.spans[:top]:
+            share = entry.self_time / command.duration * 100 if command.duration else 0.0
+            table.add_row(
+                entry.name,
+                str(entry.calls),
+                f"{entry.self_time * 1000:.1f}",
+                f"{entry.total * 1000:.1f}",
+                f"{share:.0f}%",
+                str(entry.errors) if entry.errors else "-",
+            )
+        console.print(table)
@@ -0,0 +1,154 @@
+"""
+Incremental file reading utilities.
+
+This module provides a reader that remembers how far each log file has been
+read, so periodic jobs only parse lines appended since their previous run.
+Offsets are stored per file together with its inode, which lets the reader
+notice rotation and finish the rotated ``<file>.1`` before starting over.
+
+Files rotated with copytruncate keep their inode; the reader notices the
+truncation when the file is shorter than the saved offset and finishes the
+copy in ``<file>.1`` first. If the file grows past the saved offset again
+before the next run, the truncation goes unnoticed and the lines written
+between the previous run and the truncation are skipped.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.common.logging import debug, warn
+
+
+class IncrementalReader:
+    """Reads lines appended to files since the last committed offset."""
+
+    def __init__(self, state_file: str):
+        """
+        Initialize the reader.
+
+        Args:
+            state_file: JSON file used to persist offsets between runs
+        """
+        self.state_file = state_file
+        self.state: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read offsets from {self.state_file}: {e}")
+            return {}
+
+    def commit(self) -> None:
+        """Persist the current offsets atomically."""
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Forget saved offsets.
+
+        Args:
+            key: Key of a single file to forget, or None to forget all
+        """
+        if key is None:
+            self.state = {}
+        else:
+            self.state.pop(key, None)
+
+    def _read_from(self, path: str, offset: int) -> Iterator[tuple]:
+        """
+        Yield complete lines from a file starting at a byte offset.
+
+        Yields:
+            Tuples of (line, offset after the line)
+        """
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # Partial line still being written, pick it up next run
+                    break
+                offset += len(raw)
+                yield raw.decode("utf-8", errors="replace"), offset
+
+    def rewind(self, key: str, offset: int) -> None:
+        """
+        Move the offset of a file back, to read a record again next run.
+
+        Args:
+            key: Key under which the offset is stored
+            offset: Offset in the current file, as given by read_with_offsets()
+        """
+        if key in self.state:
+            self.state[key]["offset"] = min(offset, self.state[key]["offset"])
+
+    def read_lines(self, path: str, key: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield lines appended to a file since the last run.
+
+        The new offset is recorded as lines are consumed; call commit()
+        once they have been processed to make it durable.
+
+        Args:
+            path: Path of the file to read
+            key: Key under which the offset is stored (defaults to the path)
+
+        Yields:
+            Lines including the trailing newline
+        """
+        for line, _ in self.read_with_offsets(path, key):
+            yield line
+
+    def read_with_offsets(self, path: str,
+                          key: Optional[str] = None) -> Iterator[Tuple[str, Optional[int]]]:
+        """
+        Yield lines appended to a file since the last run with their offsets.
+
+        Args:
+            path: Path of the file to read
+            key: Key under which the offset is stored (defaults to the path)
+
+        Yields:
+            Tuples of (line, offset where the line starts), with None as the
+            offset of lines from a rotated file
+        """
+        key = key or path
+        if not os.path.exists(path):
+            return
+
+        stat = os.stat(path)
+        saved = self.state.get(key, {})
+        offset = saved.get("offset", 0)
+        inode = saved.get("inode")
+
+        if inode is not None and inode != stat.st_ino:
+            # The file was rotated: finish the previous generation first
+            rotated = f"{path}.1"
+            if os.path.exists(rotated) and os.stat(rotated).st_ino == inode:
+                debug(f"Finishing rotated file {rotated} from offset {offset}")
+                for line, _ in self._read_from(rotated, offset):
+                    yield line, None
+            offset = 0
+        elif offset > stat.st_size:
+            # The file was truncated in place. With copytruncate the copy in
+            # <file>.1 holds the lines written before the truncation
+            rotated = f"{path}.1"
+            if offset and os.path.exists(rotated) and os.stat(rotated).st_size >= offset:
+                debug(f"Finishing truncated copy {rotated} from offset {offset}")
+                for line, _ in self._read_from(rotated, offset):
+                    yield line, None
+            offset = 0
+
+        self.state[key] = {"inode": stat.st_ino, "offset": offset}
+        for line, end in self._read_from(path, offset):
+            self.state[key]["offset"] = end
+            yield line, offset
+            offset = end
@@ -0,0 +1,54 @@
+"""
+Lazy package exports.
+
+Feature packages re-export their public API from ``__init__``. Importing
+every submodule there means that importing any one module of a feature
+(from cron, a CLI entry point or another feature) loads the whole feature
+and its third-party dependencies. lazy_exports gives a package a module
+level ``__getattr__`` (PEP 562) that imports a submodule only when one of
+its names is first used.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str,
+                 exports: Dict[str, List[str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build the lazy loading hooks of a package.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+            "src.features.example.core": ["do_something"],
+        })
+
+    Args:
+        package: Name of the package (``__name__``)
+        exports: Names to export, keyed by the module that defines them;
+            "name as alias" exports a name under another one
+
+    Returns:
+        Tuple: The package's ``__getattr__``, ``__dir__`` and ``__all__``
+    """
+    origins = {}
+    for module, entries in exports.items():
+        for entry in entries:
+            attr, _, alias = entry.partition(" as ")
+            origins[alias or attr] = (module, attr)
+    names = list(origins)
+
+    def __getattr__(name: str) -> Any:
+        if name not in origins:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module, attr = origins[name]
+        value = getattr(importlib.import_module(module), attr)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(names) | set(vars(importlib.import_module(package))))
+
+    return __getattr__, __dir__, names
@@ -14,6 +14,7 @@ from src.core.bootstrap.nginx import NginxBootstrap
 from src.core.bootstrap.redis import RedisBootstrap
 from src.core.bootstrap.wpcli import WPCLIBootstrap
 from src.core.bootstrap.rclone import RcloneBootstrap
+from src.core.bootstrap.state import BootstrapState, ContainerSnapshot
 
 __all__ = [
     'BaseBootstrap',
@@ -25,5 +26,7 @@ __all__ = [
     'NginxBootstrap',
     'RedisBootstrap',
     'WPCLIBootstrap',
-    'RcloneBootstrap'
+    'RcloneBootstrap',
+    'BootstrapState',
+    'ContainerSnapshot'
 ]
\ No newline at end of file
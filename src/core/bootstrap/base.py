@@ -5,7 +5,10 @@ This module provides the abstract base class for all bootstrap components.
 """
 
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
 from src.common.logging import Debug, log_call
+from src.core.bootstrap.state import ContainerSnapshot
 
 
 class BaseBootstrap(ABC):
@@ -99,3 +102,20 @@ class BaseBootstrap(ABC):
     def mark_bootstrapped(self) -> None:
         """Mark this component as bootstrapped."""
         pass
+
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Describe what is_bootstrapped() depends on.
+
+        While the fingerprint stays the same, the controller trusts the
+        previous bootstrap and does not run the checks again. Components
+        return hashes of their files and the fingerprints of their
+        containers; the default of None makes the checks run on every start.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return None
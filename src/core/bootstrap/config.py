@@ -5,12 +5,14 @@ This module handles initial configuration of the system, including
 user preferences, timezone, webserver choice, and database version.
 """
 
+from typing import Any, Dict, Optional
 import questionary
 import jsons
 from jsons.exceptions import DeserializationError
 
 from src.common.logging import Debug, log_call
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, data_fingerprint
 from src.core.config.manager import ConfigManager
 from src.core.models.core_config import CoreConfig
 
@@ -45,6 +47,18 @@ class ConfigBootstrap(BaseBootstrap):
             self.debug.error(f"Error checking core config: {e}")
             return False
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the core configuration.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {"core": data_fingerprint(self.config_manager.get().get("core", {}))}
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for configuration bootstrap are met.
@@ -5,10 +5,11 @@ This module orchestrates the bootstrap process, executing each bootstrap
 component in the correct order.
 """
 
-from typing import List, Type
+from typing import Any, Dict, List, Optional, Type
 
 from src.common.logging import Debug, log_call
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import BOOTSTRAP_FORCE, BootstrapState, ContainerSnapshot
 from src.core.bootstrap.config import ConfigBootstrap
 from src.core.bootstrap.system import SystemBootstrap
 from src.core.bootstrap.docker import DockerBootstrap
@@ -46,36 +47,79 @@ class BootstrapController:
         ]
         
     @log_call
-    def run_bootstrap(self) -> bool:
+    def run_bootstrap(self, force: bool = False) -> bool:
         """
         Run the complete bootstrap process.
-        
+
+        Components whose fingerprint matches the one saved by the last
+        bootstrap are trusted without running their checks, so a warm start
+        costs one docker ps call. Checks run again when a fingerprint
+        changes, or for every component when forced.
+
+        Args:
+            force: Whether to run every component's checks
+                (also set by WPDOCKER_BOOTSTRAP_FORCE=1)
+
         Returns:
             bool: True if all components bootstrapped successfully, False otherwise
         """
         self.debug.info("Starting bootstrap sequence")
-        
+
+        state = BootstrapState()
+        if force or BOOTSTRAP_FORCE:
+            state.clear()
+        snapshot = ContainerSnapshot.take()
+
         result = True
+        checked: List[BaseBootstrap] = []
         for bootstrap_class in self.bootstrap_sequence:
             if callable(bootstrap_class) and not isinstance(bootstrap_class, type):
                 bootstrap = bootstrap_class()
             else:
                 bootstrap = bootstrap_class()
             component_name = bootstrap.__class__.__name__
-            
+
+            fingerprint = self._fingerprint(bootstrap, snapshot)
+            if state.is_current(component_name, fingerprint):
+                self.debug.debug(f"{component_name} unchanged since last bootstrap, skipping checks")
+                continue
+
             self.debug.info(f"Bootstrapping {component_name}")
             if not bootstrap.bootstrap():
                 self.debug.error(f"Failed to bootstrap {component_name}")
+                state.forget(component_name)
                 result = False
                 break
-                
+            # Components that cannot be fingerprinted are checked on every start
+            if fingerprint is not None or snapshot is None:
+                checked.append(bootstrap)
+
+        if checked:
+            # Bootstrapping may have written files and created containers,
+            # so the fingerprints are taken from the resulting state
+            snapshot = ContainerSnapshot.take()
+            for bootstrap in checked:
+                state.record(bootstrap.__class__.__name__, self._fingerprint(bootstrap, snapshot))
+        state.save()
+
         if result:
             self.debug.success("Bootstrap sequence completed successfully")
         else:
             self.debug.error("Bootstrap sequence failed")
-            
+
         return result
-        
+
+    def _fingerprint(self, bootstrap: BaseBootstrap,
+                     snapshot: Optional[ContainerSnapshot]) -> Optional[Dict[str, Any]]:
+        # Without Docker nothing can be trusted, every check runs
+        if snapshot is None:
+            return None
+        try:
+            return bootstrap.fingerprint(snapshot)
+        except Exception as e:
+            self.debug.debug(f"Could not fingerprint {bootstrap.__class__.__name__}: {e}")
+            return None
+
     @log_call
     def run_specific_bootstrap(self, component_name: str) -> bool:
         """
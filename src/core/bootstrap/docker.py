@@ -8,8 +8,10 @@ and user permissions.
 import subprocess
 import platform
 import os
+from typing import Any, Dict, Optional
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot
 from src.features.docker.installer import install_docker_if_missing
 
 
@@ -45,6 +47,22 @@ class DockerBootstrap(BaseBootstrap):
 
         return network in networks
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the Docker network.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        # The snapshot itself shows that Docker is running
+        network = env.get("DOCKER_NETWORK")
+        if not network or network not in snapshot.networks:
+            return None
+        return {"network": network}
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for Docker bootstrap are met.
@@ -6,10 +6,12 @@ in any other bootstrap module.
 """
 
 import os
+from typing import Any, Dict, Optional
 
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint
 from src.core.utils.downloader import Downloader
 from src.common.utils.validation import validate_directory
 
@@ -37,6 +39,18 @@ class MiscBootstrap(BaseBootstrap):
 
         return True
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the WP-CLI phar.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {"wp_cli": file_fingerprint(os.path.join(env["WORDPRESS_DIR"], "wp-cli.phar"))}
+
     @log_call
     def check_prerequisites(self) -> bool:
         """
@@ -7,7 +7,7 @@ and password management.
 
 import os
 import questionary
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
@@ -15,6 +15,7 @@ from src.common.utils.system_info import get_total_ram_mb, get_total_cpu_cores
 from src.common.utils.crypto import encrypt, decrypt
 from src.common.utils.password import strong_password
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint, data_fingerprint
 from src.core.config.manager import ConfigManager
 from src.core.containers.compose import Compose
 from src.common.containers.container import Container
@@ -93,6 +94,23 @@ class MySQLBootstrap(BaseBootstrap):
         self.debug.debug(f"  - MySQL compose file: {compose_path}")
         return True
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the MySQL configuration, compose file and container.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {
+            "config": data_fingerprint(self.config_manager.get().get("mysql", {})),
+            "config_file": file_fingerprint(env["MYSQL_CONFIG_FILE"]),
+            "compose": file_fingerprint(os.path.join(env["INSTALL_DIR"], "docker-compose", "docker-compose.mysql.yml")),
+            "container": snapshot.container_fingerprint(env.get("MYSQL_CONTAINER_NAME")),
+        }
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for MySQL bootstrap are met.
@@ -312,16 +330,10 @@ class MySQLBootstrap(BaseBootstrap):
         try:
             self.debug.info(f"MySQL config file is missing, creating at: {config_path}")
 
-            # Calculate optimal settings based on system resources
-            total_ram = get_total_ram_mb()
-            total_cpu = get_total_cpu_cores()
-
-            max_connections = max(total_ram // 4, 100)
-            query_cache_size = 32
-            innodb_buffer_pool_size = max(total_ram // 2, 256)
-            innodb_log_file_size = max(innodb_buffer_pool_size // 6, 64)
-            table_open_cache = max(total_ram * 8, 400)
-            thread_cache_size = max(total_cpu * 8, 16)
+            # Start from a conservative baseline; PHP-FPM claims most of the
+            # RAM once websites exist and `mysql tune` resizes from the workload
+            from src.features.mysql.tuner import baseline_mysql_config
+            settings = baseline_mysql_config(get_total_ram_mb(), get_total_cpu_cores())
 
             # Ensure directory exists
             mysql_conf_dir = os.path.dirname(config_path)
@@ -331,14 +343,9 @@ class MySQLBootstrap(BaseBootstrap):
 
             # Create MySQL config file
             with open(config_path, "w") as f:
-                f.write(f"""[mysqld]
-max_connections = {max_connections}
-query_cache_size = {query_cache_size}M
-innodb_buffer_pool_size = {innodb_buffer_pool_size}M
-innodb_log_file_size = {innodb_log_file_size}M
-table_open_cache = {table_open_cache}
-thread_cache_size = {thread_cache_size}
-""")
+                f.write("[mysqld]\n")
+                for key, value in settings.items():
+                    f.write(f"{key} = {value}\n")
 
             self.debug.success("✅ MySQL configuration file created successfully")
 
@@ -6,10 +6,13 @@ and container setup.
 """
 
 import os
+import re
+from typing import Any, Dict, Optional
 
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint
 from src.core.containers.compose import Compose
 from src.core.containers.container import Container
 from src.features.website.utils import website_list
@@ -41,6 +44,12 @@ class NginxBootstrap(BaseBootstrap):
         if not os.path.exists(nginx_conf_path) and not os.path.exists(old_nginx_conf_path):
             return False
 
+        # Configs created before the JSON access log format need upgrading
+        if os.path.exists(nginx_conf_path):
+            with open(nginx_conf_path, "r") as f:
+                if "log_format wpdocker_json" not in f.read():
+                    return False
+
         # Check if NGINX compose file exists
         compose_path = os.path.join(env["INSTALL_DIR"], "docker-compose", "docker-compose.nginx.yml")
         if not os.path.exists(compose_path):
@@ -48,6 +57,23 @@ class NginxBootstrap(BaseBootstrap):
 
         return True
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the NGINX configuration, compose file and container.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {
+            "config": file_fingerprint(os.path.join(env["INSTALL_DIR"], "src/features/nginx/configs/nginx.conf")),
+            "old_config": file_fingerprint(os.path.join(env["INSTALL_DIR"], "core/backend/modules/nginx/nginx.conf")),
+            "compose": file_fingerprint(os.path.join(env["INSTALL_DIR"], "docker-compose", "docker-compose.nginx.yml")),
+            "container": snapshot.container_fingerprint(env.get("NGINX_CONTAINER_NAME")),
+        }
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for NGINX bootstrap are met.
@@ -88,6 +114,10 @@ class NginxBootstrap(BaseBootstrap):
             if not self._create_nginx_conf():
                 return False
 
+            # Step 1b: Add the machine-readable access log format to existing configs
+            if not self._ensure_json_log_format():
+                return False
+
             # Step 2: Create and start NGINX container
             if not self._create_nginx_container():
                 return False
@@ -185,6 +215,58 @@ class NginxBootstrap(BaseBootstrap):
             self.debug.error(f"Failed to create NGINX configuration: {e}")
             return False
 
+    def _ensure_json_log_format(self) -> bool:
+        """
+        Ensure nginx.conf defines the wpdocker_json log format and that website
+        vhosts write their access log with it.
+
+        nginx.conf is only created when missing, so installations bootstrapped
+        before the format existed are upgraded in place.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            nginx_conf_path = os.path.join(env["NGINX_CONFIG_DIR"], "nginx.conf")
+            with open(nginx_conf_path, "r") as f:
+                content = f.read()
+
+            if "log_format wpdocker_json" not in content:
+                template_path = os.path.join(env["TEMPLATES_DIR"], "nginx", "nginx.conf.template")
+                with open(template_path, "r") as f:
+                    template = f.read()
+                start = template.index("    # Machine-readable access log")
+                end = template.index("'}';", start) + len("'}';\n")
+                block = template[start:end]
+
+                # Insert right after the opening of the http block
+                marker = "http {\n"
+                if marker not in content:
+                    self.debug.warn("Could not find http block in nginx.conf, skipping log format upgrade")
+                    return True
+                content = content.replace(marker, marker + block + "\n", 1)
+                with open(nginx_conf_path, "w") as f:
+                    f.write(content)
+                self.debug.info("Added wpdocker_json log format to nginx.conf")
+
+            vhost_dir = os.path.join(env["CONFIG_DIR"], "nginx", "conf.d")
+            if os.path.isdir(vhost_dir):
+                for file_name in os.listdir(vhost_dir):
+                    if not file_name.endswith(".conf"):
+                        continue
+                    vhost_path = os.path.join(vhost_dir, file_name)
+                    with open(vhost_path, "r") as f:
+                        vhost = f.read()
+                    upgraded = re.sub(r"(access_log\s+\S+/access\.log)\s*;", r"\1 wpdocker_json;", vhost)
+                    if upgraded != vhost:
+                        with open(vhost_path, "w") as f:
+                            f.write(upgraded)
+                        self.debug.debug(f"Switched {file_name} access log to wpdocker_json")
+            return True
+        except Exception as e:
+            self.debug.error(f"Failed to add JSON access log format: {e}")
+            return False
+
     def _create_nginx_container(self) -> bool:
         """
         Create and start NGINX container.
@@ -291,10 +373,13 @@ class NginxBootstrap(BaseBootstrap):
                 "/var/www"
             ]
 
-            # Set permissions
+            # Set permissions, touching only entries with the wrong owner
+            from src.common.containers.ownership import fix_ownership
             for path in paths_to_check:
-                container.exec(["chown", "-R", "www-data:www-data", path], user="root")
-                self.debug.debug(f"Set ownership of {path} to www-data:www-data")
+                result = fix_ownership(container.name, path)
+                if result is not None:
+                    self.debug.debug(f"Set ownership of {path} to www-data:www-data "
+                                     f"({result.owner_changed} entries changed)")
 
             return True
         except Exception as e:
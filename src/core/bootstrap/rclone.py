@@ -6,10 +6,12 @@ and container setup.
 """
 
 import os
+from typing import Any, Dict, Optional
 
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint
 from src.core.containers.compose import Compose
 
 
@@ -65,6 +67,22 @@ class RcloneBootstrap(BaseBootstrap):
 
         return True
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the Rclone configuration, compose file and container.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {
+            "config": file_fingerprint(self.rclone_config_file),
+            "compose": file_fingerprint(self.compose_file),
+            "container": snapshot.container_fingerprint(env.get("RCLONE_CONTAINER_NAME")),
+        }
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for Rclone bootstrap are met.
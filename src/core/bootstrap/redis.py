@@ -5,10 +5,12 @@ This module handles Redis container initialization and configuration.
 """
 
 import os
+from typing import Any, Dict, Optional
 
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint
 from src.core.containers.compose import Compose
 
 
@@ -39,6 +41,21 @@ class RedisBootstrap(BaseBootstrap):
 
         return True
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the Redis compose file and container.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {
+            "compose": file_fingerprint(self.compose_file),
+            "container": snapshot.container_fingerprint(self.redis_container_name),
+        }
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for Redis bootstrap are met.
@@ -80,6 +97,13 @@ class RedisBootstrap(BaseBootstrap):
             template_path = os.path.join(env["TEMPLATES_DIR"], "docker-compose", "docker-compose.redis.yml.template")
             output_path = os.path.join(docker_compose_dir, "docker-compose.redis.yml")
 
+            # Cache-only server: bounded memory with eviction, no persistence
+            from src.features.cache.core.redis_manager import (
+                format_server_command,
+                get_redis_server_settings
+            )
+            redis_command = format_server_command(get_redis_server_settings(site_count=0))
+
             compose = Compose(
                 name=env["REDIS_CONTAINER_NAME"],
                 template_path=template_path,
@@ -88,6 +112,7 @@ class RedisBootstrap(BaseBootstrap):
                     "PROJECT_NAME": env["PROJECT_NAME"],
                     "REDIS_IMAGE": env["REDIS_IMAGE"],
                     "REDIS_CONTAINER_NAME": env["REDIS_CONTAINER_NAME"],
+                    "REDIS_COMMAND": redis_command,
                     "DOCKER_NETWORK": env["DOCKER_NETWORK"]
                 }
             )
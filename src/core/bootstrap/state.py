@@ -0,0 +1,257 @@
+"""
+Persisted bootstrap state.
+
+Each bootstrap component can describe what its is_bootstrapped() check
+depends on as a fingerprint: hashes of its compose and config files and the
+id and image of its container. Fingerprints are saved to
+DATA_DIR/bootstrap_state.json once a component is bootstrapped, and on the
+next start a component whose fingerprint is unchanged is trusted without
+running its checks. Container fingerprints come from a single ``docker ps``
+snapshot shared by all components.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from src.common.logging import Debug
+from src.common.utils.environment import env
+from src.version import VERSION
+
+# Files larger than this are fingerprinted by size and modification time
+MAX_HASHED_FILE_SIZE = 1024 * 1024
+
+# Set WPDOCKER_BOOTSTRAP_FORCE=1 to run every bootstrap check on the next start
+BOOTSTRAP_FORCE = os.environ.get("WPDOCKER_BOOTSTRAP_FORCE", "").lower() in ("1", "true", "yes")
+
+_debug = Debug("BootstrapState")
+
+# Latest snapshot taken by this process, reused by the container check after bootstrap
+_latest_snapshot: Optional["ContainerSnapshot"] = None
+
+
+def get_state_file() -> str:
+    return os.path.join(env["DATA_DIR"], "bootstrap_state.json")
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """
+    Fingerprint a file by its content.
+
+    Args:
+        path: File to fingerprint
+
+    Returns:
+        Optional[str]: SHA-256 of the content (size and mtime for large files),
+        or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+        if stat.st_size > MAX_HASHED_FILE_SIZE:
+            return f"{stat.st_size}:{int(stat.st_mtime)}"
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def data_fingerprint(data: Any) -> str:
+    """
+    Fingerprint JSON-serializable data, such as a config section.
+
+    Args:
+        data: Data to fingerprint
+
+    Returns:
+        str: SHA-256 of the data serialized with sorted keys
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class ContainerInfo:
+    """One container as listed by docker ps."""
+
+    id: str
+    name: str
+    image: str
+    state: str
+    networks: List[str] = field(default_factory=list)
+
+
+class ContainerSnapshot:
+    """State of every container, read with one docker ps call."""
+
+    def __init__(self, containers: Dict[str, ContainerInfo]):
+        """
+        Initialize the snapshot.
+
+        Args:
+            containers: Containers by name
+        """
+        self.containers = containers
+        self.taken_at = time.time()
+
+    @classmethod
+    def take(cls) -> Optional["ContainerSnapshot"]:
+        """
+        List all containers.
+
+        Returns:
+            Optional[ContainerSnapshot]: The snapshot, or None if Docker is not available
+        """
+        global _latest_snapshot
+        try:
+            result = subprocess.run(
+                ["docker", "ps", "-a", "--no-trunc", "--format",
+                 "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.State}}\t{{.Networks}}"],
+                capture_output=True, text=True, timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            _debug.debug(f"Could not list containers: {e}")
+            return None
+        if result.returncode != 0:
+            _debug.debug(f"Could not list containers: {result.stderr.strip()}")
+            return None
+
+        containers = {}
+        for line in result.stdout.splitlines():
+            fields = line.split("\t")
+            if len(fields) != 5:
+                continue
+            container_id, name, image, state, networks = fields
+            containers[name] = ContainerInfo(
+                id=container_id, name=name, image=image, state=state,
+                networks=[n for n in networks.split(",") if n])
+        _latest_snapshot = cls(containers)
+        return _latest_snapshot
+
+    @property
+    def networks(self) -> Set[str]:
+        """Networks at least one container is attached to."""
+        return {n for c in self.containers.values() for n in c.networks}
+
+    def running(self) -> List[str]:
+        """Names of running containers."""
+        return [c.name for c in self.containers.values() if c.state == "running"]
+
+    def stopped(self) -> List[str]:
+        """Names of exited containers."""
+        return [c.name for c in self.containers.values() if c.state == "exited"]
+
+    def container_fingerprint(self, name: Optional[str]) -> Optional[str]:
+        """
+        Fingerprint a container by its id and image.
+
+        A container recreated by compose, for example with a newer image,
+        gets a new id.
+
+        Args:
+            name: Container name
+
+        Returns:
+            Optional[str]: "<id>:<image>", or None if the container does not exist
+        """
+        container = self.containers.get(name) if name else None
+        return f"{container.id}:{container.image}" if container else None
+
+
+def get_latest_snapshot(max_age: float = 60.0) -> Optional[ContainerSnapshot]:
+    """
+    Get the snapshot taken during bootstrap if it is recent enough.
+
+    Args:
+        max_age: Maximum age in seconds
+
+    Returns:
+        Optional[ContainerSnapshot]: The snapshot, or None
+    """
+    if _latest_snapshot and time.time() - _latest_snapshot.taken_at <= max_age:
+        return _latest_snapshot
+    return None
+
+
+class BootstrapState:
+    """Fingerprints of the components that were bootstrapped."""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the state.
+
+        Args:
+            state_file: JSON state file (defaults to DATA_DIR)
+        """
+        self.state_file = state_file or get_state_file()
+        self.components: Dict[str, Dict[str, Any]] = self._load()
+        self.changed = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            _debug.warn(f"Could not read bootstrap state: {e}")
+            return {}
+        # Checks can change between versions, so their results are not reused
+        if not isinstance(data, dict) or data.get("version") != VERSION:
+            return {}
+        return data.get("components", {})
+
+    def is_current(self, component: str, fingerprint: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether a component was bootstrapped with the same fingerprint.
+
+        Args:
+            component: Component name
+            fingerprint: Current fingerprint (None never matches)
+
+        Returns:
+            bool: True if the component's checks can be skipped
+        """
+        entry = self.components.get(component)
+        return fingerprint is not None and entry is not None and entry.get("fingerprint") == fingerprint
+
+    def record(self, component: str, fingerprint: Optional[Dict[str, Any]]) -> None:
+        """
+        Record the fingerprint of a bootstrapped component.
+
+        Args:
+            component: Component name
+            fingerprint: Fingerprint (None forgets the component)
+        """
+        if fingerprint is None:
+            self.forget(component)
+            return
+        self.components[component] = {"fingerprint": fingerprint, "checked_at": time.time()}
+        self.changed = True
+
+    def forget(self, component: str) -> None:
+        """Drop a component so its checks run on the next start."""
+        if self.components.pop(component, None) is not None:
+            self.changed = True
+
+    def clear(self) -> None:
+        """Drop every component."""
+        self.changed = bool(self.components)
+        self.components = {}
+
+    def save(self) -> None:
+        """Persist the state if it changed."""
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            tmp_file = f"{self.state_file}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump({"version": VERSION, "components": self.components}, f, indent=2)
+            os.replace(tmp_file, self.state_file)
+            self.changed = False
+        except OSError as e:
+            # A missing state only means the checks run again next time
+            _debug.warn(f"Could not save bootstrap state: {e}")
@@ -6,10 +6,12 @@ This module handles the configuration of system-level settings like timezone.
 
 import platform
 import subprocess
+from typing import Any, Dict, Optional
 import questionary
 
 from src.common.logging import log_call
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot
 from src.core.config.manager import ConfigManager
 
 
@@ -31,6 +33,19 @@ class SystemBootstrap(BaseBootstrap):
         core_config = self.config.get().get("core", {})
         return bool(core_config.get("timezone"))
 
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the configured timezone.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        timezone = self.config.get().get("core", {}).get("timezone")
+        return {"timezone": timezone} if timezone else None
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for system bootstrap are met.
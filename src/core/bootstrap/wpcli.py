@@ -12,6 +12,7 @@ from typing import Dict, Any, Optional
 from src.common.logging import Debug, log_call
 from src.common.utils.environment import env
 from src.core.bootstrap.base import BaseBootstrap
+from src.core.bootstrap.state import ContainerSnapshot, file_fingerprint
 from src.core.containers.compose import Compose
 from src.features.mysql.utils import get_mysql_root_password
 
@@ -42,6 +43,22 @@ class WPCLIBootstrap(BaseBootstrap):
             
         return True
         
+    def fingerprint(self, snapshot: ContainerSnapshot) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint the WP-CLI configuration, compose file and container.
+
+        Args:
+            snapshot: Containers, listed once for all components
+
+        Returns:
+            Optional[Dict[str, Any]]: Fingerprint, or None to always check
+        """
+        return {
+            "config": file_fingerprint(os.path.join(env["CONFIG_DIR"], "wpcli-custom.ini")),
+            "compose": file_fingerprint(os.path.join(env["INSTALL_DIR"], "docker-compose", "docker-compose.wpcli.yml")),
+            "container": snapshot.container_fingerprint(env.get("WPCLI_CONTAINER_NAME")),
+        }
+
     def check_prerequisites(self) -> bool:
         """
         Check if prerequisites for WordPress CLI bootstrap are met.
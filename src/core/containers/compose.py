@@ -7,7 +7,6 @@ This module provides the Compose class for managing Docker Compose services.
 import os
 from typing import Dict, Optional, List, Any
 
-from python_on_whales import DockerClient
 from src.common.logging import Debug, log_call
 
 
@@ -34,6 +33,9 @@ class Compose:
         self.sensitive_env = sensitive_env or {}
         self.debug = Debug("Compose")
 
+        # python_on_whales is slow to import, so it is loaded on first use
+        from python_on_whales import DockerClient
+
         if self.output_path:
             self.docker = DockerClient(compose_files=[self.output_path])
         else:
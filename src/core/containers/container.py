@@ -4,7 +4,6 @@ Docker container management.
 This module provides the Container class for managing Docker containers.
 """
 
-from python_on_whales import DockerClient
 from src.common.logging import Debug, log_call
 
 
@@ -18,6 +17,9 @@ class Container:
         Args:
             name: Name of the Docker container
         """
+        # python_on_whales is slow to import, so it is loaded on first use
+        from python_on_whales import DockerClient
+
         self.name = name
         self.debug = Debug("Container")
         self.docker = DockerClient()
@@ -7,7 +7,7 @@ loading environment variables, and orchestrating the bootstrap process.
 
 import os
 import sys
-import importlib
+import importlib.util
 from typing import Dict, Any, List, Optional
 
 from src.common.logging import Debug, log_call
@@ -26,19 +26,20 @@ class SystemInitializer:
     def __init__(self) -> None:
         """Initialize the system initializer."""
         self.debug = Debug("SystemInitializer")
+        # Import name -> pip package name
         self.required_modules = {
-            "python-on-whales": "python-on-whales",
+            "python_on_whales": "python-on-whales",
             "questionary": "questionary",
             "rich": "rich",
             "requests": "requests",
             "passlib": "passlib",
             "bcrypt": "bcrypt",
             "colorama": "colorama",
-            "python-dotenv": "python-dotenv"
+            "dotenv": "python-dotenv"
         }
         
     @log_call
-    def initialize(self) -> bool:
+    def initialize(self, force_bootstrap: bool = False) -> bool:
         """
         Initialize the system.
         
@@ -47,6 +48,10 @@ class SystemInitializer:
         2. Loads environment variables
         3. Runs the bootstrap process
         
+        Args:
+            force_bootstrap: Whether to run every bootstrap check, even for
+                components unchanged since the last bootstrap
+        
         Returns:
             bool: True if initialization successful, False otherwise
         """
@@ -64,7 +69,7 @@ class SystemInitializer:
             
         # Run bootstrap process
         bootstrap_controller = BootstrapController()
-        if not bootstrap_controller.run_bootstrap():
+        if not bootstrap_controller.run_bootstrap(force=force_bootstrap):
             self.debug.error("Bootstrap process failed")
             return False
             
@@ -81,10 +86,9 @@ class SystemInitializer:
         """
         missing_modules = []
         
+        # find_spec locates a module without the cost of importing it
         for module_name, package_name in self.required_modules.items():
-            try:
-                importlib.import_module(module_name)
-            except ImportError:
+            if importlib.util.find_spec(module_name) is None:
                 missing_modules.append(package_name)
                 
         if missing_modules:
@@ -157,13 +161,16 @@ system_initializer = SystemInitializer()
 
 
 @log_call
-def initialize_system() -> bool:
+def initialize_system(force_bootstrap: bool = False) -> bool:
     """
     Initialize the system.
     
     This is the main entry point for system initialization.
     
+    Args:
+        force_bootstrap: Whether to run every bootstrap check
+    
     Returns:
         bool: True if initialization successful, False otherwise
     """
-    return system_initializer.initialize()
\ No newline at end of file
+    return system_initializer.initialize(force_bootstrap)
\ No newline at end of file
@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Dict, Optional, Any
 
 from src.common.logging import log_call, debug, info, warn, error
+from src.common.tracing import span
 from src.common.utils.environment import env_required, get_env_value
 from src.features.website.utils import get_site_config, set_site_config, get_sites_dir
 from src.common.utils.validation import validate_directory
@@ -86,7 +87,7 @@ def backup_files(domain: str) -> None:
     archive_filename = os.path.join(backup_path, "wordpress.tar.gz")
     
     # Create the archive
-    with tarfile.open(archive_filename, "w:gz") as tar:
+    with span("tar wordpress", "file_io"), tarfile.open(archive_filename, "w:gz") as tar:
         # Add the wordpress directory to the archive
         tar.add(site_dir, arcname="wordpress")
     
@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
 from src.common.logging import log_call, debug, info, warn, error, success
+from src.common.tracing import span
 from src.features.website.utils import get_sites_dir, get_site_config
 from src.common.utils.validation import validate_directory, validate_file_path
 
@@ -177,7 +178,7 @@ def restore_source_code(domain: str, archive_file: str) -> bool:
         os.makedirs(temp_dir)
         
         # Extract the tar.gz file
-        with tarfile.open(archive_file, "r:gz") as tar:
+        with span("untar wordpress", "file_io"), tarfile.open(archive_file, "r:gz") as tar:
             tar.extractall(path=temp_dir)
         
         # Move files from extraction directory to WordPress directory
@@ -207,12 +208,18 @@ def restore_source_code(domain: str, archive_file: str) -> bool:
 
 
 @log_call
-def set_wordpress_permissions(domain: str) -> bool:
+def set_wordpress_permissions(domain: str, dir_mode: Optional[str] = None,
+                              file_mode: Optional[str] = None) -> bool:
     """
     Set proper permissions for WordPress files.
     
+    Only the owner is fixed by default; restored sites may rely on
+    modes such as a read-only wp-config.php.
+    
     Args:
         domain: The domain name
+        dir_mode: Octal mode to give directories (e.g. "755"), or None to keep modes
+        file_mode: Octal mode to give files (e.g. "644"), or None to keep modes
         
     Returns:
         Success status
@@ -220,6 +227,7 @@ def set_wordpress_permissions(domain: str) -> bool:
     try:
         # Import here to avoid circular imports
         from src.common.containers.container import Container
+        from src.common.containers.ownership import fix_ownership
         
         php_container_name = f"{domain}-php"
         php_container = Container(name=php_container_name)
@@ -228,8 +236,12 @@ def set_wordpress_permissions(domain: str) -> bool:
             warn(f"⚠️ PHP container ({php_container_name}) is not running. You may need to restart the website after restoration.")
             return False
             
-        php_container.exec(["chown", "-R", "www-data:www-data", "/var/www/html"], user="root")
-        info("✅ File permissions set successfully.")
+        # Restored files may carry any owner; only wrong ones are changed
+        result = fix_ownership(php_container_name, "/var/www/html",
+                               dir_mode=dir_mode, file_mode=file_mode)
+        if result is None:
+            return False
+        info(f"✅ File permissions set successfully ({result.changed} entries changed).")
         return True
     except Exception as e:
         warn(f"⚠️ Could not set permissions: {e}")
@@ -10,6 +10,7 @@ import argparse
 from typing import List, Optional, Dict, Any
 
 from src.common.logging import log_call, info, error, success, debug
+from src.common.profiling import profiled
 from src.features.backup.backup_manager import BackupManager
 from src.features.website.utils import select_website
 
@@ -346,6 +347,7 @@ def setup_parser(subparsers: argparse._SubParsersAction) -> None:
     providers_parser.set_defaults(func=handle_providers)
 
 
+@profiled("backup")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -7,6 +7,7 @@ coordinating the backup process for database and files.
 
 import os
 from src.common.logging import log_call, info, error
+from src.common.tracing import span
 
 
 @log_call
@@ -38,19 +39,24 @@ def backup_website(domain: str) -> str:
 
     try:
         # 1. Create backup directory structure
-        backup_create_structure(domain)
+        with span("step create_structure", "step"):
+            backup_create_structure(domain)
 
         # 2. Backup database
-        backup_database(domain)
+        with span("step database", "step"):
+            backup_database(domain)
 
         # 3. Backup source code (wp-content)
-        backup_files(domain)
+        with span("step files", "step"):
+            backup_files(domain)
         
         # 4. Update configuration with backup information
-        backup_update_config(domain)
+        with span("step update_config", "step"):
+            backup_update_config(domain)
 
         # 5. Finalize and add metadata
-        backup_path = backup_finalize(domain)
+        with span("step finalize", "step"):
+            backup_path = backup_finalize(domain)
 
         # Ensure we return a valid path or empty string
         if not backup_path or not isinstance(backup_path, str) or not os.path.exists(backup_path):
@@ -1,6 +1,18 @@
+import sys
+
 import click
 from src.features.cache.core.setup import setup_fastcgi_cache
+from src.features.cache.core.warmer import warm_site_cache, DEFAULT_CONCURRENCY, DEFAULT_RATE
+from src.features.cache.core.redis_manager import (
+    DEFAULT_EVICTION_POLICY,
+    EVICTION_POLICIES,
+    apply_redis_isolation,
+    get_redis_server_info,
+    get_redis_usage,
+    print_redis_usage,
+)
 from src.common.logging import info, error
+from src.common.profiling import profile_command
 
 @click.group()
 def cache_cli():
@@ -14,4 +26,52 @@ def cli_setup_fastcgi_cache(domain):
     if setup_fastcgi_cache(domain):
         info(f"FastCGI cache setup completed for {domain}")
     else:
-        error(f"Failed to set up FastCGI cache for {domain}") 
\ No newline at end of file
+        error(f"Failed to set up FastCGI cache for {domain}")
+
+@cache_cli.command("warm")
+@click.option('--domain', prompt=True, help='Domain name of the website')
+@click.option('--url-file', default=None, help='File with URLs to warm instead of the sitemap')
+@click.option('--concurrency', default=DEFAULT_CONCURRENCY, show_default=True, help='Parallel requests')
+@click.option('--rate', default=DEFAULT_RATE, show_default=True, help='Maximum requests per second')
+@click.option('--json', 'json_output', is_flag=True, help='Print the report as JSON')
+def cli_warm_cache(domain, url_file, concurrency, rate, json_output):
+    """Warm up the FastCGI cache of a website from its sitemap."""
+    report = warm_site_cache(domain, url_file=url_file, concurrency=concurrency, rate=rate)
+    if report is None:
+        error(f"Failed to warm cache for {domain}")
+        raise SystemExit(1)
+    if json_output:
+        import json
+        print(json.dumps(report.to_dict(), indent=2))
+
+@cache_cli.command("redis-isolate")
+@click.option('--domain', default=None, help='Only this website (default: all websites using Redis)')
+@click.option('--policy', type=click.Choice(EVICTION_POLICIES), default=DEFAULT_EVICTION_POLICY,
+              show_default=True, help='Eviction policy')
+def cli_redis_isolate(domain, policy):
+    """Give each website its own Redis database and apply cache-only server settings."""
+    if not apply_redis_isolation([domain] if domain else None, policy):
+        error("Failed to apply Redis isolation")
+        raise SystemExit(1)
+
+@cache_cli.command("redis-status")
+@click.option('--json', 'json_output', is_flag=True, help='Print the report as JSON')
+def cli_redis_status(json_output):
+    """Show Redis keys and memory per website."""
+    usage = get_redis_usage()
+    server = get_redis_server_info()
+    if json_output:
+        import json
+        print(json.dumps({
+            "used_memory": server.get("used_memory"),
+            "maxmemory": server.get("maxmemory"),
+            "maxmemory_policy": server.get("maxmemory_policy"),
+            "sites": [site.to_dict() for site in usage],
+        }, indent=2))
+    else:
+        print_redis_usage(usage, server)
+
+
+if __name__ == "__main__":
+    with profile_command("cache " + " ".join(sys.argv[1:2])):
+        cache_cli()
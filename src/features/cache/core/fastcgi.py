@@ -8,46 +8,20 @@ from src.common.utils.validation import is_valid_domain
 from src.features.cache.utils.cache import validate_cache_type
 from src.features.cache.utils.nginx import update_nginx_cache_config
 from src.features.wordpress.utils import (
-    deactivate_all_cache_plugins,
-    install_and_activate_plugin,
+    switch_cache_plugins,
     update_wp_config_cache,
-    get_active_plugins,
-    run_wpcli_in_wpcli_container,
 )
+from src.features.wordpress.batch import run_wpcli_commands
+from src.features.cache.core.redis_manager import setup_site_redis
 from src.features.website.utils import get_site_config, set_site_config
 from src.features.nginx.manager import reload as reload_nginx
-from src.common.utils.environment import env
-from src.features.wordpress.utils import get_wp_path
 from src.features.cache.constants import CACHE_TYPES, CACHE_PLUGINS, CACHE_SETUP_NOTICE
 from src.common.webserver.utils import get_current_webserver
 
 
 def insert_redis_defines_to_wp_config(domain: str) -> bool:
-    wp_path = get_wp_path(domain)
-    wp_config = f"{wp_path}/wp-config.php"
-    redis_host = env.get("REDIS_CONTAINER", "redis")
-    defines = [
-        f"define('WP_REDIS_HOST', '{redis_host}');\n",
-        "define('WP_REDIS_PORT', 6379);\n",
-        "define('WP_REDIS_DATABASE', 0);\n",
-        "define('RT_WP_NGINX_HELPER_CACHE_PATH','/var/cache/nginx');\n"
-    ]
-    try:
-        with open(wp_config, "r") as f:
-            lines = f.readlines()
-        # Xóa các dòng cũ nếu có
-        lines = [l for l in lines if not l.strip().startswith("define('WP_REDIS_") and "RT_WP_NGINX_HELPER_CACHE_PATH" not in l]
-        # Thêm sau <?php
-        for i, l in enumerate(lines):
-            if l.strip().startswith("<?php"):
-                lines[i+1:i+1] = defines
-                break
-        with open(wp_config, "w") as f:
-            f.writelines(lines)
-        return True
-    except Exception as e:
-        error(f"Failed to update wp-config.php for redis: {e}")
-        return False
+    # Each website gets its own Redis database and key prefix
+    return setup_site_redis(domain) is not None
 
 
 def print_cache_setup_notice(domain: str):
@@ -77,17 +51,11 @@ def setup_fastcgi_cache(domain: str) -> bool:
         error(f"Site configuration not found for {domain}")
         return False
 
-    # Deactivate all cache plugins
-    if not deactivate_all_cache_plugins(domain):
-        error("Failed to deactivate existing cache plugins.")
+    # Replace the active cache plugins
+    if not switch_cache_plugins(domain, CACHE_PLUGINS["fastcgi-cache"]):
+        error("Failed to switch cache plugins.")
         return False
 
-    # Install and activate plugins
-    for plugin_slug in CACHE_PLUGINS["fastcgi-cache"]:
-        if not install_and_activate_plugin(domain, plugin_slug):
-            error(f"Failed to install/activate plugin: {plugin_slug}")
-            return False
-
     # Update wp-config.php for cache defines
     if not update_wp_config_cache(domain, "fastcgi-cache"):
         error("Failed to update wp-config.php for cache.")
@@ -112,13 +80,12 @@ def setup_fastcgi_cache(domain: str) -> bool:
         return False
 
     # Chạy lệnh WP CLI cấu hình redis object cache
-    try:
-        if run_wpcli_in_wpcli_container(domain, ["redis", "update-dropin"] ) is None:
-            raise Exception("update-dropin failed")
-        if run_wpcli_in_wpcli_container(domain, ["redis", "enable"] ) is None:
-            raise Exception("enable failed")
-    except Exception as e:
-        error(f"Failed to configure redis object cache: {e}")
+    # The redis commands come from the plugin activated above, so they run
+    # in their own WP-CLI process
+    results = run_wpcli_commands(domain, [["redis", "update-dropin"], ["redis", "enable"]])
+    failed = next((r for r in results or [] if not r.ok), None)
+    if results is None or failed:
+        error(f"Failed to configure redis object cache: {failed.error if failed else 'WP-CLI failed'}")
         return False
 
     success(f"✅ FastCGI cache successfully set up for {domain}")
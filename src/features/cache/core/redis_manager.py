@@ -0,0 +1,530 @@
+"""
+Redis object cache allocation.
+
+All websites share one Redis server. They used to share database 0 with
+no key prefix, so a ``wp cache flush`` on one website emptied the object
+cache of every other one. The server also ran with AOF persistence and no
+memory limit, even though it only holds cache data.
+
+This module gives each website its own Redis database and key prefix,
+sizes ``maxmemory`` from the host RAM and the number of websites using
+Redis, evicts with an LFU/LRU policy and turns persistence off. Websites
+beyond the number of databases share database 0 with a prefix and
+selective flushing. It also reports key count and memory per website.
+"""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, info, warn, error, success
+from src.common.containers.container import Container
+from src.common.utils.environment import env
+from src.common.utils.system_info import get_total_ram_mb
+
+REDIS_PORT = 6379
+
+# Databases configured for new installs; database 0 is shared
+REDIS_DATABASES = 256
+SHARED_DATABASE = 0
+
+# Memory budget: per website, within a share of the host RAM
+SITE_BUDGET_MB = 64
+MIN_MAXMEMORY_MB = 128
+MAX_RAM_SHARE = 0.15
+
+DEFAULT_EVICTION_POLICY = "allkeys-lfu"
+EVICTION_POLICIES = ("allkeys-lfu", "allkeys-lru", "volatile-lfu", "volatile-lru")
+
+# Keys sampled to estimate the memory of a database
+MEMORY_SAMPLES = 64
+
+# Samples random keys of a database and returns {sampled, total bytes}
+SAMPLE_MEMORY_SCRIPT = """
+local total, sampled = 0, 0
+for i = 1, tonumber(ARGV[1]) do
+    local key = redis.call('RANDOMKEY')
+    if not key then break end
+    local size = redis.call('MEMORY', 'USAGE', key)
+    if size then
+        total = total + size
+        sampled = sampled + 1
+    end
+end
+return {sampled, total}
+"""
+
+_state_lock = threading.Lock()
+
+
+@dataclass
+class RedisAllocation:
+    """Redis database and key prefix of one website."""
+
+    domain: str
+    database: int
+    prefix: str
+
+    @property
+    def shared(self) -> bool:
+        return self.database == SHARED_DATABASE
+
+
+@dataclass
+class RedisSiteUsage:
+    """Redis keys and memory used by one website."""
+
+    domain: str
+    database: int
+    prefix: str
+    keys: int = 0
+    memory_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "database": self.database,
+            "prefix": self.prefix,
+            "keys": self.keys,
+            "memory_mb": round(self.memory_bytes / 1048576, 2) if self.memory_bytes is not None else None,
+        }
+
+
+def get_redis_container_name() -> str:
+    return env.get("REDIS_CONTAINER_NAME", "wpdocker_redis")
+
+
+def redis_cli(args: List[str], database: int = SHARED_DATABASE) -> Optional[str]:
+    """
+    Run redis-cli inside the Redis container.
+
+    Args:
+        args: redis-cli arguments
+        database: Database to select
+
+    Returns:
+        Optional[str]: Command output, or None on error
+    """
+    container = Container(get_redis_container_name())
+    return container.exec(["redis-cli", "-n", str(database)] + args)
+
+
+def parse_info(output: str) -> Dict[str, str]:
+    """Parse the key:value lines of a Redis INFO reply."""
+    values = {}
+    for line in (output or "").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and ":" in line:
+            key, value = line.split(":", 1)
+            values[key] = value
+    return values
+
+
+def get_redis_databases() -> int:
+    """Get the number of databases the running Redis server has."""
+    output = redis_cli(["CONFIG", "GET", "databases"])
+    lines = (output or "").split()
+    if len(lines) == 2 and lines[1].isdigit():
+        return int(lines[1])
+    return 16
+
+
+def site_uses_redis(domain: str) -> bool:
+    """Check whether a website's wp-config.php configures the Redis object cache."""
+    wp_config = os.path.join(env["SITES_DIR"], domain, "wordpress", "wp-config.php")
+    try:
+        with open(wp_config, "r") as f:
+            return "WP_REDIS_HOST" in f.read()
+    except IOError:
+        return False
+
+
+class RedisAllocator:
+    """Assigns each website a Redis database and key prefix."""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the allocator.
+
+        Args:
+            state_file: JSON file holding the allocations (defaults to DATA_DIR)
+        """
+        self.state_file = state_file or os.path.join(env["DATA_DIR"], "redis_allocations.json")
+        self.sites: Dict[str, Dict[str, Any]] = self._load().get("sites", {})
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read Redis allocations: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist the allocations."""
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"sites": self.sites}, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def get(self, domain: str) -> Optional[RedisAllocation]:
+        """Get the allocation of a website, if it has one."""
+        entry = self.sites.get(domain)
+        if not entry:
+            return None
+        return RedisAllocation(domain=domain, database=entry["database"], prefix=entry["prefix"])
+
+    def all(self) -> List[RedisAllocation]:
+        """Get all allocations, ordered by domain."""
+        return [self.get(domain) for domain in sorted(self.sites)]
+
+    def allocate(self, domain: str, databases: Optional[int] = None) -> RedisAllocation:
+        """
+        Get the allocation of a website, assigning a free database if needed.
+
+        Args:
+            domain: Website domain name
+            databases: Databases of the Redis server (queried if None)
+
+        Returns:
+            RedisAllocation: Database and prefix of the website
+        """
+        existing = self.get(domain)
+        if existing:
+            return existing
+
+        databases = databases or get_redis_databases()
+        used = {entry["database"] for entry in self.sites.values()}
+        database = next((db for db in range(1, databases) if db not in used), SHARED_DATABASE)
+        if database == SHARED_DATABASE:
+            warn(f"⚠️ No free Redis database for {domain}, sharing database "
+                 f"{SHARED_DATABASE} with a key prefix")
+        self.sites[domain] = {"database": database, "prefix": f"{domain}:"}
+        self.save()
+        return self.get(domain)
+
+    def release(self, domain: str, flush: bool = True) -> None:
+        """
+        Free the allocation of a website.
+
+        Args:
+            domain: Website domain name
+            flush: Whether to delete the website's keys
+        """
+        allocation = self.get(domain)
+        if not allocation:
+            return
+        if flush:
+            flush_site_cache(allocation)
+        del self.sites[domain]
+        self.save()
+
+
+def flush_site_cache(allocation: RedisAllocation) -> bool:
+    """
+    Delete the Redis keys of one website.
+
+    Args:
+        allocation: Allocation of the website
+
+    Returns:
+        bool: True if the keys were deleted, False otherwise
+    """
+    if not allocation.shared:
+        return redis_cli(["FLUSHDB", "ASYNC"], allocation.database) is not None
+    # Shared database: only the keys under the website's prefix
+    script = ("local n = 0 for _, k in ipairs(redis.call('KEYS', ARGV[1])) do "
+              "redis.call('UNLINK', k) n = n + 1 end return n")
+    return redis_cli(["EVAL", script, "0", f"{allocation.prefix}*"], allocation.database) is not None
+
+
+def recommend_maxmemory_mb(site_count: int, total_ram_mb: Optional[int] = None) -> int:
+    """
+    Size maxmemory for a number of websites on this host.
+
+    Args:
+        site_count: Websites using Redis
+        total_ram_mb: Host RAM (detected if None)
+
+    Returns:
+        int: maxmemory in MB
+    """
+    total_ram_mb = total_ram_mb or get_total_ram_mb()
+    ceiling = max(MIN_MAXMEMORY_MB, int(total_ram_mb * MAX_RAM_SHARE))
+    return min(ceiling, max(MIN_MAXMEMORY_MB, site_count * SITE_BUDGET_MB))
+
+
+def get_redis_server_settings(site_count: int, policy: str = DEFAULT_EVICTION_POLICY) -> Dict[str, str]:
+    """
+    Get the cache-only server settings for a number of websites.
+
+    Args:
+        site_count: Websites using Redis
+        policy: Eviction policy
+
+    Returns:
+        Dict[str, str]: Redis config values
+    """
+    if policy not in EVICTION_POLICIES:
+        raise ValueError(f"Unsupported eviction policy: {policy}")
+    return {
+        "maxmemory": f"{recommend_maxmemory_mb(site_count)}mb",
+        "maxmemory-policy": policy,
+        "appendonly": "no",
+        "save": "",
+    }
+
+
+def format_server_command(settings: Dict[str, str], databases: int = REDIS_DATABASES) -> str:
+    """Build the redis-server command line for the compose file."""
+    args = [f"--databases {databases}"]
+    for key, value in settings.items():
+        args.append(f'--{key} "{value}"' if value == "" else f"--{key} {value}")
+    return "redis-server " + " ".join(args)
+
+
+@log_call
+def apply_redis_server_settings(settings: Dict[str, str]) -> bool:
+    """
+    Apply server settings to the running Redis and its compose file.
+
+    The running server is changed with CONFIG SET. The compose file gets the
+    same settings so they survive a restart; a new number of databases only
+    takes effect then.
+
+    Args:
+        settings: Redis config values
+
+    Returns:
+        bool: True if the running server accepted every setting, False otherwise
+    """
+    ok = True
+    for key, value in settings.items():
+        if redis_cli(["CONFIG", "SET", key, value]) is None:
+            error(f"❌ Redis rejected {key} {value!r}")
+            ok = False
+
+    compose_file = os.path.join(env["INSTALL_DIR"], "docker-compose", "docker-compose.redis.yml")
+    try:
+        with open(compose_file, "r") as f:
+            content = f.read()
+        databases = re.search(r"--databases\s+(\d+)", content)
+        command = format_server_command(
+            settings, int(databases.group(1)) if databases else REDIS_DATABASES)
+        updated = re.sub(r"(?m)^(\s*command:\s*).*$", lambda m: m.group(1) + command, content, count=1)
+        if updated != content:
+            with open(compose_file, "w") as f:
+                f.write(updated)
+            debug(f"Updated Redis command in {compose_file}")
+    except IOError as e:
+        warn(f"⚠️ Could not update {compose_file}: {e}")
+    return ok
+
+
+def write_redis_defines(domain: str, allocation: RedisAllocation) -> bool:
+    """
+    Point a website's Redis object cache at its database and prefix.
+
+    Args:
+        domain: Website domain name
+        allocation: Allocation of the website
+
+    Returns:
+        bool: True if wp-config.php was updated, False otherwise
+    """
+    wp_config = os.path.join(env["SITES_DIR"], domain, "wordpress", "wp-config.php")
+    defines = [
+        f"define('WP_REDIS_HOST', '{get_redis_container_name()}');\n",
+        f"define('WP_REDIS_PORT', {REDIS_PORT});\n",
+        f"define('WP_REDIS_DATABASE', {allocation.database});\n",
+        f"define('WP_REDIS_PREFIX', '{allocation.prefix}');\n",
+        # Flush only this website's keys, even in a shared database
+        "define('WP_REDIS_SELECTIVE_FLUSH', true);\n",
+        "define('RT_WP_NGINX_HELPER_CACHE_PATH','/var/cache/nginx');\n",
+    ]
+    try:
+        with open(wp_config, "r") as f:
+            lines = f.readlines()
+        lines = [l for l in lines
+                 if not l.strip().startswith("define('WP_REDIS_") and "RT_WP_NGINX_HELPER_CACHE_PATH" not in l]
+        for i, l in enumerate(lines):
+            if l.strip().startswith("<?php"):
+                lines[i + 1:i + 1] = defines
+                break
+        with open(wp_config, "w") as f:
+            f.writelines(lines)
+        return True
+    except Exception as e:
+        error(f"Failed to update wp-config.php for redis: {e}")
+        return False
+
+
+@log_call
+def setup_site_redis(domain: str, policy: str = DEFAULT_EVICTION_POLICY) -> Optional[RedisAllocation]:
+    """
+    Give a website its own Redis database and prefix and resize the server.
+
+    Args:
+        domain: Website domain name
+        policy: Eviction policy
+
+    Returns:
+        Optional[RedisAllocation]: Allocation of the website, or None on error
+    """
+    with _state_lock:
+        allocator = RedisAllocator()
+        allocation = allocator.allocate(domain)
+        site_count = len(allocator.sites)
+    if not write_redis_defines(domain, allocation):
+        return None
+    apply_redis_server_settings(get_redis_server_settings(site_count, policy))
+    return allocation
+
+
+@log_call
+def release_site_redis(domain: str) -> None:
+    """
+    Delete a website's Redis keys and free its database.
+
+    Args:
+        domain: Website domain name
+    """
+    with _state_lock:
+        RedisAllocator().release(domain)
+
+
+@log_call
+def apply_redis_isolation(domains: Optional[List[str]] = None,
+                          policy: str = DEFAULT_EVICTION_POLICY) -> bool:
+    """
+    Move websites using Redis to their own databases and apply server settings.
+
+    Args:
+        domains: Websites to update (all websites using Redis if None)
+        policy: Eviction policy
+
+    Returns:
+        bool: True if every website and the server were updated, False otherwise
+    """
+    from src.features.website.utils import website_list
+
+    domains = [d for d in (domains or website_list()) if site_uses_redis(d)]
+    ok = True
+    with _state_lock:
+        allocator = RedisAllocator()
+        databases = get_redis_databases()
+        for domain in domains:
+            allocation = allocator.allocate(domain, databases)
+            if write_redis_defines(domain, allocation):
+                info(f"🔐 {domain}: Redis database {allocation.database}, prefix '{allocation.prefix}'")
+            else:
+                ok = False
+        site_count = len(allocator.sites)
+
+    settings = get_redis_server_settings(site_count, policy)
+    ok = apply_redis_server_settings(settings) and ok
+    if ok:
+        success(f"✅ Redis: {len(domains)} website(s) isolated, maxmemory {settings['maxmemory']}, "
+                f"policy {policy}, persistence off")
+    return ok
+
+
+def _sample_memory(database: int) -> Optional[float]:
+    """Average memory per key of a database, from a random sample."""
+    output = redis_cli(["EVAL", SAMPLE_MEMORY_SCRIPT, "0", str(MEMORY_SAMPLES)], database)
+    values = [int(v) for v in (output or "").split() if v.isdigit()]
+    if len(values) != 2 or not values[0]:
+        return None
+    return values[1] / values[0]
+
+
+@log_call
+def get_redis_usage(allocations: Optional[List[RedisAllocation]] = None) -> List[RedisSiteUsage]:
+    """
+    Count the keys and estimate the memory of each website in Redis.
+
+    Memory is estimated from a sample of keys, so it is cheap to compute
+    on large caches.
+
+    Args:
+        allocations: Websites to report (all allocated websites if None)
+
+    Returns:
+        List[RedisSiteUsage]: Usage of each website
+    """
+    allocations = allocations if allocations is not None else RedisAllocator().all()
+    keyspace = {}
+    for key, value in parse_info(redis_cli(["INFO", "keyspace"])).items():
+        stats = dict(item.split("=", 1) for item in value.split(",") if "=" in item)
+        if key.startswith("db") and key[2:].isdigit():
+            keyspace[int(key[2:])] = int(stats.get("keys", 0))
+
+    usage = []
+    averages: Dict[int, Optional[float]] = {}
+    for allocation in allocations:
+        site = RedisSiteUsage(domain=allocation.domain, database=allocation.database,
+                              prefix=allocation.prefix)
+        if allocation.shared:
+            output = redis_cli(["--scan", "--pattern", f"{allocation.prefix}*"], allocation.database)
+            site.keys = len((output or "").splitlines())
+        else:
+            site.keys = keyspace.get(allocation.database, 0)
+        if site.keys:
+            if allocation.database not in averages:
+                averages[allocation.database] = _sample_memory(allocation.database)
+            average = averages[allocation.database]
+            site.memory_bytes = int(average * site.keys) if average is not None else None
+        else:
+            site.memory_bytes = 0
+        usage.append(site)
+    return usage
+
+
+def get_redis_server_info() -> Dict[str, str]:
+    """Get the memory and persistence state of the Redis server."""
+    values = parse_info(redis_cli(["INFO", "memory"]))
+    values.update(parse_info(redis_cli(["INFO", "persistence"])))
+    return values
+
+
+def print_redis_usage(usage: List[RedisSiteUsage], server: Dict[str, str]) -> None:
+    """
+    Print per-website Redis usage.
+
+    Args:
+        usage: Usage of each website
+        server: Output of get_redis_server_info
+    """
+    console = Console()
+    if server:
+        maxmemory = int(server.get("maxmemory", "0") or 0)
+        console.print(
+            f"[bold]Redis[/bold]: {server.get('used_memory_human', '?')} used of "
+            f"{f'{maxmemory / 1048576:.0f}M' if maxmemory else 'unlimited'}, "
+            f"policy {server.get('maxmemory_policy', '?')}, "
+            f"AOF {'on' if server.get('aof_enabled') == '1' else 'off'}")
+
+    table = Table(title="🧠 Redis Object Cache per Website", header_style="bold cyan")
+    table.add_column("Website", style="bold white")
+    table.add_column("DB", justify="right")
+    table.add_column("Prefix")
+    table.add_column("Keys", justify="right")
+    table.add_column("Memory", justify="right")
+    for site in usage:
+        table.add_row(
+            site.domain,
+            f"{site.database}{' (shared)' if site.database == SHARED_DATABASE else ''}",
+            site.prefix,
+            str(site.keys),
+            f"{site.memory_bytes / 1048576:.1f} MB" if site.memory_bytes is not None else "-",
+        )
+    console.print(table)
@@ -0,0 +1,440 @@
+"""
+FastCGI cache warm-up crawler.
+
+After a cache install, a purge, a restore or a PHP version change the
+FastCGI cache is cold and the first visitors pay the full PHP-FPM cost.
+This module reads the site's sitemap (or a plain URL list), requests the
+pages concurrently against the local NGINX at a bounded rate and records
+which URLs ended up as a cache HIT via the ``X-FastCGI-Cache`` header.
+"""
+
+import asyncio
+import json
+import os
+import time
+import warnings
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+
+from src.common.logging import log_call, debug, info, warn, error
+from src.common.utils.environment import env
+
+# Header added by features/nginx/configs/cache/fastcgi-cache.conf
+CACHE_STATUS_HEADER = "X-FastCGI-Cache"
+
+# Sitemaps tried in order when no URL list is given
+SITEMAP_CANDIDATES = ["/wp-sitemap.xml", "/sitemap_index.xml", "/sitemap.xml"]
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 10.0          # requests per second
+DEFAULT_TIMEOUT = 30         # seconds per request
+DEFAULT_MAX_URLS = 500
+
+@dataclass
+class WarmResult:
+    """Outcome of warming a single URL."""
+
+    path: str
+    status_code: Optional[int] = None
+    cache_status: Optional[str] = None
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def is_hit(self) -> bool:
+        return (self.cache_status or "").upper() == "HIT"
+
+
+@dataclass
+class WarmReport:
+    """Aggregated result of a warm-up run for one website."""
+
+    domain: str
+    started_at: str
+    duration: float = 0.0
+    results: List[WarmResult] = field(default_factory=list)
+
+    @property
+    def hits(self) -> List[str]:
+        return [r.path for r in self.results if r.is_hit]
+
+    @property
+    def misses(self) -> List[str]:
+        return [r.path for r in self.results if not r.is_hit and not r.error]
+
+    @property
+    def errors(self) -> List[str]:
+        return [r.path for r in self.results if r.error]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get a compact summary of the run.
+
+        Returns:
+            Dict[str, Any]: Counts and duration of the run
+        """
+        return {
+            "domain": self.domain,
+            "started_at": self.started_at,
+            "duration": round(self.duration, 2),
+            "total": len(self.results),
+            "hit": len(self.hits),
+            "miss": len(self.misses),
+            "error": len(self.errors),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a dictionary.
+
+        Returns:
+            Dict[str, Any]: Summary plus per-URL results
+        """
+        data = self.summary()
+        data["results"] = [
+            {
+                "path": r.path,
+                "status_code": r.status_code,
+                "cache_status": r.cache_status,
+                "elapsed_ms": round(r.elapsed_ms, 1),
+                "error": r.error,
+            }
+            for r in self.results
+        ]
+        return data
+
+
+class CacheWarmer:
+    """Crawls a website through the local NGINX to populate its FastCGI cache."""
+
+    def __init__(self, domain: str, host: str = "127.0.0.1",
+                 concurrency: int = DEFAULT_CONCURRENCY, rate: float = DEFAULT_RATE,
+                 timeout: int = DEFAULT_TIMEOUT, max_urls: int = DEFAULT_MAX_URLS,
+                 verify_tls: bool = False):
+        """
+        Initialize the warmer.
+
+        Args:
+            domain: Website domain name (sent as the Host header)
+            host: Address of the local NGINX
+            concurrency: Maximum number of requests in flight
+            rate: Maximum number of requests started per second
+            timeout: Timeout for each request in seconds
+            max_urls: Maximum number of URLs to warm in one run
+            verify_tls: Whether to verify the site's certificate
+        """
+        self.domain = domain
+        self.host = host
+        self.concurrency = max(1, int(concurrency))
+        self.rate = max(0.1, float(rate))
+        self.timeout = timeout
+        self.max_urls = max_urls
+        self.verify_tls = verify_tls
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Host": domain,
+            "User-Agent": "wpdocker-cache-warmer",
+        })
+
+    @contextmanager
+    def _quiet_tls_warnings(self) -> Iterator[None]:
+        """
+        Silence urllib3's unverified-HTTPS warning for this warmer's requests.
+
+        Self-signed certificates are the default for new sites. The filter is
+        restored on exit, so other requests in the process still warn.
+        """
+        with warnings.catch_warnings():
+            if not self.verify_tls:
+                warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
+            yield
+
+    def _get(self, path: str) -> requests.Response:
+        """
+        Request a path from the local NGINX for this website.
+
+        Args:
+            path: Path including query string
+
+        Returns:
+            requests.Response: Response without following redirects
+        """
+        return self.session.get(
+            f"https://{self.host}{path}",
+            timeout=self.timeout,
+            verify=self.verify_tls,
+            allow_redirects=False,
+        )
+
+    def _to_path(self, url: str) -> Optional[str]:
+        """
+        Convert an absolute URL from a sitemap to a local path.
+
+        Args:
+            url: Absolute or relative URL
+
+        Returns:
+            Optional[str]: Path with query string, or None for other hosts
+        """
+        url = url.strip()
+        if not url:
+            return None
+        if url.startswith("/"):
+            return url
+        parts = urlsplit(url)
+        netloc = parts.netloc.lower()
+        if netloc not in (self.domain, f"www.{self.domain}"):
+            return None
+        path = parts.path or "/"
+        return f"{path}?{parts.query}" if parts.query else path
+
+    def _read_sitemap(self, path: str, seen: set) -> List[str]:
+        """
+        Read a sitemap or sitemap index recursively.
+
+        Args:
+            path: Path of the sitemap on the website
+            seen: Sitemaps already visited
+
+        Returns:
+            List[str]: Page paths found in the sitemap
+        """
+        if path in seen or len(seen) > 50:
+            return []
+        seen.add(path)
+
+        try:
+            response = self._get(path)
+        except requests.RequestException as e:
+            debug(f"Could not fetch sitemap {path}: {e}")
+            return []
+        if response.status_code != 200:
+            return []
+
+        try:
+            root = ET.fromstring(response.content)
+        except ET.ParseError as e:
+            debug(f"Invalid sitemap XML at {path}: {e}")
+            return []
+
+        paths: List[str] = []
+        if root.tag.endswith("sitemapindex"):
+            for loc in root.iter(f"{SITEMAP_NS}loc"):
+                child = self._to_path(loc.text or "")
+                if child:
+                    paths.extend(self._read_sitemap(child, seen))
+                if len(paths) >= self.max_urls:
+                    break
+        else:
+            for loc in root.iter(f"{SITEMAP_NS}loc"):
+                page = self._to_path(loc.text or "")
+                if page:
+                    paths.append(page)
+        return paths
+
+    @log_call
+    def discover_urls(self) -> List[str]:
+        """
+        Discover the URLs to warm from the website's sitemap.
+
+        Returns:
+            List[str]: Unique page paths, home page first
+        """
+        paths = ["/"]
+        for candidate in SITEMAP_CANDIDATES:
+            found = self._read_sitemap(candidate, set())
+            if found:
+                debug(f"Found {len(found)} URLs in {candidate} for {self.domain}")
+                paths.extend(found)
+                break
+        else:
+            warn(f"⚠️ No sitemap found for {self.domain}, warming home page only")
+        return self._dedupe(paths)
+
+    def load_url_list(self, file_path: str) -> List[str]:
+        """
+        Load URLs to warm from a file with one URL or path per line.
+
+        Args:
+            file_path: Path to the URL list
+
+        Returns:
+            List[str]: Unique page paths
+        """
+        paths = []
+        with open(file_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                path = self._to_path(line)
+                if path:
+                    paths.append(path)
+        return self._dedupe(paths)
+
+    def _dedupe(self, paths: List[str]) -> List[str]:
+        unique = list(dict.fromkeys(paths))
+        return unique[:self.max_urls]
+
+    async def _fetch(self, path: str, verify: bool,
+                     throttle: Callable[[], Awaitable[None]]) -> WarmResult:
+        """
+        Warm a single path, optionally requesting it again to confirm a HIT.
+
+        Args:
+            path: Page path
+            verify: Whether to re-request pages that were not a HIT
+            throttle: Waits for a request slot; every request takes one
+
+        Returns:
+            WarmResult: Result for the path
+        """
+        result = WarmResult(path=path)
+        start = time.monotonic()
+        try:
+            await throttle()
+            response = await asyncio.to_thread(self._get, path)
+            if verify and response.headers.get(CACHE_STATUS_HEADER, "").upper() in ("MISS", "EXPIRED"):
+                await throttle()
+                response = await asyncio.to_thread(self._get, path)
+            result.status_code = response.status_code
+            result.cache_status = response.headers.get(CACHE_STATUS_HEADER)
+        except requests.RequestException as e:
+            result.error = str(e)
+        result.elapsed_ms = (time.monotonic() - start) * 1000
+        return result
+
+    async def _warm_all(self, paths: List[str], verify: bool) -> List[WarmResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        interval = 1.0 / self.rate
+        lock = asyncio.Lock()
+        next_slot = [time.monotonic()]
+
+        async def throttle() -> None:
+            # Space out request starts so the site never sees more than `rate` req/s
+            async with lock:
+                now = time.monotonic()
+                wait = next_slot[0] - now
+                next_slot[0] = max(now, next_slot[0]) + interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        async def worker(path: str) -> WarmResult:
+            async with semaphore:
+                return await self._fetch(path, verify, throttle)
+
+        return await asyncio.gather(*(worker(p) for p in paths))
+
+    @log_call
+    def warm(self, paths: Optional[List[str]] = None, verify: bool = True) -> WarmReport:
+        """
+        Warm the cache for the given paths, or for the sitemap if none given.
+
+        Args:
+            paths: Page paths to warm
+            verify: Whether to re-request MISS pages to confirm they became a HIT
+
+        Returns:
+            WarmReport: Report of the run
+        """
+        report = WarmReport(domain=self.domain, started_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+        # Worker threads share the process filters, so set them once around
+        # the whole run rather than per request
+        with self._quiet_tls_warnings():
+            if paths is None:
+                paths = self.discover_urls()
+            if not paths:
+                warn(f"⚠️ No URLs to warm for {self.domain}")
+                return report
+
+            info(f"🔥 Warming {len(paths)} URLs for {self.domain} "
+                 f"(concurrency={self.concurrency}, rate={self.rate}/s)")
+            start = time.monotonic()
+            try:
+                report.results = asyncio.run(self._warm_all(paths, verify))
+            finally:
+                self.session.close()
+        report.duration = time.monotonic() - start
+        return report
+
+
+def get_warm_report_path(domain: str) -> str:
+    """
+    Get the path of the last warm-up report for a website.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        str: Path of the JSON report inside the site's logs directory
+    """
+    return os.path.join(env["SITES_DIR"], domain, "logs", "cache_warm.json")
+
+
+def save_warm_report(report: WarmReport) -> None:
+    """
+    Save a warm-up report next to the site's logs.
+
+    Args:
+        report: Report to save
+    """
+    report_path = get_warm_report_path(report.domain)
+    try:
+        with open(report_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        debug(f"Cache warm report saved to {report_path}")
+    except IOError as e:
+        error(f"❌ Could not save cache warm report: {e}")
+
+
+@log_call
+def warm_site_cache(domain: str, url_file: Optional[str] = None,
+                    concurrency: int = DEFAULT_CONCURRENCY,
+                    rate: float = DEFAULT_RATE) -> Optional[WarmReport]:
+    """
+    Warm the FastCGI cache of a website and save the report.
+
+    Args:
+        domain: Website domain name
+        url_file: Optional file with URLs to warm instead of the sitemap
+        concurrency: Maximum number of requests in flight
+        rate: Maximum number of requests started per second
+
+    Returns:
+        Optional[WarmReport]: Report of the run, or None on error
+    """
+    from src.features.website.utils import get_site_config
+
+    site_config = get_site_config(domain)
+    if not site_config:
+        error(f"Site configuration not found for {domain}")
+        return None
+    if site_config.cache != "fastcgi-cache":
+        warn(f"⚠️ {domain} uses cache '{site_config.cache}', "
+             f"{CACHE_STATUS_HEADER} will not be reported")
+
+    warmer = CacheWarmer(domain, concurrency=concurrency, rate=rate)
+    try:
+        paths = warmer.load_url_list(url_file) if url_file else None
+    except IOError as e:
+        error(f"❌ Could not read URL list {url_file}: {e}")
+        return None
+
+    report = warmer.warm(paths)
+    save_warm_report(report)
+
+    summary = report.summary()
+    info(f"✅ Cache warm-up for {domain}: {summary['hit']}/{summary['total']} HIT, "
+         f"{summary['miss']} not cached, {summary['error']} errors in {summary['duration']}s")
+    return report
@@ -12,6 +12,7 @@ from src.features.cache.core.setup import setup_fastcgi_cache, setup_cache
 from src.common.logging import info, error, debug, success
 from src.features.website.utils import select_website
 from src.features.cache.constants import CACHE_TYPES
+from src.features.cache.core.warmer import warm_site_cache
 
 def not_implemented() -> None:
     """Handle not implemented features."""
@@ -43,6 +44,7 @@ def prompt_cache_menu() -> None:
                 {"name": f"3. Cài đặt {CACHE_TYPES[2].replace('-', ' ').title()} cho WordPress", "value": CACHE_TYPES[2]},
                 {"name": f"4. Cài đặt {CACHE_TYPES[3].replace('-', ' ').title()} cho WordPress", "value": CACHE_TYPES[3]},
                 {"name": f"5. Tắt toàn bộ cache (No Cache)", "value": CACHE_TYPES[4]},
+                {"name": "6. Làm nóng cache (Cache warm-up)", "value": "warm"},
                 {"name": "0. Quay lại menu chính", "value": "exit"},
             ]
         ).ask()
@@ -55,5 +57,11 @@ def prompt_cache_menu() -> None:
                 info(f"Đã cài đặt {answer} thành công cho {domain}")
             else:
                 error(f"Cài đặt {answer} thất bại cho {domain}")
+        elif answer == "warm":
+            domain = select_website("Chọn website cần làm nóng cache:")
+            if not domain:
+                info("Không có website nào hoặc thao tác bị hủy. Quay lại menu.")
+                continue
+            warm_site_cache(domain)
         elif answer == "exit":
             break
\ No newline at end of file
@@ -5,11 +5,9 @@ This package provides functionality for scheduling and managing cron jobs,
 including creating, updating, and monitoring scheduled tasks.
 """
 
-from src.features.cron.cron_manager import CronManager
-from src.features.cron.models import CronJob, JobResult
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'CronManager',
-    'CronJob',
-    'JobResult'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.cron.cron_manager": ["CronManager"],
+    "src.features.cron.models": ["CronJob", "JobResult"],
+})
@@ -5,28 +5,46 @@ This module provides a registry for job runners based on job type,
 allowing appropriate runners to be selected for different job types.
 """
 
+import importlib
 from typing import Dict, Type, Optional, Any
 
 
-# Import runner classes
-def _import_runners():
-    """Import all runner classes."""
-    from src.features.cron.runners.base_runner import BaseRunner
-    
-    try:
-        from src.features.cron.runners.backup_runner import BackupRunner
-        return {
-            "backup": BackupRunner
-        }
-    except ImportError:
-        # If backup runner is not available, return empty registry
-        return {}
+# Job types whose target_id is a website domain
+WEBSITE_JOB_TYPES = ["backup", "cache_warm"]
+
+
+# Runner class of each job type, imported only when a job of that type runs
+RUNNER_CLASSES: Dict[str, str] = {
+    "backup": "src.features.cron.runners.backup_runner.BackupRunner",
+    "cache_warm": "src.features.cron.runners.cache_warm_runner.CacheWarmRunner",
+    "access_stats": "src.features.cron.runners.access_stats_runner.AccessStatsRunner",
+    "log_rotate": "src.features.cron.runners.log_rotate_runner.LogRotateRunner",
+    "fpm_rebalance": "src.features.cron.runners.fpm_rebalance_runner.FpmRebalanceRunner",
+    "php_memory_sample": "src.features.cron.runners.php_memory_runner.PhpMemoryRunner",
+    "php_image_warmup": "src.features.cron.runners.php_image_runner.PhpImageWarmupRunner",
+    "mysql_slowlog": "src.features.cron.runners.mysql_slowlog_runner.MySQLSlowLogRunner",
+    "ssl_expiry": "src.features.cron.runners.ssl_expiry_runner.SslExpiryRunner",
+    "ssl_renew": "src.features.cron.runners.ssl_renew_runner.SslRenewRunner",
+}
 
 
 # Job type to runner class mapping
 _RUNNERS: Dict[str, Type] = {}
 
 
+def _import_runner(job_type: str) -> Optional[Type]:
+    """Import the runner class of a job type."""
+    path = RUNNER_CLASSES.get(job_type)
+    if not path:
+        return None
+    module_name, class_name = path.rsplit(".", 1)
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        # If the runner is not available, skip it
+        return None
+
+
 def get_runner_for_job_type(job_type: str) -> Optional[Type]:
     """
     Get the appropriate runner class for a job type.
@@ -37,12 +55,13 @@ def get_runner_for_job_type(job_type: str) -> Optional[Type]:
     Returns:
         Runner class or None if not found
     """
-    global _RUNNERS
-    
-    if not _RUNNERS:
-        _RUNNERS = _import_runners()
+    if job_type not in _RUNNERS:
+        runner = _import_runner(job_type)
+        if runner is None:
+            return None
+        _RUNNERS[job_type] = runner
         
-    return _RUNNERS.get(job_type)
+    return _RUNNERS[job_type]
 
 
 def get_available_job_types() -> list:
@@ -52,9 +71,4 @@ def get_available_job_types() -> list:
     Returns:
         List of job type names
     """
-    global _RUNNERS
-    
-    if not _RUNNERS:
-        _RUNNERS = _import_runners()
-        
-    return list(_RUNNERS.keys())
\ No newline at end of file
+    return list(RUNNER_CLASSES.keys())
\ No newline at end of file
@@ -373,10 +373,10 @@ def add_cron_job() -> None:
         return
     
     # Get target ID (e.g., website domain for backup tasks)
-    if job_type == "backup":
-        # For backup jobs, get the website domain
+    if job_type in job_registry.WEBSITE_JOB_TYPES:
+        # For website jobs, get the website domain
         from src.features.website.utils import select_website
-        target_id = select_website("Select website to backup:")
+        target_id = select_website(f"Select website for {job_type} task:")
         
         if not target_id:
             info("Operation cancelled.")
@@ -471,6 +471,37 @@ def add_cron_job() -> None:
         if retention_count:
             parameters["retention_count"] = int(retention_count)
     
+    elif job_type == "cache_warm":
+        # For cache warm-up jobs, ask how hard to crawl the site
+        concurrency = questionary.select(
+            "Select number of parallel requests:",
+            choices=[
+                {"name": "2", "value": 2},
+                {"name": "4", "value": 4},
+                {"name": "8", "value": 8}
+            ],
+            style=custom_style
+        ).ask()
+        
+        if concurrency:
+            parameters["concurrency"] = int(concurrency)
+
+    elif job_type == "log_rotate":
+        # For log rotation jobs, ask how many rotated generations to keep
+        keep = questionary.select(
+            "Select how many rotated logs to keep (site setting if unchanged):",
+            choices=[
+                {"name": "Use site setting", "value": 0},
+                {"name": "7", "value": 7},
+                {"name": "14", "value": 14},
+                {"name": "30", "value": 30}
+            ],
+            style=custom_style
+        ).ask()
+
+        if keep:
+            parameters["keep"] = int(keep)
+
     # Create the job
     job = CronJob(
         job_type=job_type,
@@ -5,10 +5,18 @@ This package contains runners for different types of cron jobs,
 each implementing the BaseRunner interface.
 """
 
-from src.features.cron.runners.base_runner import BaseRunner
-from src.features.cron.runners.backup_runner import BackupRunner
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'BaseRunner',
-    'BackupRunner'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.cron.runners.base_runner": ["BaseRunner"],
+    "src.features.cron.runners.backup_runner": ["BackupRunner"],
+    "src.features.cron.runners.cache_warm_runner": ["CacheWarmRunner"],
+    "src.features.cron.runners.access_stats_runner": ["AccessStatsRunner"],
+    "src.features.cron.runners.log_rotate_runner": ["LogRotateRunner"],
+    "src.features.cron.runners.fpm_rebalance_runner": ["FpmRebalanceRunner"],
+    "src.features.cron.runners.php_memory_runner": ["PhpMemoryRunner"],
+    "src.features.cron.runners.php_image_runner": ["PhpImageWarmupRunner"],
+    "src.features.cron.runners.mysql_slowlog_runner": ["MySQLSlowLogRunner"],
+    "src.features.cron.runners.ssl_expiry_runner": ["SslExpiryRunner"],
+    "src.features.cron.runners.ssl_renew_runner": ["SslRenewRunner"],
+})
@@ -0,0 +1,49 @@
+"""
+Access statistics job runner.
+
+This module provides a runner that reads new access log lines
+and updates per-site cache and latency statistics.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.nginx.analytics import AccessLogAnalyzer
+
+
+class AccessStatsRunner(BaseRunner):
+    """Runner for access statistics jobs."""
+
+    def run(self) -> bool:
+        """
+        Run an access statistics job.
+
+        The target is a website domain, or "all" for every website.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        target = self.job.target_id
+        domains = None if not target or target == "all" else [target]
+
+        try:
+            analyzer = AccessLogAnalyzer()
+            stats_list = analyzer.update_all(domains)
+        except Exception as e:
+            error_msg = f"Error updating access statistics: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        for stats in stats_list:
+            summary = stats.summary(top=0)
+            self.job_result.details[stats.domain] = {
+                "requests": summary["requests"],
+                "hit_ratio": summary["hit_ratio"],
+                "p95_ms": summary["p95_ms"],
+            }
+        self.log(f"Updated access statistics for {len(stats_list)} website(s)")
+        info(f"Access statistics updated for {len(stats_list)} website(s)")
+        return True
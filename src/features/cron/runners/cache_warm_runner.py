@@ -0,0 +1,64 @@
+"""
+Cache warm-up job runner.
+
+This module provides a runner for cache warm-up jobs,
+crawling a website to keep its FastCGI cache populated.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.cache.core.warmer import (
+    warm_site_cache,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE
+)
+
+
+class CacheWarmRunner(BaseRunner):
+    """Runner for cache warm-up jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a cache warm-up job.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        domain = self.job.target_id
+        if not domain:
+            error_msg = "Cache warm job failed: domain (target_id) is empty or None"
+            self.log(error_msg)
+            error(error_msg)
+            return False
+
+        parameters = self.job.parameters or {}
+        concurrency = parameters.get("concurrency", DEFAULT_CONCURRENCY)
+        rate = parameters.get("rate", DEFAULT_RATE)
+        url_file = parameters.get("url_file")
+
+        self.log(f"Starting cache warm-up of {domain} (concurrency={concurrency}, rate={rate}/s)")
+        info(f"Running cache warm job for {domain}")
+
+        try:
+            report = warm_site_cache(domain, url_file=url_file,
+                                     concurrency=concurrency, rate=rate)
+        except Exception as e:
+            error_msg = f"Error running cache warm job for {domain}: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        if report is None:
+            self.log(f"Cache warm-up failed for {domain}")
+            return False
+
+        summary = report.summary()
+        self.job_result.details.update(summary)
+        self.log(f"Warmed {summary['total']} URLs: {summary['hit']} HIT, "
+                 f"{summary['miss']} not cached, {summary['error']} errors")
+
+        # A run where nothing could be fetched is a failure
+        return summary["total"] == 0 or summary["error"] < summary["total"]
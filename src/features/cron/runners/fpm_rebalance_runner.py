@@ -0,0 +1,50 @@
+"""
+PHP-FPM rebalance job runner.
+
+This module provides a runner that periodically re-plans the PHP-FPM
+pools of all websites so their workers fit in the host's memory.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.php.capacity import rebalance_php_fpm
+
+
+class FpmRebalanceRunner(BaseRunner):
+    """Runner for PHP-FPM rebalance jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a PHP-FPM rebalance job.
+
+        Pools are planned together, so the target is always every website;
+        the "reserved_mb" parameter overrides the RAM kept outside PHP.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        parameters = self.job.parameters or {}
+
+        try:
+            sites = rebalance_php_fpm(reserved_mb=parameters.get("reserved_mb"),
+                                      force=parameters.get("force", False))
+        except Exception as e:
+            error_msg = f"Error rebalancing PHP-FPM pools: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        changed = [s for s in sites if s.changed]
+        for site in sites:
+            self.job_result.details[site.domain] = {
+                "worker_mb": round(site.worker_mb, 1),
+                "weight": round(site.weight, 4),
+                "max_children": site.plan.get("pm.max_children"),
+                "changed": site.changed,
+            }
+        self.log(f"Planned {len(sites)} PHP-FPM pool(s), {len(changed)} resized")
+        info(f"PHP-FPM rebalance finished: {len(changed)} of {len(sites)} pools resized")
+        return True
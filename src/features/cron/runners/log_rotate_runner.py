@@ -0,0 +1,54 @@
+"""
+Log rotation job runner.
+
+This module provides a runner that rotates, compresses and prunes
+website logs according to each site's rotation policy.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.website.log_rotate import rotate_logs
+
+# Job parameters that override the per-site rotation policy
+POLICY_PARAMETERS = ("max_size_mb", "interval_days", "keep", "compress")
+
+
+class LogRotateRunner(BaseRunner):
+    """Runner for log rotation jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a log rotation job.
+
+        The target is a website domain, or "all" for every website.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        target = self.job.target_id
+        domains = None if not target or target == "all" else [target]
+        parameters = self.job.parameters or {}
+        overrides = {k: parameters[k] for k in POLICY_PARAMETERS if k in parameters}
+
+        try:
+            results = rotate_logs(domains, overrides=overrides,
+                                  force=parameters.get("force", False))
+        except Exception as e:
+            error_msg = f"Error rotating logs: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        rotated = [r for r in results if r.rotated]
+        failed = [r for r in results if r.error]
+        for result in rotated + failed:
+            self.job_result.details[f"{result.domain}/{result.log}"] = result.to_dict()
+
+        for result in failed:
+            self.log(f"Could not rotate {result.domain}/{result.log}: {result.error}")
+        self.log(f"Rotated {len(rotated)} log file(s), {len(failed)} failed")
+        info(f"Log rotation finished: {len(rotated)} rotated, {len(failed)} failed")
+        return not failed
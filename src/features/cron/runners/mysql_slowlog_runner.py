@@ -0,0 +1,44 @@
+"""
+MySQL slow query digest job runner.
+
+This module provides a runner that periodically reads new entries from
+the MySQL slow query log into the per-site digest, which also keeps the
+log from growing without bound.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.mysql.analytics import SlowQueryDigest
+
+
+class MySQLSlowLogRunner(BaseRunner):
+    """Runner for MySQL slow query digest jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a MySQL slow query digest job.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            digest = SlowQueryDigest()
+            parsed = digest.update()
+        except Exception as e:
+            error_msg = f"Error reading MySQL slow query log: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        for summary in digest.by_database():
+            self.job_result.details[summary.domain or summary.database or "-"] = {
+                "queries": summary.queries,
+                "total_time": round(summary.total_time, 1),
+                "share": round(summary.share, 4),
+            }
+        self.log(f"Read {parsed} new slow queries")
+        info(f"MySQL slow query digest updated with {parsed} new queries")
+        return True
@@ -0,0 +1,44 @@
+"""
+PHP image warmup job runner.
+
+This module provides a runner that periodically pulls the PHP-FPM images
+so website creation and PHP version changes never wait for a download.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.php.images import PhpImageManager
+
+
+class PhpImageWarmupRunner(BaseRunner):
+    """Runner for PHP image warmup jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a PHP image warmup job.
+
+        The target is a PHP version, or "all" for every supported version.
+        Images already present are pulled again to pick up rebuilt tags.
+
+        Returns:
+            True if every image is available, False otherwise
+        """
+        target = self.job.target_id
+        versions = None if not target or target == "all" else [target]
+
+        try:
+            results = PhpImageManager().warmup(versions, refresh=True)
+        except Exception as e:
+            error_msg = f"Error warming up PHP images: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        self.job_result.details.update(results)
+        ready = sum(results.values())
+        self.log(f"{ready} of {len(results)} PHP image(s) ready")
+        info(f"PHP images warmed up: {ready}/{len(results)}")
+        return ready == len(results)
@@ -0,0 +1,49 @@
+"""
+PHP worker memory sampling job runner.
+
+This module provides a runner that periodically measures the memory
+of PHP-FPM workers so pool sizing can use measured figures.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.php.worker_memory import WorkerMemorySampler
+
+
+class PhpMemoryRunner(BaseRunner):
+    """Runner for PHP worker memory sampling jobs."""
+
+    def run(self) -> bool:
+        """
+        Run a PHP worker memory sampling job.
+
+        The target is a website domain, or "all" for every website.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        target = self.job.target_id
+        domains = None if not target or target == "all" else [target]
+
+        try:
+            sampler = WorkerMemorySampler()
+            results = sampler.sample_all(domains)
+        except Exception as e:
+            error_msg = f"Error sampling PHP worker memory: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        for domain, workers in results.items():
+            stats = sampler.stats(domain)
+            self.job_result.details[domain] = {
+                "workers": len(workers),
+                "p90_mb": round(stats.p90, 1) if stats else None,
+            }
+        sampled = sum(len(w) for w in results.values())
+        self.log(f"Sampled {sampled} PHP worker(s) across {len(results)} website(s)")
+        info(f"PHP worker memory sampled for {len(results)} website(s)")
+        return True
@@ -0,0 +1,54 @@
+"""
+SSL certificate expiry job runner.
+
+This module provides a runner that periodically scans the certificates
+of all websites and reports the ones that are expired or about to expire.
+"""
+
+import traceback
+
+from src.common.logging import info, warn, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.ssl.scanner import EXPIRY_WARNING_DAYS, scan_certificates
+
+
+class SslExpiryRunner(BaseRunner):
+    """Runner for SSL certificate expiry scans."""
+
+    def run(self) -> bool:
+        """
+        Run an SSL certificate expiry scan.
+
+        The target is a website domain, or "all" for every website; the
+        "warn_days" parameter overrides the expiry warning window.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        target = self.job.target_id
+        domains = None if not target or target == "all" else [target]
+        parameters = self.job.parameters or {}
+
+        try:
+            results = scan_certificates(
+                domains, warn_days=parameters.get("warn_days", EXPIRY_WARNING_DAYS))
+        except Exception as e:
+            error_msg = f"Error scanning SSL certificates: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        urgent = [r for r in results if r.status in ("expired", "expiring")]
+        for result in results:
+            self.job_result.details[result.domain] = {
+                "status": result.status,
+                "days_left": result.days_left,
+                "expires_at": result.expires_at,
+            }
+        for result in urgent:
+            warn(f"⚠️ SSL certificate of {result.domain} is {result.status} "
+                 f"({result.days_left} days left)")
+        self.log(f"Scanned {len(results)} certificate(s), {len(urgent)} expired or expiring")
+        info(f"SSL expiry scan finished: {len(urgent)} of {len(results)} need renewal")
+        return True
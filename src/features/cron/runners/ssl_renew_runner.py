@@ -0,0 +1,51 @@
+"""
+Let's Encrypt renewal job runner.
+
+This module provides a runner that periodically renews every due
+Let's Encrypt certificate in one certbot session.
+"""
+
+import traceback
+
+from src.common.logging import info, error, debug
+from src.features.cron.runners.base_runner import BaseRunner
+from src.features.ssl.renewal import RENEW_BEFORE_DAYS, renew_certificates
+
+
+class SslRenewRunner(BaseRunner):
+    """Runner for batched Let's Encrypt renewals."""
+
+    def run(self) -> bool:
+        """
+        Run a Let's Encrypt renewal batch.
+
+        The target is a website domain, or "all" for every website; the
+        "renew_days" parameter overrides how early certificates are renewed.
+
+        Returns:
+            True if no renewal failed, False otherwise
+        """
+        target = self.job.target_id
+        domains = None if not target or target == "all" else [target]
+        parameters = self.job.parameters or {}
+
+        try:
+            report = renew_certificates(
+                domains, renew_days=parameters.get("renew_days", RENEW_BEFORE_DAYS))
+        except Exception as e:
+            error_msg = f"Error renewing SSL certificates: {str(e)}"
+            self.log(error_msg)
+            error(error_msg)
+            debug(traceback.format_exc())
+            return False
+
+        for result in report.results:
+            self.job_result.details[result.domain] = {
+                "status": result.status,
+                "days_left": result.days_left,
+                "message": result.message,
+            }
+        self.log(f"Renewed {len(report.renewed)} of {len(report.results)} due certificate(s), "
+                 f"{len(report.failed)} failed, webserver reloaded: {report.reloaded}")
+        info(f"SSL renewal finished: {len(report.renewed)} renewed, {len(report.failed)} failed")
+        return not report.failed
@@ -1,16 +1,14 @@
 """
 Docker feature module that provides Docker installation and management functionality.
 """
-from src.features.docker.installer import (
-    install_docker_if_missing,
-    verify_docker,
-    install_docker_almalinux,
-    install_docker_general
-)
 
-__all__ = [
-    'install_docker_if_missing',
-    'verify_docker',
-    'install_docker_almalinux',
-    'install_docker_general'
-]
\ No newline at end of file
+from src.common.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.docker.installer": [
+        "install_docker_if_missing",
+        "verify_docker",
+        "install_docker_almalinux",
+        "install_docker_general",
+    ],
+})
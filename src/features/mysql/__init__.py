@@ -5,60 +5,52 @@ This package provides functionality for MySQL database operations,
 including creating, importing, exporting, and managing databases.
 """
 
-# Core database operations
-from src.features.mysql.database import (
-    create_database,
-    create_database_user,
-    grant_privileges,
-    setup_database_for_website,
-    delete_database,
-    delete_database_user
-)
+from src.common.utils.lazy import lazy_exports
 
-# Import/export functionality
-from src.features.mysql.import_export import export_database, import_database
-
-# Command execution
-from src.features.mysql.mysql_exec import run_mysql_command, run_mysql_import, run_mysql_dump
-
-# Configuration management
-from src.features.mysql.config import edit_mysql_config, backup_mysql_config, restore_mysql_config
-
-# Utilities
-from src.features.mysql.utils import get_mysql_root_password, get_domain_db_pass, detect_mysql_client
-
-# CLI interfaces
-from src.features.mysql.cli import cli_restore_database, cli_mysql_config
-
-__all__ = [
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
     # Core database operations
-    'create_database',
-    'create_database_user',
-    'grant_privileges',
-    'setup_database_for_website',
-    'delete_database',
-    'delete_database_user',
-    
+    "src.features.mysql.database": [
+        "create_database",
+        "create_database_user",
+        "grant_privileges",
+        "setup_database_for_website",
+        "delete_database",
+        "delete_database_user",
+    ],
     # Import/export functionality
-    'export_database',
-    'import_database',
-    
+    "src.features.mysql.import_export": ["export_database", "import_database"],
     # Command execution
-    'run_mysql_command',
-    'run_mysql_import',
-    'run_mysql_dump',
-    
+    "src.features.mysql.mysql_exec": ["run_mysql_command", "run_mysql_import", "run_mysql_dump"],
     # Configuration management
-    'edit_mysql_config',
-    'backup_mysql_config',
-    'restore_mysql_config',
-    
+    "src.features.mysql.config": [
+        "edit_mysql_config",
+        "backup_mysql_config",
+        "restore_mysql_config",
+    ],
+    # Workload-aware tuning
+    "src.features.mysql.tuner": ["tune_mysql", "apply_mysql_tuning"],
+    # Per-website database analysis
+    "src.features.mysql.analyzer": ["analyze_site_database", "optimize_site_database"],
+    # Slow query analytics
+    "src.features.mysql.analytics": [
+        "SlowQueryDigest",
+        "enable_slow_query_log",
+        "disable_slow_query_log",
+    ],
     # Utilities
-    'get_mysql_root_password',
-    'get_domain_db_pass',
-    'detect_mysql_client',
-    
+    "src.features.mysql.utils": [
+        "get_mysql_root_password",
+        "get_domain_db_pass",
+        "detect_mysql_client",
+    ],
     # CLI interfaces
-    'cli_restore_database',
-    'cli_mysql_config'
-]
\ No newline at end of file
+    "src.features.mysql.cli": [
+        "cli_restore_database",
+        "cli_mysql_config",
+        "cli_mysql_tune",
+        "cli_analyze_database",
+        "cli_optimize_database",
+        "cli_slow_query_log",
+        "cli_slow_query_report",
+    ],
+})
@@ -0,0 +1,34 @@
+"""
+MySQL slow query analytics.
+
+This package captures the shared MySQL server's slow query log and
+aggregates slow queries by fingerprint and by website incrementally.
+"""
+
+from src.features.mysql.analytics.slow_log import (
+    SlowQueryEntry,
+    fingerprint_query,
+    fingerprint_id,
+    parse_slow_query_log
+)
+from src.features.mysql.analytics.slow_digest import (
+    QueryDigest,
+    DatabaseSummary,
+    SlowQueryDigest,
+    enable_slow_query_log,
+    disable_slow_query_log,
+    print_slow_query_digest
+)
+
+__all__ = [
+    'SlowQueryEntry',
+    'fingerprint_query',
+    'fingerprint_id',
+    'parse_slow_query_log',
+    'QueryDigest',
+    'DatabaseSummary',
+    'SlowQueryDigest',
+    'enable_slow_query_log',
+    'disable_slow_query_log',
+    'print_slow_query_digest'
+]
@@ -0,0 +1,510 @@
+"""
+MySQL slow query capture and per-site digest.
+
+All websites share one MySQL container, so a single site's unindexed
+queries slow down every other site. This module turns on the server's
+slow query log, reads it incrementally from the container and aggregates
+the queries by fingerprint and database: count, total and p95 time, and
+rows examined. Databases map to websites through SiteConfig.mysql.db_name,
+which shows which site is saturating the server.
+
+The log is written inside the MySQL data volume. New lines are streamed
+out of the container from the last offset, and the file is truncated
+once it has been read past MAX_LOG_BYTES, since the server never rotates
+it on its own. The server writes an entry's header before its query, so
+the last entry read is left for the next run: the saved offset is where
+it starts.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn, error, success
+from src.common.containers.container import Container
+from src.common.utils.environment import env
+from src.features.mysql.analytics.slow_log import (
+    ENTRY_START_PREFIXES,
+    SlowQueryEntry,
+    fingerprint_id,
+    parse_slow_query_log
+)
+from src.features.mysql.mysql_exec import run_mysql_command
+
+SLOW_LOG_PATH = "/var/lib/mysql/slow.log"
+
+DEFAULT_LONG_QUERY_TIME = 1.0
+
+# Query times kept per fingerprint for the p95
+MAX_TIMES_PER_QUERY = 200
+
+# Distinct fingerprints kept between runs; the ones with the least total
+# time are dropped first
+MAX_TRACKED_QUERIES = 2000
+
+# Example query kept per fingerprint
+MAX_SAMPLE_LENGTH = 500
+
+# The log is truncated after it has been read past this size
+MAX_LOG_BYTES = 64 * 1024 * 1024
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass
+class QueryDigest:
+    """Aggregates of one query fingerprint in one database."""
+
+    fingerprint: str
+    database: Optional[str] = None
+    sample: str = ""
+    count: int = 0
+    total_time: float = 0.0
+    lock_time: float = 0.0
+    max_time: float = 0.0
+    rows_examined: int = 0
+    rows_sent: int = 0
+    times: List[float] = field(default_factory=list)
+    first_seen: Optional[int] = None
+    last_seen: Optional[int] = None
+
+    @property
+    def id(self) -> str:
+        return fingerprint_id(self.fingerprint)
+
+    @property
+    def p95_time(self) -> float:
+        return _percentile(self.times, 95)
+
+    def add(self, entry: SlowQueryEntry) -> None:
+        """Count one execution."""
+        self.count += 1
+        self.total_time += entry.query_time
+        self.lock_time += entry.lock_time
+        self.max_time = max(self.max_time, entry.query_time)
+        self.rows_examined += entry.rows_examined
+        self.rows_sent += entry.rows_sent
+        self.times = (self.times + [round(entry.query_time, 6)])[-MAX_TIMES_PER_QUERY:]
+        if not self.sample:
+            self.sample = entry.query[:MAX_SAMPLE_LENGTH]
+        if entry.timestamp:
+            self.first_seen = min(self.first_seen or entry.timestamp, entry.timestamp)
+            self.last_seen = max(self.last_seen or entry.timestamp, entry.timestamp)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "database": self.database,
+            "sample": self.sample,
+            "count": self.count,
+            "total_time": round(self.total_time, 6),
+            "lock_time": round(self.lock_time, 6),
+            "max_time": self.max_time,
+            "rows_examined": self.rows_examined,
+            "rows_sent": self.rows_sent,
+            "times": self.times,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QueryDigest":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+    def summary(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "domain": domain,
+            "database": self.database,
+            "fingerprint": self.fingerprint,
+            "sample": self.sample,
+            "count": self.count,
+            "total_time": round(self.total_time, 3),
+            "avg_time": round(self.total_time / self.count, 3) if self.count else 0,
+            "p95_time": round(self.p95_time, 3),
+            "max_time": round(self.max_time, 3),
+            "rows_examined": self.rows_examined,
+            "avg_rows_examined": self.rows_examined // self.count if self.count else 0,
+        }
+
+
+@dataclass
+class DatabaseSummary:
+    """Slow query totals of one database."""
+
+    database: Optional[str]
+    domain: Optional[str]
+    queries: int = 0
+    fingerprints: int = 0
+    total_time: float = 0.0
+    rows_examined: int = 0
+    share: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "database": self.database,
+            "domain": self.domain,
+            "queries": self.queries,
+            "fingerprints": self.fingerprints,
+            "total_time": round(self.total_time, 3),
+            "rows_examined": self.rows_examined,
+            "share": round(self.share, 4),
+        }
+
+
+def get_database_domains() -> Dict[str, str]:
+    """Map each website's database name to its domain."""
+    from src.features.website.utils import get_site_config, website_list
+
+    databases = {}
+    for domain in website_list():
+        site_config = get_site_config(domain)
+        if site_config and getattr(site_config, "mysql", None):
+            databases[site_config.mysql.db_name] = domain
+    return databases
+
+
+@log_call
+def enable_slow_query_log(long_query_time: float = DEFAULT_LONG_QUERY_TIME,
+                          persist: bool = True) -> bool:
+    """
+    Turn on the slow query log of the running server.
+
+    Args:
+        long_query_time: Seconds after which a query is logged
+        persist: Whether to also write the settings to the MySQL config file
+
+    Returns:
+        bool: True if the log is on, False otherwise
+    """
+    if long_query_time < 0:
+        error("❌ The slow query threshold cannot be negative")
+        return False
+    statements = [
+        f"SET GLOBAL slow_query_log_file = '{SLOW_LOG_PATH}'",
+        f"SET GLOBAL long_query_time = {long_query_time}",
+        "SET GLOBAL slow_query_log = ON",
+    ]
+    for statement in statements:
+        if run_mysql_command(statement) is None:
+            error(f"❌ Could not enable the slow query log: {statement} failed")
+            return False
+
+    if persist:
+        from src.features.mysql.tuner import write_mysql_config
+        if not write_mysql_config({
+            "slow_query_log": "1",
+            "slow_query_log_file": SLOW_LOG_PATH,
+            "long_query_time": str(long_query_time),
+        }, remove=()):
+            return False
+    success(f"✅ Slow query log enabled for queries over {long_query_time}s")
+    return True
+
+
+@log_call
+def disable_slow_query_log(persist: bool = True) -> bool:
+    """
+    Turn off the slow query log of the running server.
+
+    Args:
+        persist: Whether to also write the setting to the MySQL config file
+
+    Returns:
+        bool: True if the log is off, False otherwise
+    """
+    if run_mysql_command("SET GLOBAL slow_query_log = OFF") is None:
+        error("❌ Could not disable the slow query log")
+        return False
+    if persist:
+        from src.features.mysql.tuner import write_mysql_config
+        if not write_mysql_config({"slow_query_log": "0"}, remove=()):
+            return False
+    success("✅ Slow query log disabled")
+    return True
+
+
+class SlowQueryDigest:
+    """Incrementally aggregates the MySQL slow query log."""
+
+    def __init__(self, data_dir: Optional[str] = None):
+        """
+        Initialize the digest.
+
+        Args:
+            data_dir: Directory for the offset and aggregates (defaults to DATA_DIR/analytics)
+        """
+        self.data_dir = data_dir or os.path.join(env["DATA_DIR"], "analytics")
+        self.stats_file = os.path.join(self.data_dir, "mysql_slow_stats.json")
+        self.container_name = env["MYSQL_CONTAINER_NAME"]
+        self.offset = 0
+        self.database: Optional[str] = None
+        self.since: Optional[float] = None
+        self.queries: Dict[str, QueryDigest] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, "r") as f:
+                raw = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read slow query stats: {e}")
+            return
+        self.offset = raw.get("offset", 0)
+        self.database = raw.get("database")
+        self.since = raw.get("since")
+        self.queries = {key: QueryDigest.from_dict(data)
+                        for key, data in raw.get("queries", {}).items()}
+
+    def save(self) -> None:
+        """Persist the offset and aggregates."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        tmp_file = f"{self.stats_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({
+                "offset": self.offset,
+                "database": self.database,
+                "since": self.since,
+                "queries": {key: q.to_dict() for key, q in self.queries.items()},
+            }, f)
+        os.replace(tmp_file, self.stats_file)
+
+    def reset(self) -> None:
+        """Reset aggregates, keeping the offset so old entries are not counted again."""
+        self.queries = {}
+        self.since = None
+
+    def _log_size(self) -> Optional[int]:
+        output = Container(self.container_name).exec(
+            ["sh", "-c", f"stat -c %s {SLOW_LOG_PATH} 2>/dev/null || echo 0"], user="root")
+        try:
+            return int((output or "").strip())
+        except ValueError:
+            return None
+
+    def _stream_lines(self) -> Iterator[Tuple[int, str]]:
+        """Yield complete log lines after the offset, with the offset just past each."""
+        from python_on_whales import DockerClient
+
+        stream = DockerClient().container.execute(
+            self.container_name, ["tail", "-c", f"+{self.offset + 1}", SLOW_LOG_PATH],
+            user="root", stream=True)
+        position = self.offset
+        pending = b""
+        for source, chunk in stream:
+            if source != "stdout":
+                continue
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                position += len(raw) + 1
+                yield position, raw.decode("utf-8", errors="replace")
+
+    def _rotate(self) -> None:
+        """Truncate the log once it has been read completely."""
+        output = Container(self.container_name).exec(
+            ["sh", "-c", f": > {SLOW_LOG_PATH}"], user="root")
+        if output is not None:
+            debug(f"Truncated {SLOW_LOG_PATH} after {self.offset} bytes")
+            self.offset = 0
+
+    def _add(self, entry: SlowQueryEntry) -> None:
+        key = f"{entry.database or ''}:{fingerprint_id(entry.fingerprint)}"
+        digest = self.queries.get(key)
+        if digest is None:
+            digest = self.queries[key] = QueryDigest(
+                fingerprint=entry.fingerprint, database=entry.database)
+        digest.add(entry)
+        self.database = entry.database or self.database
+
+    def _prune(self) -> None:
+        if len(self.queries) <= MAX_TRACKED_QUERIES:
+            return
+        keep = sorted(self.queries.items(), key=lambda item: item[1].total_time, reverse=True)
+        self.queries = dict(keep[:MAX_TRACKED_QUERIES])
+
+    @log_call
+    def update(self) -> int:
+        """
+        Read new slow log entries and update the aggregates.
+
+        Returns:
+            int: Number of new slow queries
+        """
+        from python_on_whales import DockerException
+
+        size = self._log_size()
+        if size is None:
+            error(f"❌ Could not read the slow query log of {self.container_name}")
+            return 0
+        if size < self.offset:
+            # Truncated or replaced outside of this digest
+            self.offset = 0
+
+        parsed = 0
+        if size > self.offset:
+            # Offsets of the lines an entry can start on, by line index
+            starts: Dict[int, int] = {}
+            end = self.offset
+
+            def lines() -> Iterator[str]:
+                nonlocal end
+                for number, (line_end, line) in enumerate(self._stream_lines()):
+                    if line.startswith(ENTRY_START_PREFIXES):
+                        starts[number] = end
+                    end = line_end
+                    yield line
+
+            # Each entry is counted once the next one has been parsed
+            last: Optional[SlowQueryEntry] = None
+            try:
+                for entry in parse_slow_query_log(lines(), self.database):
+                    if last is not None:
+                        self._add(last)
+                        parsed += 1
+                    last = entry
+            except DockerException as e:
+                error(f"❌ Could not stream the slow query log: {e}")
+
+            # An entry is complete once another one starts after its query;
+            # the log is truncated at MAX_LOG_BYTES, so then it is now or never
+            later = [offset for number, offset in starts.items()
+                     if last is None or number > last.end_line]
+            if last is not None and (later or end >= MAX_LOG_BYTES):
+                self._add(last)
+                parsed += 1
+                last = None
+            if last is not None:
+                self.offset = starts[last.start_line]
+            elif later:
+                # Headers without a query yet are read again with it
+                self.offset = min(later)
+            else:
+                self.offset = end
+
+        if parsed and self.since is None:
+            self.since = time.time()
+        if self.offset >= MAX_LOG_BYTES and self.offset >= size:
+            self._rotate()
+        self._prune()
+        self.save()
+        debug(f"Slow query log: {parsed} new slow queries")
+        return parsed
+
+    def top(self, limit: int = 10, database: Optional[str] = None,
+            order: str = "total_time") -> List[QueryDigest]:
+        """
+        Get the most expensive query fingerprints.
+
+        Args:
+            limit: Number of fingerprints
+            database: Only fingerprints of this database
+            order: QueryDigest attribute to sort by
+
+        Returns:
+            List[QueryDigest]: Fingerprints, most expensive first
+        """
+        queries = [q for q in self.queries.values() if database is None or q.database == database]
+        return sorted(queries, key=lambda q: getattr(q, order), reverse=True)[:limit]
+
+    def by_database(self) -> List[DatabaseSummary]:
+        """
+        Get slow query totals per database, with the website it belongs to.
+
+        Returns:
+            List[DatabaseSummary]: Databases, most total time first
+        """
+        domains = get_database_domains()
+        summaries: Dict[Optional[str], DatabaseSummary] = {}
+        for query in self.queries.values():
+            summary = summaries.setdefault(query.database, DatabaseSummary(
+                database=query.database, domain=domains.get(query.database or "")))
+            summary.queries += query.count
+            summary.fingerprints += 1
+            summary.total_time += query.total_time
+            summary.rows_examined += query.rows_examined
+        total = sum(s.total_time for s in summaries.values())
+        for summary in summaries.values():
+            summary.share = summary.total_time / total if total else 0.0
+        return sorted(summaries.values(), key=lambda s: s.total_time, reverse=True)
+
+    def summary(self, top: int = 10, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the digest as plain data.
+
+        Args:
+            top: Number of fingerprints
+            domain: Only report on this website
+
+        Returns:
+            Dict[str, Any]: Per-database totals and the top fingerprints
+        """
+        domains = get_database_domains()
+        database = None
+        if domain:
+            database = next((db for db, d in domains.items() if d == domain), None)
+        databases = [s for s in self.by_database() if not domain or s.domain == domain]
+        return {
+            "since": self.since,
+            "databases": [s.to_dict() for s in databases],
+            "queries": [q.summary(domains.get(q.database or ""))
+                        for q in self.top(top, database)] if not domain or database else [],
+        }
+
+
+def print_slow_query_digest(digest: SlowQueryDigest, top: int = 10,
+                            domain: Optional[str] = None) -> None:
+    """
+    Print slow query totals per website and the most expensive queries.
+
+    Args:
+        digest: Digest to report
+        top: Number of fingerprints
+        domain: Only report on this website
+    """
+    console = Console()
+    data = digest.summary(top, domain)
+    if not data["databases"]:
+        console.print("No slow queries recorded.", style="bold green")
+        return
+
+    table = Table(title="Slow queries by website", header_style="bold cyan")
+    table.add_column("Website", style="bold white")
+    table.add_column("Database")
+    table.add_column("Queries", justify="right")
+    table.add_column("Total time", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Rows examined", justify="right")
+    for row in data["databases"]:
+        share = row["share"] * 100
+        style = "red" if share >= 50 else "yellow" if share >= 20 else "white"
+        table.add_row(row["domain"] or "-", row["database"] or "-", str(row["queries"]),
+                      f"{row['total_time']:.1f}s", f"[{style}]{share:.1f}%[/{style}]",
+                      f"{row['rows_examined']:,}")
+    console.print(table)
+
+    queries = Table(title="Most expensive queries", header_style="bold cyan")
+    queries.add_column("Website")
+    queries.add_column("Count", justify="right")
+    queries.add_column("Total", justify="right")
+    queries.add_column("p95", justify="right")
+    queries.add_column("Rows/exec", justify="right")
+    queries.add_column("Query", overflow="fold")
+    for row in data["queries"]:
+        queries.add_row(row["domain"] or row["database"] or "-", str(row["count"]),
+                        f"{row['total_time']:.1f}s", f"{row['p95_time']:.2f}s",
+                        f"{row['avg_rows_examined']:,}", row["fingerprint"][:200])
+    console.print(queries)
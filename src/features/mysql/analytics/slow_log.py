@@ -0,0 +1,166 @@
+"""
+MySQL/MariaDB slow query log parsing.
+
+This module turns slow query log lines into entries and normalizes each
+query into a fingerprint: literals, numbers and value lists are replaced
+with placeholders, so every execution of the same statement shape is
+counted together regardless of its parameters.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+HEADER_FIELD_PATTERN = re.compile(r"(\w+):\s+(\S+)")
+USER_HOST_PATTERN = re.compile(r"^# User@Host:\s+(?P<user>[^\[\s]+)")
+USE_PATTERN = re.compile(r"^use\s+`?(?P<db>[^`;\s]+)`?;\s*$", re.IGNORECASE)
+SET_TIMESTAMP_PATTERN = re.compile(r"^SET\s+timestamp=(?P<ts>\d+);\s*$", re.IGNORECASE)
+
+# Header lines that begin a new entry once the previous one has its query
+ENTRY_START_PREFIXES = ("# Time:", "# User@Host:")
+
+# Server banner lines at the top of the log and after every restart
+BANNER_PREFIXES = ("/usr/sbin/", "/usr/local/", "Tcp port:", "Time ", "Time\t")
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/|--[^\n]*|#[^\n]*", re.S)
+STRING_PATTERN = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+# A minus is only part of the number after an operator or "(", so x-1 stays x-?
+NUMBER_PATTERN = re.compile(r"(?:(?<=[-(,=<>+*/%])-|(?<=[-(,=<>+*/%] )-)?"
+                            r"\b(?:0x[0-9a-f]+|\d+(?:\.\d+)?(?:e[+-]?\d+)?)\b")
+IN_LIST_PATTERN = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+VALUES_PATTERN = re.compile(r"\bvalues\s*\(.*\)", re.S)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Table names that differ only by a numeric suffix, e.g. multisite wp_2_posts
+NUMBERED_TABLE_PATTERN = re.compile(r"\b(\w+?)_\d+_(\w+)")
+
+
+@dataclass
+class SlowQueryEntry:
+    """A single query from the slow log."""
+
+    query: str = ""
+    database: Optional[str] = None
+    user: Optional[str] = None
+    timestamp: Optional[int] = None
+    query_time: float = 0.0
+    lock_time: float = 0.0
+    rows_sent: int = 0
+    rows_examined: int = 0
+    # Indexes of the first line of the entry and the last line of its query,
+    # among the lines parsed
+    start_line: int = 0
+    end_line: int = 0
+
+    @property
+    def fingerprint(self) -> str:
+        return fingerprint_query(self.query)
+
+
+def fingerprint_query(query: str) -> str:
+    """
+    Normalize a query so that executions differing only in values match.
+
+    Args:
+        query: SQL statement
+
+    Returns:
+        str: Lower-case statement with literals replaced by "?"
+    """
+    text = STRING_PATTERN.sub("?", query.strip().rstrip(";"))
+    text = COMMENT_PATTERN.sub(" ", text)
+    text = WHITESPACE_PATTERN.sub(" ", text.lower()).strip()
+    text = NUMBER_PATTERN.sub("?", text)
+    text = IN_LIST_PATTERN.sub("in (?+)", text)
+    text = VALUES_PATTERN.sub("values (?+)", text)
+    text = NUMBERED_TABLE_PATTERN.sub(r"\1_?_\2", text)
+    return text
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Get a short stable id for a fingerprint."""
+    return hashlib.md5(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def _apply_header(entry: SlowQueryEntry, line: str) -> None:
+    user = USER_HOST_PATTERN.match(line)
+    if user:
+        entry.user = user.group("user")
+        return
+    for name, value in HEADER_FIELD_PATTERN.findall(line):
+        try:
+            if name == "Query_time":
+                entry.query_time = float(value)
+            elif name == "Lock_time":
+                entry.lock_time = float(value)
+            elif name == "Rows_sent":
+                entry.rows_sent = int(value)
+            elif name == "Rows_examined":
+                entry.rows_examined = int(value)
+            elif name == "Schema" and value:
+                entry.database = value
+        except ValueError:
+            continue
+
+
+def parse_slow_query_log(lines: Iterable[str],
+                         database: Optional[str] = None) -> Iterator[SlowQueryEntry]:
+    """
+    Group slow query log lines into entries.
+
+    Both the MySQL and the MariaDB format are understood. The database
+    comes from the MariaDB "Schema" header, or else from the last "use"
+    statement, which the server only writes when it changes.
+
+    Args:
+        lines: Slow log lines
+        database: Database in use before the first line, when reading
+            continues where a previous run stopped
+
+    Yields:
+        SlowQueryEntry: Entries with a query. The last one may still be
+        incomplete when the log is being written to.
+    """
+    current: Optional[SlowQueryEntry] = None
+    query_lines = []
+    last_database = database
+
+    def finish() -> Optional[SlowQueryEntry]:
+        if current is None or not query_lines:
+            return None
+        current.query = "\n".join(query_lines).strip()
+        if not current.database:
+            current.database = last_database
+        return current if current.query else None
+
+    for number, raw in enumerate(lines):
+        line = raw.rstrip("\r\n")
+        if line.startswith("# "):
+            if line.startswith(ENTRY_START_PREFIXES) and (current is None or query_lines):
+                done = finish()
+                if done:
+                    yield done
+                current = SlowQueryEntry(start_line=number)
+                query_lines = []
+            if current is not None:
+                _apply_header(current, line)
+            continue
+        if current is None or not line.strip() or line.startswith(BANNER_PREFIXES):
+            continue
+
+        use = USE_PATTERN.match(line)
+        if use:
+            last_database = use.group("db")
+            if not current.database:
+                current.database = last_database
+            continue
+        timestamp = SET_TIMESTAMP_PATTERN.match(line)
+        if timestamp:
+            current.timestamp = int(timestamp.group("ts"))
+            continue
+        query_lines.append(line)
+        current.end_line = number
+
+    done = finish()
+    if done:
+        yield done
@@ -0,0 +1,507 @@
+"""
+Per-website database analysis.
+
+Slow WordPress sites usually pay for their database on every request:
+WordPress loads every autoloaded option before anything else, so a bloated
+autoload set is read on every page view, and meta tables that grew past
+their indexes turn every lookup into a scan. The analyzer here reports
+table and index sizes, the autoloaded options and their largest keys,
+transients and orphaned post meta, and tables missing the indexes
+WordPress relies on. The common fixes can be applied one by one, each
+with a dry-run that only shows what would change.
+
+Queries are passed to the MySQL client through a shell, so they must not
+contain double quotes, backticks or ``$``; identifiers are validated
+before they are interpolated.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, info, warn, error, success
+from src.common.utils.environment import env
+from src.features.mysql.mysql_exec import run_mysql_command
+from src.features.website.utils import get_site_config
+
+MB = 1024 * 1024
+
+# Autoload values WordPress loads on every request (6.6+ adds "on" and "auto")
+AUTOLOAD_VALUES = ("yes", "on", "auto", "auto-on")
+
+# Site Health warns above this autoloaded options size
+AUTOLOAD_WARN_BYTES = 800 * 1024
+
+# Largest autoloaded options listed in the report
+TOP_AUTOLOAD_OPTIONS = 10
+
+# Indexes WordPress queries rely on: table suffix -> (column, index definition)
+EXPECTED_INDEXES: Dict[str, List[Tuple[str, str]]] = {
+    "options": [("autoload", "autoload")],
+    "postmeta": [("post_id", "post_id"), ("meta_key", "meta_key(191)")],
+    "usermeta": [("user_id", "user_id"), ("meta_key", "meta_key(191)")],
+    "commentmeta": [("comment_id", "comment_id"), ("meta_key", "meta_key(191)")],
+    "termmeta": [("term_id", "term_id"), ("meta_key", "meta_key(191)")],
+    "posts": [("post_name", "post_name(191)"), ("post_type", "post_type, post_status, post_date, ID"),
+              ("post_parent", "post_parent"), ("post_author", "post_author")],
+    "comments": [("comment_post_ID", "comment_post_ID"), ("comment_approved", "comment_approved, comment_date_gmt")],
+}
+
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+TABLE_PREFIX_PATTERN = re.compile(r"""\$table_prefix\s*=\s*['"]([^'"]+)['"]""")
+
+
+@dataclass
+class TableStats:
+    """Size of one table."""
+
+    name: str
+    engine: str
+    rows: int
+    data_bytes: int
+    index_bytes: int
+    free_bytes: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.data_bytes + self.index_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "engine": self.engine,
+            "rows": self.rows,
+            "data_bytes": self.data_bytes,
+            "index_bytes": self.index_bytes,
+            "free_bytes": self.free_bytes,
+        }
+
+
+@dataclass
+class MissingIndex:
+    """An index WordPress expects that a table does not have."""
+
+    table: str
+    column: str
+    definition: str
+
+    @property
+    def statement(self) -> str:
+        return f"ALTER TABLE {self.table} ADD INDEX {self.column} ({self.definition})"
+
+
+@dataclass
+class DatabaseReport:
+    """Performance-relevant facts about a website's database."""
+
+    domain: str
+    database: str
+    prefix: str
+    tables: List[TableStats] = field(default_factory=list)
+    autoload_count: int = 0
+    autoload_bytes: int = 0
+    top_autoload: List[Tuple[str, int]] = field(default_factory=list)
+    transient_count: int = 0
+    transient_bytes: int = 0
+    expired_transients: int = 0
+    orphaned_postmeta: int = 0
+    missing_indexes: List[MissingIndex] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(t.total_bytes for t in self.tables)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "database": self.database,
+            "prefix": self.prefix,
+            "total_bytes": self.total_bytes,
+            "tables": [t.to_dict() for t in self.tables],
+            "autoload": {
+                "count": self.autoload_count,
+                "bytes": self.autoload_bytes,
+                "largest": [{"name": n, "bytes": b} for n, b in self.top_autoload],
+            },
+            "transients": {
+                "count": self.transient_count,
+                "bytes": self.transient_bytes,
+                "expired": self.expired_transients,
+            },
+            "orphaned_postmeta": self.orphaned_postmeta,
+            "missing_indexes": [
+                {"table": i.table, "column": i.column, "statement": i.statement}
+                for i in self.missing_indexes
+            ],
+            "warnings": self.warnings,
+        }
+
+
+@dataclass
+class DatabaseFix:
+    """Outcome of one optimization."""
+
+    name: str
+    description: str
+    affected: int
+    statements: List[str]
+    dry_run: bool
+    ok: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "affected": self.affected,
+            "statements": self.statements,
+            "dry_run": self.dry_run,
+            "ok": self.ok,
+        }
+
+
+def run_query_rows(query: str, database: str) -> Optional[List[List[str]]]:
+    """
+    Run a query and split its tab-separated output into rows.
+
+    Args:
+        query: SQL query
+        database: Database to run it in
+
+    Returns:
+        Optional[List[List[str]]]: Rows without the header, or None on error
+    """
+    output = run_mysql_command(query, database)
+    if output is None:
+        return None
+    return [line.split("\t") for line in output.splitlines()[1:]]
+
+
+def _scalar(query: str, database: str) -> int:
+    rows = run_query_rows(query, database)
+    try:
+        return int(rows[0][0])
+    except (TypeError, IndexError, ValueError):
+        return 0
+
+
+def get_site_database(domain: str) -> Optional[str]:
+    """Get the database name of a website."""
+    site_config = get_site_config(domain)
+    if not site_config or not getattr(site_config, "mysql", None):
+        return None
+    return site_config.mysql.db_name
+
+
+def get_table_prefix(domain: str) -> str:
+    """
+    Read a website's table prefix from its wp-config.php.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        str: Table prefix, "wp_" if it cannot be read
+    """
+    path = os.path.join(env["SITES_DIR"], domain, "wordpress", "wp-config.php")
+    try:
+        with open(path, "r") as f:
+            match = TABLE_PREFIX_PATTERN.search(f.read())
+    except IOError:
+        match = None
+    return match.group(1) if match else "wp_"
+
+
+def _autoload_condition() -> str:
+    return "autoload IN (" + ", ".join(f"'{v}'" for v in AUTOLOAD_VALUES) + ")"
+
+
+def _transient_condition() -> str:
+    return r"(option_name LIKE '\_transient\_%' OR option_name LIKE '\_site\_transient\_%')"
+
+
+def _expired_transients_queries(prefix: str, action: str) -> List[str]:
+    # Same join as WordPress' delete_expired_transients(): a transient and
+    # its timeout row, where the timeout has passed
+    options = f"{prefix}options"
+    queries = []
+    for kind, length in (("_transient_", 12), ("_site_transient_", 17)):
+        like = kind.replace("_", r"\_")
+        timeout_like = f"{kind}timeout_".replace("_", r"\_")
+        queries.append(
+            f"{action} FROM {options} a, {options} b "
+            f"WHERE a.option_name LIKE '{like}%' AND a.option_name NOT LIKE '{timeout_like}%' "
+            f"AND b.option_name = CONCAT('{kind}timeout_', SUBSTRING(a.option_name, {length})) "
+            f"AND b.option_value < UNIX_TIMESTAMP()")
+    return queries
+
+
+def _orphaned_postmeta_condition(prefix: str) -> str:
+    return (f"FROM {prefix}postmeta pm LEFT JOIN {prefix}posts p ON p.ID = pm.post_id "
+            f"WHERE p.ID IS NULL")
+
+
+def get_table_stats(database: str) -> List[TableStats]:
+    """Get the size of every table in a database, largest first."""
+    rows = run_query_rows(
+        "SELECT table_name, COALESCE(engine, ''), COALESCE(table_rows, 0), "
+        "COALESCE(data_length, 0), COALESCE(index_length, 0), COALESCE(data_free, 0) "
+        f"FROM information_schema.tables WHERE table_schema = '{database}' "
+        "ORDER BY data_length + index_length DESC", database) or []
+    tables = []
+    for row in rows:
+        if len(row) < 6:
+            continue
+        try:
+            tables.append(TableStats(name=row[0], engine=row[1], rows=int(row[2]),
+                                     data_bytes=int(row[3]), index_bytes=int(row[4]),
+                                     free_bytes=int(row[5])))
+        except ValueError:
+            continue
+    return tables
+
+
+def find_missing_indexes(database: str, prefix: str, tables: List[str]) -> List[MissingIndex]:
+    """
+    Find the WordPress indexes a database lacks.
+
+    A column counts as indexed when some index starts with it.
+
+    Args:
+        database: Database name
+        prefix: Table prefix
+        tables: Tables that exist in the database
+
+    Returns:
+        List[MissingIndex]: Indexes to add
+    """
+    rows = run_query_rows(
+        "SELECT table_name, column_name FROM information_schema.statistics "
+        f"WHERE table_schema = '{database}' AND seq_in_index = 1", database) or []
+    indexed = {(row[0], row[1].lower()) for row in rows if len(row) >= 2}
+
+    missing = []
+    for suffix, indexes in EXPECTED_INDEXES.items():
+        table = f"{prefix}{suffix}"
+        if table not in tables:
+            continue
+        for column, definition in indexes:
+            if (table, column.lower()) not in indexed:
+                missing.append(MissingIndex(table=table, column=column, definition=definition))
+    return missing
+
+
+@log_call
+def analyze_site_database(domain: str) -> Optional[DatabaseReport]:
+    """
+    Analyze the database of a website.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        Optional[DatabaseReport]: Report, or None if the database cannot be read
+    """
+    database = get_site_database(domain)
+    prefix = get_table_prefix(domain)
+    if not database:
+        error(f"❌ MySQL configuration not found for website: {domain}")
+        return None
+    if not IDENTIFIER_PATTERN.match(database) or not IDENTIFIER_PATTERN.match(prefix):
+        error(f"❌ Unsupported database name or table prefix for {domain}: {database}, {prefix}")
+        return None
+
+    report = DatabaseReport(domain=domain, database=database, prefix=prefix)
+    report.tables = get_table_stats(database)
+    if not report.tables:
+        error(f"❌ Could not read the tables of {database}")
+        return None
+    table_names = {t.name for t in report.tables}
+    options = f"{prefix}options"
+
+    if options in table_names:
+        rows = run_query_rows(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(option_value)), 0) FROM {options} "
+            f"WHERE {_autoload_condition()}", database)
+        if rows and len(rows[0]) >= 2:
+            report.autoload_count, report.autoload_bytes = int(rows[0][0]), int(rows[0][1])
+        rows = run_query_rows(
+            f"SELECT option_name, LENGTH(option_value) AS size FROM {options} "
+            f"WHERE {_autoload_condition()} ORDER BY size DESC LIMIT {TOP_AUTOLOAD_OPTIONS}",
+            database) or []
+        report.top_autoload = [(row[0], int(row[1])) for row in rows if len(row) >= 2]
+
+        rows = run_query_rows(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(option_value)), 0) FROM {options} "
+            f"WHERE {_transient_condition()}", database)
+        if rows and len(rows[0]) >= 2:
+            report.transient_count, report.transient_bytes = int(rows[0][0]), int(rows[0][1])
+        report.expired_transients = sum(
+            _scalar(query, database)
+            for query in _expired_transients_queries(prefix, "SELECT COUNT(*)"))
+
+    if {f"{prefix}postmeta", f"{prefix}posts"} <= table_names:
+        report.orphaned_postmeta = _scalar(
+            f"SELECT COUNT(*) {_orphaned_postmeta_condition(prefix)}", database)
+
+    report.missing_indexes = find_missing_indexes(database, prefix, list(table_names))
+
+    if report.autoload_bytes > AUTOLOAD_WARN_BYTES:
+        report.warnings.append(
+            f"{report.autoload_bytes / 1024:.0f}KB of options are autoloaded on every request "
+            f"(more than {AUTOLOAD_WARN_BYTES // 1024}KB)")
+    if report.expired_transients:
+        report.warnings.append(f"{report.expired_transients} expired transient(s) are still stored")
+    if report.orphaned_postmeta:
+        report.warnings.append(f"{report.orphaned_postmeta} post meta row(s) belong to deleted posts")
+    if report.missing_indexes:
+        report.warnings.append(f"{len(report.missing_indexes)} expected index(es) are missing")
+    return report
+
+
+def fix_expired_transients(report: DatabaseReport, dry_run: bool = False) -> DatabaseFix:
+    """Delete transients whose timeout has passed, together with their timeout rows."""
+    statements = _expired_transients_queries(report.prefix, "DELETE a, b")
+    fix = DatabaseFix(name="transients", description="Delete expired transients",
+                      affected=report.expired_transients, statements=statements, dry_run=dry_run)
+    if not dry_run and fix.affected:
+        fix.ok = all(run_mysql_command(s, report.database) is not None for s in statements)
+    return fix
+
+
+def fix_orphaned_postmeta(report: DatabaseReport, dry_run: bool = False) -> DatabaseFix:
+    """Delete post meta rows whose post no longer exists."""
+    statement = f"DELETE pm {_orphaned_postmeta_condition(report.prefix)}"
+    fix = DatabaseFix(name="postmeta", description="Delete post meta of deleted posts",
+                      affected=report.orphaned_postmeta, statements=[statement], dry_run=dry_run)
+    if not dry_run and fix.affected:
+        fix.ok = run_mysql_command(statement, report.database) is not None
+    return fix
+
+
+def fix_missing_indexes(report: DatabaseReport, dry_run: bool = False) -> DatabaseFix:
+    """Add the indexes WordPress expects, including the options autoload index."""
+    statements = [index.statement for index in report.missing_indexes]
+    fix = DatabaseFix(name="indexes", description="Add missing indexes",
+                      affected=len(statements), statements=statements, dry_run=dry_run)
+    if not dry_run:
+        for statement in statements:
+            info(f"🔧 {statement}")
+            if run_mysql_command(statement, report.database) is None:
+                fix.ok = False
+    return fix
+
+
+# Optimizations by name, in the order they are applied
+DATABASE_FIXES: Dict[str, Callable[[DatabaseReport, bool], DatabaseFix]] = {
+    "transients": fix_expired_transients,
+    "postmeta": fix_orphaned_postmeta,
+    "indexes": fix_missing_indexes,
+}
+
+
+@log_call
+def optimize_site_database(domain: str, fixes: Optional[List[str]] = None,
+                           dry_run: bool = False) -> Optional[List[DatabaseFix]]:
+    """
+    Apply database optimizations to a website.
+
+    Args:
+        domain: Website domain name
+        fixes: Names from DATABASE_FIXES to apply (all if None)
+        dry_run: Whether to only report what would change
+
+    Returns:
+        Optional[List[DatabaseFix]]: Outcome of each fix, or None if the
+        database could not be analyzed
+    """
+    fixes = fixes or list(DATABASE_FIXES)
+    unknown = [name for name in fixes if name not in DATABASE_FIXES]
+    if unknown:
+        error(f"❌ Unknown database fix(es): {', '.join(unknown)}")
+        return None
+
+    report = analyze_site_database(domain)
+    if not report:
+        return None
+
+    results = []
+    for name, fix in DATABASE_FIXES.items():
+        if name not in fixes:
+            continue
+        result = fix(report, dry_run)
+        results.append(result)
+        if not result.ok:
+            warn(f"⚠️ {result.description} failed for {domain}")
+        elif not dry_run and result.affected:
+            success(f"✅ {result.description}: {result.affected} for {domain}")
+        else:
+            debug(f"{result.description}: {result.affected} for {domain} (dry-run={dry_run})")
+    return results
+
+
+def print_database_report(report: DatabaseReport, limit: int = 15) -> None:
+    """
+    Print a database report.
+
+    Args:
+        report: Report from analyze_site_database
+        limit: Number of tables to list
+    """
+    console = Console()
+    console.print(f"[bold]{report.domain}[/bold] database [cyan]{report.database}[/cyan] "
+                  f"({report.total_bytes / MB:.1f}MB, prefix {report.prefix})")
+
+    tables = Table(title="Largest tables")
+    tables.add_column("Table", style="cyan")
+    tables.add_column("Engine")
+    tables.add_column("Rows", justify="right")
+    tables.add_column("Data", justify="right")
+    tables.add_column("Index", justify="right")
+    tables.add_column("Free", justify="right")
+    for t in report.tables[:limit]:
+        tables.add_row(t.name, t.engine, f"{t.rows:,}", f"{t.data_bytes / MB:.1f}MB",
+                       f"{t.index_bytes / MB:.1f}MB", f"{t.free_bytes / MB:.1f}MB")
+    console.print(tables)
+
+    console.print(f"[bold]Autoloaded options:[/bold] {report.autoload_count} "
+                  f"({report.autoload_bytes / 1024:.0f}KB)")
+    if report.top_autoload:
+        autoload = Table(title="Largest autoloaded options")
+        autoload.add_column("Option", style="cyan")
+        autoload.add_column("Size", justify="right")
+        for name, size in report.top_autoload:
+            autoload.add_row(name, f"{size / 1024:.1f}KB")
+        console.print(autoload)
+
+    console.print(f"[bold]Transients:[/bold] {report.transient_count} "
+                  f"({report.transient_bytes / 1024:.0f}KB), {report.expired_transients} expired")
+    console.print(f"[bold]Orphaned post meta:[/bold] {report.orphaned_postmeta}")
+    for index in report.missing_indexes:
+        console.print(f"[bold]Missing index:[/bold] {index.table}.{index.column}")
+
+    for message in report.warnings:
+        console.print(f"[yellow]⚠️ {message}[/yellow]")
+
+
+def print_database_fixes(fixes: List[DatabaseFix]) -> None:
+    """
+    Print the outcome of database optimizations.
+
+    Args:
+        fixes: Results from optimize_site_database
+    """
+    console = Console()
+    for fix in fixes:
+        if fix.dry_run:
+            console.print(f"[cyan]🔍 {fix.description}:[/cyan] {fix.affected} would change")
+            if fix.affected:
+                for statement in fix.statements:
+                    console.print(f"   {statement}", markup=False, highlight=False)
+        else:
+            mark = "[green]✔[/green]" if fix.ok else "[red]✘[/red]"
+            console.print(f"{mark} {fix.description}: {fix.affected}")
@@ -5,13 +5,12 @@ This package provides command-line interfaces for managing MySQL databases,
 including restoration and configuration management.
 """
 
-from src.features.mysql.cli.restore import cli_restore_database, restore_database
-from src.features.mysql.cli.config_editor import cli_mysql_config
-from src.features.mysql.cli.main import main
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'cli_restore_database',
-    'restore_database',
-    'cli_mysql_config',
-    'main'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.mysql.cli.restore": ["cli_restore_database", "restore_database"],
+    "src.features.mysql.cli.config_editor": ["cli_mysql_config"],
+    "src.features.mysql.cli.tune": ["cli_mysql_tune"],
+    "src.features.mysql.cli.analyze": ["cli_analyze_database", "cli_optimize_database"],
+    "src.features.mysql.cli.slowlog": ["cli_slow_query_log", "cli_slow_query_report"],
+})
@@ -0,0 +1,81 @@
+"""
+CLI interface for per-website database analysis.
+
+This module provides command-line interfaces for reporting on a website's
+database and applying the common optimizations.
+"""
+
+import json
+from typing import List, Optional
+
+from src.common.logging import log_call, info, error
+from src.features.mysql.analyzer import (
+    analyze_site_database,
+    optimize_site_database,
+    print_database_report,
+    print_database_fixes
+)
+from src.features.website.utils import select_website
+
+
+@log_call
+def cli_analyze_database(domain: Optional[str] = None, json_output: bool = False) -> bool:
+    """
+    Report table sizes, autoload bloat, transients and missing indexes of a website.
+
+    Args:
+        domain: Website to analyze (prompted for if None)
+        json_output: Whether to print JSON instead of tables
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        domain = domain or select_website("🌐 Select website to analyze:")
+        if not domain:
+            info("Operation cancelled.")
+            return False
+        report = analyze_site_database(domain)
+        if not report:
+            return False
+        if json_output:
+            print(json.dumps(report.to_dict(), indent=2))
+        else:
+            print_database_report(report)
+        return True
+    except Exception as e:
+        error(f"❌ Error analyzing database: {str(e)}")
+        return False
+
+
+@log_call
+def cli_optimize_database(domain: Optional[str] = None, fixes: Optional[List[str]] = None,
+                          dry_run: bool = False, json_output: bool = False) -> bool:
+    """
+    Apply database optimizations to a website.
+
+    Args:
+        domain: Website to optimize (prompted for if None)
+        fixes: Optimizations to apply (all if None)
+        dry_run: Whether to only show what would change
+        json_output: Whether to print JSON instead of a summary
+
+    Returns:
+        bool: True if every optimization succeeded, False otherwise
+    """
+    try:
+        domain = domain or select_website("🌐 Select website to optimize:")
+        if not domain:
+            info("Operation cancelled.")
+            return False
+        results = optimize_site_database(domain, fixes, dry_run=dry_run)
+        if results is None:
+            return False
+        if json_output:
+            print(json.dumps([r.to_dict() for r in results], indent=2))
+        else:
+            print_database_fixes(results)
+        return all(r.ok for r in results)
+    except Exception as e:
+        error(f"❌ Error optimizing database: {str(e)}")
+        return False
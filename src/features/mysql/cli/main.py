@@ -10,8 +10,14 @@ import argparse
 from typing import List, Optional
 
 from src.common.logging import log_call, info, warn, error, success
+from src.common.profiling import profiled
 from src.features.mysql.cli.restore import cli_restore_database
 from src.features.mysql.cli.config_editor import cli_mysql_config
+from src.features.mysql.cli.tune import cli_mysql_tune
+from src.features.mysql.cli.analyze import cli_analyze_database, cli_optimize_database
+from src.features.mysql.cli.slowlog import cli_slow_query_log, cli_slow_query_report
+from src.features.mysql.analyzer import DATABASE_FIXES
+from src.features.mysql.analytics.slow_digest import DEFAULT_LONG_QUERY_TIME
 
 
 @log_call
@@ -48,9 +54,119 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         help="Manage MySQL configuration"
     )
     
+    # Tune server settings
+    tune_parser = subparsers.add_parser(
+        "tune",
+        help="Tune MySQL settings for the current workload"
+    )
+    tune_parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Apply the settings to the running server and the config file"
+    )
+    tune_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the recommendation as JSON"
+    )
+    
+    # Analyze a website's database
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="Report table sizes, autoload bloat and missing indexes of a website"
+    )
+    analyze_parser.add_argument(
+        "domain",
+        nargs="?",
+        help="Website domain name"
+    )
+    analyze_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+    
+    # Optimize a website's database
+    optimize_parser = subparsers.add_parser(
+        "optimize",
+        help="Clean up and index a website's database"
+    )
+    optimize_parser.add_argument(
+        "domain",
+        nargs="?",
+        help="Website domain name"
+    )
+    optimize_parser.add_argument(
+        "--fix",
+        action="append",
+        choices=list(DATABASE_FIXES),
+        help="Optimization to apply (repeatable, default: all)"
+    )
+    optimize_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only show what would change"
+    )
+    optimize_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON"
+    )
+    
+    # Slow query log
+    slowlog_parser = subparsers.add_parser(
+        "slowlog",
+        help="Capture slow queries and report them per website"
+    )
+    slowlog_subparsers = slowlog_parser.add_subparsers(
+        title="slowlog commands",
+        dest="slowlog_command",
+        help="Slow query log commands"
+    )
+    slowlog_enable_parser = slowlog_subparsers.add_parser(
+        "enable",
+        help="Turn on the slow query log"
+    )
+    slowlog_enable_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_LONG_QUERY_TIME,
+        metavar="SECONDS",
+        help=f"Log queries slower than this (default: {DEFAULT_LONG_QUERY_TIME})"
+    )
+    slowlog_subparsers.add_parser(
+        "disable",
+        help="Turn off the slow query log"
+    )
+    slowlog_report_parser = slowlog_subparsers.add_parser(
+        "report",
+        help="Show slow queries per website and fingerprint"
+    )
+    slowlog_report_parser.add_argument(
+        "--domain",
+        help="Only report on this website"
+    )
+    slowlog_report_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of queries to list"
+    )
+    slowlog_report_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Reset aggregates before reading new entries"
+    )
+    slowlog_report_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+    
     return parser.parse_args(args)
 
 
+@profiled("mysql")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -78,6 +194,35 @@ def main(args: Optional[List[str]] = None) -> int:
     elif parsed_args.command == "config":
         return 0 if cli_mysql_config() else 1
     
+    elif parsed_args.command == "tune":
+        return 0 if cli_mysql_tune(apply=parsed_args.apply, json_output=parsed_args.json) else 1
+    
+    elif parsed_args.command == "analyze":
+        return 0 if cli_analyze_database(parsed_args.domain, json_output=parsed_args.json) else 1
+    
+    elif parsed_args.command == "optimize":
+        return 0 if cli_optimize_database(
+            parsed_args.domain,
+            fixes=parsed_args.fix,
+            dry_run=parsed_args.dry_run,
+            json_output=parsed_args.json
+        ) else 1
+    
+    elif parsed_args.command == "slowlog":
+        if parsed_args.slowlog_command == "enable":
+            return 0 if cli_slow_query_log(True, parsed_args.threshold) else 1
+        elif parsed_args.slowlog_command == "disable":
+            return 0 if cli_slow_query_log(False) else 1
+        elif parsed_args.slowlog_command == "report":
+            return 0 if cli_slow_query_report(
+                domain=parsed_args.domain,
+                top=parsed_args.top,
+                json_output=parsed_args.json,
+                reset=parsed_args.reset
+            ) else 1
+        parse_args(["slowlog", "--help"])
+        return 1
+    
     else:
         error(f"Unknown command: {parsed_args.command}")
         return 1
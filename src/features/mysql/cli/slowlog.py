@@ -0,0 +1,69 @@
+"""
+CLI interface for the MySQL slow query log.
+
+This module provides command-line interfaces for turning the slow query
+log on and off and for reporting which websites' queries load the server.
+"""
+
+import json
+from typing import Optional
+
+from src.common.logging import log_call, error
+from src.features.mysql.analytics import (
+    SlowQueryDigest,
+    enable_slow_query_log,
+    disable_slow_query_log,
+    print_slow_query_digest
+)
+from src.features.mysql.analytics.slow_digest import DEFAULT_LONG_QUERY_TIME
+
+
+@log_call
+def cli_slow_query_log(enable: bool, threshold: float = DEFAULT_LONG_QUERY_TIME) -> bool:
+    """
+    Turn the slow query log on or off.
+
+    Args:
+        enable: Whether to turn the log on
+        threshold: Seconds after which a query is logged
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        if enable:
+            return enable_slow_query_log(threshold)
+        return disable_slow_query_log()
+    except Exception as e:
+        error(f"❌ Error changing the slow query log: {str(e)}")
+        return False
+
+
+@log_call
+def cli_slow_query_report(domain: Optional[str] = None, top: int = 10,
+                          json_output: bool = False, reset: bool = False) -> bool:
+    """
+    Update and display the slow query digest.
+
+    Args:
+        domain: Website to report on (all websites if None)
+        top: Number of queries to list
+        json_output: Whether to print JSON instead of tables
+        reset: Whether to reset aggregates before reading new entries
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        digest = SlowQueryDigest()
+        if reset:
+            digest.reset()
+        digest.update()
+        if json_output:
+            print(json.dumps(digest.summary(top, domain), indent=2))
+        else:
+            print_slow_query_digest(digest, top, domain)
+        return True
+    except Exception as e:
+        error(f"❌ Error analysing MySQL slow query log: {str(e)}")
+        return False
@@ -0,0 +1,39 @@
+"""
+CLI interface for MySQL tuning.
+
+This module provides a command-line interface for showing and applying
+workload-aware MySQL server settings.
+"""
+
+import json
+
+from src.common.logging import log_call, error
+from src.features.mysql.tuner import tune_mysql, apply_mysql_tuning, print_mysql_tuning
+
+
+@log_call
+def cli_mysql_tune(apply: bool = False, json_output: bool = False) -> bool:
+    """
+    Recommend MySQL settings for the current workload and optionally apply them.
+
+    Args:
+        apply: Whether to change the running server and the config file
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        tuning = tune_mysql()
+        if not tuning:
+            return False
+        if json_output:
+            print(json.dumps(tuning.to_dict(), indent=2))
+        else:
+            print_mysql_tuning(tuning)
+        if apply:
+            return apply_mysql_tuning(tuning)
+        return True
+    except Exception as e:
+        error(f"❌ Error tuning MySQL: {str(e)}")
+        return False
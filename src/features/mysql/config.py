@@ -15,8 +15,9 @@ from src.common.utils.editor import choose_editor
 from src.common.containers.container import Container
 
 
-# Ensure required environment variables are set
-env_required(["MYSQL_CONFIG_FILE", "MYSQL_CONTAINER_NAME"])
+def get_mysql_config_path() -> str:
+    # Ensure required environment variables are set
+    return env_required(["MYSQL_CONFIG_FILE", "MYSQL_CONTAINER_NAME"])["MYSQL_CONFIG_FILE"]
 
 
 @log_call
@@ -31,7 +32,7 @@ def edit_mysql_config() -> bool:
     Returns:
         bool: True if edit was successful, False otherwise
     """
-    config_path = env["MYSQL_CONFIG_FILE"]
+    config_path = get_mysql_config_path()
 
     # Ensure directory exists
     config_dir = os.path.dirname(config_path)
@@ -80,7 +81,7 @@ def backup_mysql_config() -> Optional[str]:
     Returns:
         Optional[str]: Path to the backup file if successful, None otherwise
     """
-    config_path = env["MYSQL_CONFIG_FILE"]
+    config_path = get_mysql_config_path()
     
     # Ensure directory exists
     config_dir = os.path.dirname(config_path)
@@ -119,7 +120,7 @@ def restore_mysql_config(backup_path: Optional[str] = None) -> bool:
     Returns:
         bool: True if restore was successful, False otherwise
     """
-    config_path = env["MYSQL_CONFIG_FILE"]
+    config_path = get_mysql_config_path()
     backup_path = backup_path or f"{config_path}.bak"
     
     # Ensure directory exists
@@ -10,17 +10,15 @@ from datetime import datetime
 from typing import Optional
 
 from src.common.logging import log_call, info, error
-from src.common.utils.environment import env_required, env
-from src.common.containers.container import Container
-from src.features.mysql.mysql_exec import run_mysql_dump, run_mysql_import, run_mysql_command
+from src.features.mysql.mysql_exec import (
+    get_mysql_container,
+    run_mysql_dump,
+    run_mysql_import,
+    run_mysql_command
+)
 from src.features.website.utils import get_site_config
 
 
-# Ensure required environment variables are set
-env_required(["MYSQL_CONTAINER_NAME"])
-mysql_container = Container(env["MYSQL_CONTAINER_NAME"])
-
-
 @log_call
 def export_database(domain: str, target_folder: str) -> Optional[str]:
     """
@@ -44,7 +42,7 @@ def export_database(domain: str, target_folder: str) -> Optional[str]:
     filepath = os.path.join(target_folder, filename)
 
     run_mysql_dump(site_config.mysql.db_name, "/tmp/export.sql")
-    mysql_container.copy_from("/tmp/export.sql", filepath)
+    get_mysql_container().copy_from("/tmp/export.sql", filepath)
     info(f"✅ Database exported for {domain} to: {filepath}")
     
     return filepath
@@ -74,7 +72,7 @@ def import_database(domain: str, db_file: str, reset: bool = True) -> bool:
         run_mysql_command(f"DROP DATABASE IF EXISTS {db_name}; CREATE DATABASE {db_name};")
         info(f"🗑️ Database {db_name} reset before import.")
 
-    mysql_container.copy_to(db_file, "/tmp/import.sql")
+    get_mysql_container().copy_to(db_file, "/tmp/import.sql")
     run_mysql_import("/tmp/import.sql", db_name)
     info(f"✅ Data imported from {db_file} to database {db_name} for website {domain}.")
     
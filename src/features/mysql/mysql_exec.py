@@ -5,16 +5,24 @@ This module provides functions for executing MySQL commands in a container,
 including queries, imports, and dumps.
 """
 
+import functools
 from typing import Optional, Dict, List, Any
 
-from src.common.utils.environment import env_required, env
+from src.common.utils.environment import env_required
 from src.common.containers.container import Container
 from src.features.mysql.utils import detect_mysql_client, get_mysql_root_password
 
 
-# Ensure required environment variables are set
-env_required(["MYSQL_CONTAINER_NAME"])
-mysql_container = Container(env["MYSQL_CONTAINER_NAME"])
+@functools.lru_cache(maxsize=None)
+def get_mysql_container() -> Container:
+    """
+    Get the MySQL container, created on first use rather than at import.
+
+    Returns:
+        Container: The MySQL container
+    """
+    # Ensure required environment variables are set
+    return Container(env_required(["MYSQL_CONTAINER_NAME"])["MYSQL_CONTAINER_NAME"])
 
 
 def run_mysql_command(query: str, db: Optional[str] = None) -> str:
@@ -28,7 +36,7 @@ def run_mysql_command(query: str, db: Optional[str] = None) -> str:
     Returns:
         Command output
     """
-    container = mysql_container
+    container = get_mysql_container()
     client = detect_mysql_client(container)
     pwd = get_mysql_root_password()
     db_part = f"{db}" if db else ""
@@ -47,7 +55,7 @@ def run_mysql_import(sql_path: str, db: str) -> str:
     Returns:
         Command output
     """
-    container = mysql_container
+    container = get_mysql_container()
     client = detect_mysql_client(container)
     pwd = get_mysql_root_password()
     cmd = f"{client} -u root {db} < {sql_path}"
@@ -65,7 +73,7 @@ def run_mysql_dump(db: str, output_path_in_container: str) -> str:
     Returns:
         Command output
     """
-    container = mysql_container
+    container = get_mysql_container()
     client = detect_mysql_client(container)
     pwd = get_mysql_root_password()
     dump_cmd = "mariadb-dump" if client == "mariadb" else "mysqldump"
@@ -0,0 +1,553 @@
+"""
+Workload-aware MySQL/MariaDB tuning.
+
+The config written at bootstrap is sized from the host RAM alone, before
+any website exists, and is never revisited. The tuner here reads what the
+running server has actually seen (buffer pool hit rate, temporary tables
+spilled to disk, thread cache misses, peak connections) next to the
+memory the PHP-FPM pools on the same host may use, and recommends a
+config that fits in what is left. Dynamic variables are applied to the
+running server with ``SET GLOBAL`` and every recommendation is written to
+the MySQL config file, so nothing needs a restart to take effect and the
+values survive the next one.
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, info, warn, error, success
+from src.common.utils.environment import env
+from src.common.utils.system_info import get_total_ram_mb, get_total_cpu_cores
+from src.features.mysql.config import backup_mysql_config
+from src.features.mysql.mysql_exec import run_mysql_command
+
+MB = 1024 * 1024
+
+# RAM kept for the OS, NGINX and the docker daemon
+OS_RESERVED_MB = 256
+
+# MySQL always gets at least this much, even when PHP-FPM promised the rest
+MIN_MYSQL_MB = 256
+
+# Share of the MySQL budget given to the InnoDB buffer pool; the rest is
+# left for per-connection buffers, temporary tables and caches
+BUFFER_POOL_SHARE = 0.7
+MIN_BUFFER_POOL_MB = 128
+# The buffer pool is resized in chunks of innodb_buffer_pool_chunk_size
+BUFFER_POOL_CHUNK_MB = 128
+# Room for the data set to grow before the pool needs to follow
+DATA_HEADROOM = 1.25
+
+# Share of the MySQL budget all connections' session buffers may use
+CONNECTION_MEMORY_SHARE = 0.25
+MIN_CONNECTIONS = 50
+CONNECTION_HEADROOM = 1.25
+# Connections besides PHP-FPM workers: WP-CLI, backups, cron, the admin
+EXTRA_CONNECTIONS = 10
+
+MIN_TMP_TABLE_MB = 16
+MAX_TMP_TABLE_MB = 256
+# Grow tmp_table_size when more temporary tables than this go to disk
+TMP_DISK_RATIO_LIMIT = 0.25
+
+MIN_THREAD_CACHE = 16
+MAX_THREAD_CACHE = 256
+THREAD_CACHE_MISS_LIMIT = 0.01
+
+MIN_TABLE_OPEN_CACHE = 400
+MAX_TABLE_OPEN_CACHE = 16384
+
+MIN_LOG_FILE_MB = 64
+MAX_LOG_FILE_MB = 2048
+
+# Status counters are meaningless right after a restart
+MIN_UPTIME_SECONDS = 3600
+
+# Variables holding a size in bytes, written to the config file in MB
+SIZE_VARIABLES = {
+    "innodb_buffer_pool_size",
+    "innodb_log_file_size",
+    "tmp_table_size",
+    "max_heap_table_size",
+    "query_cache_size",
+}
+
+# Variables that need a restart to change on the running server
+STATIC_VARIABLES = {"innodb_log_file_size"}
+
+# Settings dropped from the config file: the query cache serializes every
+# write on a busy server, and MySQL 8 refuses to start with them
+OBSOLETE_VARIABLES = ("query_cache_size", "query_cache_type", "query_cache_limit")
+
+
+@dataclass
+class TuningItem:
+    """Recommended value of one server variable."""
+
+    name: str
+    current: Optional[int]
+    recommended: int
+    reason: str
+
+    @property
+    def dynamic(self) -> bool:
+        return self.name not in STATIC_VARIABLES
+
+    @property
+    def changed(self) -> bool:
+        return self.current != self.recommended
+
+    def format(self, value: Optional[int]) -> str:
+        if value is None:
+            return "-"
+        if self.name in SIZE_VARIABLES:
+            return f"{value // MB}M"
+        return str(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "current": self.current,
+            "recommended": self.recommended,
+            "changed": self.changed,
+            "dynamic": self.dynamic,
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class MySQLTuning:
+    """Workload metrics and recommended settings of the MySQL server."""
+
+    total_ram_mb: int
+    php_mb: int
+    php_children: int
+    redis_mb: int
+    mysql_mb: int
+    data_mb: Optional[float]
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    items: List[TuningItem] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def changes(self) -> List[TuningItem]:
+        return [item for item in self.items if item.changed]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ram_mb": self.total_ram_mb,
+            "php_mb": self.php_mb,
+            "php_children": self.php_children,
+            "redis_mb": self.redis_mb,
+            "mysql_mb": self.mysql_mb,
+            "data_mb": round(self.data_mb, 1) if self.data_mb is not None else None,
+            "metrics": self.metrics,
+            "items": [item.to_dict() for item in self.items],
+            "warnings": self.warnings,
+        }
+
+
+def parse_show_output(output: Optional[str]) -> Dict[str, str]:
+    """
+    Parse the tab-separated output of SHOW GLOBAL STATUS/VARIABLES.
+
+    Args:
+        output: Client output, including the header line
+
+    Returns:
+        Dict[str, str]: Values by lower-case variable name
+    """
+    values = {}
+    for line in (output or "").splitlines()[1:]:
+        name, _, value = line.partition("\t")
+        if name:
+            values[name.strip().lower()] = value.strip()
+    return values
+
+
+def _int(values: Dict[str, str], name: str, default: int = 0) -> int:
+    try:
+        return int(values.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def read_server_state() -> Optional[Tuple[Dict[str, str], Dict[str, str]]]:
+    """
+    Read the global variables and status counters of the running server.
+
+    Returns:
+        Optional[Tuple[Dict[str, str], Dict[str, str]]]: Variables and status,
+        or None if the server could not be queried
+    """
+    variables = parse_show_output(run_mysql_command("SHOW GLOBAL VARIABLES"))
+    status = parse_show_output(run_mysql_command("SHOW GLOBAL STATUS"))
+    if not variables or not status:
+        return None
+    return variables, status
+
+
+def get_innodb_data_mb() -> Optional[float]:
+    """Get the size of all InnoDB data and indexes in MB."""
+    output = run_mysql_command(
+        "SELECT COALESCE(SUM(data_length + index_length), 0) FROM information_schema.tables "
+        "WHERE engine = 'InnoDB'")
+    lines = (output or "").splitlines()
+    try:
+        return int(lines[-1].strip()) / MB
+    except (IndexError, ValueError):
+        return None
+
+
+def get_php_fpm_budget() -> Tuple[int, int]:
+    """
+    Get the memory the PHP-FPM pools on this host may use.
+
+    Each pool may grow to pm.max_children workers of the size sampled for
+    its website (or the host's average worker size without samples).
+
+    Returns:
+        Tuple[int, int]: Memory in MB and total number of PHP-FPM workers
+    """
+    from src.features.php.capacity import read_fpm_pool
+    from src.features.php.worker_memory import WorkerMemorySampler
+    from src.features.website.utils import get_resource_profile, website_list
+
+    sampler = WorkerMemorySampler()
+    default_mb = (sampler.worker_mb()
+                  or get_resource_profile(get_total_ram_mb(), get_total_cpu_cores())["avg_process_size"])
+    total_mb = 0.0
+    total_children = 0
+    for domain in website_list():
+        try:
+            children = int(read_fpm_pool(domain).get("pm.max_children", 0))
+        except ValueError:
+            children = 0
+        total_children += children
+        total_mb += children * (sampler.worker_mb(domain) or default_mb)
+    return int(total_mb), total_children
+
+
+def get_redis_maxmemory_mb() -> int:
+    """Get the maxmemory of the Redis server in MB, or 0 if it is not running."""
+    try:
+        from src.features.cache.core.redis_manager import get_redis_server_info
+        return int(get_redis_server_info().get("maxmemory", "0") or 0) // MB
+    except Exception as e:
+        debug(f"Could not read Redis maxmemory: {e}")
+        return 0
+
+
+def _round_down(value_mb: float, step_mb: int) -> int:
+    return int(value_mb // step_mb) * step_mb
+
+
+def recommend_mysql_config(variables: Dict[str, str], status: Dict[str, str],
+                           total_ram_mb: int, php_mb: int, php_children: int,
+                           redis_mb: int = 0, data_mb: Optional[float] = None) -> MySQLTuning:
+    """
+    Recommend server settings from the observed workload and the host's memory.
+
+    Args:
+        variables: Output of SHOW GLOBAL VARIABLES
+        status: Output of SHOW GLOBAL STATUS
+        total_ram_mb: Host RAM in MB
+        php_mb: Memory the PHP-FPM pools may use in MB
+        php_children: Total PHP-FPM workers on the host
+        redis_mb: Redis maxmemory in MB
+        data_mb: Size of the InnoDB data set in MB, if known
+
+    Returns:
+        MySQLTuning: Metrics and recommended settings
+    """
+    mysql_mb = max(MIN_MYSQL_MB, total_ram_mb - php_mb - redis_mb - OS_RESERVED_MB)
+    tuning = MySQLTuning(total_ram_mb=total_ram_mb, php_mb=php_mb, php_children=php_children,
+                         redis_mb=redis_mb, mysql_mb=mysql_mb, data_mb=data_mb)
+    if total_ram_mb - php_mb - redis_mb - OS_RESERVED_MB < MIN_MYSQL_MB:
+        tuning.warnings.append(
+            f"PHP-FPM pools may use {php_mb}MB of {total_ram_mb}MB RAM; MySQL is sized for the "
+            f"{MIN_MYSQL_MB}MB minimum. Lower pm.max_children with 'php capacity --reserve'.")
+
+    uptime = _int(status, "uptime")
+    if uptime < MIN_UPTIME_SECONDS:
+        tuning.warnings.append(
+            f"The server has only been up {uptime}s; workload counters are not representative yet.")
+
+    # Observed workload
+    read_requests = _int(status, "innodb_buffer_pool_read_requests")
+    disk_reads = _int(status, "innodb_buffer_pool_reads")
+    hit_rate = 1 - disk_reads / read_requests if read_requests else None
+    tmp_tables = _int(status, "created_tmp_tables")
+    tmp_disk_tables = _int(status, "created_tmp_disk_tables")
+    tmp_disk_ratio = tmp_disk_tables / tmp_tables if tmp_tables else 0.0
+    connections = _int(status, "connections")
+    threads_created = _int(status, "threads_created")
+    thread_miss_rate = threads_created / connections if connections else 0.0
+    max_used = _int(status, "max_used_connections")
+    open_tables = _int(status, "open_tables")
+    tuning.metrics = {
+        "uptime": uptime,
+        "buffer_pool_hit_rate": round(hit_rate, 5) if hit_rate is not None else None,
+        "tmp_disk_ratio": round(tmp_disk_ratio, 4),
+        "thread_cache_miss_rate": round(thread_miss_rate, 4),
+        "max_used_connections": max_used,
+        "open_tables": open_tables,
+        "opened_tables": _int(status, "opened_tables"),
+    }
+
+    def current(name: str) -> Optional[int]:
+        return _int(variables, name) if name in variables else None
+
+    # Connections: every PHP worker may hold one, plus room over the observed peak
+    session_bytes = sum(_int(variables, name) for name in (
+        "sort_buffer_size", "join_buffer_size", "read_buffer_size",
+        "read_rnd_buffer_size", "thread_stack"))
+    session_mb = max(session_bytes / MB, 1.0)
+    wanted = max(MIN_CONNECTIONS, php_children + EXTRA_CONNECTIONS,
+                 math.ceil(max_used * CONNECTION_HEADROOM))
+    cap = max(MIN_CONNECTIONS, int(mysql_mb * CONNECTION_MEMORY_SHARE / session_mb))
+    max_connections = min(wanted, cap)
+    reason = f"{php_children} PHP workers + {EXTRA_CONNECTIONS}, peak {max_used}"
+    if wanted > cap:
+        reason += f", capped by {session_mb:.1f}MB session buffers each"
+    tuning.items.append(TuningItem("max_connections", current("max_connections"),
+                                   max_connections, reason))
+
+    # Buffer pool: the share of the budget, but no larger than the data set needs
+    pool_mb = _round_down(mysql_mb * BUFFER_POOL_SHARE, BUFFER_POOL_CHUNK_MB)
+    reason = f"{BUFFER_POOL_SHARE:.0%} of {mysql_mb}MB MySQL budget"
+    if data_mb is not None and data_mb * DATA_HEADROOM < pool_mb:
+        pool_mb = math.ceil(data_mb * DATA_HEADROOM / BUFFER_POOL_CHUNK_MB) * BUFFER_POOL_CHUNK_MB
+        reason = f"{data_mb:.0f}MB InnoDB data + {DATA_HEADROOM - 1:.0%} headroom"
+    pool_mb = max(MIN_BUFFER_POOL_MB, pool_mb)
+    if hit_rate is not None:
+        reason += f", hit rate {hit_rate:.2%}"
+        if hit_rate < 0.99 and data_mb is not None and pool_mb < data_mb:
+            tuning.warnings.append(
+                f"The buffer pool holds {pool_mb}MB of {data_mb:.0f}MB data and misses "
+                f"{1 - hit_rate:.1%} of reads; the host needs more RAM for MySQL.")
+    tuning.items.append(TuningItem("innodb_buffer_pool_size",
+                                   current("innodb_buffer_pool_size"), pool_mb * MB, reason))
+
+    # Redo log: a quarter of the buffer pool, only takes effect after a restart
+    log_mb = min(MAX_LOG_FILE_MB, max(MIN_LOG_FILE_MB, _round_down(pool_mb / 4, 16)))
+    tuning.items.append(TuningItem("innodb_log_file_size", current("innodb_log_file_size"),
+                                   log_mb * MB, "25% of the buffer pool, applied on restart"))
+
+    # Temporary tables: grow while too many spill to disk
+    tmp_cap_mb = max(MIN_TMP_TABLE_MB, min(MAX_TMP_TABLE_MB, mysql_mb // 16))
+    tmp_mb = min(_int(variables, "tmp_table_size"), _int(variables, "max_heap_table_size")) // MB
+    if tmp_tables >= 100 and tmp_disk_ratio > TMP_DISK_RATIO_LIMIT:
+        tmp_mb *= 2
+    reason = f"{tmp_disk_ratio:.0%} of temporary tables written to disk"
+    tmp_mb = max(MIN_TMP_TABLE_MB, min(tmp_cap_mb, tmp_mb))
+    for name in ("tmp_table_size", "max_heap_table_size"):
+        tuning.items.append(TuningItem(name, current(name), tmp_mb * MB, reason))
+
+    # Thread cache: keep enough idle threads that connects rarely create one
+    thread_cache = max(MIN_THREAD_CACHE, _int(variables, "thread_cache_size"))
+    if thread_miss_rate > THREAD_CACHE_MISS_LIMIT:
+        thread_cache = max(thread_cache, math.ceil(max_used / 2))
+    thread_cache = min(MAX_THREAD_CACHE, thread_cache)
+    tuning.items.append(TuningItem("thread_cache_size", current("thread_cache_size"),
+                                   thread_cache,
+                                   f"{thread_miss_rate:.1%} of connections created a thread"))
+
+    # Table cache: grow when every slot is in use
+    table_cache = max(MIN_TABLE_OPEN_CACHE, _int(variables, "table_open_cache"))
+    if open_tables >= table_cache * 0.95:
+        table_cache *= 2
+    table_cache = min(MAX_TABLE_OPEN_CACHE, table_cache)
+    tuning.items.append(TuningItem("table_open_cache", current("table_open_cache"), table_cache,
+                                   f"{open_tables} tables open"))
+
+    # Query cache: off, it serializes every write
+    if _int(variables, "query_cache_size") > 0:
+        tuning.items.append(TuningItem("query_cache_size", current("query_cache_size"), 0,
+                                       "query cache locks on every write"))
+
+    return tuning
+
+
+@log_call
+def tune_mysql() -> Optional[MySQLTuning]:
+    """
+    Measure the MySQL workload and recommend settings for this host.
+
+    Returns:
+        Optional[MySQLTuning]: Recommendation, or None if the server could not be queried
+    """
+    state = read_server_state()
+    if not state:
+        error(f"❌ Could not read the state of {env['MYSQL_CONTAINER_NAME']}. Is it running?")
+        return None
+    variables, status = state
+    php_mb, php_children = get_php_fpm_budget()
+    return recommend_mysql_config(
+        variables, status,
+        total_ram_mb=get_total_ram_mb(),
+        php_mb=php_mb,
+        php_children=php_children,
+        redis_mb=get_redis_maxmemory_mb(),
+        data_mb=get_innodb_data_mb(),
+    )
+
+
+def format_config_value(name: str, value: int) -> str:
+    """Format a variable for the MySQL config file."""
+    return f"{value // MB}M" if name in SIZE_VARIABLES else str(value)
+
+
+@log_call
+def write_mysql_config(values: Dict[str, str], remove: Tuple[str, ...] = OBSOLETE_VARIABLES) -> bool:
+    """
+    Update settings in the [mysqld] section of the MySQL config file.
+
+    Other settings and comments are kept; missing keys are added to the
+    section.
+
+    Args:
+        values: Settings to write
+        remove: Settings to delete from the file
+
+    Returns:
+        bool: True if the file was written, False otherwise
+    """
+    path = env["MYSQL_CONFIG_FILE"]
+    try:
+        with open(path, "r") as f:
+            content = f.read()
+    except IOError:
+        content = ""
+    if not re.search(r"^\[mysqld\]", content, re.MULTILINE):
+        content = "[mysqld]\n" + content
+
+    for key in remove:
+        content = re.sub(rf"^\s*{re.escape(key)}\s*=.*\n?", "", content, flags=re.MULTILINE)
+    missing = []
+    for key, value in values.items():
+        pattern = re.compile(rf"^\s*{re.escape(key)}\s*=.*$", re.MULTILINE)
+        line = f"{key} = {value}"
+        if pattern.search(content):
+            content = pattern.sub(line, content, count=1)
+        else:
+            missing.append(line)
+    if missing:
+        content = re.sub(r"^\[mysqld\][ \t]*\n?", lambda m: "[mysqld]\n" + "\n".join(missing) + "\n",
+                         content, count=1, flags=re.MULTILINE)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        return True
+    except IOError as e:
+        error(f"❌ Could not write {path}: {e}")
+        return False
+
+
+@log_call
+def apply_mysql_tuning(tuning: MySQLTuning) -> bool:
+    """
+    Apply recommended settings to the running server and the config file.
+
+    Dynamic variables are changed with SET GLOBAL; the rest take effect on
+    the next restart. The config file is backed up first.
+
+    Args:
+        tuning: Recommendation from tune_mysql
+
+    Returns:
+        bool: True if every setting was applied, False otherwise
+    """
+    ok = True
+    for item in tuning.changes:
+        if not item.dynamic:
+            continue
+        if run_mysql_command(f"SET GLOBAL {item.name} = {item.recommended}") is None:
+            warn(f"⚠️ Could not set {item.name} on the running server")
+            ok = False
+        else:
+            debug(f"SET GLOBAL {item.name} = {item.recommended}")
+
+    if os.path.isfile(env["MYSQL_CONFIG_FILE"]) and not backup_mysql_config():
+        return False
+    values = {item.name: format_config_value(item.name, item.recommended)
+              for item in tuning.items if item.name not in OBSOLETE_VARIABLES}
+    if not write_mysql_config(values):
+        return False
+
+    pending = [item.name for item in tuning.changes if not item.dynamic]
+    if pending:
+        info(f"ℹ️ {', '.join(pending)} will take effect after the next MySQL restart")
+    if ok:
+        success(f"✅ Applied {len(tuning.changes)} MySQL setting(s) without a restart")
+    return ok
+
+
+def baseline_mysql_config(total_ram_mb: int, total_cpu: int) -> Dict[str, str]:
+    """
+    Get the config written before the server has seen any workload.
+
+    MySQL starts with a quarter of the RAM left after the OS reservation,
+    since PHP-FPM will claim most of it once websites exist; tune_mysql
+    resizes it later from the real workload.
+
+    Args:
+        total_ram_mb: Host RAM in MB
+        total_cpu: Host CPU cores
+
+    Returns:
+        Dict[str, str]: Settings for the [mysqld] section
+    """
+    mysql_mb = max(MIN_MYSQL_MB, (total_ram_mb - OS_RESERVED_MB) // 4)
+    pool_mb = max(MIN_BUFFER_POOL_MB, _round_down(mysql_mb * BUFFER_POOL_SHARE, BUFFER_POOL_CHUNK_MB))
+    log_mb = min(MAX_LOG_FILE_MB, max(MIN_LOG_FILE_MB, _round_down(pool_mb / 4, 16)))
+    return {
+        "max_connections": str(max(MIN_CONNECTIONS * 2, total_cpu * 25)),
+        "innodb_buffer_pool_size": f"{pool_mb}M",
+        "innodb_log_file_size": f"{log_mb}M",
+        "tmp_table_size": f"{MIN_TMP_TABLE_MB * 2}M",
+        "max_heap_table_size": f"{MIN_TMP_TABLE_MB * 2}M",
+        "table_open_cache": str(2000 if total_ram_mb >= 4096 else MIN_TABLE_OPEN_CACHE),
+        "thread_cache_size": str(max(MIN_THREAD_CACHE, total_cpu * 8)),
+    }
+
+
+def print_mysql_tuning(tuning: MySQLTuning) -> None:
+    """
+    Print the workload metrics and recommended settings.
+
+    Args:
+        tuning: Recommendation from tune_mysql
+    """
+    console = Console()
+    console.print(
+        f"[bold]RAM:[/bold] {tuning.total_ram_mb}MB total, {tuning.php_mb}MB PHP-FPM "
+        f"({tuning.php_children} workers), {tuning.redis_mb}MB Redis, "
+        f"[green]{tuning.mysql_mb}MB for MySQL[/green]")
+
+    table = Table(title="MySQL tuning")
+    table.add_column("Variable", style="cyan")
+    table.add_column("Current", justify="right")
+    table.add_column("Recommended", justify="right")
+    table.add_column("Why")
+    for item in tuning.items:
+        recommended = item.format(item.recommended)
+        if item.changed:
+            recommended = f"[bold yellow]{recommended}[/bold yellow]"
+        if not item.dynamic:
+            recommended += " [dim](restart)[/dim]"
+        table.add_row(item.name, item.format(item.current), recommended, item.reason)
+    console.print(table)
+
+    for message in tuning.warnings:
+        console.print(f"[yellow]⚠️ {message}[/yellow]")
@@ -4,35 +4,26 @@ NGINX web server management functionality.
 This package provides functionality for managing NGINX configuration,
 including virtual host management, caching, and security.
 """
-# Re-export core functions for backward compatibility
-from src.features.nginx.manager import test_config, reload, restart, apply_config
 
-# Export CLI functions for usage by other modules
-from src.features.nginx.cli import (
-    nginx_cli,
-    cli_test_config,
-    cli_reload,
-    cli_restart,
-    cli_manage_cache
-)
+from src.common.utils.lazy import lazy_exports
 
-# Export prompt functions
-from src.features.nginx.prompts.prompt_menu import prompt_nginx_menu
-
-__all__ = [
-    # Core functions
-    'test_config',
-    'reload',
-    'restart',
-    'apply_config',  # Required for webserver compatibility
-    
-    # CLI functions
-    'nginx_cli',
-    'cli_test_config',
-    'cli_reload',
-    'cli_restart',
-    'cli_manage_cache',
-    
-    # Prompt functions
-    'prompt_nginx_menu'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    # Re-export core functions for backward compatibility
+    "src.features.nginx.manager": [
+        "test_config",
+        "reload",
+        "reopen_logs",
+        "restart",
+        "apply_config",
+    ],
+    # Export CLI functions for usage by other modules
+    "src.features.nginx.cli": [
+        "nginx_cli",
+        "cli_test_config",
+        "cli_reload",
+        "cli_restart",
+        "cli_manage_cache",
+    ],
+    # Export prompt functions
+    "src.features.nginx.prompts.prompt_menu": ["prompt_nginx_menu"],
+})
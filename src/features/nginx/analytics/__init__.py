@@ -0,0 +1,24 @@
+"""
+NGINX access log analytics.
+
+This package parses per-site access logs and aggregates cache hit ratio,
+latency percentiles and traffic figures incrementally.
+"""
+
+from src.features.nginx.analytics.access_log import (
+    AccessLogEntry,
+    parse_access_line
+)
+from src.features.nginx.analytics.cache_stats import (
+    AccessLogAnalyzer,
+    SiteAccessStats,
+    print_access_stats
+)
+
+__all__ = [
+    'AccessLogEntry',
+    'parse_access_line',
+    'AccessLogAnalyzer',
+    'SiteAccessStats',
+    'print_access_stats'
+]
@@ -0,0 +1,170 @@
+"""
+NGINX access log parsing.
+
+This module parses per-site access log lines written either with the
+``wpdocker_json`` log_format (one JSON object per line) or with NGINX's
+default ``combined`` format used by vhosts created before it existed.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# $remote_addr - $remote_user [$time_local] "$request" $status $body_bytes_sent "$http_referer" "$http_user_agent"
+COMBINED_PATTERN = re.compile(
+    r'^(?P<remote_addr>\S+) \S+ \S+ \[(?P<time_local>[^\]]+)\] '
+    r'"(?P<method>[A-Z]+) (?P<uri>\S+)[^"]*" (?P<status>\d{3}) (?P<bytes>\d+|-)'
+    r'(?: "(?P<referer>[^"]*)" "(?P<user_agent>[^"]*)")?'
+)
+
+TIME_LOCAL_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+
+# Cache statuses where the response was served from the FastCGI cache
+CACHED_STATUSES = ("HIT", "STALE", "UPDATING", "REVALIDATED")
+
+
+@dataclass
+class AccessLogEntry:
+    """A single parsed access log line."""
+
+    timestamp: float
+    remote_addr: str
+    method: str
+    uri: str
+    status: int
+    bytes: int
+    host: Optional[str] = None
+    request_time: Optional[float] = None
+    upstream_response_time: Optional[float] = None
+    cache_status: Optional[str] = None
+    referer: Optional[str] = None
+    user_agent: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        """Request URI without the query string."""
+        return self.uri.split("?", 1)[0]
+
+    @property
+    def is_cached(self) -> bool:
+        """Whether the response was served from the FastCGI cache."""
+        return (self.cache_status or "").upper() in CACHED_STATUSES
+
+
+def _to_float(value) -> Optional[float]:
+    """
+    Convert an NGINX timing variable to seconds.
+
+    ``$upstream_response_time`` is ``-`` when no upstream was contacted and a
+    comma separated list when several were, in which case the times are summed.
+    """
+    if value is None or value == "" or value == "-":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    total = 0.0
+    found = False
+    for part in str(value).replace(":", ",").split(","):
+        part = part.strip()
+        if part and part != "-":
+            try:
+                total += float(part)
+                found = True
+            except ValueError:
+                continue
+    return total if found else None
+
+
+def parse_time_local(value: str) -> Optional[float]:
+    """
+    Parse a ``$time_local`` value to a Unix timestamp.
+
+    Args:
+        value: Time such as ``18/Oct/2026:14:00:01 +0700``
+
+    Returns:
+        Optional[float]: Unix timestamp, or None if it cannot be parsed
+    """
+    try:
+        return datetime.strptime(value, TIME_LOCAL_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_json_line(line: str) -> Optional[AccessLogEntry]:
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    timestamp = _to_float(data.get("msec"))
+    if timestamp is None and data.get("time"):
+        try:
+            timestamp = datetime.fromisoformat(data["time"]).timestamp()
+        except ValueError:
+            timestamp = None
+    if timestamp is None:
+        return None
+
+    try:
+        status = int(data.get("status", 0))
+        size = int(data.get("bytes", 0) or 0)
+    except (TypeError, ValueError):
+        return None
+
+    return AccessLogEntry(
+        timestamp=timestamp,
+        remote_addr=data.get("remote_addr", ""),
+        method=data.get("method", ""),
+        uri=data.get("uri", ""),
+        status=status,
+        bytes=size,
+        host=data.get("host") or None,
+        request_time=_to_float(data.get("request_time")),
+        upstream_response_time=_to_float(data.get("upstream_response_time")),
+        cache_status=data.get("cache") or None,
+        referer=data.get("referer") or None,
+        user_agent=data.get("user_agent") or None,
+    )
+
+
+def _parse_combined_line(line: str) -> Optional[AccessLogEntry]:
+    match = COMBINED_PATTERN.match(line)
+    if not match:
+        return None
+    timestamp = parse_time_local(match.group("time_local"))
+    if timestamp is None:
+        return None
+    size = match.group("bytes")
+    return AccessLogEntry(
+        timestamp=timestamp,
+        remote_addr=match.group("remote_addr"),
+        method=match.group("method"),
+        uri=match.group("uri"),
+        status=int(match.group("status")),
+        bytes=int(size) if size != "-" else 0,
+        referer=match.group("referer") or None,
+        user_agent=match.group("user_agent") or None,
+    )
+
+
+def parse_access_line(line: str) -> Optional[AccessLogEntry]:
+    """
+    Parse one access log line in JSON or combined format.
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        Optional[AccessLogEntry]: Parsed entry, or None if the line is not recognised
+    """
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith("{"):
+        return _parse_json_line(line)
+    return _parse_combined_line(line)
@@ -0,0 +1,365 @@
+"""
+FastCGI cache hit-ratio analytics.
+
+This module reads each website's access log incrementally and keeps running
+per-site totals: cache hit ratio, request latency percentiles, bytes served
+and the most requested URLs that were not served from the cache. Totals and
+read offsets are persisted, so running it every minute only costs the lines
+written since the previous run.
+"""
+
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn, error
+from src.common.utils.environment import env
+from src.common.utils.incremental_reader import IncrementalReader
+from src.features.nginx.analytics.access_log import parse_access_line, CACHED_STATUSES
+
+# Latency histogram buckets grow by 10%, so percentiles are accurate to ~5%
+HISTOGRAM_BASE = 1.1
+
+# Number of uncached URLs kept per site between runs
+MAX_TRACKED_URLS = 1000
+
+
+def get_analytics_dir() -> str:
+    """
+    Get the directory where analytics state is stored.
+
+    Returns:
+        str: Path to the analytics data directory
+    """
+    return os.path.join(env["DATA_DIR"], "analytics")
+
+
+class LatencyHistogram:
+    """Mergeable log-scale histogram of request times in milliseconds."""
+
+    def __init__(self, buckets: Optional[Dict[str, int]] = None):
+        self.buckets: Dict[str, int] = dict(buckets or {})
+
+    def add(self, seconds: float) -> None:
+        ms = max(seconds * 1000, 1.0)
+        index = str(int(math.log(ms, HISTOGRAM_BASE)))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def mean(self) -> Optional[float]:
+        """Estimate the mean latency in milliseconds, or None without samples."""
+        total = self.count
+        if total == 0:
+            return None
+        weighted = sum(HISTOGRAM_BASE ** (int(index) + 0.5) * count
+                       for index, count in self.buckets.items())
+        return weighted / total
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Optional[float]: Latency in milliseconds, or None without samples
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = math.ceil(total * p / 100)
+        seen = 0
+        for index in sorted(self.buckets, key=int):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Middle of the bucket in log space
+                return HISTOGRAM_BASE ** (int(index) + 0.5)
+        return None
+
+
+@dataclass
+class SiteAccessStats:
+    """Running access log totals for one website."""
+
+    domain: str
+    since: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    updated_at: Optional[str] = None
+    requests: int = 0
+    bytes: int = 0
+    cache: Dict[str, int] = field(default_factory=dict)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    upstream_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    uncached: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def cached_requests(self) -> int:
+        return sum(v for k, v in self.cache.items() if k in CACHED_STATUSES)
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Share of requests served from cache, or None without cache data."""
+        with_status = sum(v for k, v in self.cache.items() if k != "-")
+        if with_status == 0:
+            return None
+        return self.cached_requests / with_status
+
+    def top_uncached(self, limit: int = 10) -> List[tuple]:
+        return sorted(self.uncached.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "since": self.since,
+            "updated_at": self.updated_at,
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "cache": self.cache,
+            "statuses": self.statuses,
+            "latency": self.latency.buckets,
+            "upstream_latency": self.upstream_latency.buckets,
+            "uncached": self.uncached,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteAccessStats":
+        return cls(
+            domain=data.get("domain"),
+            since=data.get("since") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            updated_at=data.get("updated_at"),
+            requests=data.get("requests", 0),
+            bytes=data.get("bytes", 0),
+            cache=data.get("cache", {}),
+            statuses=data.get("statuses", {}),
+            latency=LatencyHistogram(data.get("latency")),
+            upstream_latency=LatencyHistogram(data.get("upstream_latency")),
+            uncached=data.get("uncached", {}),
+        )
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Get the computed metrics for reporting.
+
+        Args:
+            top: Number of uncached URLs to include
+
+        Returns:
+            Dict[str, Any]: Hit ratio, percentiles, bytes and top uncached URLs
+        """
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 1) if value is not None else None
+
+        hit_ratio = self.hit_ratio
+        return {
+            "domain": self.domain,
+            "since": self.since,
+            "updated_at": self.updated_at,
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "hit_ratio": round(hit_ratio, 4) if hit_ratio is not None else None,
+            "cache": self.cache,
+            "statuses": self.statuses,
+            "p50_ms": rounded(self.latency.percentile(50)),
+            "p95_ms": rounded(self.latency.percentile(95)),
+            "p99_ms": rounded(self.latency.percentile(99)),
+            "upstream_p95_ms": rounded(self.upstream_latency.percentile(95)),
+            "top_uncached": [{"path": p, "count": c} for p, c in self.top_uncached(top)],
+        }
+
+
+class AccessLogAnalyzer:
+    """Incrementally aggregates per-site access logs."""
+
+    def __init__(self, data_dir: Optional[str] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            data_dir: Directory for offsets and totals (defaults to DATA_DIR/analytics)
+        """
+        self.data_dir = data_dir or get_analytics_dir()
+        self.stats_file = os.path.join(self.data_dir, "access_stats.json")
+        self.reader = IncrementalReader(os.path.join(self.data_dir, "access_offsets.json"))
+        self.stats: Dict[str, SiteAccessStats] = self._load()
+
+    def _load(self) -> Dict[str, SiteAccessStats]:
+        if not os.path.exists(self.stats_file):
+            return {}
+        try:
+            with open(self.stats_file, "r") as f:
+                raw = json.load(f)
+            return {domain: SiteAccessStats.from_dict(data) for domain, data in raw.items()}
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read access stats: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist totals and offsets."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        tmp_file = f"{self.stats_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({d: s.to_dict() for d, s in self.stats.items()}, f)
+        os.replace(tmp_file, self.stats_file)
+        self.reader.commit()
+
+    def reset(self, domain: Optional[str] = None) -> None:
+        """
+        Reset totals, keeping offsets so old lines are not counted again.
+
+        Args:
+            domain: Website to reset, or None for all
+        """
+        if domain is None:
+            self.stats = {}
+        else:
+            self.stats.pop(domain, None)
+
+    @staticmethod
+    def get_access_log_path(domain: str) -> str:
+        return os.path.join(env["SITES_DIR"], domain, "logs", "access.log")
+
+    def update_site(self, domain: str) -> SiteAccessStats:
+        """
+        Read new access log lines for a website and update its totals.
+
+        Args:
+            domain: Website domain name
+
+        Returns:
+            SiteAccessStats: Updated totals for the website
+        """
+        stats = self.stats.setdefault(domain, SiteAccessStats(domain=domain))
+        log_path = self.get_access_log_path(domain)
+
+        parsed = skipped = 0
+        for line in self.reader.read_lines(log_path, key=domain):
+            entry = parse_access_line(line)
+            if entry is None:
+                skipped += 1
+                continue
+            parsed += 1
+
+            stats.requests += 1
+            stats.bytes += entry.bytes
+            status_class = f"{entry.status // 100}xx"
+            stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+
+            cache_status = (entry.cache_status or "-").upper()
+            stats.cache[cache_status] = stats.cache.get(cache_status, 0) + 1
+
+            if entry.request_time is not None:
+                stats.latency.add(entry.request_time)
+            if entry.upstream_response_time is not None:
+                stats.upstream_latency.add(entry.upstream_response_time)
+
+            if not entry.is_cached and entry.method == "GET" and entry.status == 200:
+                stats.uncached[entry.path] = stats.uncached.get(entry.path, 0) + 1
+
+        if len(stats.uncached) > MAX_TRACKED_URLS:
+            stats.uncached = dict(stats.top_uncached(MAX_TRACKED_URLS))
+
+        stats.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        debug(f"Access stats for {domain}: {parsed} new lines, {skipped} skipped")
+        if skipped and not parsed:
+            warn(f"⚠️ Access log of {domain} is not in a recognised format")
+        return stats
+
+    @log_call
+    def update_all(self, domains: Optional[List[str]] = None) -> List[SiteAccessStats]:
+        """
+        Update totals for several websites and save the state.
+
+        Args:
+            domains: Websites to update (defaults to all websites)
+
+        Returns:
+            List[SiteAccessStats]: Updated totals
+        """
+        if domains is None:
+            from src.features.website.utils import website_list
+            domains = website_list()
+
+        results = []
+        for domain in domains:
+            try:
+                results.append(self.update_site(domain))
+            except IOError as e:
+                error(f"❌ Could not read access log for {domain}: {e}")
+        self.save()
+        return results
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def print_access_stats(stats_list: List[SiteAccessStats], top: int = 5) -> None:
+    """
+    Print a cache and latency report for several websites.
+
+    Args:
+        stats_list: Totals to report
+        top: Number of uncached URLs to list per website
+    """
+    console = Console()
+    if not stats_list:
+        console.print("No access statistics available.", style="bold red")
+        return
+
+    table = Table(title="📊 FastCGI Cache Statistics", header_style="bold cyan")
+    table.add_column("Domain", style="bold white")
+    table.add_column("Requests", justify="right")
+    table.add_column("Hit ratio", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Since")
+
+    def ms(value: Optional[float]) -> str:
+        return f"{value:.0f} ms" if value is not None else "-"
+
+    for stats in stats_list:
+        summary = stats.summary(top)
+        ratio = summary["hit_ratio"]
+        if ratio is None:
+            ratio_str = "-"
+        else:
+            style = "green" if ratio >= 0.8 else "yellow" if ratio >= 0.5 else "red"
+            ratio_str = f"[{style}]{ratio * 100:.1f}%[/{style}]"
+        table.add_row(
+            stats.domain,
+            str(summary["requests"]),
+            ratio_str,
+            ms(summary["p50_ms"]),
+            ms(summary["p95_ms"]),
+            ms(summary["p99_ms"]),
+            _format_bytes(summary["bytes"]),
+            summary["since"],
+        )
+    console.print(table)
+
+    for stats in stats_list:
+        uncached = stats.top_uncached(top)
+        if not uncached:
+            continue
+        url_table = Table(title=f"Top uncached URLs: {stats.domain}", header_style="bold cyan")
+        url_table.add_column("Path", style="white")
+        url_table.add_column("Requests", justify="right")
+        for path, count in uncached:
+            url_table.add_row(path, str(count))
+        console.print(url_table)
@@ -3,16 +3,14 @@ CLI interface for NGINX module.
 
 This module exports CLI functions and the main command group.
 """
-from src.features.nginx.cli.main import nginx_cli
-from src.features.nginx.cli.config import cli_test_config
-from src.features.nginx.cli.reload import cli_reload
-from src.features.nginx.cli.restart import cli_restart
-from src.features.nginx.cli.cache import cli_manage_cache
 
-__all__ = [
-    "nginx_cli",
-    "cli_test_config",
-    "cli_reload",
-    "cli_restart",
-    "cli_manage_cache"
-]
\ No newline at end of file
+from src.common.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.nginx.cli.main": ["nginx_cli"],
+    "src.features.nginx.cli.config": ["cli_test_config"],
+    "src.features.nginx.cli.reload": ["cli_reload"],
+    "src.features.nginx.cli.restart": ["cli_restart"],
+    "src.features.nginx.cli.cache": ["cli_manage_cache"],
+    "src.features.nginx.cli.stats": ["cli_access_stats"],
+})
@@ -6,10 +6,13 @@ with commands for testing configurations, reloading, restarting,
 and managing cache settings.
 """
 
+import sys
+
 import click
 from typing import Optional, List
 
 from src.common.logging import info, error, debug
+from src.common.profiling import profile_command
 
 
 @click.group(name="nginx")
@@ -23,13 +26,16 @@ from src.features.nginx.cli.config import test_config_cli
 from src.features.nginx.cli.reload import reload_cli
 from src.features.nginx.cli.restart import restart_cli
 from src.features.nginx.cli.cache import cache_cli
+from src.features.nginx.cli.stats import stats_cli
 
 # Add subcommands to the main group
 nginx_cli.add_command(test_config_cli)
 nginx_cli.add_command(reload_cli)
 nginx_cli.add_command(restart_cli)
 nginx_cli.add_command(cache_cli)
+nginx_cli.add_command(stats_cli)
 
 
 if __name__ == "__main__":
-    nginx_cli()
\ No newline at end of file
+    with profile_command("nginx " + " ".join(sys.argv[1:2])):
+        nginx_cli()
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+NGINX access statistics CLI module.
+
+This module provides a command for reporting FastCGI cache hit ratio,
+latency percentiles and traffic per website from the access logs.
+"""
+
+import json
+import click
+from typing import Optional
+
+from src.common.logging import error
+from src.features.nginx.analytics import AccessLogAnalyzer, print_access_stats
+
+
+def cli_access_stats(website: Optional[str] = None, json_output: bool = False,
+                     reset: bool = False, top: int = 5) -> bool:
+    """
+    Update and display access log statistics.
+
+    Args:
+        website: Website to report on (all websites if None)
+        json_output: Whether to print JSON instead of tables
+        reset: Whether to reset totals before reading new lines
+        top: Number of uncached URLs to show per website
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        analyzer = AccessLogAnalyzer()
+        if reset:
+            analyzer.reset(website)
+        stats_list = analyzer.update_all([website] if website else None)
+
+        if json_output:
+            print(json.dumps([s.summary(top) for s in stats_list], indent=2))
+        else:
+            print_access_stats(stats_list, top)
+        return True
+    except Exception as e:
+        error(f"❌ Error computing access statistics: {str(e)}")
+        return False
+
+
+@click.command(name="stats")
+@click.option("--website", required=False, help="Website domain (default: all websites)")
+@click.option("--json", "json_output", is_flag=True, help="Output in JSON format")
+@click.option("--reset", is_flag=True, help="Reset totals before reading new log lines")
+@click.option("--top", default=5, show_default=True, help="Number of uncached URLs to show")
+def stats_cli(website: Optional[str], json_output: bool, reset: bool, top: int):
+    """Show FastCGI cache hit ratio and latency from access logs."""
+    if not cli_access_stats(website, json_output, reset, top):
+        ctx = click.get_current_context()
+        ctx.exit(1)
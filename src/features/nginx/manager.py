@@ -37,7 +37,10 @@ def test_config() -> bool:
     
     try:
         container = Container(name=container_name)
-        container.exec(["openresty", "-t"])
+        # Container.exec returns None when the command exits with an error
+        if container.exec(["openresty", "-t"]) is None:
+            error("❌ NGINX configuration test failed.")
+            return False
         info("✅ NGINX configuration is valid.")
         return True
     except Exception as e:
@@ -65,7 +68,9 @@ def reload() -> bool:
     
     try:
         container = Container(name=container_name)
-        container.exec(["openresty", "-s", "reload"])
+        if container.exec(["openresty", "-s", "reload"]) is None:
+            error("❌ NGINX reload failed.")
+            return False
         info("🔄 NGINX reloaded successfully.")
         return True
     except Exception as e:
@@ -73,6 +78,33 @@ def reload() -> bool:
         return False
 
 
+@log_call
+def reopen_logs() -> bool:
+    """
+    Make NGINX reopen its log files.
+
+    Used after log rotation so workers write to the new files. Unlike a
+    reload, no configuration is re-read and no workers are replaced.
+
+    Returns:
+        bool: True if the signal was sent, False otherwise.
+    """
+    if not compose_nginx:
+        error("❌ NGINX container information not found.")
+        return False
+
+    try:
+        container = Container(name=container_name)
+        if container.exec(["openresty", "-s", "reopen"]) is None:
+            error("❌ NGINX could not reopen its log files.")
+            return False
+        debug("NGINX log files reopened.")
+        return True
+    except Exception as e:
+        error(f"❌ Error reopening NGINX log files: {e}")
+        return False
+
+
 @log_call
 def restart() -> bool:
     """
@@ -5,90 +5,55 @@ This package provides functionality for managing PHP installations,
 including version selection, configuration, and extension management.
 """
 
-# Core utilities
-from src.features.php.utils import (
-    get_php_container_id_by_name,
-    get_php_container_id,
-    get_php_container_name,
-    php_choose_version,
-    AVAILABLE_PHP_VERSIONS
-)
+from src.common.utils.lazy import lazy_exports
 
-# Container client
-from src.features.php.client import (
-    init_php_client,
-    run_php_command,
-    run_php_script
-)
-
-# Version management
-from src.features.php.version import (
-    change_php_version,
-    get_current_php_version,
-    restore_php_extensions
-)
-
-# Configuration management
-from src.features.php.config import (
-    edit_php_ini,
-    edit_php_fpm_pool,
-    backup_php_config,
-    restore_php_config_backup
-)
-
-# Extensions management
-from src.features.php.extensions import (
-    install_php_extension,
-    uninstall_php_extension,
-    get_installed_extensions,
-    get_available_extensions,
-    BaseExtension
-)
-
-# CLI interfaces
-from src.features.php.cli import (
-    cli_change_php_version,
-    cli_edit_php_config,
-    cli_list_extensions,
-    cli_install_extension,
-    cli_uninstall_extension
-)
-
-__all__ = [
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
     # Core utilities
-    'get_php_container_id_by_name',
-    'get_php_container_id',
-    'get_php_container_name',
-    'php_choose_version',
-    'AVAILABLE_PHP_VERSIONS',
-    
+    "src.features.php.utils": [
+        "get_php_container_id_by_name",
+        "get_php_container_id",
+        "get_php_container_name",
+        "php_choose_version",
+        "AVAILABLE_PHP_VERSIONS",
+    ],
     # Container client
-    'init_php_client',
-    'run_php_command',
-    'run_php_script',
-    
+    "src.features.php.client": [
+        "init_php_client",
+        "test_php_fpm_config",
+        "reload_php_fpm",
+        "apply_php_config",
+        "run_php_command",
+        "run_php_script",
+        "run_fpm_request",
+    ],
     # Version management
-    'change_php_version',
-    'get_current_php_version',
-    'restore_php_extensions',
-    
+    "src.features.php.version": [
+        "change_php_version",
+        "get_current_php_version",
+        "restore_php_extensions",
+    ],
+    "src.features.php.switch": ["switch_php_version", "rollback_php_version"],
     # Configuration management
-    'edit_php_ini',
-    'edit_php_fpm_pool',
-    'backup_php_config',
-    'restore_php_config_backup',
-    
+    "src.features.php.config": [
+        "edit_php_ini",
+        "edit_php_fpm_pool",
+        "backup_php_config",
+        "restore_php_config_backup",
+    ],
     # Extensions management
-    'install_php_extension',
-    'uninstall_php_extension',
-    'get_installed_extensions',
-    'get_available_extensions',
-    'BaseExtension',
-    
+    "src.features.php.extensions": [
+        "install_php_extension",
+        "uninstall_php_extension",
+        "get_installed_extensions",
+        "get_available_extensions",
+        "BaseExtension",
+    ],
     # CLI interfaces
-    'cli_change_php_version',
-    'cli_edit_php_config',
-    'cli_list_extensions',
-    'cli_install_extension',
-    'cli_uninstall_extension'
-]
\ No newline at end of file
+    "src.features.php.cli": [
+        "cli_change_php_version",
+        "cli_edit_php_config",
+        "cli_list_extensions",
+        "cli_install_extension",
+        "cli_uninstall_extension",
+    ],
+})
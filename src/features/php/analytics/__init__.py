@@ -0,0 +1,28 @@
+"""
+PHP slow log analytics.
+
+This package parses per-site PHP-FPM slow logs and aggregates slow requests
+by plugin, theme and function incrementally.
+"""
+
+from src.features.php.analytics.slow_log import (
+    SlowLogEntry,
+    SlowLogFrame,
+    classify_component,
+    parse_slow_log
+)
+from src.features.php.analytics.slow_profile import (
+    SlowLogAnalyzer,
+    SiteSlowProfile,
+    print_slow_profile
+)
+
+__all__ = [
+    'SlowLogEntry',
+    'SlowLogFrame',
+    'classify_component',
+    'parse_slow_log',
+    'SlowLogAnalyzer',
+    'SiteSlowProfile',
+    'print_slow_profile'
+]
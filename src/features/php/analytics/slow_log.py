@@ -0,0 +1,173 @@
+"""
+PHP-FPM slow log parsing.
+
+PHP-FPM writes a stack trace to ``php_slow.log`` for every request that runs
+longer than ``request_slowlog_timeout``::
+
+    [18-Oct-2026 14:00:01]  [pool www] pid 1234
+    script_filename = /var/www/html/index.php
+    [0x00007f1c3e613e40] curl_exec() /var/www/html/wp-content/plugins/foo/http.php:123
+    [0x00007f1c3e613d80] request() /var/www/html/wp-includes/class-http.php:45
+    ...
+
+This module turns those blocks into entries and maps each frame to the
+WordPress component (plugin, theme, core) whose file it is in.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+HEADER_PATTERN = re.compile(
+    r"^\[(?P<time>\d{2}-\w{3}-\d{4} \d{2}:\d{2}:\d{2})[^\]]*\]\s+"
+    r"\[pool (?P<pool>[^\]]+)\] pid (?P<pid>\d+)"
+)
+SCRIPT_PATTERN = re.compile(r"^script_filename = (?P<script>.+)$")
+FRAME_PATTERN = re.compile(r"^\[0x[0-9a-f]+\] (?P<function>.+?)\(\) (?P<file>\S+?):(?P<line>\d+)$")
+
+SLOW_LOG_TIME_FORMAT = "%d-%b-%Y %H:%M:%S"
+
+# Path prefixes mapped to component kinds, most specific first
+COMPONENT_PATTERNS = [
+    (re.compile(r"/wp-content/mu-plugins/([^/]+)"), "mu-plugin"),
+    (re.compile(r"/wp-content/plugins/([^/]+)"), "plugin"),
+    (re.compile(r"/wp-content/themes/([^/]+)"), "theme"),
+    (re.compile(r"/wp-(?:includes|admin)/"), "core"),
+]
+
+
+@dataclass
+class SlowLogFrame:
+    """One stack frame of a slow request."""
+
+    function: str
+    file: str
+    line: int
+
+    @property
+    def component(self) -> str:
+        return classify_component(self.file)
+
+    @property
+    def label(self) -> str:
+        """Frame name used in reports and folded stacks."""
+        return f"{self.function}()"
+
+
+@dataclass
+class SlowLogEntry:
+    """A slow request with its stack trace, innermost frame first."""
+
+    timestamp: Optional[float]
+    pool: str
+    pid: int
+    script: Optional[str] = None
+    frames: List[SlowLogFrame] = field(default_factory=list)
+    # Index of the header line among the lines parsed
+    start_line: int = 0
+    # Whether a blank line or the next header ended the trace; PHP-FPM
+    # writes the frames one at a time, so a trace at the end of the log
+    # may still grow
+    complete: bool = False
+
+    @property
+    def culprit(self) -> str:
+        """
+        The innermost non-core component on the stack.
+
+        This is the plugin or theme that made the call which was still
+        running when the timeout hit, falling back to core or other code.
+        """
+        components = [frame.component for frame in self.frames]
+        for component in components:
+            if component not in ("core", "other"):
+                return component
+        return components[0] if components else "other"
+
+    def folded_stack(self) -> str:
+        """Stack in folded format (outermost first, ``;`` separated)."""
+        return ";".join(frame.label for frame in reversed(self.frames))
+
+
+def classify_component(path: str) -> str:
+    """
+    Map a PHP file path to the WordPress component it belongs to.
+
+    Args:
+        path: File path from a stack frame
+
+    Returns:
+        str: e.g. "plugin:woocommerce", "theme:astra", "core" or "other"
+    """
+    for pattern, kind in COMPONENT_PATTERNS:
+        match = pattern.search(path)
+        if match:
+            return f"{kind}:{match.group(1)}" if match.groups() else kind
+    return "other"
+
+
+def _parse_header(line: str, number: int = 0) -> Optional[SlowLogEntry]:
+    match = HEADER_PATTERN.match(line)
+    if not match:
+        return None
+    try:
+        timestamp = datetime.strptime(match.group("time"), SLOW_LOG_TIME_FORMAT).timestamp()
+    except ValueError:
+        timestamp = None
+    return SlowLogEntry(
+        timestamp=timestamp,
+        pool=match.group("pool"),
+        pid=int(match.group("pid")),
+        start_line=number,
+    )
+
+
+def parse_slow_log(lines: Iterable[str]) -> Iterator[SlowLogEntry]:
+    """
+    Group slow log lines into entries.
+
+    Lines that do not belong to a recognised entry are skipped, so reading
+    can start in the middle of a trace.
+
+    Args:
+        lines: Slow log lines
+
+    Yields:
+        SlowLogEntry: Entries with at least one stack frame. If the lines
+        end inside a trace, that entry comes last, is not marked complete
+        and may have no frames yet.
+    """
+    current: Optional[SlowLogEntry] = None
+    for number, raw in enumerate(lines):
+        line = raw.rstrip("\r\n")
+        entry = _parse_header(line, number)
+        if entry is not None:
+            if current and current.frames:
+                current.complete = True
+                yield current
+            current = entry
+            continue
+        if current is None:
+            continue
+        if not line.strip():
+            if current.frames:
+                current.complete = True
+                yield current
+            current = None
+            continue
+
+        script = SCRIPT_PATTERN.match(line)
+        if script:
+            current.script = script.group("script")
+            continue
+        frame = FRAME_PATTERN.match(line)
+        if frame:
+            current.frames.append(SlowLogFrame(
+                function=frame.group("function"),
+                file=frame.group("file"),
+                line=int(frame.group("line")),
+            ))
+
+    if current is not None:
+        yield current
@@ -0,0 +1,356 @@
+"""
+PHP slow request profiling.
+
+This module reads each website's PHP-FPM slow log incrementally and keeps
+per-site aggregates: slow requests per plugin, theme and function, and the
+folded stacks needed to draw a flamegraph. PHP-FPM does not log how long a
+slow request took, only that it passed ``request_slowlog_timeout``, so time
+figures are lower bounds computed as count x timeout.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn, error
+from src.common.utils.environment import env
+from src.common.utils.incremental_reader import IncrementalReader
+from src.features.php.analytics.slow_log import SlowLogEntry, parse_slow_log
+
+DEFAULT_SLOWLOG_TIMEOUT = 10
+
+# Distinct folded stacks and functions kept per site between runs
+MAX_TRACKED_STACKS = 2000
+MAX_TRACKED_FUNCTIONS = 2000
+
+SLOWLOG_TIMEOUT_PATTERN = re.compile(
+    r"^\s*request_slowlog_timeout\s*=\s*(\d+)\s*([smh]?)\s*$", re.MULTILINE
+)
+
+
+def get_analytics_dir() -> str:
+    return os.path.join(env["DATA_DIR"], "analytics")
+
+
+def get_slowlog_timeout(domain: str) -> int:
+    """
+    Read the slow log threshold of a website's PHP-FPM pool.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        int: Threshold in seconds
+    """
+    fpm_conf = os.path.join(env["SITES_DIR"], domain, "php", "php-fpm.conf")
+    try:
+        with open(fpm_conf, "r") as f:
+            match = SLOWLOG_TIMEOUT_PATTERN.search(f.read())
+    except IOError:
+        return DEFAULT_SLOWLOG_TIMEOUT
+    if not match:
+        return DEFAULT_SLOWLOG_TIMEOUT
+    value = int(match.group(1))
+    return value * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
+
+
+def _increment(counter: Dict[str, int], key: str, amount: int = 1) -> None:
+    counter[key] = counter.get(key, 0) + amount
+
+
+def _top(counter: Dict[str, int], limit: int) -> List[tuple]:
+    return sorted(counter.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+@dataclass
+class SiteSlowProfile:
+    """Running slow log aggregates for one website."""
+
+    domain: str
+    since: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    updated_at: Optional[str] = None
+    timeout: int = DEFAULT_SLOWLOG_TIMEOUT
+    requests: int = 0
+    # Component the slow call was made from (innermost plugin/theme)
+    culprits: Dict[str, int] = field(default_factory=dict)
+    # Component anywhere on the stack, counted once per request
+    components: Dict[str, int] = field(default_factory=dict)
+    # Innermost frame, i.e. the function that was running
+    functions_self: Dict[str, int] = field(default_factory=dict)
+    # Function anywhere on the stack, counted once per request
+    functions_total: Dict[str, int] = field(default_factory=dict)
+    scripts: Dict[str, int] = field(default_factory=dict)
+    stacks: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, entry: SlowLogEntry) -> None:
+        """Add one slow request to the aggregates."""
+        self.requests += 1
+        _increment(self.culprits, entry.culprit)
+        for component in {frame.component for frame in entry.frames}:
+            _increment(self.components, component)
+
+        innermost = entry.frames[0]
+        _increment(self.functions_self, f"{innermost.label} [{innermost.component}]")
+        for label in {f"{f.label} [{f.component}]" for f in entry.frames}:
+            _increment(self.functions_total, label)
+
+        if entry.script:
+            _increment(self.scripts, entry.script)
+        _increment(self.stacks, entry.folded_stack())
+
+    def prune(self) -> None:
+        """Keep the bookkeeping bounded for long-running sites."""
+        if len(self.stacks) > MAX_TRACKED_STACKS:
+            self.stacks = dict(_top(self.stacks, MAX_TRACKED_STACKS))
+        if len(self.functions_total) > MAX_TRACKED_FUNCTIONS:
+            self.functions_total = dict(_top(self.functions_total, MAX_TRACKED_FUNCTIONS))
+        if len(self.functions_self) > MAX_TRACKED_FUNCTIONS:
+            self.functions_self = dict(_top(self.functions_self, MAX_TRACKED_FUNCTIONS))
+
+    def ranking(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank components by the slow requests they caused.
+
+        Args:
+            limit: Number of components to return
+
+        Returns:
+            List[Dict[str, Any]]: Component, slow requests, share and minimum seconds
+        """
+        rows = []
+        for component, count in _top(self.culprits, limit):
+            rows.append({
+                "component": component,
+                "slow_requests": count,
+                "on_stack": self.components.get(component, count),
+                "share": round(count / self.requests, 4) if self.requests else 0,
+                "min_seconds": count * self.timeout,
+            })
+        return rows
+
+    def folded(self) -> str:
+        """Folded stacks for flamegraph.pl or speedscope, weighted by minimum seconds."""
+        return "\n".join(f"{stack} {count * self.timeout}"
+                         for stack, count in _top(self.stacks, len(self.stacks)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "since": self.since,
+            "updated_at": self.updated_at,
+            "timeout": self.timeout,
+            "requests": self.requests,
+            "culprits": self.culprits,
+            "components": self.components,
+            "functions_self": self.functions_self,
+            "functions_total": self.functions_total,
+            "scripts": self.scripts,
+            "stacks": self.stacks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteSlowProfile":
+        return cls(
+            domain=data.get("domain"),
+            since=data.get("since") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            updated_at=data.get("updated_at"),
+            timeout=data.get("timeout", DEFAULT_SLOWLOG_TIMEOUT),
+            requests=data.get("requests", 0),
+            culprits=data.get("culprits", {}),
+            components=data.get("components", {}),
+            functions_self=data.get("functions_self", {}),
+            functions_total=data.get("functions_total", {}),
+            scripts=data.get("scripts", {}),
+            stacks=data.get("stacks", {}),
+        )
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Get the computed rankings for reporting.
+
+        Args:
+            top: Number of rows per ranking
+
+        Returns:
+            Dict[str, Any]: Component, function and script rankings
+        """
+        return {
+            "domain": self.domain,
+            "since": self.since,
+            "updated_at": self.updated_at,
+            "timeout": self.timeout,
+            "requests": self.requests,
+            "components": self.ranking(top),
+            "functions": [
+                {"function": f, "self": c, "total": self.functions_total.get(f, c)}
+                for f, c in _top(self.functions_self, top)
+            ],
+            "scripts": [{"script": s, "count": c} for s, c in _top(self.scripts, top)],
+        }
+
+
+class SlowLogAnalyzer:
+    """Incrementally aggregates per-site PHP slow logs."""
+
+    def __init__(self, data_dir: Optional[str] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            data_dir: Directory for offsets and aggregates (defaults to DATA_DIR/analytics)
+        """
+        self.data_dir = data_dir or get_analytics_dir()
+        self.stats_file = os.path.join(self.data_dir, "slowlog_stats.json")
+        self.reader = IncrementalReader(os.path.join(self.data_dir, "slowlog_offsets.json"))
+        self.profiles: Dict[str, SiteSlowProfile] = self._load()
+
+    def _load(self) -> Dict[str, SiteSlowProfile]:
+        if not os.path.exists(self.stats_file):
+            return {}
+        try:
+            with open(self.stats_file, "r") as f:
+                raw = json.load(f)
+            return {domain: SiteSlowProfile.from_dict(data) for domain, data in raw.items()}
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read slow log stats: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist aggregates and offsets."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        tmp_file = f"{self.stats_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({d: p.to_dict() for d, p in self.profiles.items()}, f)
+        os.replace(tmp_file, self.stats_file)
+        self.reader.commit()
+
+    def reset(self, domain: Optional[str] = None) -> None:
+        """
+        Reset aggregates, keeping offsets so old entries are not counted again.
+
+        Args:
+            domain: Website to reset, or None for all
+        """
+        if domain is None:
+            self.profiles = {}
+        else:
+            self.profiles.pop(domain, None)
+
+    @staticmethod
+    def get_slow_log_path(domain: str) -> str:
+        return os.path.join(env["SITES_DIR"], domain, "logs", "php_slow.log")
+
+    def update_site(self, domain: str) -> SiteSlowProfile:
+        """
+        Read new slow log entries for a website and update its aggregates.
+
+        Args:
+            domain: Website domain name
+
+        Returns:
+            SiteSlowProfile: Updated aggregates for the website
+        """
+        profile = self.profiles.setdefault(domain, SiteSlowProfile(domain=domain))
+        profile.timeout = get_slowlog_timeout(domain)
+
+        # Offset of every line read, to rewind to a trace that is still being written
+        offsets: List[Optional[int]] = []
+
+        def lines() -> Iterator[str]:
+            for line, offset in self.reader.read_with_offsets(
+                    self.get_slow_log_path(domain), key=domain):
+                offsets.append(offset)
+                yield line
+
+        parsed = 0
+        for entry in parse_slow_log(lines()):
+            start = offsets[entry.start_line]
+            if not entry.complete and start is not None:
+                # Read it again, with the rest of its frames, next run
+                self.reader.rewind(domain, start)
+                break
+            if entry.frames:
+                profile.add(entry)
+                parsed += 1
+        profile.prune()
+
+        profile.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        debug(f"Slow log for {domain}: {parsed} new slow requests")
+        return profile
+
+    @log_call
+    def update_all(self, domains: Optional[List[str]] = None) -> List[SiteSlowProfile]:
+        """
+        Update aggregates for several websites and save the state.
+
+        Args:
+            domains: Websites to update (defaults to all websites)
+
+        Returns:
+            List[SiteSlowProfile]: Updated aggregates
+        """
+        if domains is None:
+            from src.features.website.utils import website_list
+            domains = website_list()
+
+        results = []
+        for domain in domains:
+            try:
+                results.append(self.update_site(domain))
+            except IOError as e:
+                error(f"❌ Could not read slow log for {domain}: {e}")
+        self.save()
+        return results
+
+
+def print_slow_profile(profiles: List[SiteSlowProfile], top: int = 10) -> None:
+    """
+    Print plugin, theme and function rankings for several websites.
+
+    Args:
+        profiles: Aggregates to report
+        top: Number of rows per ranking
+    """
+    console = Console()
+    profiles = [p for p in profiles if p.requests]
+    if not profiles:
+        console.print("No slow requests recorded.", style="bold green")
+        return
+
+    for profile in profiles:
+        console.print(
+            f"\n[bold cyan]🐢 {profile.domain}[/bold cyan]: {profile.requests} slow requests "
+            f"(>{profile.timeout}s) since {profile.since}"
+        )
+
+        table = Table(title="Slow requests by component", header_style="bold cyan")
+        table.add_column("Component", style="bold white")
+        table.add_column("Caused", justify="right")
+        table.add_column("Share", justify="right")
+        table.add_column("On stack", justify="right")
+        table.add_column("Min. time", justify="right")
+        for row in profile.ranking(top):
+            share = row["share"] * 100
+            style = "red" if share >= 50 else "yellow" if share >= 20 else "white"
+            table.add_row(
+                row["component"],
+                str(row["slow_requests"]),
+                f"[{style}]{share:.1f}%[/{style}]",
+                str(row["on_stack"]),
+                f"{row['min_seconds']}s",
+            )
+        console.print(table)
+
+        func_table = Table(title="Hot functions", header_style="bold cyan")
+        func_table.add_column("Function", style="white")
+        func_table.add_column("Self", justify="right")
+        func_table.add_column("Total", justify="right")
+        for func in profile.summary(top)["functions"]:
+            func_table.add_row(func["function"], str(func["self"]), str(func["total"]))
+        console.print(func_table)
@@ -0,0 +1,390 @@
+"""
+Host-wide PHP-FPM capacity planning.
+
+Every website runs its own PHP-FPM pool on the same host, so sizing each
+pool against the whole host's RAM lets the pools together promise several
+times the memory that exists. This module plans all pools together: it
+measures the memory used per worker in each container, weights each site
+by the PHP time it served recently (busy seconds from the access log
+analytics, which by Little's law is proportional to the workers it keeps
+busy) and divides the RAM left after a host reservation between them.
+Worker sizes come from the samples kept by src.features.php.worker_memory.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, info, warn, error
+from src.common.utils.environment import env
+from src.common.utils.system_info import get_total_ram_mb, get_total_cpu_cores
+from src.features.php.utils import validate_ini_content, write_mounted_file
+from src.features.php.worker_memory import WorkerMemorySampler
+from src.features.website.utils import get_resource_profile, calculate_spare_servers
+
+# Every pool keeps at least this many workers
+MIN_CHILDREN = 2
+
+# Sites without traffic data get this fraction of an average site's weight
+BASELINE_WEIGHT = 0.25
+
+# Pools only grow when the new size differs by at least this fraction;
+# shrinking is always applied so the host stays within its memory
+REBALANCE_THRESHOLD = 0.15
+
+@dataclass
+class SiteCapacity:
+    """Measurements and planned PHP-FPM pool size of one website."""
+
+    domain: str
+    worker_mb: float
+    samples: int = 0
+    busy_seconds: float = 0.0
+    weight: float = 0.0
+    budget_mb: float = 0.0
+    current: Dict[str, str] = field(default_factory=dict)
+    plan: Dict[str, Any] = field(default_factory=dict)
+    changed: bool = False
+
+    @property
+    def current_max_children(self) -> Optional[int]:
+        try:
+            return int(self.current.get("pm.max_children"))
+        except (TypeError, ValueError):
+            return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "worker_mb": round(self.worker_mb, 1),
+            "samples": self.samples,
+            "busy_seconds": round(self.busy_seconds, 1),
+            "weight": round(self.weight, 4),
+            "budget_mb": round(self.budget_mb),
+            "current_max_children": self.current_max_children,
+            "plan": self.plan,
+            "changed": self.changed,
+        }
+
+
+def get_fpm_pool_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "php", "php-fpm.conf")
+
+
+def read_fpm_pool(domain: str) -> Dict[str, str]:
+    """
+    Read the key = value settings of a website's PHP-FPM pool.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        Dict[str, str]: Pool settings, empty if the file does not exist
+    """
+    values = {}
+    try:
+        with open(get_fpm_pool_path(domain), "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith((";", "#", "[")) or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                values[key.strip()] = value.strip()
+    except IOError:
+        pass
+    return values
+
+
+def write_fpm_pool(domain: str, values: Dict[str, Any]) -> bool:
+    """
+    Update settings in a website's PHP-FPM pool file in place.
+
+    Other settings and comments are kept; missing keys are appended.
+
+    Args:
+        domain: Website domain name
+        values: Settings to write
+
+    Returns:
+        bool: True if the file was written, False otherwise
+    """
+    path = get_fpm_pool_path(domain)
+    try:
+        with open(path, "r") as f:
+            content = f.read()
+    except IOError as e:
+        error(f"❌ Could not read {path}: {e}")
+        return False
+
+    for key, value in values.items():
+        pattern = re.compile(rf"^\s*{re.escape(key)}\s*=.*$", re.MULTILINE)
+        line = f"{key} = {value}"
+        if pattern.search(content):
+            content = pattern.sub(line, content, count=1)
+        else:
+            content = content.rstrip("\n") + f"\n{line}\n"
+
+    invalid = validate_ini_content(content)
+    if invalid is not None:
+        error(f"❌ Refusing to write {path}, invalid line: {invalid.strip()}")
+        return False
+    try:
+        write_mounted_file(path, content)
+    except IOError as e:
+        error(f"❌ Could not write {path}: {e}")
+        return False
+    return True
+
+
+class CapacityPlanner:
+    """Plans PHP-FPM pool sizes for all websites on the host."""
+
+    def __init__(self, total_ram_mb: Optional[int] = None, total_cpu: Optional[int] = None,
+                 reserved_mb: Optional[int] = None,
+                 sampler: Optional[WorkerMemorySampler] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            total_ram_mb: Host RAM in MB (detected if omitted)
+            total_cpu: Host CPU cores (detected if omitted)
+            reserved_mb: RAM kept for the OS, MySQL, Redis and NGINX
+                (defaults to the reservation of the host's resource group)
+            sampler: Worker memory sampler (defaults to the shared samples)
+        """
+        self.total_ram_mb = total_ram_mb or get_total_ram_mb()
+        self.total_cpu = total_cpu or get_total_cpu_cores()
+        self.profile = get_resource_profile(self.total_ram_mb, self.total_cpu)
+        self.reserved_mb = reserved_mb if reserved_mb is not None else self.profile["reserved_ram"]
+        self.sampler = sampler or WorkerMemorySampler()
+
+    @property
+    def pool_mb(self) -> int:
+        """RAM that all PHP-FPM pools together may use."""
+        return max(self.total_ram_mb - self.reserved_mb, 0)
+
+    @property
+    def max_children_cap(self) -> int:
+        """Upper bound per pool, beyond which more workers only add CPU contention."""
+        return self.total_cpu * self.profile["cpu_multiplier"]
+
+    def save(self) -> None:
+        """Persist the worker memory samples taken while collecting."""
+        self.sampler.save()
+
+    def collect(self, domains: List[str], measure: bool = True) -> List[SiteCapacity]:
+        """
+        Gather worker memory, traffic and current settings of websites.
+
+        Worker size is the 90th percentile of the site's sampled workers,
+        or the resource group default until the site has been sampled.
+
+        Args:
+            domains: Websites on the host
+            measure: Whether to measure worker memory in the containers
+
+        Returns:
+            List[SiteCapacity]: One entry per website
+        """
+        from src.features.nginx.analytics import AccessLogAnalyzer
+
+        access_stats = {s.domain: s for s in AccessLogAnalyzer().update_all(domains)}
+
+        sites = []
+        for domain in domains:
+            if measure:
+                self.sampler.sample_site(domain)
+
+            busy_seconds = 0.0
+            stats = access_stats.get(domain)
+            if stats:
+                mean_ms = stats.upstream_latency.mean()
+                if mean_ms is not None:
+                    busy_seconds = stats.upstream_latency.count * mean_ms / 1000
+
+            sites.append(SiteCapacity(
+                domain=domain,
+                worker_mb=self.sampler.worker_mb(domain) or self.profile["avg_process_size"],
+                samples=len(self.sampler.samples.get(domain, [])),
+                busy_seconds=busy_seconds,
+                current=read_fpm_pool(domain),
+            ))
+        return sites
+
+    def plan(self, sites: List[SiteCapacity]) -> List[SiteCapacity]:
+        """
+        Divide the PHP RAM between websites and size each pool.
+
+        Every pool first gets MIN_CHILDREN workers; the rest of the RAM is
+        shared by weight, and RAM a pool cannot use because it hit the CPU
+        cap is handed on to the others.
+
+        Args:
+            sites: Collected website data
+
+        Returns:
+            List[SiteCapacity]: The same entries with budget and plan filled in
+        """
+        if not sites:
+            return sites
+
+        total_busy = sum(s.busy_seconds for s in sites)
+        baseline = BASELINE_WEIGHT * total_busy / len(sites) if total_busy else 1.0
+        for site in sites:
+            site.weight = max(site.busy_seconds, baseline)
+        total_weight = sum(s.weight for s in sites)
+        for site in sites:
+            site.weight /= total_weight
+
+        for site in sites:
+            site.budget_mb = MIN_CHILDREN * site.worker_mb
+        remaining = self.pool_mb - sum(s.budget_mb for s in sites)
+        if remaining < 0:
+            warn(f"⚠️ {len(sites)} PHP pools need {self.pool_mb - remaining:.0f} MB at minimum "
+                 f"but only {self.pool_mb} MB is available; memory is overcommitted")
+
+        open_sites = list(sites)
+        while remaining > 1 and open_sites:
+            open_weight = sum(s.weight for s in open_sites)
+            handed_out = 0.0
+            for site in list(open_sites):
+                cap_mb = self.max_children_cap * site.worker_mb
+                share = remaining * site.weight / open_weight
+                grant = min(share, cap_mb - site.budget_mb)
+                site.budget_mb += grant
+                handed_out += grant
+                if site.budget_mb >= cap_mb - 1e-6:
+                    open_sites.remove(site)
+            remaining -= handed_out
+            if handed_out < 1:
+                break
+
+        for site in sites:
+            max_children = int(site.budget_mb // site.worker_mb)
+            max_children = max(MIN_CHILDREN, min(max_children, self.max_children_cap))
+            pm_mode = "dynamic" if site.weight >= 0.25 and max_children >= 8 else "ondemand"
+            site.plan = {
+                "pm": pm_mode,
+                "pm.max_children": max_children,
+                **{f"pm.{k}": v for k, v in
+                   calculate_spare_servers(pm_mode, max_children, self.total_cpu).items()},
+            }
+            site.changed = self._needs_change(site)
+        return sites
+
+    @staticmethod
+    def _needs_change(site: SiteCapacity) -> bool:
+        current = site.current_max_children
+        planned = site.plan["pm.max_children"]
+        if current is None or site.current.get("pm") != site.plan["pm"]:
+            return True
+        if planned < current:
+            return True
+        return planned > current and (planned - current) / current >= REBALANCE_THRESHOLD
+
+    def apply(self, sites: List[SiteCapacity], force: bool = False) -> List[str]:
+        """
+        Write planned pool sizes and gracefully reload the changed pools.
+
+        Args:
+            sites: Planned websites
+            force: Write every pool, even when the change is below the threshold
+
+        Returns:
+            List[str]: Domains whose pool was changed
+        """
+        from src.features.php.client import apply_php_config
+
+        changed = []
+        for site in sites:
+            if not (site.changed or force):
+                continue
+            if not write_fpm_pool(site.domain, site.plan):
+                continue
+            if apply_php_config(site.domain):
+                changed.append(site.domain)
+                debug(f"PHP-FPM pool of {site.domain}: {site.current_max_children} -> "
+                      f"{site.plan['pm.max_children']} workers")
+        self.save()
+        return changed
+
+
+@log_call
+def rebalance_php_fpm(domains: Optional[List[str]] = None, apply: bool = True,
+                      force: bool = False, reserved_mb: Optional[int] = None) -> List[SiteCapacity]:
+    """
+    Plan PHP-FPM pools for all websites and optionally apply the plan.
+
+    Args:
+        domains: Websites to plan (defaults to all websites)
+        apply: Whether to rewrite php-fpm.conf and reload changed pools
+        force: Rewrite every pool regardless of the rebalance threshold
+        reserved_mb: RAM to keep outside PHP (defaults to the resource group reservation)
+
+    Returns:
+        List[SiteCapacity]: Planned websites
+    """
+    if domains is None:
+        from src.features.website.utils import website_list
+        domains = website_list()
+
+    planner = CapacityPlanner(reserved_mb=reserved_mb)
+    sites = planner.plan(planner.collect(domains))
+    if apply:
+        changed = planner.apply(sites, force)
+        info(f"⚖️ Rebalanced PHP-FPM pools: {len(changed)} of {len(sites)} changed "
+             f"within {planner.pool_mb} MB")
+    else:
+        planner.save()
+    return sites
+
+
+def print_capacity_plan(sites: List[SiteCapacity], pool_mb: Optional[int] = None) -> None:
+    """
+    Print the planned PHP-FPM pool sizes.
+
+    Args:
+        sites: Planned websites
+        pool_mb: RAM available to PHP, shown in the title
+    """
+    console = Console()
+    if not sites:
+        console.print("No websites to plan.", style="bold red")
+        return
+
+    title = "⚖️ PHP-FPM Capacity Plan"
+    if pool_mb is not None:
+        title += f" ({pool_mb} MB for PHP)"
+    table = Table(title=title, header_style="bold cyan")
+    table.add_column("Domain", style="bold white")
+    table.add_column("Worker", justify="right")
+    table.add_column("Busy", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Budget", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Planned", justify="right")
+    table.add_column("pm")
+
+    planned_mb = 0.0
+    for site in sites:
+        planned = site.plan.get("pm.max_children", 0)
+        planned_mb += planned * site.worker_mb
+        current = site.current_max_children
+        style = "yellow" if site.changed else "white"
+        table.add_row(
+            site.domain,
+            f"{site.worker_mb:.0f} MB" + ("" if site.samples else "*"),
+            f"{site.busy_seconds:.0f}s",
+            f"{site.weight * 100:.1f}%",
+            f"{site.budget_mb:.0f} MB",
+            str(current) if current is not None else "-",
+            f"[{style}]{planned}[/{style}]",
+            site.plan.get("pm", "-"),
+        )
+    console.print(table)
+    console.print(f"Planned worker memory: {planned_mb:.0f} MB "
+                  f"(* = default worker size, no workers sampled yet)")
@@ -5,20 +5,19 @@ This package provides command-line interfaces for managing PHP,
 including version changes, configuration editing, and extensions management.
 """
 
-from src.features.php.cli.version import cli_change_php_version
-from src.features.php.cli.config_editor import cli_edit_php_config
-from src.features.php.cli.extensions import (
-    cli_list_extensions,
-    cli_install_extension,
-    cli_uninstall_extension
-)
-from src.features.php.cli.main import main
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'cli_change_php_version',
-    'cli_edit_php_config',
-    'cli_list_extensions',
-    'cli_install_extension',
-    'cli_uninstall_extension',
-    'main'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.php.cli.version": ["cli_change_php_version", "cli_rollback_php_version"],
+    "src.features.php.cli.config_editor": ["cli_edit_php_config"],
+    "src.features.php.cli.extensions": [
+        "cli_list_extensions",
+        "cli_install_extension",
+        "cli_uninstall_extension",
+    ],
+    "src.features.php.cli.slowlog": ["cli_slowlog_report"],
+    "src.features.php.cli.capacity": ["cli_capacity_plan"],
+    "src.features.php.cli.memory": ["cli_worker_memory"],
+    "src.features.php.cli.opcache": ["cli_opcache_advisor"],
+    "src.features.php.cli.images": ["cli_php_images"],
+})
@@ -0,0 +1,39 @@
+"""
+CLI interface for PHP-FPM capacity planning.
+
+This module provides a command-line interface for showing and applying
+host-wide PHP-FPM pool sizes for all websites.
+"""
+
+import json
+from typing import Optional
+
+from src.common.logging import log_call, error
+from src.features.php.capacity import CapacityPlanner, rebalance_php_fpm, print_capacity_plan
+
+
+@log_call
+def cli_capacity_plan(apply: bool = False, force: bool = False,
+                      reserved_mb: Optional[int] = None, json_output: bool = False) -> bool:
+    """
+    Plan PHP-FPM pools for all websites and optionally apply the plan.
+
+    Args:
+        apply: Whether to rewrite php-fpm.conf and reload changed pools
+        force: Rewrite every pool regardless of the rebalance threshold
+        reserved_mb: RAM to keep outside PHP in MB
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        sites = rebalance_php_fpm(apply=apply, force=force, reserved_mb=reserved_mb)
+        if json_output:
+            print(json.dumps([s.to_dict() for s in sites], indent=2))
+        else:
+            print_capacity_plan(sites, CapacityPlanner(reserved_mb=reserved_mb).pool_mb)
+        return True
+    except Exception as e:
+        error(f"❌ Error planning PHP-FPM capacity: {str(e)}")
+        return False
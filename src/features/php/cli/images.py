@@ -0,0 +1,51 @@
+"""
+CLI interface for PHP image management.
+
+This module provides a command-line interface for listing the PHP-FPM
+images and pulling them ahead of time.
+"""
+
+import json
+from typing import List, Optional
+
+from src.common.logging import log_call, info, error
+from src.features.php.images import PhpImageManager, print_image_status
+from src.features.php.utils import AVAILABLE_PHP_VERSIONS
+
+
+@log_call
+def cli_php_images(warmup: bool = False, versions: Optional[List[str]] = None,
+                   refresh: bool = False, json_output: bool = False) -> bool:
+    """
+    List PHP-FPM images and optionally pull them ahead of time.
+
+    Args:
+        warmup: Whether to pull missing images first
+        versions: PHP versions to handle (defaults to all supported versions)
+        refresh: Whether to pull images that are already present
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        unknown = [v for v in versions or [] if v not in AVAILABLE_PHP_VERSIONS]
+        if unknown:
+            error(f"❌ Unsupported PHP version(s): {', '.join(unknown)}")
+            return False
+
+        manager = PhpImageManager()
+        results = {}
+        if warmup:
+            results = manager.warmup(versions, refresh)
+            info(f"📦 {sum(results.values())} of {len(results)} PHP image(s) ready")
+
+        statuses = manager.status(versions)
+        if json_output:
+            print(json.dumps([s.to_dict() for s in statuses], indent=2))
+        else:
+            print_image_status(statuses)
+        return all(results.values())
+    except Exception as e:
+        error(f"❌ Error managing PHP images: {str(e)}")
+        return False
@@ -11,13 +11,19 @@ import argparse
 from typing import List, Optional
 
 from src.common.logging import log_call, info, warn, error, success
-from src.features.php.cli.version import cli_change_php_version
+from src.common.profiling import profiled
+from src.features.php.cli.version import cli_change_php_version, cli_rollback_php_version
 from src.features.php.cli.config_editor import cli_edit_php_config
 from src.features.php.cli.extensions import (
     cli_list_extensions,
     cli_install_extension,
     cli_uninstall_extension
 )
+from src.features.php.cli.slowlog import cli_slowlog_report
+from src.features.php.cli.capacity import cli_capacity_plan
+from src.features.php.cli.memory import cli_worker_memory
+from src.features.php.cli.opcache import cli_opcache_advisor
+from src.features.php.cli.images import cli_php_images
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -34,9 +40,15 @@ def create_parser() -> argparse.ArgumentParser:
         epilog="""
 Examples:
   php version change example.com 8.2    # Change PHP version to 8.2
+  php version rollback example.com      # Go back to the previous PHP version
   php config edit example.com           # Edit PHP configuration
   php extension list example.com        # List installed extensions
   php extension install example.com ioncube  # Install IonCube extension
+  php slowlog example.com --top 5       # Rank plugins behind slow requests
+  php capacity --apply                  # Resize all PHP-FPM pools to fit the host
+  php memory --sample                   # Measure PHP-FPM worker memory
+  php opcache example.com --apply --preload  # Tune OPcache and preload hot files
+  php image warmup                      # Pull all PHP images ahead of time
         """
     )
     
@@ -71,6 +83,21 @@ Examples:
         "version",
         help="PHP version to change to (e.g., 8.2)"
     )
+    version_change_parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Recreate the PHP container in place instead of switching without downtime"
+    )
+
+    # Version rollback
+    version_rollback_parser = version_subparsers.add_parser(
+        "rollback",
+        help="Switch a website back to its previous PHP version"
+    )
+    version_rollback_parser.add_argument(
+        "domain",
+        help="Website domain name"
+    )
     
     # Version check
     version_check_parser = version_subparsers.add_parser(
@@ -181,6 +208,180 @@ Examples:
         help="Extension identifier to uninstall"
     )
     
+    # Slow log command
+    slowlog_parser = subparsers.add_parser(
+        "slowlog",
+        help="Profile slow PHP requests",
+        description="Rank plugins, themes and functions found in the PHP-FPM slow log"
+    )
+    slowlog_parser.add_argument(
+        "domain",
+        nargs="?",
+        help="Website domain name (default: all websites)"
+    )
+    slowlog_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of rows per ranking (default: 10)"
+    )
+    slowlog_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    slowlog_parser.add_argument(
+        "--folded",
+        metavar="FILE",
+        help="Write folded stacks for flamegraph.pl or speedscope to FILE"
+    )
+    slowlog_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Reset aggregates before reading new slow log entries"
+    )
+    
+    # Capacity command
+    capacity_parser = subparsers.add_parser(
+        "capacity",
+        help="Plan PHP-FPM pool sizes for all websites",
+        description="Share the host RAM between all PHP-FPM pools by traffic and worker memory"
+    )
+    capacity_parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Rewrite php-fpm.conf and reload the pools that changed"
+    )
+    capacity_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every pool, even small changes"
+    )
+    capacity_parser.add_argument(
+        "--reserve",
+        type=int,
+        metavar="MB",
+        help="RAM to keep for the OS, MySQL, Redis and NGINX"
+    )
+    capacity_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    
+    # Worker memory command
+    memory_parser = subparsers.add_parser(
+        "memory",
+        help="Show measured PHP-FPM worker memory",
+        description="Sample and report PHP-FPM worker memory percentiles per website"
+    )
+    memory_parser.add_argument(
+        "domain",
+        nargs="?",
+        help="Website domain name (default: all websites)"
+    )
+    memory_parser.add_argument(
+        "--sample",
+        action="store_true",
+        help="Measure the running workers before reporting"
+    )
+    memory_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    
+    # OPcache command
+    opcache_parser = subparsers.add_parser(
+        "opcache",
+        help="Tune OPcache settings",
+        description="Recommend OPcache memory, file-count and validation settings per website"
+    )
+    opcache_parser.add_argument(
+        "domain",
+        nargs="?",
+        help="Website domain name (default: all websites)"
+    )
+    opcache_parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Write the recommended settings to php.ini and reload PHP-FPM"
+    )
+    validate_group = opcache_parser.add_mutually_exclusive_group()
+    validate_group.add_argument(
+        "--production",
+        dest="production",
+        action="store_true",
+        default=None,
+        help="Stop checking files for changes (reload PHP after updates)"
+    )
+    validate_group.add_argument(
+        "--development",
+        dest="production",
+        action="store_false",
+        help="Check files for changes again"
+    )
+    opcache_parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Pick the most used files to preload; written and enabled with --apply"
+    )
+    opcache_parser.add_argument(
+        "--preload-limit",
+        type=int,
+        default=500,
+        help="Maximum number of files to preload (default: 500)"
+    )
+    opcache_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    
+    # Image command
+    image_parser = subparsers.add_parser(
+        "image",
+        help="Manage PHP-FPM images",
+        description="List PHP-FPM images or pull them ahead of time"
+    )
+    image_subparsers = image_parser.add_subparsers(
+        title="actions",
+        dest="action",
+        help="Image management actions"
+    )
+    
+    # Image list
+    image_list_parser = image_subparsers.add_parser(
+        "list",
+        help="List PHP-FPM images"
+    )
+    image_list_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    
+    # Image warmup
+    image_warmup_parser = image_subparsers.add_parser(
+        "warmup",
+        help="Pull PHP-FPM images ahead of time"
+    )
+    image_warmup_parser.add_argument(
+        "versions",
+        nargs="*",
+        help="PHP versions to pull (default: all supported versions)"
+    )
+    image_warmup_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Pull images that are already present to pick up rebuilt tags"
+    )
+    image_warmup_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output in JSON format"
+    )
+    
     return parser
 
 
@@ -199,6 +400,7 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
+@profiled("php")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -224,7 +426,10 @@ def main(args: Optional[List[str]] = None) -> int:
         # Handle version commands
         if parsed_args.command == "version":
             if parsed_args.action == "change":
-                return 0 if cli_change_php_version(parsed_args.domain, parsed_args.version) else 1
+                return 0 if cli_change_php_version(
+                    parsed_args.domain, parsed_args.version, parsed_args.in_place) else 1
+            elif parsed_args.action == "rollback":
+                return 0 if cli_rollback_php_version(parsed_args.domain) else 1
             elif parsed_args.action == "check":
                 from src.features.php.version import get_current_php_version
                 version = get_current_php_version(parsed_args.domain)
@@ -250,6 +455,56 @@ def main(args: Optional[List[str]] = None) -> int:
             elif parsed_args.action == "uninstall":
                 return 0 if cli_uninstall_extension(parsed_args.domain, parsed_args.extension) else 1
                 
+        # Handle slow log command
+        elif parsed_args.command == "slowlog":
+            return 0 if cli_slowlog_report(
+                parsed_args.domain,
+                parsed_args.top,
+                parsed_args.json,
+                parsed_args.folded,
+                parsed_args.reset
+            ) else 1
+                
+        # Handle capacity command
+        elif parsed_args.command == "capacity":
+            return 0 if cli_capacity_plan(
+                parsed_args.apply,
+                parsed_args.force,
+                parsed_args.reserve,
+                parsed_args.json
+            ) else 1
+                
+        # Handle worker memory command
+        elif parsed_args.command == "memory":
+            return 0 if cli_worker_memory(
+                parsed_args.domain,
+                parsed_args.sample,
+                parsed_args.json
+            ) else 1
+                
+        # Handle OPcache command
+        elif parsed_args.command == "opcache":
+            return 0 if cli_opcache_advisor(
+                parsed_args.domain,
+                parsed_args.apply,
+                parsed_args.production,
+                parsed_args.preload,
+                parsed_args.preload_limit,
+                parsed_args.json
+            ) else 1
+                
+        # Handle image commands
+        elif parsed_args.command == "image":
+            if parsed_args.action == "list":
+                return 0 if cli_php_images(json_output=parsed_args.json) else 1
+            elif parsed_args.action == "warmup":
+                return 0 if cli_php_images(
+                    True,
+                    parsed_args.versions or None,
+                    parsed_args.refresh,
+                    parsed_args.json
+                ) else 1
+                
         else:
             error(f"Unknown command: {parsed_args.command}")
             return 1
@@ -0,0 +1,47 @@
+"""
+CLI interface for PHP-FPM worker memory.
+
+This module provides a command-line interface for sampling and reporting
+the measured memory of PHP-FPM workers per website.
+"""
+
+import json
+from typing import Optional
+
+from src.common.logging import log_call, error
+from src.common.utils.system_info import get_total_ram_mb, get_total_cpu_cores
+from src.features.php.worker_memory import WorkerMemorySampler, print_worker_memory
+from src.features.website.utils import get_resource_profile
+
+
+@log_call
+def cli_worker_memory(domain: Optional[str] = None, sample: bool = False,
+                      json_output: bool = False) -> bool:
+    """
+    Report PHP-FPM worker memory percentiles.
+
+    Args:
+        domain: Website to report on (all sampled websites if None)
+        sample: Whether to take a new sample before reporting
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        sampler = WorkerMemorySampler()
+        if sample:
+            sampler.sample_all([domain] if domain else None)
+
+        domains = [domain] if domain else sorted(sampler.samples)
+        stats_list = [s for s in (sampler.stats(d) for d in domains) if s]
+
+        if json_output:
+            print(json.dumps([s.to_dict() for s in stats_list], indent=2))
+        else:
+            profile = get_resource_profile(get_total_ram_mb(), get_total_cpu_cores())
+            print_worker_memory(stats_list, profile["avg_process_size"])
+        return True
+    except Exception as e:
+        error(f"❌ Error reporting PHP worker memory: {str(e)}")
+        return False
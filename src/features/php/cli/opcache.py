@@ -0,0 +1,73 @@
+"""
+CLI interface for the OPcache advisor.
+
+This module provides a command-line interface for reviewing and applying
+recommended OPcache settings and preload scripts per website.
+"""
+
+import json
+from typing import Optional
+
+from src.common.logging import log_call, warn, error
+from src.features.php.opcache import (
+    DEFAULT_PRELOAD_SCRIPTS,
+    advise_opcache,
+    apply_opcache_advice,
+    generate_preload_script,
+    get_opcache_status,
+    print_opcache_advice,
+    select_preload_files
+)
+from src.features.website.utils import website_list
+
+
+@log_call
+def cli_opcache_advisor(domain: Optional[str] = None, apply: bool = False,
+                        production: Optional[bool] = None, preload: bool = False,
+                        preload_limit: int = DEFAULT_PRELOAD_SCRIPTS,
+                        json_output: bool = False) -> bool:
+    """
+    Recommend and optionally apply OPcache settings.
+
+    Args:
+        domain: Website to analyze (all websites if None)
+        apply: Whether to write the recommended settings and reload PHP-FPM
+        production: True to turn off timestamp validation, False to turn it
+            back on, None to keep the current setting
+        preload: Whether to pick files to preload; the script is only
+            written to the website and enabled together with apply
+        preload_limit: Maximum number of files to preload
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        domains = [domain] if domain else website_list()
+        success = True
+        advice_list = []
+        for site in domains:
+            status = get_opcache_status(site, scripts=preload)
+            if status is None:
+                warn(f"⚠️ Could not read the OPcache status of {site}, using file counts only")
+            advice = advise_opcache(site, production, status or {})
+            advice_list.append(advice)
+
+            preload_path = None
+            if preload:
+                advice.preload_files = select_preload_files(status, preload_limit) if status else []
+                if not advice.preload_files:
+                    warn(f"⚠️ No OPcache usage data for {site} yet, nothing to preload")
+                elif apply:
+                    preload_path = generate_preload_script(site, status, preload_limit)
+            if apply:
+                success = apply_opcache_advice(advice, preload_path) and success
+
+        if json_output:
+            print(json.dumps([a.to_dict() for a in advice_list], indent=2))
+        else:
+            print_opcache_advice(advice_list)
+        return success
+    except Exception as e:
+        error(f"❌ Error analyzing OPcache: {str(e)}")
+        return False
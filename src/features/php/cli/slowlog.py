@@ -0,0 +1,52 @@
+"""
+CLI interface for PHP slow log profiling.
+
+This module provides a command-line interface for ranking the plugins,
+themes and functions behind a website's slow PHP requests.
+"""
+
+import json
+from typing import Optional
+
+from src.common.logging import log_call, error, success
+from src.features.php.analytics import SlowLogAnalyzer, print_slow_profile
+
+
+@log_call
+def cli_slowlog_report(domain: Optional[str] = None, top: int = 10,
+                       json_output: bool = False, folded_file: Optional[str] = None,
+                       reset: bool = False) -> bool:
+    """
+    Update and display slow log rankings.
+
+    Args:
+        domain: Website to report on (all websites if None)
+        top: Number of rows per ranking
+        json_output: Whether to print JSON instead of tables
+        folded_file: Write folded stacks for a flamegraph to this file
+        reset: Whether to reset aggregates before reading new entries
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        analyzer = SlowLogAnalyzer()
+        if reset:
+            analyzer.reset(domain)
+        profiles = analyzer.update_all([domain] if domain else None)
+
+        if folded_file:
+            with open(folded_file, "w") as f:
+                for profile in profiles:
+                    if profile.stacks:
+                        f.write(profile.folded() + "\n")
+            success(f"✅ Folded stacks written to {folded_file}")
+
+        if json_output:
+            print(json.dumps([p.summary(top) for p in profiles], indent=2))
+        else:
+            print_slow_profile(profiles, top)
+        return True
+    except Exception as e:
+        error(f"❌ Error analysing PHP slow log: {str(e)}")
+        return False
@@ -13,6 +13,7 @@ from src.common.logging import log_call, info, warn, error, success
 from src.features.website.utils import select_website
 from src.features.php.utils import php_choose_version, AVAILABLE_PHP_VERSIONS
 from src.features.php.version import get_current_php_version, change_php_version
+from src.features.php.switch import rollback_php_version
 
 
 @log_call
@@ -51,7 +52,7 @@ def get_php_version_change_params() -> Optional[Dict[str, Any]]:
         # Confirm version change
         confirm_change = confirm(
             f"Change PHP version for {domain} from {current_version} to {php_version}? "
-            "This will restart the PHP container."
+            "The website keeps serving requests during the switch."
         ).ask()
 
         if not confirm_change:
@@ -68,18 +69,47 @@ def get_php_version_change_params() -> Optional[Dict[str, Any]]:
 
 
 @log_call
-def cli_change_php_version() -> bool:
+def cli_change_php_version(domain: Optional[str] = None, php_version: Optional[str] = None,
+                           in_place: bool = False) -> bool:
     """
     CLI entry point for changing PHP version.
 
+    Args:
+        domain: Website domain name (prompted for if None)
+        php_version: PHP version to change to (prompted for if None)
+        in_place: Whether to recreate the container in place instead of
+            switching without downtime
+
     Returns:
         bool: True if version change was successful, False otherwise
     """
-    params = get_php_version_change_params()
-    if not params:
-        return False
+    if not domain or not php_version:
+        params = get_php_version_change_params()
+        if not params:
+            return False
+        domain, php_version = params["domain"], params["php_version"]
+
+    return change_php_version(domain, php_version, in_place=in_place)
+
+
+@log_call
+def cli_rollback_php_version(domain: Optional[str] = None) -> bool:
+    """
+    CLI entry point for switching a website back to its previous PHP version.
+
+    Args:
+        domain: Website domain name (prompted for if None)
+
+    Returns:
+        bool: True if the rollback was successful, False otherwise
+    """
+    if not domain:
+        domain = select_website("Select website to roll back PHP version:")
+        if not domain:
+            warn("No website selected or no websites available.")
+            return False
 
-    return change_php_version(params["domain"], params["php_version"])
+    return rollback_php_version(domain)
 
 
 if __name__ == "__main__":
@@ -5,15 +5,16 @@ This module provides functions for interacting with PHP containers,
 including initialization and command execution.
 """
 
+import base64
 from typing import Optional, Dict, Any, List
 
-from src.common.logging import log_call, error
+from src.common.logging import log_call, debug, info, warn, error
 from src.common.containers.container import Container
 from src.features.php.utils import get_php_container_name
 
 
 @log_call
-def init_php_client(domain: str) -> Container:
+def init_php_client(domain: str, container_name: Optional[str] = None) -> Container:
     """
     Initialize a Container object for a website's PHP container.
     
@@ -21,6 +22,8 @@ def init_php_client(domain: str) -> Container:
     
     Args:
         domain: Website domain name
+        container_name: Container to use instead of the website's PHP
+            container, such as the temporary one of a version switch
         
     Returns:
         Container: PHP container object
@@ -28,7 +31,7 @@ def init_php_client(domain: str) -> Container:
     Raises:
         ValueError: If container doesn't exist
     """
-    container_name = get_php_container_name(domain)
+    container_name = container_name or get_php_container_name(domain)
     try:
         php_container = Container(container_name)
 
@@ -42,6 +45,172 @@ def init_php_client(domain: str) -> Container:
         raise
 
 
+# Sends one request to a PHP-FPM pool over FastCGI and prints the response
+# body. The script to run is written to a temporary .php file because FPM
+# only executes files with an allowed extension.
+FPM_REQUEST_SCRIPT = r"""
+$file = sys_get_temp_dir() . '/wpdocker_fpm_' . getmypid() . '.php';
+file_put_contents($file, base64_decode('__BODY__'));
+chmod($file, 0644);
+$socket = @fsockopen('__HOST__', __PORT__, $errno, $errstr, 5);
+if (!$socket) { unlink($file); fwrite(STDERR, $errstr); exit(1); }
+stream_set_timeout($socket, 30);
+$record = function ($type, $body) { return pack('CCnnCx', 1, $type, 1, strlen($body), 0) . $body; };
+$length = function ($n) { return $n < 128 ? chr($n) : pack('N', $n | 0x80000000); };
+$params = '';
+foreach (['SCRIPT_FILENAME' => $file, 'REQUEST_METHOD' => 'GET', 'SERVER_PROTOCOL' => 'HTTP/1.1'] as $k => $v) {
+    $params .= $length(strlen($k)) . $length(strlen($v)) . $k . $v;
+}
+fwrite($socket, $record(1, pack('nCx5', 1, 0)) . $record(4, $params) . $record(4, '') . $record(5, ''));
+$out = '';
+while (strlen($header = stream_get_contents($socket, 8)) == 8) {
+    $r = unpack('Cversion/Ctype/nid/nlength/Cpadding', $header);
+    $body = $r['length'] ? stream_get_contents($socket, $r['length']) : '';
+    if ($r['padding']) { stream_get_contents($socket, $r['padding']); }
+    if ($r['type'] == 6) { $out .= $body; }
+    if ($r['type'] == 3) { break; }
+}
+fclose($socket);
+unlink($file);
+$parts = explode("\r\n\r\n", $out, 2);
+echo end($parts);
+"""
+
+
+@log_call
+def run_fpm_request(domain: str, php_file: str,
+                    container_name: Optional[str] = None) -> Optional[str]:
+    """
+    Run PHP code inside a PHP-FPM worker of a website.
+
+    ``php -r`` runs in a separate CLI process; this goes through the FPM
+    pool instead, so the code sees the workers' OPcache, extensions and
+    settings.
+
+    Args:
+        domain: Website domain name (used to find the pool's listen address)
+        php_file: Contents of the PHP file to run, starting with ``<?php``
+        container_name: Container to run in (defaults to the website's PHP container)
+
+    Returns:
+        Optional[str]: Response body, or None if the pool could not be reached
+    """
+    # Imported here because capacity imports this module
+    from src.features.php.capacity import read_fpm_pool
+
+    listen = read_fpm_pool(domain).get("listen", "9000")
+    host, _, port = listen.rpartition(":")
+    if not port.isdigit():
+        debug(f"PHP-FPM of {domain} does not listen on TCP ({listen})")
+        return None
+    host = host.strip("[]") if host and host not in ("0.0.0.0", "[::]") else "127.0.0.1"
+
+    script = (FPM_REQUEST_SCRIPT
+              .replace("__BODY__", base64.b64encode(php_file.encode()).decode())
+              .replace("__HOST__", host)
+              .replace("__PORT__", port))
+    try:
+        container = init_php_client(domain, container_name)
+        return container.exec(["php", "-r", script], user="www-data")
+    except Exception as e:
+        error(f"❌ Error querying PHP-FPM for {domain}: {e}")
+        return None
+
+
+# Pool settings the FPM master only applies when it starts
+FPM_RESTART_KEYS = ("listen", "rlimit_files", "rlimit_core")
+
+
+@log_call
+def test_php_fpm_config(domain: str, container_name: Optional[str] = None) -> bool:
+    """
+    Validate the PHP-FPM and php.ini configuration inside the container.
+
+    The configuration files are bind-mounted, so this checks the files as
+    they are on disk now, before the running master is told about them.
+
+    Args:
+        domain: Website domain name
+        container_name: Container to use (defaults to the website's PHP container)
+
+    Returns:
+        bool: True if the configuration is valid, False otherwise
+    """
+    try:
+        container = init_php_client(domain, container_name)
+        # Container.exec returns None when the command exits with an error
+        if container.exec(["php-fpm", "-t"], user="root") is None:
+            error(f"❌ PHP-FPM configuration test failed for {domain}")
+            return False
+        return True
+    except Exception as e:
+        error(f"❌ Error testing PHP-FPM configuration for {domain}: {e}")
+        return False
+
+
+@log_call
+def reload_php_fpm(domain: str, container_name: Optional[str] = None) -> bool:
+    """
+    Gracefully reload PHP-FPM so it re-reads its configuration.
+
+    Sends USR2 to the FPM master (PID 1 in the container). The master
+    re-executes with the new php-fpm.conf, php.ini and extensions while
+    workers finish their current request within process_control_timeout,
+    so no request is dropped. OPcache starts empty afterwards.
+
+    Args:
+        domain: Website domain name
+        container_name: Container to use (defaults to the website's PHP container)
+
+    Returns:
+        bool: True if the signal was sent, False otherwise
+    """
+    try:
+        container = init_php_client(domain, container_name)
+        if container.exec(["kill", "-USR2", "1"], user="root") is None:
+            return False
+        return True
+    except Exception as e:
+        error(f"❌ Error reloading PHP-FPM for {domain}: {e}")
+        return False
+
+
+@log_call
+def apply_php_config(domain: str, restart: bool = False,
+                     container_name: Optional[str] = None) -> bool:
+    """
+    Apply changed PHP configuration files to a running website.
+
+    The configuration is validated first and left unapplied if it is
+    invalid. Valid changes are applied with a graceful reload, falling back
+    to a container restart when requested or when the reload fails.
+
+    Args:
+        domain: Website domain name
+        restart: Whether a setting changed that FPM cannot reload
+        container_name: Container to use (defaults to the website's PHP container)
+
+    Returns:
+        bool: True if the configuration is valid and was applied, False otherwise
+    """
+    if not test_php_fpm_config(domain, container_name):
+        return False
+
+    if not restart and reload_php_fpm(domain, container_name):
+        info(f"🔄 PHP-FPM reloaded gracefully for {domain}")
+        return True
+
+    if not restart:
+        warn(f"⚠️ Graceful reload failed for {domain}, restarting the PHP container")
+    try:
+        container = init_php_client(domain, container_name)
+        container.restart()
+        return True
+    except Exception as e:
+        error(f"❌ Error restarting PHP container for {domain}: {e}")
+        return False
+
+
 @log_call
 def run_php_command(domain: str, command: List[str], user: str = "www-data") -> Optional[str]:
     """
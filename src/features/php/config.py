@@ -14,7 +14,7 @@ from pathlib import Path
 
 from src.common.logging import log_call, debug, error, info, warn
 from src.common.utils.environment import env
-from src.features.php.client import init_php_client
+from src.features.php.client import apply_php_config, FPM_RESTART_KEYS
 from src.features.php.utils import get_php_container_name
 
 
@@ -36,6 +36,12 @@ DEFAULT_PHP_INI = {
     'opcache.revalidate_freq': '60'
 }
 
+# Default PHP-FPM global configuration values
+DEFAULT_PHP_FPM_GLOBAL = {
+    # Lets workers finish their request when PHP-FPM is reloaded
+    'process_control_timeout': '30s'
+}
+
 # Default PHP-FPM configuration values
 DEFAULT_PHP_FPM = {
     'user': 'www-data',
@@ -195,15 +201,18 @@ def edit_php_ini(domain: str) -> bool:
                 
         if not validate_php_ini(config_dict):
             warn("⚠️ Configuration validation failed. Restoring backup...")
-            restore_php_config_backup(domain)
+            restore_php_config_backup(domain, apply=False)
             return False
             
-        # Apply changes
-        shutil.move(temp_path, php_ini_path)
+        # Apply changes; the file is bind-mounted, so copy over it instead of renaming
+        shutil.copyfile(temp_path, php_ini_path)
+        os.remove(temp_path)
         
-        # Restart PHP container
-        container = init_php_client(domain)
-        container.restart()
+        # Validate inside the container, then reload PHP-FPM gracefully
+        if not apply_php_config(domain):
+            warn("⚠️ PHP rejected the new configuration. Restoring backup...")
+            restore_php_config_backup(domain, apply=False)
+            return False
         
         info(f"✅ PHP INI configuration updated for {domain}")
         return True
@@ -259,15 +268,27 @@ def edit_php_fpm_pool(domain: str) -> bool:
                 
         if not validate_php_fpm(config_dict):
             warn("⚠️ Configuration validation failed. Restoring backup...")
-            restore_php_config_backup(domain)
+            restore_php_config_backup(domain, apply=False)
             return False
+        
+        # Some pool settings are only read when the FPM master starts
+        current = configparser.ConfigParser()
+        current.read(fpm_conf_path)
+        current_dict = {}
+        for section in current.sections():
+            for key, value in current.items(section):
+                current_dict[key] = value
+        restart = any(current_dict.get(key) != config_dict.get(key) for key in FPM_RESTART_KEYS)
             
-        # Apply changes
-        shutil.move(temp_path, fpm_conf_path)
+        # Apply changes; the file is bind-mounted, so copy over it instead of renaming
+        shutil.copyfile(temp_path, fpm_conf_path)
+        os.remove(temp_path)
         
-        # Restart PHP container
-        container = init_php_client(domain)
-        container.restart()
+        # Validate inside the container, then reload PHP-FPM gracefully
+        if not apply_php_config(domain, restart=restart):
+            warn("⚠️ PHP-FPM rejected the new configuration. Restoring backup...")
+            restore_php_config_backup(domain, apply=False)
+            return False
         
         info(f"✅ PHP-FPM configuration updated for {domain}")
         return True
@@ -316,12 +337,14 @@ def backup_php_config(domain: str) -> Optional[str]:
 
 
 @log_call
-def restore_php_config_backup(domain: str) -> bool:
+def restore_php_config_backup(domain: str, apply: bool = True) -> bool:
     """
     Restore PHP configuration files from backup.
     
     Args:
         domain: Website domain name
+        apply: Whether to reload PHP-FPM afterwards (not needed when the
+            running PHP-FPM never saw the rejected files)
         
     Returns:
         bool: True if restoration was successful, False otherwise
@@ -347,11 +370,10 @@ def restore_php_config_backup(domain: str) -> bool:
             with open(fpm_conf_path, "w") as dst:
                 dst.write(src.read())
                 
-        # Restart PHP container to apply changes
-        container = init_php_client(domain)
-        container.restart()
+        if apply and not apply_php_config(domain):
+            return False
         
-        info(f"✅ PHP configuration restored from backup and container restarted")
+        info(f"✅ PHP configuration restored from backup")
         return True
     except Exception as e:
         error(f"❌ Error restoring PHP configuration: {e}")
@@ -384,7 +406,10 @@ def create_default_php_config(domain: str, php_version: str) -> bool:
         # Create php-fpm.conf
         fpm_conf_path = os.path.join(php_dir, "php-fpm.conf")
         with open(fpm_conf_path, "w") as f:
-            f.write("[www]\n")
+            f.write("[global]\n")
+            for key, value in DEFAULT_PHP_FPM_GLOBAL.items():
+                f.write(f"{key} = {value}\n")
+            f.write("\n[www]\n")
             for key, value in DEFAULT_PHP_FPM.items():
                 f.write(f"{key} = {value}\n")
                 
@@ -71,12 +71,13 @@ class BaseExtension(ABC):
         return None
     
     @abstractmethod
-    def install(self, domain: str) -> bool:
+    def install(self, domain: str, container_name: Optional[str] = None) -> bool:
         """
         Install this extension for a website.
         
         Args:
             domain: Website domain name
+            container_name: Container to install into (defaults to the website's PHP container)
             
         Returns:
             bool: True if installation was successful, False otherwise
@@ -41,17 +41,18 @@ class IoncubeLoaderExtension(BaseExtension):
         return None
     
     @log_call
-    def install(self, domain: str) -> bool:
+    def install(self, domain: str, container_name: Optional[str] = None) -> bool:
         """
         Install IonCube Loader extension for a website.
         
         Args:
             domain: Website domain name
+            container_name: Container to install into (defaults to the website's PHP container)
             
         Returns:
             bool: True if installation was successful, False otherwise
         """
-        container = init_php_client(domain)
+        container = init_php_client(domain, container_name)
 
         # Get PHP version and architecture
         php_version = container.exec(["php", "-r", "echo PHP_VERSION;"]).strip().split(".")[:2]
@@ -119,7 +120,6 @@ class IoncubeLoaderExtension(BaseExtension):
             f.writelines(lines)
             f.write(f"\nzend_extension={loader_path}\n")
 
-        container.restart()
         info(f"✅ IonCube Loader installed successfully for {domain}.")
         return True
     
@@ -146,11 +146,7 @@ class IoncubeLoaderExtension(BaseExtension):
                 
             with open(php_ini, "w") as f:
                 f.writelines(lines)
-                
-            # Restart the PHP container
-            container = init_php_client(domain)
-            container.restart()
-            
+
             info(f"✅ IonCube Loader uninstalled successfully for {domain}.")
             return True
         except Exception as e:
@@ -12,7 +12,8 @@ from pathlib import Path
 from src.common.logging import log_call, debug, error, info, warn
 from src.common.utils.environment import env
 from src.features.website.utils import get_site_config, set_site_config
-from src.features.php.client import init_php_client
+from src.features.php.client import apply_php_config
+from src.features.php.utils import write_mounted_file
 from src.features.php.extensions.registry import (
     EXTENSION_REGISTRY,
     get_extension_instance,
@@ -52,6 +53,16 @@ def install_php_extension(domain: str, ext_id: str) -> bool:
         # Get extension instance
         ext = get_extension_instance(ext_id)
         
+        # Remember the current state so a failed reload can be rolled back
+        php_ini_path = os.path.join(env["SITES_DIR"], domain, "php", "php.ini")
+        previous_extensions = list(site_config.php.php_installed_extensions or [])
+        try:
+            with open(php_ini_path, "r") as f:
+                previous_ini = f.read()
+        except IOError as e:
+            error(f"❌ Could not read {php_ini_path}: {e}")
+            return False
+        
         # Install extension
         if not ext.install(domain):
             error(f"❌ Failed to install extension '{ext_id}'")
@@ -68,9 +79,11 @@ def install_php_extension(domain: str, ext_id: str) -> bool:
         site_config.php.php_installed_extensions.append(ext_id)
         set_site_config(domain, site_config)
         
-        # Restart PHP container
-        container = init_php_client(domain)
-        container.restart()
+        # Validate and reload PHP-FPM gracefully to load the extension
+        if not apply_php_config(domain):
+            error(f"❌ PHP-FPM could not load extension '{ext_id}', rolling back")
+            _rollback_extension_install(domain, php_ini_path, previous_ini, previous_extensions)
+            return False
         
         info(f"✅ Successfully installed extension '{ext_id}' for {domain}")
         return True
@@ -80,6 +93,32 @@ def install_php_extension(domain: str, ext_id: str) -> bool:
         return False
 
 
+def _rollback_extension_install(domain: str, php_ini_path: str, previous_ini: str,
+                                previous_extensions: List[str]) -> None:
+    """
+    Restore php.ini and the installed extension list after a failed install.
+
+    Args:
+        domain: Website domain name
+        php_ini_path: Path to the website's php.ini
+        previous_ini: php.ini content before the install
+        previous_extensions: Installed extensions before the install
+    """
+    try:
+        write_mounted_file(php_ini_path, previous_ini)
+    except IOError as e:
+        error(f"❌ Could not restore {php_ini_path}: {e}")
+        return
+    
+    site_config = get_site_config(domain)
+    if site_config and site_config.php:
+        site_config.php.php_installed_extensions = previous_extensions
+        set_site_config(domain, site_config)
+    
+    if apply_php_config(domain):
+        info(f"↩️ Restored the previous PHP configuration for {domain}")
+
+
 @log_call
 def uninstall_php_extension(domain: str, ext_id: str) -> bool:
     """
@@ -116,9 +155,9 @@ def uninstall_php_extension(domain: str, ext_id: str) -> bool:
         site_config.php.php_installed_extensions.remove(ext_id)
         set_site_config(domain, site_config)
         
-        # Restart PHP container
-        container = init_php_client(domain)
-        container.restart()
+        # Validate and reload PHP-FPM gracefully to unload the extension
+        if not apply_php_config(domain):
+            return False
         
         info(f"✅ Successfully uninstalled extension '{ext_id}' from {domain}")
         return True
@@ -38,19 +38,20 @@ class XdebugExtension(BaseExtension):
         return None
     
     @log_call
-    def install(self, domain: str) -> bool:
+    def install(self, domain: str, container_name: Optional[str] = None) -> bool:
         """
         Install Xdebug extension for a website.
         
         Args:
             domain: Website domain name
+            container_name: Container to install into (defaults to the website's PHP container)
             
         Returns:
             bool: True if installation was successful, False otherwise
         """
         try:
             from src.features.php.client import init_php_client
-            container = init_php_client(domain)
+            container = init_php_client(domain, container_name)
             
             # Install Xdebug through PECL
             info("📦 Installing Xdebug extension...")
@@ -73,9 +74,6 @@ class XdebugExtension(BaseExtension):
                 f.write("xdebug.client_port=9003\n")
                 f.write("xdebug.start_with_request=yes\n")
             
-            # Restart PHP container
-            container.restart()
-            
             info(f"✅ Xdebug installed successfully for {domain}.")
             return True
         except Exception as e:
@@ -94,7 +92,6 @@ class XdebugExtension(BaseExtension):
             bool: True if uninstallation was successful, False otherwise
         """
         try:
-            from src.features.php.client import init_php_client
             from src.common.utils.environment import env
             
             # Update PHP configuration
@@ -106,10 +103,6 @@ class XdebugExtension(BaseExtension):
             with open(php_ini, "w") as f:
                 f.writelines(lines)
             
-            # Restart PHP container
-            container = init_php_client(domain)
-            container.restart()
-            
             info(f"✅ Xdebug uninstalled successfully for {domain}.")
             return True
         except Exception as e:
@@ -133,12 +126,13 @@ class OpCacheExtension(BaseExtension):
         return "Improves PHP performance by storing precompiled script bytecode in shared memory"
     
     @log_call
-    def install(self, domain: str) -> bool:
+    def install(self, domain: str, container_name: Optional[str] = None) -> bool:
         """
         Install OPCache extension for a website.
         
         Args:
             domain: Website domain name
+            container_name: Container to install into (defaults to the website's PHP container)
             
         Returns:
             bool: True if installation was successful, False otherwise
@@ -160,11 +154,6 @@ class OpCacheExtension(BaseExtension):
                 f.write("opcache.fast_shutdown=1\n")
                 f.write("opcache.enable_cli=1\n")
             
-            # Restart PHP container
-            from src.features.php.client import init_php_client
-            container = init_php_client(domain)
-            container.restart()
-            
             info(f"✅ OPCache installed successfully for {domain}.")
             return True
         except Exception as e:
@@ -194,11 +183,6 @@ class OpCacheExtension(BaseExtension):
             with open(php_ini, "w") as f:
                 f.writelines(lines)
             
-            # Restart PHP container
-            from src.features.php.client import init_php_client
-            container = init_php_client(domain)
-            container.restart()
-            
             info(f"✅ OPCache uninstalled successfully for {domain}.")
             return True
         except Exception as e:
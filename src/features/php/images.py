@@ -0,0 +1,340 @@
+"""
+PHP-FPM image cache.
+
+Creating a website or switching its PHP version used to pull
+``bitnami/php-fpm:<version>`` from Docker Hub during the operation, and
+every version check made a live Docker Hub request. This module keeps the
+images of all supported PHP versions pulled ahead of time and remembers
+which tags exist, so user-facing operations only touch the registry when
+an image is really missing.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import requests
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn, error
+from src.common.utils.environment import env
+from src.features.php.utils import (
+    AVAILABLE_PHP_VERSIONS,
+    PHP_IMAGE,
+    get_php_image,
+    pull_php_image
+)
+
+DOCKER_HUB_URL = "https://hub.docker.com/v2/repositories/{image}/tags/{version}"
+REGISTRY_TIMEOUT = 10
+
+# How long a registry answer is trusted
+TAG_CACHE_TTL = 7 * 86400
+MISSING_TAG_CACHE_TTL = 3600
+
+# Website setups running in parallel share the state file; other processes
+# are kept out with a lock file
+_save_lock = threading.Lock()
+
+
+@dataclass
+class PhpImageStatus:
+    """Local and registry state of one PHP image."""
+
+    version: str
+    image: str
+    present: bool
+    size_mb: Optional[float] = None
+    created: Optional[str] = None
+    pulled_at: Optional[float] = None
+    tag_available: Optional[bool] = None
+    tag_checked_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        def fmt(ts: Optional[float]) -> Optional[str]:
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)) if ts else None
+
+        return {
+            "version": self.version,
+            "image": self.image,
+            "present": self.present,
+            "size_mb": round(self.size_mb, 1) if self.size_mb is not None else None,
+            "created": self.created,
+            "pulled_at": fmt(self.pulled_at),
+            "tag_available": self.tag_available,
+            "tag_checked_at": fmt(self.tag_checked_at),
+        }
+
+
+class PhpImageManager:
+    """Keeps PHP-FPM images pulled and caches tag availability."""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the image manager.
+
+        Args:
+            state_file: JSON file holding the tag cache (defaults to DATA_DIR)
+        """
+        self.state_file = state_file or os.path.join(env["DATA_DIR"], "php_images.json")
+        state = self._load()
+        # version -> {"available": bool, "checked_at": timestamp}
+        self.tags: Dict[str, Dict[str, Any]] = state.get("tags", {})
+        # version -> timestamp of the last pull
+        self.pulled: Dict[str, float] = state.get("pulled", {})
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read PHP image cache: {e}")
+            return {}
+
+    def _merge(self, state: Dict[str, Any]) -> None:
+        """Merge a state read from disk, keeping the newest entry of each version."""
+        for version, entry in state.get("tags", {}).items():
+            current = self.tags.get(version)
+            if not current or entry.get("checked_at", 0) > current.get("checked_at", 0):
+                self.tags[version] = entry
+        for version, pulled_at in state.get("pulled", {}).items():
+            self.pulled[version] = max(pulled_at, self.pulled.get(version, 0))
+
+    def save(self) -> None:
+        """
+        Persist the tag cache.
+
+        Other processes (cron jobs, a second CLI) may have saved since this
+        manager was created, so the file is re-read and merged under a file
+        lock before it is written.
+        """
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with _save_lock, open(f"{self.state_file}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._merge(self._load())
+                with open(tmp_file, "w") as f:
+                    json.dump({"tags": self.tags, "pulled": self.pulled}, f, indent=2)
+                os.replace(tmp_file, self.state_file)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _cached_tag(self, version: str) -> Optional[bool]:
+        entry = self.tags.get(version)
+        if not entry:
+            return None
+        ttl = TAG_CACHE_TTL if entry.get("available") else MISSING_TAG_CACHE_TTL
+        if time.time() - entry.get("checked_at", 0) > ttl:
+            return None
+        return entry.get("available")
+
+    def check_registry(self, version: str) -> Optional[bool]:
+        """
+        Ask Docker Hub whether a PHP image tag exists and cache the answer.
+
+        Args:
+            version: PHP version tag
+
+        Returns:
+            Optional[bool]: Whether the tag exists, or None if the registry
+            could not be reached
+        """
+        url = DOCKER_HUB_URL.format(image=PHP_IMAGE.replace("/", "%2F"), version=version)
+        try:
+            response = requests.get(url, timeout=REGISTRY_TIMEOUT)
+        except requests.RequestException as e:
+            debug(f"Docker Hub request for {version} failed: {e}")
+            return None
+        if response.status_code not in (200, 404):
+            debug(f"Docker Hub returned {response.status_code} for {version}")
+            return None
+        available = response.status_code == 200
+        self.tags[version] = {"available": available, "checked_at": time.time()}
+        self.save()
+        return available
+
+    def is_tag_available(self, version: str, refresh: bool = False) -> bool:
+        """
+        Check whether a PHP image tag can be used.
+
+        A locally present image or a fresh cache entry answers without a
+        registry request.
+
+        Args:
+            version: PHP version tag
+            refresh: Whether to ignore the cache and ask the registry
+
+        Returns:
+            bool: True if the tag exists, False otherwise
+        """
+        if not refresh:
+            if self.is_present(version):
+                return True
+            cached = self._cached_tag(version)
+            if cached is not None:
+                return cached
+
+        available = self.check_registry(version)
+        if available is None:
+            # Registry unreachable: trust the last answer, however old
+            stale = self.tags.get(version, {}).get("available")
+            if stale is not None:
+                warn(f"⚠️ Docker Hub unreachable, using cached result for PHP {version}")
+                return stale
+            error(f"❌ Could not check PHP {version} on Docker Hub")
+            return False
+        return available
+
+    @staticmethod
+    def is_present(version: str) -> bool:
+        """Check whether the image of a PHP version is pulled locally."""
+        from python_on_whales import docker
+
+        try:
+            return docker.image.exists(get_php_image(version))
+        except Exception as e:
+            debug(f"Could not inspect {get_php_image(version)}: {e}")
+            return False
+
+    def ensure(self, version: str) -> bool:
+        """
+        Make sure the image of a PHP version is available locally.
+
+        Args:
+            version: PHP version tag
+
+        Returns:
+            bool: True if the image is available, False otherwise
+        """
+        if self.is_present(version):
+            return True
+        if not pull_php_image(version):
+            return False
+        self.pulled[version] = time.time()
+        self.tags[version] = {"available": True, "checked_at": time.time()}
+        self.save()
+        return True
+
+    @log_call
+    def warmup(self, versions: Optional[List[str]] = None, refresh: bool = False,
+               parallel: int = 2) -> Dict[str, bool]:
+        """
+        Pull the images of several PHP versions ahead of time.
+
+        Args:
+            versions: PHP versions to pull (defaults to AVAILABLE_PHP_VERSIONS)
+            refresh: Whether to pull images that are already present, picking
+                up rebuilt tags (running containers are not affected)
+            parallel: Images pulled at the same time
+
+        Returns:
+            Dict[str, bool]: Whether each image is available afterwards
+        """
+        versions = versions or list(AVAILABLE_PHP_VERSIONS)
+        results: Dict[str, bool] = {}
+        to_pull = []
+        for version in versions:
+            if not refresh and self.is_present(version):
+                debug(f"PHP image for {version} already present")
+                results[version] = True
+            else:
+                to_pull.append(version)
+
+        if to_pull:
+            with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+                pulled = dict(zip(to_pull, executor.map(
+                    lambda version: pull_php_image(version, refresh=True), to_pull)))
+            now = time.time()
+            for version, ok in pulled.items():
+                results[version] = ok
+                if ok:
+                    self.pulled[version] = now
+                    self.tags[version] = {"available": True, "checked_at": now}
+            self.save()
+        return results
+
+    def status(self, versions: Optional[List[str]] = None) -> List[PhpImageStatus]:
+        """
+        Get the local and cached registry state of PHP images.
+
+        Args:
+            versions: PHP versions to report (defaults to AVAILABLE_PHP_VERSIONS)
+
+        Returns:
+            List[PhpImageStatus]: State of each image
+        """
+        from python_on_whales import docker
+
+        statuses = []
+        for version in versions or AVAILABLE_PHP_VERSIONS:
+            image = get_php_image(version)
+            status = PhpImageStatus(
+                version=version,
+                image=image,
+                present=False,
+                pulled_at=self.pulled.get(version),
+                tag_available=self.tags.get(version, {}).get("available"),
+                tag_checked_at=self.tags.get(version, {}).get("checked_at"),
+            )
+            try:
+                inspected = docker.image.inspect(image)
+                status.present = True
+                status.size_mb = inspected.size / 1048576
+                status.created = inspected.created.strftime("%Y-%m-%d")
+            except Exception:
+                pass
+            statuses.append(status)
+        return statuses
+
+
+@log_call
+def warmup_php_images(versions: Optional[List[str]] = None, refresh: bool = False) -> Dict[str, bool]:
+    """
+    Pull the images of the supported PHP versions ahead of time.
+
+    Args:
+        versions: PHP versions to pull (defaults to AVAILABLE_PHP_VERSIONS)
+        refresh: Whether to pull images that are already present
+
+    Returns:
+        Dict[str, bool]: Whether each image is available afterwards
+    """
+    return PhpImageManager().warmup(versions, refresh)
+
+
+def print_image_status(statuses: List[PhpImageStatus]) -> None:
+    """
+    Print the state of PHP images.
+
+    Args:
+        statuses: Image states to report
+    """
+    console = Console()
+    table = Table(title="🐘 PHP-FPM Images", header_style="bold cyan")
+    table.add_column("Version", style="bold white")
+    table.add_column("Image")
+    table.add_column("Local", justify="center")
+    table.add_column("Size", justify="right")
+    table.add_column("Built")
+    table.add_column("Last pull")
+
+    for status in statuses:
+        data = status.to_dict()
+        table.add_row(
+            status.version,
+            status.image,
+            "[green]✔[/green]" if status.present else "[red]✘[/red]",
+            f"{status.size_mb:.0f} MB" if status.size_mb is not None else "-",
+            status.created or "-",
+            data["pulled_at"] or "-",
+        )
+    console.print(table)
@@ -0,0 +1,497 @@
+"""
+OPcache tuning advisor.
+
+Every website ships with the same OPcache settings (256 MB, 10000 files,
+timestamp validation on). Sites with large plugin stacks have more PHP
+files than that, so scripts keep being evicted and recompiled. This module
+counts the PHP files of a website, reads the live OPcache status of its
+PHP-FPM pool and recommends memory, file-count and validation settings,
+optionally writing them to php.ini together with a preload script built
+from the most used files.
+
+``opcache_get_status()`` only reports on the shared memory of the process
+that calls it, and ``php -r`` runs in a separate CLI process. The status
+script therefore talks FastCGI to the local PHP-FPM pool, so the numbers
+are those of the workers that serve the website.
+"""
+
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, info, warn, error
+from src.common.utils.environment import env
+from src.features.php.capacity import read_fpm_pool
+from src.features.php.client import run_fpm_request, apply_php_config
+from src.features.php.utils import validate_ini_content, write_mounted_file
+
+# OPcache sizes its hash table to the first of these primes that is at
+# least opcache.max_accelerated_files, so that prime is the real limit
+OPCACHE_PRIMES = [223, 463, 983, 1979, 3907, 7963, 16229, 32531, 65407,
+                  130987, 262237, 524521, 1048793]
+
+# Room for plugin and core updates before the cache is full again
+FILE_HEADROOM = 1.3
+MEMORY_HEADROOM = 1.25
+
+# Compiled size of an average WordPress file, used until OPcache has warmed up
+ESTIMATED_KB_PER_FILE = 32
+MIN_WARM_SCRIPTS = 100
+
+MIN_MEMORY_MB = 128
+MAX_MEMORY_MB = 1024
+MAX_INTERNED_STRINGS_MB = 64
+
+DEFAULT_OPCACHE = {
+    "opcache.memory_consumption": "128",
+    "opcache.interned_strings_buffer": "8",
+    "opcache.max_accelerated_files": "10000",
+    "opcache.validate_timestamps": "1",
+    "opcache.revalidate_freq": "2",
+}
+
+# Container paths; the wordpress directory is mounted at /var/www/html
+CONTAINER_WEB_ROOT = "/var/www/html"
+PRELOAD_FILE_NAME = ".wpdocker-opcache-preload.php"
+DEFAULT_PRELOAD_SCRIPTS = 500
+
+# Runs inside a PHP-FPM worker (see run_fpm_request)
+STATUS_SCRIPT = """<?php
+echo json_encode([
+    "status" => opcache_get_status(__SCRIPTS__),
+    "directives" => opcache_get_configuration()["directives"],
+]);
+"""
+
+PRELOAD_TEMPLATE = """<?php
+// Generated by wpdocker: compiles the most used PHP files of {domain} into
+// OPcache when PHP-FPM starts. Regenerate with: php opcache {domain} --preload
+if (isset($_SERVER['REQUEST_METHOD'])) {{
+    http_response_code(404);
+    return;
+}}
+foreach ([
+{files}
+] as $file) {{
+    if (is_file($file)) {{
+        @opcache_compile_file($file);
+    }}
+}}
+"""
+
+
+def get_php_ini_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "php", "php.ini")
+
+
+def get_preload_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "wordpress", PRELOAD_FILE_NAME)
+
+
+def count_php_files(domain: str) -> int:
+    """
+    Count the PHP files of a website's WordPress tree.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        int: Number of .php files
+    """
+    wordpress_dir = os.path.join(env["SITES_DIR"], domain, "wordpress")
+    count = 0
+    for _, _, files in os.walk(wordpress_dir):
+        count += sum(1 for name in files if name.endswith(".php"))
+    return count
+
+
+def read_opcache_ini(domain: str) -> Dict[str, str]:
+    """
+    Read the OPcache settings of a website's php.ini.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        Dict[str, str]: opcache.* settings, with PHP defaults for missing keys
+    """
+    values = dict(DEFAULT_OPCACHE)
+    try:
+        with open(get_php_ini_path(domain), "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith("opcache.") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                values[key.strip()] = value.strip().strip('"')
+    except IOError:
+        pass
+    return values
+
+
+def write_php_ini(domain: str, values: Dict[str, Any]) -> bool:
+    """
+    Update settings in a website's php.ini in place.
+
+    Other settings and comments are kept; missing keys are appended.
+
+    Args:
+        domain: Website domain name
+        values: Settings to write
+
+    Returns:
+        bool: True if the file was written, False otherwise
+    """
+    path = get_php_ini_path(domain)
+    try:
+        with open(path, "r") as f:
+            content = f.read()
+    except IOError as e:
+        error(f"❌ Could not read {path}: {e}")
+        return False
+
+    for key, value in values.items():
+        pattern = re.compile(rf"^\s*{re.escape(key)}\s*=.*$", re.MULTILINE)
+        line = f"{key}={value}"
+        if pattern.search(content):
+            content = pattern.sub(line, content, count=1)
+        else:
+            content = content.rstrip("\n") + f"\n{line}\n"
+
+    invalid = validate_ini_content(content)
+    if invalid is not None:
+        error(f"❌ Refusing to write {path}, invalid line: {invalid.strip()}")
+        return False
+    try:
+        write_mounted_file(path, content)
+    except IOError as e:
+        error(f"❌ Could not write {path}: {e}")
+        return False
+    return True
+
+
+@log_call
+def get_opcache_status(domain: str, scripts: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Read the OPcache status of a website's PHP-FPM pool.
+
+    Args:
+        domain: Website domain name
+        scripts: Whether to include per-script hit counts
+
+    Returns:
+        Optional[Dict[str, Any]]: "status" and "directives", or None if the
+        pool could not be queried or OPcache is disabled
+    """
+    output = run_fpm_request(domain, STATUS_SCRIPT.replace("__SCRIPTS__", "true" if scripts else "false"))
+    if not output:
+        return None
+    try:
+        result = json.loads(output)
+    except json.JSONDecodeError:
+        debug(f"Unexpected OPcache status output for {domain}: {output[:200]}")
+        return None
+    if not isinstance(result, dict) or not result.get("status"):
+        return None
+    return result
+
+
+def effective_max_files(value: int) -> int:
+    """Get the number of files OPcache really accepts for a max_accelerated_files value."""
+    for prime in OPCACHE_PRIMES:
+        if prime >= value:
+            return prime
+    return OPCACHE_PRIMES[-1]
+
+
+@dataclass
+class OpcacheAdvice:
+    """Current and recommended OPcache settings of one website."""
+
+    domain: str
+    php_files: int
+    current: Dict[str, str]
+    recommended: Dict[str, str]
+    reasons: List[str] = field(default_factory=list)
+    cached_scripts: Optional[int] = None
+    used_mb: Optional[float] = None
+    hit_rate: Optional[float] = None
+    restarts: int = 0
+    # Container paths of the files a preload script would compile
+    preload_files: List[str] = field(default_factory=list)
+
+    @property
+    def changes(self) -> Dict[str, str]:
+        return {key: value for key, value in self.recommended.items()
+                if self.current.get(key) != value}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "php_files": self.php_files,
+            "cached_scripts": self.cached_scripts,
+            "used_mb": round(self.used_mb, 1) if self.used_mb is not None else None,
+            "hit_rate": round(self.hit_rate, 2) if self.hit_rate is not None else None,
+            "restarts": self.restarts,
+            "current": {k: self.current.get(k) for k in self.recommended},
+            "recommended": self.recommended,
+            "changes": self.changes,
+            "reasons": self.reasons,
+            "preload_files": self.preload_files,
+        }
+
+
+def recommend_opcache(domain: str, php_files: int, current: Dict[str, str],
+                      status: Optional[Dict[str, Any]] = None,
+                      production: Optional[bool] = None) -> OpcacheAdvice:
+    """
+    Work out OPcache settings for a website.
+
+    Args:
+        domain: Website domain name
+        php_files: Number of PHP files of the website
+        current: Current opcache.* settings
+        status: Result of get_opcache_status(), if the pool could be queried
+        production: True to turn off timestamp validation, False to turn it
+            back on, None to keep the current setting
+
+    Returns:
+        OpcacheAdvice: Current and recommended settings with the reasons
+    """
+    advice = OpcacheAdvice(domain=domain, php_files=php_files, current=current, recommended={})
+    opcache = (status or {}).get("status") or {}
+    memory = opcache.get("memory_usage") or {}
+    statistics = opcache.get("opcache_statistics") or {}
+    interned = opcache.get("interned_strings_usage") or {}
+
+    def setting(key: str) -> int:
+        try:
+            return int(float(current.get(key, DEFAULT_OPCACHE[key])))
+        except ValueError:
+            return int(DEFAULT_OPCACHE[key])
+
+    if statistics:
+        advice.cached_scripts = statistics.get("num_cached_scripts", 0)
+        advice.hit_rate = statistics.get("opcache_hit_rate")
+        advice.restarts = statistics.get("oom_restarts", 0) + statistics.get("hash_restarts", 0)
+    if memory:
+        advice.used_mb = memory.get("used_memory", 0) / 1048576
+    files = max(php_files, advice.cached_scripts or 0)
+
+    # File count: the hash table must hold every file plus headroom
+    current_files = setting("opcache.max_accelerated_files")
+    max_files = effective_max_files(max(int(files * FILE_HEADROOM), 10000))
+    if max_files > effective_max_files(current_files):
+        advice.reasons.append(
+            f"{files} PHP files but only {effective_max_files(current_files)} cache slots")
+    else:
+        max_files = current_files
+    if statistics.get("hash_restarts"):
+        advice.reasons.append(f"{statistics['hash_restarts']} restart(s) because the key table was full")
+    advice.recommended["opcache.max_accelerated_files"] = str(max_files)
+
+    # Interned strings: grow when nearly full
+    current_interned = setting("opcache.interned_strings_buffer")
+    interned_mb = max(current_interned, 16 if files > 10000 else 8)
+    buffer_size = interned.get("buffer_size") or 0
+    if buffer_size and interned.get("free_memory", buffer_size) / buffer_size < 0.1:
+        interned_mb = min(max(current_interned * 2, interned_mb), MAX_INTERNED_STRINGS_MB)
+        advice.reasons.append("interned strings buffer is over 90% full")
+    advice.recommended["opcache.interned_strings_buffer"] = str(interned_mb)
+
+    # Memory: measured size per compiled script once warm, an estimate before.
+    # Never shrunk, since unused shared memory is not backed by RAM anyway
+    cached = advice.cached_scripts or 0
+    if cached >= MIN_WARM_SCRIPTS and memory.get("used_memory"):
+        kb_per_file = memory["used_memory"] / 1024 / cached
+    else:
+        kb_per_file = ESTIMATED_KB_PER_FILE
+    needed_mb = files * kb_per_file / 1024 * MEMORY_HEADROOM + interned_mb
+    current_memory = setting("opcache.memory_consumption")
+    if statistics.get("oom_restarts") or opcache.get("cache_full"):
+        needed_mb = max(needed_mb, current_memory * 1.5)
+        advice.reasons.append("OPcache ran out of memory and was restarted or is full")
+    memory_mb = int(min(max(math.ceil(needed_mb / 32) * 32, MIN_MEMORY_MB), MAX_MEMORY_MB))
+    if memory_mb > current_memory:
+        advice.reasons.append(f"about {needed_mb:.0f} MB needed, {current_memory} MB configured")
+    else:
+        memory_mb = current_memory
+    advice.recommended["opcache.memory_consumption"] = str(memory_mb)
+
+    # Validation: production sites only pick up code changes on reload
+    if production:
+        advice.recommended["opcache.validate_timestamps"] = "0"
+        if current.get("opcache.validate_timestamps") != "0":
+            advice.reasons.append("production mode: no file checks; reload PHP after updates")
+    elif production is False:
+        advice.recommended["opcache.validate_timestamps"] = "1"
+        advice.recommended["opcache.revalidate_freq"] = str(max(setting("opcache.revalidate_freq"), 2))
+    else:
+        advice.recommended["opcache.validate_timestamps"] = str(setting("opcache.validate_timestamps"))
+
+    if advice.hit_rate is not None and advice.hit_rate < 90 and cached >= MIN_WARM_SCRIPTS:
+        advice.reasons.append(f"hit rate is only {advice.hit_rate:.1f}%")
+    return advice
+
+
+@log_call
+def advise_opcache(domain: str, production: Optional[bool] = None,
+                   status: Optional[Dict[str, Any]] = None) -> OpcacheAdvice:
+    """
+    Recommend OPcache settings for a website from its files and live status.
+
+    Args:
+        domain: Website domain name
+        production: True to turn off timestamp validation, False to turn it
+            back on, None to keep the current setting
+        status: Previously read OPcache status (read from the pool if None)
+
+    Returns:
+        OpcacheAdvice: Current and recommended settings with the reasons
+    """
+    if status is None:
+        status = get_opcache_status(domain)
+    if status is None:
+        warn(f"⚠️ Could not read the OPcache status of {domain}, using file counts only")
+    return recommend_opcache(domain, count_php_files(domain), read_opcache_ini(domain),
+                             status, production)
+
+
+def select_preload_files(status: Dict[str, Any],
+                         limit: int = DEFAULT_PRELOAD_SCRIPTS) -> List[str]:
+    """
+    Pick a website's most used files for preloading.
+
+    Args:
+        status: Result of get_opcache_status(domain, scripts=True)
+        limit: Maximum number of files
+
+    Returns:
+        List[str]: Container paths, most hits first; empty if OPcache has
+        no usage data yet
+    """
+    scripts = (status.get("status") or {}).get("scripts") or {}
+    container_path = f"{CONTAINER_WEB_ROOT}/{PRELOAD_FILE_NAME}"
+    ranked = sorted(
+        (s for s in scripts.values()
+         if s.get("full_path", "").startswith(CONTAINER_WEB_ROOT + "/")
+         and s["full_path"] != container_path),
+        key=lambda s: s.get("hits", 0), reverse=True,
+    )[:limit]
+    return [s["full_path"] for s in ranked]
+
+
+def generate_preload_script(domain: str, status: Dict[str, Any],
+                            limit: int = DEFAULT_PRELOAD_SCRIPTS) -> Optional[str]:
+    """
+    Write a preload script compiling a website's most used files.
+
+    The files are only compiled, not executed, so WordPress code that
+    depends on constants or load order is safe to list. The script stops
+    at once if it is ever requested over HTTP.
+
+    Args:
+        domain: Website domain name
+        status: Result of get_opcache_status(domain, scripts=True)
+        limit: Maximum number of files to preload
+
+    Returns:
+        Optional[str]: Container path of the script for opcache.preload, or
+        None if OPcache has no usage data yet
+    """
+    ranked = select_preload_files(status, limit)
+    if not ranked:
+        return None
+
+    container_path = f"{CONTAINER_WEB_ROOT}/{PRELOAD_FILE_NAME}"
+    files = "\n".join(f"    {json.dumps(path)}," for path in ranked)
+    path = get_preload_path(domain)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(PRELOAD_TEMPLATE.format(domain=domain, files=files))
+    os.replace(tmp_path, path)
+    debug(f"Wrote preload script for {domain} with {len(ranked)} files")
+    return container_path
+
+
+@log_call
+def apply_opcache_advice(advice: OpcacheAdvice, preload: Optional[str] = None) -> bool:
+    """
+    Write recommended OPcache settings to php.ini and reload PHP-FPM.
+
+    Args:
+        advice: Advice from advise_opcache()
+        preload: Container path of a preload script to enable
+
+    Returns:
+        bool: True if the settings were applied, False otherwise
+    """
+    from src.features.php.config import backup_php_config, restore_php_config_backup
+
+    values = dict(advice.changes)
+    if preload:
+        values["opcache.preload"] = preload
+        values["opcache.preload_user"] = read_fpm_pool(advice.domain).get("user", "www-data")
+    if not values:
+        info(f"✅ OPcache settings of {advice.domain} are already up to date")
+        return True
+
+    if not backup_php_config(advice.domain):
+        return False
+    if not write_php_ini(advice.domain, values):
+        return False
+    if not apply_php_config(advice.domain):
+        warn("⚠️ PHP rejected the new OPcache settings. Restoring backup...")
+        restore_php_config_backup(advice.domain, apply=False)
+        return False
+
+    info(f"✅ OPcache settings updated for {advice.domain}")
+    return True
+
+
+def print_opcache_advice(advice_list: List[OpcacheAdvice]) -> None:
+    """
+    Print current and recommended OPcache settings for several websites.
+
+    Args:
+        advice_list: Advice to report
+    """
+    console = Console()
+    if not advice_list:
+        console.print("No websites to analyze.", style="bold red")
+        return
+
+    for advice in advice_list:
+        hit_rate = f"{advice.hit_rate:.1f}%" if advice.hit_rate is not None else "-"
+        used = f"{advice.used_mb:.0f} MB" if advice.used_mb is not None else "-"
+        console.print(
+            f"\n[bold cyan]⚡ {advice.domain}[/bold cyan]: {advice.php_files} PHP files, "
+            f"{advice.cached_scripts if advice.cached_scripts is not None else '-'} cached, "
+            f"{used} used, hit rate {hit_rate}"
+        )
+
+        table = Table(header_style="bold cyan")
+        table.add_column("Setting", style="bold white")
+        table.add_column("Current", justify="right")
+        table.add_column("Recommended", justify="right")
+        changes = advice.changes
+        for key, value in advice.recommended.items():
+            style = "yellow" if key in changes else "green"
+            table.add_row(key, advice.current.get(key, "-"), f"[{style}]{value}[/{style}]")
+        console.print(table)
+
+        for reason in advice.reasons:
+            console.print(f"  • {reason}")
+
+        if advice.preload_files:
+            console.print(f"  Preload candidates ({len(advice.preload_files)} files, most used first):")
+            for path in advice.preload_files[:10]:
+                console.print(f"    {path}", style="dim")
+            if len(advice.preload_files) > 10:
+                console.print(f"    … and {len(advice.preload_files) - 10} more", style="dim")
@@ -0,0 +1,353 @@
+"""
+Zero-downtime PHP version switch.
+
+Recreating ``<domain>-php`` in place takes the website offline until the
+new image has started and warmed up. The switch here starts the new
+version next to the running container first and only moves traffic once
+it answers FastCGI requests:
+
+1. Start ``<domain>-php-next`` with the new image and the same mounts,
+   install the website's extensions into it and ping it through PHP-FPM.
+2. Point the vhost's ``$php_upstream`` at it and reload NGINX.
+3. Recreate ``<domain>-php`` with the new version, restore its extensions
+   and ping it.
+4. Point ``$php_upstream`` back at ``<domain>-php``, reload NGINX and
+   remove ``<domain>-php-next``.
+
+The website always ends up on the ``<domain>-php`` container, which
+everything else expects. If any step fails, ``<domain>-php`` is brought
+back on the previous version and traffic returns to it. The previous
+version is kept in the site config, so a finished switch can be undone
+with a single rollback_php_version call.
+"""
+
+import os
+import re
+import time
+from typing import Optional
+
+from src.common.logging import log_call, debug, info, warn, error, success
+from src.common.containers.container import Container
+from src.common.utils.environment import env
+from src.core.containers.compose import Compose
+from src.features.nginx.manager import reload as nginx_reload
+from src.features.php.client import run_fpm_request
+from src.features.php.images import PhpImageManager
+from src.features.php.utils import PHP_IMAGE, get_php_container_name, get_php_image
+from src.features.php.version import (
+    check_version_compatibility,
+    get_php_compose_path,
+    restore_php_extensions,
+    set_compose_php_image,
+    validate_php_version
+)
+from src.features.website.utils import get_site_config, set_site_config
+
+# How long a new container gets to answer FastCGI requests
+HEALTH_TIMEOUT = 60
+HEALTH_INTERVAL = 2
+
+PING_SCRIPT = "<?php echo 'pong ' . PHP_VERSION;"
+
+UPSTREAM_PATTERN = re.compile(r'(set\s+\$php_upstream\s+")([^":]+)(:\d+)?(";)')
+
+
+def get_candidate_container_name(domain: str) -> str:
+    return f"{get_php_container_name(domain)}-next"
+
+
+def get_candidate_compose_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "docker-compose.php-next.yml")
+
+
+def get_vhost_path(domain: str) -> str:
+    return os.path.join(env["CONFIG_DIR"], "nginx", "conf.d", f"{domain}.conf")
+
+
+@log_call
+def ping_php_fpm(domain: str, container_name: str, php_version: str,
+                 timeout: int = HEALTH_TIMEOUT) -> bool:
+    """
+    Wait until a PHP container serves FastCGI requests with the expected version.
+
+    Args:
+        domain: Website domain name
+        container_name: Container to check
+        php_version: PHP version the container should run
+        timeout: Seconds to wait
+
+    Returns:
+        bool: True if the container answered in time, False otherwise
+    """
+    deadline = time.time() + timeout
+    while True:
+        if Container(container_name).running():
+            output = run_fpm_request(domain, PING_SCRIPT, container_name)
+            if output and output.strip().startswith("pong "):
+                running = output.strip().split()[1]
+                if running.startswith(f"{php_version}.") or running == php_version:
+                    debug(f"{container_name} answered with PHP {running}")
+                    return True
+                error(f"❌ {container_name} runs PHP {running}, expected {php_version}")
+                return False
+        if time.time() >= deadline:
+            error(f"❌ {container_name} did not answer FastCGI requests within {timeout}s")
+            return False
+        time.sleep(HEALTH_INTERVAL)
+
+
+def get_php_upstream(domain: str) -> Optional[str]:
+    """
+    Get the PHP container the vhost of a website sends requests to.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        Optional[str]: Container name, or None if the vhost has no upstream
+    """
+    try:
+        with open(get_vhost_path(domain), "r") as f:
+            match = UPSTREAM_PATTERN.search(f.read())
+    except IOError:
+        return None
+    return match.group(2) if match else None
+
+
+@log_call
+def set_php_upstream(domain: str, container_name: str) -> bool:
+    """
+    Send a website's PHP requests to another container and reload NGINX.
+
+    The vhost is restored if NGINX rejects it.
+
+    Args:
+        domain: Website domain name
+        container_name: PHP container to send requests to
+
+    Returns:
+        bool: True if NGINX now uses the container, False otherwise
+    """
+    vhost_path = get_vhost_path(domain)
+    try:
+        with open(vhost_path, "r") as f:
+            original = f.read()
+    except IOError as e:
+        error(f"❌ Could not read NGINX config of {domain}: {e}")
+        return False
+
+    if not UPSTREAM_PATTERN.search(original):
+        error(f"❌ No $php_upstream found in {vhost_path}")
+        return False
+    updated = UPSTREAM_PATTERN.sub(
+        lambda m: f"{m.group(1)}{container_name}{m.group(3) or ':9000'}{m.group(4)}",
+        original)
+    if updated == original:
+        return True
+
+    tmp_path = f"{vhost_path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(updated)
+    os.replace(tmp_path, vhost_path)
+    if nginx_reload():
+        info(f"🔀 {domain} now served by {container_name}")
+        return True
+
+    with open(tmp_path, "w") as f:
+        f.write(original)
+    os.replace(tmp_path, vhost_path)
+    error(f"❌ NGINX rejected the new upstream for {domain}, config restored")
+    return False
+
+
+def write_candidate_compose(domain: str, php_version: str) -> Optional[str]:
+    """
+    Write the compose file of the temporary container for a new PHP version.
+
+    It is the website's compose file with its own project and container
+    name, so it shares the mounts and network of the running container.
+
+    Args:
+        domain: Website domain name
+        php_version: PHP version of the new container
+
+    Returns:
+        Optional[str]: Path to the compose file, or None on error
+    """
+    try:
+        with open(get_php_compose_path(domain), "r") as f:
+            content = f.read()
+    except IOError as e:
+        error(f"❌ Could not read PHP compose file of {domain}: {e}")
+        return None
+
+    content = re.sub(r"^name:.*$", f"name: {domain}-next", content, count=1, flags=re.M)
+    content = re.sub(r"(container_name:\s*)\S+",
+                     rf"\g<1>{get_candidate_container_name(domain)}", content, count=1)
+    content = re.sub(rf"(image:\s*){re.escape(PHP_IMAGE)}:\S+",
+                     rf"\g<1>{get_php_image(php_version)}", content, count=1)
+
+    path = get_candidate_compose_path(domain)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def remove_candidate(domain: str) -> None:
+    """
+    Remove the temporary container of a PHP version switch.
+
+    Args:
+        domain: Website domain name
+    """
+    path = get_candidate_compose_path(domain)
+    if not os.path.isfile(path):
+        return
+    Compose(name=get_candidate_container_name(domain), output_path=path).down()
+    os.remove(path)
+
+
+def prepare_php_container(domain: str, container_name: str, php_version: str) -> bool:
+    """
+    Install a website's extensions into a freshly started PHP container and check it.
+
+    The container must answer before the extensions are installed, and
+    again after PHP-FPM has reloaded with them.
+
+    Args:
+        domain: Website domain name
+        container_name: Container that was just started
+        php_version: PHP version the container should run
+
+    Returns:
+        bool: True if the container serves requests with all extensions, False otherwise
+    """
+    if not ping_php_fpm(domain, container_name, php_version):
+        return False
+    if not restore_php_extensions(domain, container_name):
+        error(f"❌ Could not restore the PHP extensions of {domain} in {container_name}")
+        return False
+    return ping_php_fpm(domain, container_name, php_version)
+
+
+def recreate_php_container(domain: str, php_version: str) -> bool:
+    """
+    Recreate ``<domain>-php`` with a PHP version and wait until it serves requests.
+
+    Args:
+        domain: Website domain name
+        php_version: PHP version to run
+
+    Returns:
+        bool: True if the container is up and healthy, False otherwise
+    """
+    container_name = get_php_container_name(domain)
+    compose_file_path = get_php_compose_path(domain)
+    set_compose_php_image(compose_file_path, php_version)
+    compose = Compose(name=container_name, output_path=compose_file_path)
+    compose.down()
+    if not compose.up(force_recreate=True):
+        return False
+    return prepare_php_container(domain, container_name, php_version)
+
+
+@log_call
+def switch_php_version(domain: str, php_version: str) -> bool:
+    """
+    Change the PHP version of a running website without downtime.
+
+    Args:
+        domain: Website domain name
+        php_version: PHP version to switch to (e.g., "8.2")
+
+    Returns:
+        bool: True if the website now runs the new version, False otherwise
+    """
+    if not validate_php_version(php_version):
+        return False
+
+    site_config = get_site_config(domain)
+    if not site_config or not site_config.php:
+        error(f"❌ PHP configuration not found for website {domain}")
+        return False
+    current_version = site_config.php.php_version
+    if current_version == php_version:
+        warn(f"⚠️ {domain} already runs PHP {php_version}")
+        return True
+    if not check_version_compatibility(current_version, php_version):
+        return False
+    if not os.path.isfile(get_php_compose_path(domain)):
+        error(f"❌ File not found: {get_php_compose_path(domain)}")
+        return False
+
+    if not PhpImageManager().ensure(php_version):
+        error(f"❌ PHP {php_version} image is not available")
+        return False
+
+    container_name = get_php_container_name(domain)
+    candidate_name = get_candidate_container_name(domain)
+
+    # A leftover from an interrupted switch must not keep serving the site
+    if get_php_upstream(domain) == candidate_name:
+        set_php_upstream(domain, container_name)
+    remove_candidate(domain)
+
+    info(f"🟢 Starting PHP {php_version} next to the running container...")
+    candidate_compose = write_candidate_compose(domain, php_version)
+    if not candidate_compose:
+        return False
+    if (not Compose(name=candidate_name, output_path=candidate_compose).up(force_recreate=True)
+            or not prepare_php_container(domain, candidate_name, php_version)):
+        remove_candidate(domain)
+        error(f"❌ PHP {php_version} did not start for {domain}, nothing was changed")
+        return False
+
+    if not set_php_upstream(domain, candidate_name):
+        remove_candidate(domain)
+        return False
+
+    info(f"🔁 Recreating {container_name} with PHP {php_version}...")
+    switched = recreate_php_container(domain, php_version)
+    if not switched:
+        warn(f"⚠️ {container_name} failed on PHP {php_version}, rolling back to {current_version}")
+        if not recreate_php_container(domain, current_version):
+            error(f"❌ Could not bring {container_name} back on PHP {current_version}; "
+                  f"{domain} stays on {candidate_name}")
+            return False
+
+    if not set_php_upstream(domain, container_name):
+        error(f"❌ {domain} stays on {candidate_name}; "
+              f"fix the NGINX config and run the switch again")
+        return False
+    remove_candidate(domain)
+    if not switched:
+        return False
+
+    site_config.php.php_previous_version = current_version
+    site_config.php.php_version = php_version
+    set_site_config(domain, site_config)
+    success(f"✅ {domain} switched from PHP {current_version} to {php_version} without downtime")
+    return True
+
+
+@log_call
+def rollback_php_version(domain: str) -> bool:
+    """
+    Switch a website back to the PHP version it ran before the last change.
+
+    This is a regular zero-downtime switch, so the version being left
+    becomes the previous version and a second rollback undoes the first.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        bool: True if the website runs the previous version again, False otherwise
+    """
+    site_config = get_site_config(domain)
+    previous = site_config.php.php_previous_version if site_config and site_config.php else None
+    if not previous:
+        error(f"❌ No previous PHP version recorded for {domain}")
+        return False
+    info(f"⏪ Rolling {domain} back to PHP {previous}...")
+    return switch_php_version(domain, previous)
@@ -5,12 +5,12 @@ This module provides utility functions for PHP operations,
 including container management and version selection.
 """
 
+import os
+import threading
 from typing import Dict, List, Optional, Any
 
-from python_on_whales import docker
-import questionary
-
-from src.common.logging import debug
+from src.common.logging import debug, info, error
+from src.common.tracing import span
 from src.common.utils.validation import is_arm
 from src.features.website.utils import get_site_config
 
@@ -28,6 +28,8 @@ def get_php_container_id_by_name(container_name: str) -> str:
     Raises:
         ValueError: If container not found
     """
+    from python_on_whales import docker
+
     containers = docker.container.list(
         all=True, filters={"name": container_name})
     if not containers:
@@ -77,6 +79,58 @@ AVAILABLE_PHP_VERSIONS = [
     "8.3",
 ]
 
+# Image used by docker-compose.php.yml.template
+PHP_IMAGE = "bitnami/php-fpm"
+
+# One lock per image so concurrent website setups pull it only once
+_pull_locks: Dict[str, threading.Lock] = {}
+_pull_locks_guard = threading.Lock()
+
+
+def get_php_image(php_version: str) -> str:
+    """
+    Get the PHP-FPM image reference for a PHP version.
+    
+    Args:
+        php_version: PHP version (e.g., 8.2)
+        
+    Returns:
+        Image reference
+    """
+    return f"{PHP_IMAGE}:{php_version}"
+
+
+def pull_php_image(php_version: str, refresh: bool = False) -> bool:
+    """
+    Make sure the PHP-FPM image for a PHP version is available locally.
+    
+    Safe to call from several threads; the image is pulled at most once.
+    
+    Args:
+        php_version: PHP version (e.g., 8.2)
+        refresh: Whether to pull the tag again even if the image is present
+        
+    Returns:
+        bool: True if the image is available, False otherwise
+    """
+    from python_on_whales import docker
+
+    image = get_php_image(php_version)
+    with _pull_locks_guard:
+        lock = _pull_locks.setdefault(image, threading.Lock())
+    with lock:
+        try:
+            if not refresh and docker.image.exists(image):
+                debug(f"PHP image {image} already present")
+                return True
+            info(f"📥 Pulling PHP image {image}...")
+            with span(f"docker pull {image}", "network"):
+                docker.image.pull(image, quiet=True)
+            return True
+        except Exception as e:
+            error(f"❌ Error pulling PHP image {image}: {e}")
+            return False
+
 
 def php_choose_version() -> str:
     """
@@ -85,6 +139,8 @@ def php_choose_version() -> str:
     Returns:
         Selected PHP version
     """
+    import questionary
+
     choices = []
     arm_system = is_arm()
     for ver in AVAILABLE_PHP_VERSIONS:
@@ -97,4 +153,45 @@ def php_choose_version() -> str:
     ).ask()
 
     debug(f"Selected PHP version: {selected}")
-    return selected
\ No newline at end of file
+    return selected
+
+
+def validate_ini_content(content: str) -> Optional[str]:
+    """
+    Check that every line of a php.ini or PHP-FPM pool file can be parsed.
+
+    Args:
+        content: File content
+
+    Returns:
+        Optional[str]: The first line that is not a comment, section or
+        key = value setting, or None if the content is valid
+    """
+    for line in content.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith((";", "#")):
+            continue
+        if stripped.startswith("[") and stripped.endswith("]"):
+            continue
+        if "=" in stripped and stripped.split("=", 1)[0].strip():
+            continue
+        return line
+    return None
+
+
+def write_mounted_file(path: str, content: str) -> None:
+    """
+    Rewrite a file that is bind-mounted into a PHP container.
+
+    php.ini and php-fpm.conf are mounted as single files, which Docker
+    binds by inode: a file put in place with os.replace is never seen by
+    the container. The content is written into the existing file instead.
+
+    Args:
+        path: File to rewrite
+        content: New content
+    """
+    with open(path, "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
@@ -7,23 +7,24 @@ including changing versions and checking available versions.
 
 import os
 import re
-import requests
 from typing import Optional, Dict, Any, List, Tuple
 
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from src.common.logging import log_call, debug, error, info, warn
+from src.common.containers.container import Container
 from src.common.utils.environment import env
 from src.core.containers.compose import Compose
 from src.features.website.utils import get_site_config, set_site_config
 from src.features.website.models.site_config import SitePHP
-from src.features.php.client import init_php_client
-from src.features.php.utils import get_php_container_name, AVAILABLE_PHP_VERSIONS
-
-
-# Constants for Docker Hub
-BITNAMI_IMAGE_PREFIX = "bitnami/php-fpm"
-DOCKER_HUB_URL = "https://hub.docker.com/v2/repositories/{image}/tags/{version}"
+from src.features.php.client import init_php_client, apply_php_config
+from src.features.php.utils import (
+    AVAILABLE_PHP_VERSIONS,
+    PHP_IMAGE,
+    get_php_container_name,
+    get_php_image
+)
+from src.features.php.images import PhpImageManager
 
 
 def validate_php_version(version: str) -> bool:
@@ -48,13 +49,8 @@ def validate_php_version(version: str) -> bool:
             error(f"PHP version {version} is not in supported versions: {AVAILABLE_PHP_VERSIONS}")
             return False
             
-        # Check if version exists on Docker Hub
-        image_url = DOCKER_HUB_URL.format(
-            image=BITNAMI_IMAGE_PREFIX.replace('/', '%2F'),
-            version=version
-        )
-        response = requests.get(image_url)
-        if response.status_code != 200:
+        # Check if the image exists locally or on Docker Hub (cached)
+        if not PhpImageManager().is_tag_available(version):
             error(f"PHP version {version} doesn't exist on Docker Hub!")
             return False
             
@@ -99,21 +95,53 @@ def check_version_compatibility(current_version: str, new_version: str) -> bool:
         return False
 
 
+def get_php_compose_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "docker-compose.php.yml")
+
+
+def set_compose_php_image(compose_file_path: str, php_version: str) -> None:
+    """
+    Point the PHP service of a compose file at the image of a PHP version.
+
+    Args:
+        compose_file_path: Path to the docker-compose file
+        php_version: PHP version to use
+    """
+    with open(compose_file_path, "r") as f:
+        lines = f.readlines()
+
+    with open(compose_file_path, "w") as f:
+        for line in lines:
+            if f"{PHP_IMAGE}:" in line:
+                indent = line[:len(line) - len(line.lstrip())]
+                f.write(f"{indent}image: {get_php_image(php_version)}\n")
+            else:
+                f.write(line)
+
+
 @log_call
-def change_php_version(domain: str, php_version: str) -> bool:
+def change_php_version(domain: str, php_version: str, in_place: bool = False) -> bool:
     """
     Change PHP version for a website.
     
-    This function updates the configuration, docker-compose file, and
-    rebuilds the PHP container with the new version.
+    A running website is switched with a blue/green container swap, so it
+    keeps serving requests (see switch_php_version). Otherwise, or when
+    in_place is set, this updates the configuration and docker-compose file
+    and rebuilds the PHP container with the new version.
     
     Args:
         domain: Website domain name
         php_version: PHP version to change to (e.g., "8.2")
+        in_place: Whether to recreate the container in place even if it is running
         
     Returns:
         bool: True if change was successful, False otherwise
     """
+    if not in_place and Container(get_php_container_name(domain)).running():
+        # Imported here to avoid circular imports
+        from src.features.php.switch import switch_php_version
+        return switch_php_version(domain, php_version)
+
     try:
         # Validate version
         if not validate_php_version(php_version):
@@ -133,6 +161,13 @@ def change_php_version(domain: str, php_version: str) -> bool:
         ) as progress:
             task = progress.add_task(f"Changing PHP version to {php_version}...", total=None)
 
+            # Pull the new image while the current container keeps serving
+            progress.update(task, description=f"Preparing PHP {php_version} image...")
+            if not PhpImageManager().ensure(php_version):
+                progress.stop()
+                error(f"❌ PHP {php_version} image is not available")
+                return False
+
             # Update site config
             progress.update(task, description=f"Updating config for {domain}...")
             site_config = get_site_config(domain)
@@ -144,29 +179,22 @@ def change_php_version(domain: str, php_version: str) -> bool:
             if not hasattr(site_config, 'php') or not site_config.php:
                 site_config.php = SitePHP(php_version=php_version, php_container=None, php_installed_extensions=[])
             else:
+                if site_config.php.php_version != php_version:
+                    site_config.php.php_previous_version = site_config.php.php_version
                 site_config.php.php_version = php_version
 
             set_site_config(domain, site_config)
             info(f"📦 Updated config: PHP version → {php_version}")
 
             # Update docker-compose file
-            compose_file_path = os.path.join(env["SITES_DIR"], domain, "docker-compose.php.yml")
+            compose_file_path = get_php_compose_path(domain)
             if not os.path.isfile(compose_file_path):
                 progress.stop()
                 error(f"❌ File not found: {compose_file_path}")
                 return False
 
             progress.update(task, description="Updating docker-compose.php.yml...")
-            with open(compose_file_path, "r") as f:
-                lines = f.readlines()
-
-            with open(compose_file_path, "w") as f:
-                for line in lines:
-                    if "bitnami/php-fpm:" in line:
-                        indent = line[:len(line) - len(line.lstrip())]
-                        f.write(f"{indent}image: bitnami/php-fpm:{php_version}\n")
-                    else:
-                        f.write(line)
+            set_compose_php_image(compose_file_path, php_version)
 
             # Rebuild PHP container
             progress.update(task, description="Rebuilding PHP container...")
@@ -220,12 +248,16 @@ def get_current_php_version(domain: str) -> Optional[str]:
 
 
 @log_call
-def restore_php_extensions(domain: str) -> None:
+def restore_php_extensions(domain: str, container_name: Optional[str] = None) -> bool:
     """
     Restore PHP extensions after version change.
     
     Args:
         domain: Website domain name
+        container_name: Container to install into (defaults to the website's PHP container)
+        
+    Returns:
+        bool: True if every installed extension was restored and loaded, False otherwise
     """
     from src.features.php.extensions.registry import EXTENSION_REGISTRY
     from src.features.php.extensions.manager import get_extension_instance
@@ -233,14 +265,16 @@ def restore_php_extensions(domain: str) -> None:
     site_config = get_site_config(domain)
     if not site_config or not hasattr(site_config, 'php') or not site_config.php:
         warn(f"⚠️ PHP configuration not found for website {domain}")
-        return
+        return False
 
     extensions = site_config.php.php_installed_extensions or []
     if not extensions:
         info(f"💤 Website {domain} doesn't have any PHP extensions installed.")
-        return
+        return True
 
     info(f"🔁 Restoring PHP extensions for {domain}...")
+    restored = False
+    failed = False
     for ext_id in extensions:
         try:
             if ext_id not in EXTENSION_REGISTRY:
@@ -248,7 +282,16 @@ def restore_php_extensions(domain: str) -> None:
                 continue
 
             ext = get_extension_instance(ext_id)
-            ext.install(domain)
+            if not ext.install(domain, container_name):
+                failed = True
+                continue
             ext.update_config(domain)
+            restored = True
         except Exception as e:
-            warn(f"⚠️ Error installing extension '{ext_id}': {e}")
\ No newline at end of file
+            warn(f"⚠️ Error installing extension '{ext_id}': {e}")
+            failed = True
+
+    # PHP-FPM only loads extensions when it starts
+    if restored and not apply_php_config(domain, container_name=container_name):
+        return False
+    return not failed
\ No newline at end of file
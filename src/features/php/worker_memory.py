@@ -0,0 +1,317 @@
+"""
+PHP-FPM worker memory sampling.
+
+PHP-FPM sizing used to assume a fixed worker size of 40-60 MB, while real
+WordPress workers (WooCommerce in particular) often use 120-250 MB. This
+module samples the memory of every running FPM worker in a website's
+container from ``/proc`` and keeps a rolling window of samples, so sizing
+can use measured percentiles instead of a guess.
+
+Proportional set size (Pss) is used when the kernel provides it, so shared
+memory such as the OPcache segment is split between workers instead of
+being counted once per worker; VmRSS is the fallback.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn
+from src.common.utils.environment import env
+from src.features.php.utils import get_php_container_name
+
+# Prints the status and memory rollup of every process in the container
+MEASURE_SCRIPT = (
+    'for p in /proc/[0-9]*; do echo "== ${p#/proc/}"; '
+    'cat "$p/status" "$p/smaps_rollup" 2>/dev/null; done'
+)
+
+# Samples older than this are dropped
+SAMPLE_WINDOW_DAYS = 7
+
+# Samples kept per site, oldest dropped first
+MAX_SAMPLES = 2000
+
+# Percentile used when sizing pools, to leave headroom for heavy requests
+SIZING_PERCENTILE = 90
+
+
+@dataclass
+class WorkerMemoryStats:
+    """Worker memory percentiles of one website."""
+
+    domain: str
+    samples: int
+    runs: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    first_sample: float
+    last_sample: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "samples": self.samples,
+            "runs": self.runs,
+            "p50_mb": round(self.p50, 1),
+            "p90_mb": round(self.p90, 1),
+            "p99_mb": round(self.p99, 1),
+            "max_mb": round(self.max, 1),
+            "first_sample": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.first_sample)),
+            "last_sample": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_sample)),
+        }
+
+
+def parse_worker_memory(output: str) -> List[float]:
+    """
+    Extract the memory of each PHP-FPM worker from MEASURE_SCRIPT output.
+
+    Args:
+        output: Output of MEASURE_SCRIPT run in a PHP container
+
+    Returns:
+        List[float]: Memory per worker in MB
+    """
+    workers = []
+    for block in output.split("== ")[1:]:
+        pid, _, body = block.partition("\n")
+        fields = {}
+        for line in body.splitlines():
+            key, _, value = line.partition(":")
+            fields.setdefault(key.strip(), value.strip())
+        # PID 1 is the FPM master, which does not serve requests
+        if pid.strip() == "1" or not fields.get("Name", "").startswith("php-fpm"):
+            continue
+        memory = fields.get("Pss") or fields.get("VmRSS")
+        if memory:
+            try:
+                workers.append(int(memory.split()[0]) / 1024)
+            except ValueError:
+                continue
+    return workers
+
+
+def measure_worker_memory(domain: str) -> List[float]:
+    """
+    Measure the memory of each running PHP-FPM worker of a website.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        List[float]: Memory per worker in MB, empty if none could be measured
+    """
+    from src.common.containers.container import Container
+
+    container = Container(get_php_container_name(domain))
+    if not container.running():
+        return []
+    output = container.exec(["sh", "-c", MEASURE_SCRIPT], user="root")
+    return parse_worker_memory(output or "")
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class WorkerMemorySampler:
+    """Keeps a rolling window of PHP-FPM worker memory samples per website."""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            state_file: JSON file holding the samples (defaults to DATA_DIR/analytics)
+        """
+        self.state_file = state_file or os.path.join(
+            env["DATA_DIR"], "analytics", "php_worker_memory.json")
+        # domain -> list of [timestamp, MB]
+        self.samples: Dict[str, List[List[float]]] = self._load()
+
+    def _load(self) -> Dict[str, List[List[float]]]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read PHP worker memory samples: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist the samples."""
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.samples, f)
+        os.replace(tmp_file, self.state_file)
+
+    def add(self, domain: str, workers: List[float], now: Optional[float] = None) -> None:
+        """
+        Record one measurement of a website's workers.
+
+        Args:
+            domain: Website domain name
+            workers: Memory per worker in MB
+            now: Time of the measurement (defaults to time.time())
+        """
+        now = now or time.time()
+        cutoff = now - SAMPLE_WINDOW_DAYS * 86400
+        samples = [s for s in self.samples.get(domain, []) if s[0] >= cutoff]
+        samples.extend([round(now, 1), round(mb, 2)] for mb in workers)
+        self.samples[domain] = samples[-MAX_SAMPLES:]
+
+    def sample_site(self, domain: str) -> List[float]:
+        """
+        Measure a website's running workers and record the result.
+
+        Args:
+            domain: Website domain name
+
+        Returns:
+            List[float]: Memory per worker in MB
+        """
+        try:
+            workers = measure_worker_memory(domain)
+        except Exception as e:
+            debug(f"Could not measure PHP workers of {domain}: {e}")
+            return []
+        if workers:
+            self.add(domain, workers)
+        debug(f"Sampled {len(workers)} PHP worker(s) of {domain}")
+        return workers
+
+    @log_call
+    def sample_all(self, domains: Optional[List[str]] = None) -> Dict[str, List[float]]:
+        """
+        Measure the workers of several websites and save the samples.
+
+        Args:
+            domains: Websites to sample (defaults to all websites)
+
+        Returns:
+            Dict[str, List[float]]: Memory per worker for each website
+        """
+        if domains is None:
+            from src.features.website.utils import website_list
+            domains = website_list()
+
+        results = {domain: self.sample_site(domain) for domain in domains}
+        self.save()
+        return results
+
+    def stats(self, domain: str) -> Optional[WorkerMemoryStats]:
+        """
+        Get worker memory percentiles of a website.
+
+        Args:
+            domain: Website domain name
+
+        Returns:
+            Optional[WorkerMemoryStats]: Percentiles, or None without samples
+        """
+        samples = self.samples.get(domain)
+        if not samples:
+            return None
+        ordered = sorted(s[1] for s in samples)
+        return WorkerMemoryStats(
+            domain=domain,
+            samples=len(samples),
+            runs=len({s[0] for s in samples}),
+            p50=_percentile(ordered, 50),
+            p90=_percentile(ordered, 90),
+            p99=_percentile(ordered, 99),
+            max=ordered[-1],
+            first_sample=min(s[0] for s in samples),
+            last_sample=max(s[0] for s in samples),
+        )
+
+    def worker_mb(self, domain: Optional[str] = None,
+                  percentile: float = SIZING_PERCENTILE) -> Optional[float]:
+        """
+        Get the worker size to plan with.
+
+        Args:
+            domain: Website domain name, or None for all websites on the host
+                (used to size a new website that has no samples yet)
+            percentile: Percentile of the sampled worker memory
+
+        Returns:
+            Optional[float]: Worker size in MB, or None without samples
+        """
+        if domain is not None:
+            values = [s[1] for s in self.samples.get(domain, [])]
+        else:
+            values = [s[1] for samples in self.samples.values() for s in samples]
+        if not values:
+            return None
+        return _percentile(sorted(values), percentile)
+
+
+def get_measured_worker_mb(domain: Optional[str] = None) -> Optional[float]:
+    """
+    Get the measured worker size of a website, or of the host if domain is None.
+
+    Args:
+        domain: Website domain name
+
+    Returns:
+        Optional[float]: Worker size in MB, or None if nothing was sampled yet
+    """
+    try:
+        return WorkerMemorySampler().worker_mb(domain)
+    except Exception as e:
+        debug(f"Could not read PHP worker memory samples: {e}")
+        return None
+
+
+def print_worker_memory(stats_list: List[WorkerMemoryStats],
+                        assumed_mb: Optional[float] = None) -> None:
+    """
+    Print worker memory percentiles for several websites.
+
+    Args:
+        stats_list: Percentiles to report
+        assumed_mb: Default worker size used without samples, for comparison
+    """
+    console = Console()
+    if not stats_list:
+        console.print("No PHP worker memory samples yet. Run with --sample first.",
+                      style="bold red")
+        return
+
+    table = Table(title="🧠 PHP-FPM Worker Memory", header_style="bold cyan")
+    table.add_column("Domain", style="bold white")
+    table.add_column("Samples", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p90", justify="right")
+    table.add_column("p99", justify="right")
+    table.add_column("Max", justify="right")
+    if assumed_mb:
+        table.add_column("vs default", justify="right")
+    table.add_column("Since")
+
+    for stats in stats_list:
+        row = [
+            stats.domain,
+            f"{stats.samples} ({stats.runs} runs)",
+            f"{stats.p50:.0f} MB",
+            f"{stats.p90:.0f} MB",
+            f"{stats.p99:.0f} MB",
+            f"{stats.max:.0f} MB",
+        ]
+        if assumed_mb:
+            ratio = stats.p90 / assumed_mb
+            style = "red" if ratio >= 1.5 else "yellow" if ratio >= 1.1 else "green"
+            row.append(f"[{style}]{ratio:.1f}x[/{style}]")
+        row.append(stats.to_dict()["first_sample"])
+        table.add_row(*row)
+    console.print(table)
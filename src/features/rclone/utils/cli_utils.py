@@ -8,6 +8,7 @@ import os
 
 from src.common.logging import info, error, debug
 from src.common.utils.environment import env
+from src.common.tracing import span
 
 def run_rclone_command(args: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
     """
@@ -31,12 +32,13 @@ def run_rclone_command(args: List[str], capture_output: bool = True) -> Tuple[in
             args.extend(['--config', config_path])
             
         # Chạy lệnh
-        result = subprocess.run(
-            ['rclone'] + args,
-            capture_output=capture_output,
-            text=True,
-            check=False
-        )
+        with span(f"rclone {args[0]}", "network"):
+            result = subprocess.run(
+                ['rclone'] + args,
+                capture_output=capture_output,
+                text=True,
+                check=False
+            )
         
         return result.returncode, result.stdout, result.stderr
         
@@ -5,51 +5,29 @@ This package provides functionality for managing SSL certificates,
 including installation, checking, and editing.
 """
 
-# Models
-from src.features.ssl.models.ssl_config import SSLConfig, SSLType
+from src.common.utils.lazy import lazy_exports
 
-# Core functionality
-from src.features.ssl.core.installer import (
-    install_selfsigned_ssl,
-    install_manual_ssl,
-    install_letsencrypt_ssl
-)
-from src.features.ssl.core.checker import check_ssl, get_ssl_status
-from src.features.ssl.core.editor import edit_ssl, read_ssl_files
-
-# Utilities
-from src.features.ssl.utils.ssl_utils import (
-    get_ssl_paths,
-    ensure_ssl_dir,
-    has_ssl_certificate,
-    backup_ssl_files,
-    restore_ssl_backup
-)
-
-# CLI interface
-from src.features.ssl.cli.main import main as cli_main
-
-__all__ = [
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
     # Models
-    'SSLConfig',
-    'SSLType',
-    
+    "src.features.ssl.models.ssl_config": ["SSLConfig", "SSLType"],
     # Core functionality
-    'install_selfsigned_ssl',
-    'install_manual_ssl',
-    'install_letsencrypt_ssl',
-    'check_ssl',
-    'get_ssl_status',
-    'edit_ssl',
-    'read_ssl_files',
-    
+    "src.features.ssl.core.installer": [
+        "install_selfsigned_ssl",
+        "install_manual_ssl",
+        "install_letsencrypt_ssl",
+    ],
+    "src.features.ssl.core.checker": ["check_ssl", "get_ssl_status"],
+    "src.features.ssl.core.editor": ["edit_ssl", "read_ssl_files"],
+    "src.features.ssl.scanner": ["scan_certificates", "CertificateStatus"],
+    "src.features.ssl.renewal": ["renew_certificates", "RenewalReport"],
     # Utilities
-    'get_ssl_paths',
-    'ensure_ssl_dir',
-    'has_ssl_certificate',
-    'backup_ssl_files',
-    'restore_ssl_backup',
-    
+    "src.features.ssl.utils.ssl_utils": [
+        "get_ssl_paths",
+        "ensure_ssl_dir",
+        "has_ssl_certificate",
+        "backup_ssl_files",
+        "restore_ssl_backup",
+    ],
     # CLI interface
-    'cli_main'
-]
\ No newline at end of file
+    "src.features.ssl.cli.main": ["main as cli_main"],
+})
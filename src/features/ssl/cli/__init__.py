@@ -5,14 +5,10 @@ This package provides command-line interfaces for installing, checking,
 and editing SSL certificates.
 """
 
-from src.features.ssl.cli.install import cli_install_ssl
-from src.features.ssl.cli.check import cli_check_ssl
-from src.features.ssl.cli.edit import cli_edit_ssl
-from src.features.ssl.cli.main import main
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'cli_install_ssl',
-    'cli_check_ssl',
-    'cli_edit_ssl',
-    'main'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.ssl.cli.install": ["cli_install_ssl"],
+    "src.features.ssl.cli.check": ["cli_check_ssl"],
+    "src.features.ssl.cli.edit": ["cli_edit_ssl"],
+})
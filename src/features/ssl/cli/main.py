@@ -9,6 +9,7 @@ import sys
 from typing import Optional
 
 from src.common.logging import log_call, debug, error, info, warn, success
+from src.common.profiling import profiled
 from src.features.ssl.core.installer import (
     install_selfsigned_ssl,
     install_manual_ssl,
@@ -16,6 +17,10 @@ from src.features.ssl.core.installer import (
 )
 from src.features.ssl.core.checker import check_ssl, get_ssl_status
 from src.features.ssl.core.editor import edit_ssl, read_ssl_files
+from src.features.ssl.cli.scan import cli_scan_ssl
+from src.features.ssl.cli.renew import cli_renew_ssl
+from src.features.ssl.renewal import RENEW_BEFORE_DAYS
+from src.features.ssl.scanner import EXPIRY_WARNING_DAYS
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -38,6 +43,12 @@ Examples:
   # Check certificate status
   wpdocker ssl check example.com
   
+  # Report certificate expiry of all websites
+  wpdocker ssl scan --json
+  
+  # Renew every due Let's Encrypt certificate in one certbot session
+  wpdocker ssl renew --dry-run
+  
   # Edit certificate configuration
   wpdocker ssl edit example.com --cert /path/to/cert.pem --key /path/to/key.pem
 """
@@ -61,6 +72,31 @@ Examples:
     check_parser = subparsers.add_parser("check", help="Check SSL certificate")
     check_parser.add_argument("domain", help="Domain name")
     
+    # Scan command
+    scan_parser = subparsers.add_parser("scan", help="Report certificate expiry of all websites")
+    scan_parser.add_argument("domains", nargs="*", help="Domain names (default: all websites)")
+    scan_parser.add_argument("--warn-days", type=int, default=EXPIRY_WARNING_DAYS,
+                           help=f"Days before expiry to report a certificate as expiring "
+                                f"(default: {EXPIRY_WARNING_DAYS})")
+    scan_parser.add_argument("--no-cache", action="store_true",
+                           help="Decode every certificate again")
+    scan_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    
+    # Renew command
+    renew_parser = subparsers.add_parser("renew", help="Renew due Let's Encrypt certificates")
+    renew_parser.add_argument("domains", nargs="*", help="Domain names (default: all websites)")
+    renew_parser.add_argument("--days", type=int, default=RENEW_BEFORE_DAYS,
+                            help=f"Days before expiry to renew a certificate "
+                                 f"(default: {RENEW_BEFORE_DAYS})")
+    renew_parser.add_argument("--email", help="Account email, issues listed domains without a certificate")
+    renew_parser.add_argument("--staging", action="store_true",
+                            help="Use the Let's Encrypt staging environment")
+    renew_parser.add_argument("--dry-run", action="store_true",
+                            help="Test the renewals without saving certificates")
+    renew_parser.add_argument("--force", action="store_true",
+                            help="Renew the listed certificates even if not due")
+    renew_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    
     # Edit command
     edit_parser = subparsers.add_parser("edit", help="Edit SSL configuration")
     edit_parser.add_argument("domain", help="Domain name")
@@ -76,6 +112,7 @@ Examples:
     return parser
 
 
+@profiled("ssl")
 @log_call
 def main(args: Optional[argparse.Namespace] = None) -> int:
     """
@@ -97,7 +134,7 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
     try:
         if args.command == "install":
             if args.type == "selfsigned":
-                success = install_selfsigned_ssl(args.domain, args.email)
+                success = install_selfsigned_ssl(args.domain)
             elif args.type == "manual":
                 if not args.cert or not args.key:
                     error("Certificate and key files are required for manual installation")
@@ -116,6 +153,27 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
             print(status)
             return 0
             
+        elif args.command == "scan":
+            success = cli_scan_ssl(
+                args.domains or None,
+                warn_days=args.warn_days,
+                json_output=args.json,
+                use_cache=not args.no_cache
+            )
+            return 0 if success else 1
+            
+        elif args.command == "renew":
+            success = cli_renew_ssl(
+                args.domains or None,
+                renew_days=args.days,
+                email=args.email,
+                staging=args.staging,
+                dry_run=args.dry_run,
+                force=args.force,
+                json_output=args.json
+            )
+            return 0 if success else 1
+            
         elif args.command == "edit":
             auto_renew = None
             if args.auto_renew:
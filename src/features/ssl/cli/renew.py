@@ -0,0 +1,48 @@
+"""
+CLI interface for batched Let's Encrypt renewal.
+
+This module provides a command-line interface for renewing every due
+Let's Encrypt certificate in one certbot session.
+"""
+
+import json
+from typing import List, Optional
+
+from src.common.logging import log_call, error
+from src.features.ssl.renewal import (
+    RENEW_BEFORE_DAYS,
+    renew_certificates,
+    print_renewal_report
+)
+
+
+@log_call
+def cli_renew_ssl(domains: Optional[List[str]] = None, renew_days: int = RENEW_BEFORE_DAYS,
+                  email: Optional[str] = None, staging: bool = False, dry_run: bool = False,
+                  force: bool = False, json_output: bool = False) -> bool:
+    """
+    Renew the Let's Encrypt certificates that are due.
+
+    Args:
+        domains: Websites to renew (all websites if None)
+        renew_days: Days before expiry at which a certificate is renewed
+        email: Account email, also enables first-time issuance for listed domains
+        staging: Whether to use the Let's Encrypt staging environment
+        dry_run: Whether to test the orders without saving certificates
+        force: Whether to renew the listed certificates even if not due
+        json_output: Whether to print JSON instead of a table
+
+    Returns:
+        bool: True if no renewal failed, False otherwise
+    """
+    try:
+        report = renew_certificates(domains, renew_days=renew_days, email=email,
+                                    staging=staging, dry_run=dry_run, force=force)
+        if json_output:
+            print(json.dumps(report.to_dict(), indent=2))
+        else:
+            print_renewal_report(report)
+        return not report.failed
+    except Exception as e:
+        error(f"❌ Error renewing SSL certificates: {str(e)}")
+        return False
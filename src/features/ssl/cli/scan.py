@@ -0,0 +1,43 @@
+"""
+CLI interface for scanning SSL certificate expiry.
+
+This module provides a command-line interface for reporting the expiry
+status of every website's SSL certificate at once.
+"""
+
+import json
+from typing import List, Optional
+
+from src.common.logging import log_call, error
+from src.features.ssl.scanner import (
+    EXPIRY_WARNING_DAYS,
+    scan_certificates,
+    print_certificate_report
+)
+
+
+@log_call
+def cli_scan_ssl(domains: Optional[List[str]] = None, warn_days: int = EXPIRY_WARNING_DAYS,
+                 json_output: bool = False, use_cache: bool = True) -> bool:
+    """
+    Report the certificate expiry of several websites.
+
+    Args:
+        domains: Websites to scan (all websites if None)
+        warn_days: Days before expiry at which a certificate counts as expiring
+        json_output: Whether to print JSON instead of a table
+        use_cache: Whether to reuse certificates parsed by earlier scans
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        results = scan_certificates(domains, warn_days=warn_days, use_cache=use_cache)
+        if json_output:
+            print(json.dumps([r.to_dict() for r in results], indent=2))
+        else:
+            print_certificate_report(results)
+        return True
+    except Exception as e:
+        error(f"❌ Error scanning SSL certificates: {str(e)}")
+        return False
@@ -16,12 +16,13 @@ from src.features.webserver.webserver_reload import WebserverReload
 
 
 @log_call
-def install_selfsigned_ssl(domain: str) -> bool:
+def install_selfsigned_ssl(domain: str, reload: bool = True) -> bool:
     """
     Install a self-signed SSL certificate for a domain.
     
     Args:
         domain: Website domain name
+        reload: Whether to reload the webserver afterwards
         
     Returns:
         bool: True if installation was successful, False otherwise
@@ -47,7 +48,8 @@ def install_selfsigned_ssl(domain: str) -> bool:
     try:
         subprocess.run(cmd, check=True)
         success(f"✅ Self-signed SSL certificate created for {domain}")
-        WebserverReload.webserver_reload()
+        if reload:
+            WebserverReload.webserver_reload()
         return True
     except subprocess.CalledProcessError as e:
         error(f"❌ Error creating self-signed SSL for {domain}: {e}")
@@ -125,7 +127,8 @@ def edit_ssl_cert(domain: str, new_cert: str, new_key: str) -> bool:
     
     
 @log_call
-def install_letsencrypt_ssl(domain: str, email: str, staging: bool = False) -> bool:
+def install_letsencrypt_ssl(domain: str, email: str, staging: bool = False,
+                            reload: bool = True) -> bool:
     """
     Install a Let's Encrypt SSL certificate for a domain.
     
@@ -133,7 +136,8 @@ def install_letsencrypt_ssl(domain: str, email: str, staging: bool = False) -> b
         domain: Website domain name
         email: Email address for Let's Encrypt notifications
         staging: Whether to use Let's Encrypt staging environment
-        
+        reload: Whether to reload the webserver afterwards
+
     Returns:
         bool: True if installation was successful, False otherwise
     """
@@ -177,26 +181,17 @@ def install_letsencrypt_ssl(domain: str, email: str, staging: bool = False) -> b
             command=certbot_args
         )
 
-        cert_path = os.path.join(certbot_data, "live", domain, "fullchain.pem")
-        key_path = os.path.join(certbot_data, "live", domain, "privkey.pem")
-
-        if not os.path.isfile(cert_path) or not os.path.isfile(key_path):
+        # Swap the pair into the website directory atomically
+        from src.features.ssl.renewal import install_lineage
+        try:
+            install_lineage(domain)
+        except FileNotFoundError:
             error(f"❌ Let's Encrypt certificates not found for {domain}")
             return False
 
-        # Copy certificates to website directory
-        with open(cert_path, "r") as f:
-            cert_content = f.read()
-        with open(key_path, "r") as f:
-            key_content = f.read()
-
-        with open(os.path.join(ssl_dir, "cert.crt"), "w") as f:
-            f.write(cert_content)
-        with open(os.path.join(ssl_dir, "priv.key"), "w") as f:
-            f.write(key_content)
-
         success(f"✅ Let's Encrypt SSL certificate installed successfully for {domain}")
-        WebserverReload.webserver_reload()
+        if reload:
+            WebserverReload.webserver_reload()
         return True
 
     except Exception as e:
@@ -0,0 +1,513 @@
+"""
+Batched Let's Encrypt certificate renewal.
+
+install_letsencrypt_ssl starts a new certbot container and reloads NGINX
+for every domain. The renewal engine here finds the certificates that are
+due with the expiry scanner, starts a single certbot container with all
+website webroots mounted, renews the certificates in it one after another
+while staying inside Let's Encrypt's rate limits, swaps the new files into
+place atomically and reloads NGINX once at the end.
+"""
+
+import json
+import os
+import ssl
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, info, debug, warn, error, success
+from src.common.utils.environment import env
+from src.common.utils.validation import validate_directory
+from src.features.ssl.scanner import scan_certificates
+
+CERTBOT_IMAGE = "certbot/certbot"
+CERTBOT_CONFIG_MOUNT = "/etc/letsencrypt"
+SITES_MOUNT = "/var/www/sites"
+
+# certbot renews certificates this many days before they expire
+RENEW_BEFORE_DAYS = 30
+
+# Let's Encrypt rate limits, with headroom left for manual installs
+ORDERS_PER_3_HOURS = 250
+CERTIFICATES_PER_REGISTERED_DOMAIN_WEEK = 45
+DUPLICATE_CERTIFICATES_WEEK = 5
+FAILED_VALIDATIONS_PER_HOUR = 3
+
+# Second-level labels under which registrations happen, e.g. example.co.uk
+SECOND_LEVEL_LABELS = {"co", "com", "net", "org", "gov", "edu", "ac"}
+
+RATE_LIMIT_MARKERS = ("rateLimited", "too many certificates", "too many new orders",
+                      "too many failed authorizations")
+NOT_DUE_MARKER = "not yet due for renewal"
+
+
+@dataclass
+class RenewalResult:
+    """Outcome of renewing one website's certificate."""
+
+    domain: str
+    status: str
+    days_left: Optional[int] = None
+    message: str = ""
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "status": self.status,
+            "days_left": self.days_left,
+            "message": self.message,
+            "duration": round(self.duration, 1),
+        }
+
+
+@dataclass
+class RenewalReport:
+    """Outcome of a renewal batch."""
+
+    results: List[RenewalResult] = field(default_factory=list)
+    reloaded: bool = False
+    dry_run: bool = False
+
+    @property
+    def renewed(self) -> List[RenewalResult]:
+        return [r for r in self.results if r.status == "renewed"]
+
+    @property
+    def failed(self) -> List[RenewalResult]:
+        return [r for r in self.results if r.status in ("failed", "rate_limited")]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "results": [r.to_dict() for r in self.results],
+            "reloaded": self.reloaded,
+            "dry_run": self.dry_run,
+        }
+
+
+def get_certbot_data_dir() -> str:
+    return os.path.join(env["INSTALL_DIR"], ".certbot")
+
+
+def has_certbot_lineage(domain: str) -> bool:
+    """Check whether certbot has already issued a certificate for a domain."""
+    return os.path.isfile(os.path.join(get_certbot_data_dir(), "renewal", f"{domain}.conf"))
+
+
+def get_registered_domain(domain: str) -> str:
+    """
+    Get the domain that Let's Encrypt counts certificates against.
+
+    Args:
+        domain: Fully qualified domain name
+
+    Returns:
+        str: The registered domain, e.g. "example.co.uk" for "www.example.co.uk"
+    """
+    labels = domain.lower().rstrip(".").split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class RenewalHistory:
+    """Recent certificate orders, used to stay under Let's Encrypt's rate limits."""
+
+    def __init__(self, history_file: Optional[str] = None):
+        """
+        Initialize the history.
+
+        Args:
+            history_file: JSON file holding recent orders (defaults to DATA_DIR)
+        """
+        self.history_file = history_file or os.path.join(env["DATA_DIR"], "ssl_renewals.json")
+        self.orders: List[Dict[str, Any]] = self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.history_file):
+            return []
+        try:
+            with open(self.history_file, "r") as f:
+                return json.load(f).get("orders", [])
+        except (json.JSONDecodeError, IOError, AttributeError) as e:
+            warn(f"⚠️ Could not read SSL renewal history: {e}")
+            return []
+
+    def save(self) -> None:
+        """Persist orders from the last week."""
+        cutoff = time.time() - timedelta(days=7).total_seconds()
+        self.orders = [o for o in self.orders if o["time"] >= cutoff]
+        os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+        tmp_file = f"{self.history_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"orders": self.orders}, f)
+        os.replace(tmp_file, self.history_file)
+
+    def record(self, domain: str, ok: bool, now: Optional[float] = None) -> None:
+        """
+        Record a certificate order.
+
+        Args:
+            domain: Domain the certificate was ordered for
+            ok: Whether a certificate was issued
+            now: Time of the order (defaults to time.time())
+        """
+        self.orders.append({
+            "domain": domain,
+            "registered_domain": get_registered_domain(domain),
+            "time": now or time.time(),
+            "ok": ok,
+        })
+
+    def _count(self, seconds: float, now: float, **match: Any) -> int:
+        return sum(1 for o in self.orders
+                   if o["time"] >= now - seconds
+                   and all(o.get(k) == v for k, v in match.items()))
+
+    def blocked_reason(self, domain: str, now: Optional[float] = None) -> Optional[str]:
+        """
+        Check whether ordering a certificate now would hit a rate limit.
+
+        Args:
+            domain: Domain to order a certificate for
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Optional[str]: The limit that would be hit, or None
+        """
+        now = now or time.time()
+        hour, week = 3600, 7 * 86400
+        if self._count(3 * hour, now) >= ORDERS_PER_3_HOURS:
+            return f"{ORDERS_PER_3_HOURS} orders in the last 3 hours"
+        if self._count(hour, now, domain=domain, ok=False) >= FAILED_VALIDATIONS_PER_HOUR:
+            return f"{FAILED_VALIDATIONS_PER_HOUR} failed validations in the last hour"
+        if self._count(week, now, domain=domain, ok=True) >= DUPLICATE_CERTIFICATES_WEEK:
+            return f"{DUPLICATE_CERTIFICATES_WEEK} certificates for {domain} this week"
+        registered = get_registered_domain(domain)
+        if (self._count(week, now, registered_domain=registered, ok=True)
+                >= CERTIFICATES_PER_REGISTERED_DOMAIN_WEEK):
+            return (f"{CERTIFICATES_PER_REGISTERED_DOMAIN_WEEK} certificates "
+                    f"for {registered} this week")
+        return None
+
+
+class CertbotSession:
+    """
+    One certbot container reused for a batch of certificate orders.
+
+    The container sleeps with every website directory mounted under
+    SITES_MOUNT, and each order runs in it with ``docker exec``. certbot
+    locks its config directory, so orders are run one at a time.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """
+        Initialize the session.
+
+        Args:
+            name: Container name (derived from PROJECT_NAME by default)
+        """
+        # Imported here like in Container, python_on_whales is slow to import
+        from python_on_whales import DockerClient
+
+        self.name = name or f"{env['PROJECT_NAME']}_certbot"
+        self.docker = DockerClient()
+
+    def __enter__(self) -> "CertbotSession":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start the container, replacing one left behind by an earlier run."""
+        if self.docker.container.exists(self.name):
+            self.docker.container.remove(self.name, force=True)
+        certbot_data = get_certbot_data_dir()
+        validate_directory(certbot_data, create=True)
+        self.docker.run(
+            image=CERTBOT_IMAGE,
+            name=self.name,
+            detach=True,
+            remove=True,
+            entrypoint="sleep",
+            command=["infinity"],
+            volumes=[
+                (env["SITES_DIR"], SITES_MOUNT),
+                (certbot_data, CERTBOT_CONFIG_MOUNT),
+            ],
+        )
+        debug(f"Started certbot container {self.name}")
+
+    def stop(self) -> None:
+        """Remove the container."""
+        from python_on_whales import DockerException
+
+        try:
+            self.docker.container.remove(self.name, force=True)
+            debug(f"Removed certbot container {self.name}")
+        except DockerException as e:
+            warn(f"⚠️ Could not remove certbot container {self.name}: {e}")
+
+    def run(self, args: List[str]) -> Tuple[bool, str]:
+        """
+        Run certbot in the container.
+
+        Args:
+            args: certbot arguments
+
+        Returns:
+            Tuple[bool, str]: Whether certbot succeeded, and its output
+        """
+        from python_on_whales import DockerException
+
+        try:
+            output = self.docker.container.execute(
+                self.name, ["certbot"] + args, tty=False, interactive=False)
+            return True, output or ""
+        except DockerException as e:
+            return False, "\n".join(filter(None, [e.stdout, e.stderr])).strip() or str(e)
+
+
+def build_certbot_args(domain: str, email: Optional[str] = None, staging: bool = False,
+                       dry_run: bool = False, force: bool = False) -> List[str]:
+    """
+    Build the certbot arguments that renew or issue one website's certificate.
+
+    Args:
+        domain: Website domain name
+        email: Account email, only needed when no account is registered yet
+        staging: Whether to use the Let's Encrypt staging environment
+        dry_run: Whether to test the order without saving a certificate
+        force: Whether to renew even if certbot thinks it is not due
+
+    Returns:
+        List[str]: certbot arguments
+    """
+    args = [
+        "certonly",
+        "--webroot", "-w", f"{SITES_MOUNT}/{domain}/wordpress",
+        "-d", domain,
+        "--cert-name", domain,
+        "--non-interactive",
+        "--agree-tos",
+        "--force-renewal" if force else "--keep-until-expiring",
+    ]
+    if email:
+        args += ["-m", email]
+    if staging:
+        args.append("--staging")
+    if dry_run:
+        args.append("--dry-run")
+    return args
+
+
+def install_lineage(domain: str) -> None:
+    """
+    Copy certbot's current certificate for a domain into the website.
+
+    The pair is written to temporary files, checked to match, and then
+    renamed over cert.crt and priv.key, so NGINX never sees a half-written
+    file or a certificate paired with the wrong key.
+
+    Args:
+        domain: Website domain name
+
+    Raises:
+        FileNotFoundError: If certbot has no certificate for the domain
+        ssl.SSLError: If the certificate and key do not match
+    """
+    live_dir = os.path.join(get_certbot_data_dir(), "live", domain)
+    ssl_dir = os.path.join(env["SITES_DIR"], domain, "ssl")
+    validate_directory(ssl_dir, create=True)
+
+    files = {
+        "cert.crt": os.path.join(live_dir, "fullchain.pem"),
+        "priv.key": os.path.join(live_dir, "privkey.pem"),
+    }
+    staged = {}
+    try:
+        for name, source in files.items():
+            with open(source, "r") as f:
+                content = f.read()
+            tmp_path = os.path.join(ssl_dir, f".{name}.tmp")
+            with open(tmp_path, "w") as f:
+                f.write(content)
+            staged[name] = tmp_path
+        os.chmod(staged["priv.key"], 0o600)
+
+        ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER).load_cert_chain(
+            staged["cert.crt"], staged["priv.key"])
+
+        os.replace(staged.pop("priv.key"), os.path.join(ssl_dir, "priv.key"))
+        os.replace(staged.pop("cert.crt"), os.path.join(ssl_dir, "cert.crt"))
+    finally:
+        for tmp_path in staged.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def find_due_certificates(domains: Optional[List[str]] = None,
+                          renew_days: int = RENEW_BEFORE_DAYS,
+                          include_new: bool = False) -> List[Tuple[str, Optional[int]]]:
+    """
+    Find the websites whose Let's Encrypt certificate should be renewed.
+
+    Args:
+        domains: Websites to check (all websites if None)
+        renew_days: Days before expiry at which a certificate is renewed
+        include_new: Whether websites without a certbot certificate count too
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: Domains with their days left, most urgent first
+    """
+    due = []
+    for status in scan_certificates(domains, warn_days=renew_days):
+        if has_certbot_lineage(status.domain):
+            if status.status in ("expired", "expiring"):
+                due.append((status.domain, status.days_left))
+        elif include_new:
+            due.append((status.domain, status.days_left))
+    return due
+
+
+@log_call
+def renew_certificates(domains: Optional[List[str]] = None,
+                       renew_days: int = RENEW_BEFORE_DAYS,
+                       email: Optional[str] = None,
+                       staging: bool = False,
+                       dry_run: bool = False,
+                       force: bool = False) -> RenewalReport:
+    """
+    Renew every due Let's Encrypt certificate in one certbot session.
+
+    Only websites certbot already holds a certificate for are renewed,
+    unless an email is given, in which case listed websites without one
+    are issued a first certificate. An order that Let's Encrypt rejects
+    for a rate limit stops the batch; the remaining websites are deferred
+    to the next run. NGINX is reloaded once if any certificate changed.
+
+    Args:
+        domains: Websites to renew (all websites if None)
+        renew_days: Days before expiry at which a certificate is renewed
+        email: Account email, also enables first-time issuance for listed domains
+        staging: Whether to use the Let's Encrypt staging environment
+        dry_run: Whether to test the orders without saving certificates
+        force: Whether to renew the listed certificates even if not due
+
+    Returns:
+        RenewalReport: Outcome of every website that was due
+    """
+    report = RenewalReport(dry_run=dry_run)
+    if force and domains:
+        due = [(domain, None) for domain in domains]
+    else:
+        due = find_due_certificates(domains, renew_days,
+                                    include_new=bool(email and domains))
+    if not due:
+        info("No Let's Encrypt certificates are due for renewal.")
+        return report
+
+    history = RenewalHistory()
+    info(f"Renewing {len(due)} certificate(s) in one certbot session...")
+    stopped: Optional[str] = None
+    with CertbotSession() as session:
+        for domain, days_left in due:
+            result = RenewalResult(domain=domain, status="deferred", days_left=days_left)
+            report.results.append(result)
+            if stopped:
+                result.message = stopped
+                continue
+            blocked = history.blocked_reason(domain)
+            if blocked:
+                result.message = f"Rate limit budget reached: {blocked}"
+                warn(f"⚠️ Skipping {domain}: {result.message}")
+                continue
+
+            started = time.time()
+            ok, output = session.run(build_certbot_args(domain, email, staging, dry_run, force))
+            result.duration = time.time() - started
+            debug(f"certbot output for {domain}:\n{output}")
+
+            if not ok and any(marker in output for marker in RATE_LIMIT_MARKERS):
+                result.status = "rate_limited"
+                result.message = output.splitlines()[-1] if output else "Rate limited"
+                stopped = f"Deferred after rate limit on {domain}"
+                error(f"❌ Let's Encrypt rate limit hit on {domain}, stopping the batch")
+                history.record(domain, ok=False)
+                continue
+            if not ok:
+                result.status = "failed"
+                result.message = output.splitlines()[-1] if output else "certbot failed"
+                error(f"❌ Renewal failed for {domain}: {result.message}")
+                if not dry_run:
+                    history.record(domain, ok=False)
+                continue
+            if NOT_DUE_MARKER in output:
+                result.status = "not_due"
+                result.message = "certbot: not yet due for renewal"
+                continue
+            if dry_run:
+                result.status = "dry_run"
+                result.message = "Dry run succeeded"
+                continue
+
+            history.record(domain, ok=True)
+            try:
+                install_lineage(domain)
+                result.status = "renewed"
+                success(f"✅ Renewed SSL certificate for {domain}")
+            except (OSError, ssl.SSLError) as e:
+                result.status = "failed"
+                result.message = f"Could not install certificate: {e}"
+                error(f"❌ {result.message} ({domain})")
+
+    history.save()
+    if report.renewed:
+        from src.features.webserver.webserver_reload import WebserverReload
+        report.reloaded = bool(WebserverReload.webserver_reload())
+    info(f"Renewed {len(report.renewed)} of {len(due)} certificate(s), "
+         f"{len(report.failed)} failed")
+    return report
+
+
+def print_renewal_report(report: RenewalReport) -> None:
+    """
+    Print the outcome of a renewal batch.
+
+    Args:
+        report: Report from renew_certificates
+    """
+    console = Console()
+    if not report.results:
+        console.print("No certificates were due for renewal.", style="bold yellow")
+        return
+
+    styles = {"renewed": "green", "dry_run": "green", "not_due": "dim",
+              "deferred": "yellow", "failed": "red", "rate_limited": "bold red"}
+    title = "🔒 Let's Encrypt renewal" + (" (dry run)" if report.dry_run else "")
+    table = Table(title=title, header_style="bold cyan")
+    table.add_column("Website", style="bold white")
+    table.add_column("Status")
+    table.add_column("Days left", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Message")
+    for result in report.results:
+        style = styles.get(result.status, "white")
+        table.add_row(
+            result.domain,
+            f"[{style}]{result.status}[/{style}]",
+            str(result.days_left) if result.days_left is not None else "-",
+            f"{result.duration:.1f}s" if result.duration else "-",
+            result.message or "-",
+        )
+    console.print(table)
+    if report.renewed:
+        state = "reloaded" if report.reloaded else "NOT reloaded"
+        console.print(f"Webserver {state} once for {len(report.renewed)} certificate(s).")
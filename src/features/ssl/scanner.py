@@ -0,0 +1,307 @@
+"""
+Fleet-wide SSL certificate expiry scanning.
+
+check_ssl decodes and prints one certificate at a time. The scanner here
+reads every website's ``ssl/cert.crt`` in parallel and returns one sorted
+expiry report. Parsed certificates are cached in DATA_DIR, keyed by the
+file's mtime and SHA-256, so repeated scans from cron or a status page
+only decode the certificates that changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from src.common.logging import log_call, debug, warn
+from src.common.utils.environment import env
+from src.features.website.utils import website_list
+
+# Let's Encrypt renews certificates this many days before they expire
+EXPIRY_WARNING_DAYS = 30
+
+# Certificates read at the same time
+MAX_PARALLEL_READS = 8
+
+CERT_TIME_FORMAT = "%b %d %H:%M:%S %Y %Z"
+
+# Report order: what needs attention first
+STATUS_ORDER = {"expired": 0, "expiring": 1, "error": 2, "missing": 3, "valid": 4}
+
+
+@dataclass
+class CertificateStatus:
+    """Expiry status of one website's certificate."""
+
+    domain: str
+    status: str
+    days_left: Optional[int] = None
+    expires_at: Optional[str] = None
+    issued_at: Optional[str] = None
+    common_name: Optional[str] = None
+    issuer: Optional[str] = None
+    names: List[str] = field(default_factory=list)
+    self_signed: bool = False
+    error: Optional[str] = None
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "status": self.status,
+            "days_left": self.days_left,
+            "expires_at": self.expires_at,
+            "issued_at": self.issued_at,
+            "common_name": self.common_name,
+            "issuer": self.issuer,
+            "names": self.names,
+            "self_signed": self.self_signed,
+            "error": self.error,
+            "cached": self.cached,
+        }
+
+
+def get_cert_path(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "ssl", "cert.crt")
+
+
+def parse_certificate(path: str) -> Dict[str, Any]:
+    """
+    Decode the fields of a PEM certificate needed for the expiry report.
+
+    Args:
+        path: Path to the certificate
+
+    Returns:
+        Dict[str, Any]: Subject, issuer, names and validity as ISO timestamps
+
+    Raises:
+        ValueError: If the file is not a readable certificate
+    """
+    try:
+        cert = ssl._ssl._test_decode_cert(path)
+    except Exception as e:
+        raise ValueError(f"Could not decode certificate: {e}")
+
+    subject = dict(x[0] for x in cert.get("subject", []))
+    issuer = dict(x[0] for x in cert.get("issuer", []))
+    return {
+        "common_name": subject.get("commonName"),
+        "issuer": issuer.get("organizationName") or issuer.get("commonName"),
+        "names": [value for kind, value in cert.get("subjectAltName", []) if kind == "DNS"],
+        "self_signed": subject == issuer,
+        "issued_at": datetime.strptime(cert["notBefore"], CERT_TIME_FORMAT).isoformat(),
+        "expires_at": datetime.strptime(cert["notAfter"], CERT_TIME_FORMAT).isoformat(),
+    }
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class CertificateCache:
+    """Parsed certificates keyed by file path, mtime and content hash."""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: JSON file holding parsed certificates (defaults to DATA_DIR)
+        """
+        self.cache_file = cache_file or os.path.join(env["DATA_DIR"], "ssl_scan_cache.json")
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self.lock = threading.Lock()
+        self.changed = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read SSL scan cache: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist the cache if it changed."""
+        if not self.changed:
+            return
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_file, self.cache_file)
+        self.changed = False
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a certificate's parsed fields, decoding it only if it changed.
+
+        The mtime is checked first; a new mtime with the same content hash
+        (e.g. a copy that rewrote the file unchanged) still hits the cache.
+
+        Args:
+            path: Path to the certificate
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed fields with a "cached" flag
+
+        Raises:
+            ValueError: If the file is not a readable certificate
+            OSError: If the file cannot be read
+        """
+        mtime = os.stat(path).st_mtime
+        with self.lock:
+            entry = self.entries.get(path)
+        if entry and entry.get("mtime") == mtime:
+            return dict(entry["cert"], cached=True)
+
+        digest = _file_hash(path)
+        if entry and entry.get("sha256") == digest:
+            with self.lock:
+                entry["mtime"] = mtime
+                self.changed = True
+            return dict(entry["cert"], cached=True)
+
+        cert = parse_certificate(path)
+        with self.lock:
+            self.entries[path] = {"mtime": mtime, "sha256": digest, "cert": cert}
+            self.changed = True
+        return dict(cert, cached=False)
+
+    def prune(self, paths: List[str]) -> None:
+        """Forget certificates of websites that no longer exist."""
+        keep = set(paths)
+        for path in [p for p in self.entries if p not in keep]:
+            del self.entries[path]
+            self.changed = True
+
+
+def check_certificate(domain: str, cache: Optional[CertificateCache] = None,
+                      warn_days: int = EXPIRY_WARNING_DAYS,
+                      now: Optional[datetime] = None) -> CertificateStatus:
+    """
+    Get the expiry status of a website's certificate.
+
+    Args:
+        domain: Website domain name
+        cache: Cache of parsed certificates (the file is decoded if None)
+        warn_days: Days before expiry at which a certificate counts as expiring
+        now: Current time (defaults to datetime.utcnow())
+
+    Returns:
+        CertificateStatus: Status of the certificate
+    """
+    path = get_cert_path(domain)
+    if not os.path.isfile(path):
+        return CertificateStatus(domain=domain, status="missing")
+    try:
+        cert = cache.get(path) if cache else dict(parse_certificate(path), cached=False)
+    except (ValueError, OSError) as e:
+        return CertificateStatus(domain=domain, status="error", error=str(e))
+
+    expires_at = datetime.fromisoformat(cert["expires_at"])
+    days_left = (expires_at - (now or datetime.utcnow())).days
+    if days_left < 0:
+        status = "expired"
+    elif days_left < warn_days:
+        status = "expiring"
+    else:
+        status = "valid"
+    return CertificateStatus(
+        domain=domain,
+        status=status,
+        days_left=days_left,
+        expires_at=cert["expires_at"],
+        issued_at=cert["issued_at"],
+        common_name=cert["common_name"],
+        issuer=cert["issuer"],
+        names=cert["names"],
+        self_signed=cert["self_signed"],
+        cached=cert["cached"],
+    )
+
+
+@log_call
+def scan_certificates(domains: Optional[List[str]] = None,
+                      warn_days: int = EXPIRY_WARNING_DAYS,
+                      use_cache: bool = True,
+                      parallel: int = MAX_PARALLEL_READS) -> List[CertificateStatus]:
+    """
+    Get the expiry status of many websites' certificates.
+
+    Args:
+        domains: Websites to scan (all websites if None)
+        warn_days: Days before expiry at which a certificate counts as expiring
+        use_cache: Whether to reuse certificates parsed by earlier scans
+        parallel: Certificates read at the same time
+
+    Returns:
+        List[CertificateStatus]: Statuses, most urgent first
+    """
+    scan_all = domains is None
+    domains = website_list() if scan_all else list(domains)
+    cache = CertificateCache() if use_cache else None
+    now = datetime.utcnow()
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix="ssl-scan") as executor:
+        results = list(executor.map(
+            lambda domain: check_certificate(domain, cache, warn_days, now), domains))
+
+    if cache:
+        if scan_all:
+            cache.prune([get_cert_path(domain) for domain in domains])
+        cache.save()
+
+    debug(f"Scanned {len(results)} certificate(s), "
+          f"{sum(1 for r in results if r.cached)} from cache")
+    return sorted(results, key=lambda r: (
+        STATUS_ORDER.get(r.status, len(STATUS_ORDER)),
+        r.days_left if r.days_left is not None else 0,
+        r.domain))
+
+
+def print_certificate_report(results: List[CertificateStatus]) -> None:
+    """
+    Print the expiry report of several websites.
+
+    Args:
+        results: Statuses from scan_certificates
+    """
+    console = Console()
+    if not results:
+        console.print("No websites found.", style="bold yellow")
+        return
+
+    styles = {"expired": "bold red", "expiring": "yellow", "error": "red",
+              "missing": "dim", "valid": "green"}
+    table = Table(title="🔒 SSL certificate expiry", header_style="bold cyan")
+    table.add_column("Website", style="bold white")
+    table.add_column("Status")
+    table.add_column("Days left", justify="right")
+    table.add_column("Expires on")
+    table.add_column("Issuer")
+    for result in results:
+        style = styles.get(result.status, "white")
+        issuer = result.issuer or "-"
+        if result.self_signed:
+            issuer += " (self-signed)"
+        table.add_row(
+            result.domain,
+            f"[{style}]{result.status}[/{style}]",
+            str(result.days_left) if result.days_left is not None else "-",
+            result.expires_at[:10] if result.expires_at else "-",
+            result.error or issuer,
+        )
+    console.print(table)
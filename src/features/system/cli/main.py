@@ -5,12 +5,15 @@ This module provides the main CLI command group for system management.
 """
 
 
+import sys
+
 import click
 from src.features.system.cli.rebuild import rebuild_core_cli
 from src.features.system.cli.system_info import view_system_info_cli
 from src.features.system.cli.change_language import change_language_cli
 
 from src.common.logging import info, error, debug, success
+from src.common.profiling import profile_command
 
 
 @click.group("system")
@@ -25,4 +28,5 @@ system_cli.add_command(view_system_info_cli)
 system_cli.add_command(change_language_cli)
 
 if __name__ == "__main__":
-    system_cli()
+    with profile_command("system " + " ".join(sys.argv[1:2])):
+        system_cli()
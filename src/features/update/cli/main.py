@@ -10,6 +10,7 @@ import argparse
 from typing import List, Optional
 
 from src.common.logging import log_call, info, error, success, warn
+from src.common.profiling import profiled
 from src.features.update.actions import check_version_action, update_action
 
 
@@ -50,6 +51,7 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
+@profiled("update")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -5,33 +5,51 @@ This module serves as a compatibility layer to load the appropriate web server m
 based on the system configuration. Currently, it supports NGINX by default.
 """
 # This is a compatibility layer for future web server support
-# It will automatically load the configured web server module
-
-from src.common.webserver.utils import get_current_webserver
-from src.common.containers.container import Container
-import subprocess
-
-try:
-    webserver_type = get_current_webserver()
-except ValueError:
-    # Default to NGINX if not configured
-    webserver_type = "nginx"
-
-# Load appropriate web server module
-if webserver_type == "nginx":
-    from src.features.nginx import test_config, reload, restart
-    from src.features.nginx.manager import apply_config, reload as nginx_reload
-    
-    # Export functions
-    __all__ = ['test_config', 'reload', 'restart', 'apply_config']
-else:
-    # Placeholder for future web server support
-    def not_implemented(*args, **kwargs):
-        raise NotImplementedError(f"Web server '{webserver_type}' not supported yet")
-        
-    test_config = reload = restart = apply_config = not_implemented
-    
-    __all__ = ['test_config', 'reload', 'restart', 'apply_config']
-
-from src.features.webserver.webserver_reload import WebserverReload
+# It will automatically load the configured web server module.
+# The configuration is read, and the module loaded, on first use rather
+# than at import time.
 
+from typing import Any
+
+__all__ = ['test_config', 'reload', 'restart', 'apply_config', 'WebserverReload']
+
+# Functions of each web server module, by exported name
+_WEBSERVER_FUNCTIONS = {
+    "nginx": {
+        "test_config": "test_config",
+        "reload": "reload",
+        "restart": "restart",
+        "apply_config": "apply_config",
+        "nginx_reload": "reload",
+    },
+}
+
+
+def _get_webserver_type() -> str:
+    from src.common.webserver.utils import get_current_webserver
+    try:
+        return get_current_webserver()
+    except ValueError:
+        # Default to NGINX if not configured
+        return "nginx"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "WebserverReload":
+        from src.features.webserver.webserver_reload import WebserverReload
+        value = WebserverReload
+    elif name == "webserver_type":
+        value = _get_webserver_type()
+    elif name in _WEBSERVER_FUNCTIONS["nginx"]:
+        webserver_type = _get_webserver_type()
+        if webserver_type == "nginx":
+            from src.features.nginx import manager
+            value = getattr(manager, _WEBSERVER_FUNCTIONS["nginx"][name])
+        else:
+            # Placeholder for future web server support
+            def value(*args, **kwargs):
+                raise NotImplementedError(f"Web server '{webserver_type}' not supported yet")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -4,7 +4,7 @@ from src.features.cache.constants import CACHE_PLUGINS, CACHE_SETUP_NOTICE
 from src.features.website.utils import get_site_config, set_site_config
 from src.features.wordpress.utils import (
     deactivate_all_cache_plugins,
-    install_and_activate_plugin,
+    switch_cache_plugins,
     update_wp_config_cache,
 )
 from src.common.logging import error, success
@@ -21,13 +21,9 @@ class NginxCacheManager(BaseCacheManager):
         if not site_config:
             error(f"Site configuration not found for {domain}")
             return False
-        if not deactivate_all_cache_plugins(domain):
-            error("Failed to deactivate existing cache plugins.")
+        if not switch_cache_plugins(domain, CACHE_PLUGINS["w3-total-cache"]):
+            error("Failed to switch cache plugins.")
             return False
-        for plugin_slug in CACHE_PLUGINS["w3-total-cache"]:
-            if not install_and_activate_plugin(domain, plugin_slug):
-                error(f"Failed to install/activate plugin: {plugin_slug}")
-                return False
         if not update_wp_config_cache(domain, "w3-total-cache"):
             error("Failed to update wp-config.php for cache.")
             return False
@@ -51,13 +47,9 @@ class NginxCacheManager(BaseCacheManager):
         if not site_config:
             error(f"Site configuration not found for {domain}")
             return False
-        if not deactivate_all_cache_plugins(domain):
-            error("Failed to deactivate existing cache plugins.")
+        if not switch_cache_plugins(domain, CACHE_PLUGINS["wp-super-cache"]):
+            error("Failed to switch cache plugins.")
             return False
-        for plugin_slug in CACHE_PLUGINS["wp-super-cache"]:
-            if not install_and_activate_plugin(domain, plugin_slug):
-                error(f"Failed to install/activate plugin: {plugin_slug}")
-                return False
         if not update_wp_config_cache(domain, "wp-super-cache"):
             error("Failed to update wp-config.php for cache.")
             return False
@@ -81,13 +73,9 @@ class NginxCacheManager(BaseCacheManager):
         if not site_config:
             error(f"Site configuration not found for {domain}")
             return False
-        if not deactivate_all_cache_plugins(domain):
-            error("Failed to deactivate existing cache plugins.")
+        if not switch_cache_plugins(domain, CACHE_PLUGINS["wp-fastest-cache"]):
+            error("Failed to switch cache plugins.")
             return False
-        for plugin_slug in CACHE_PLUGINS["wp-fastest-cache"]:
-            if not install_and_activate_plugin(domain, plugin_slug):
-                error(f"Failed to install/activate plugin: {plugin_slug}")
-                return False
         if not update_wp_config_cache(domain, "wp-fastest-cache"):
             error("Failed to update wp-config.php for cache.")
             return False
@@ -16,7 +16,8 @@ class NginxSiteManager(WebserverSiteManager):
                 content = f.read().replace("${DOMAIN}", domain)
             with open(nginx_target_path, "w") as f:
                 f.write(content)
-            nginx_restart()
+            if kwargs.get("reload", True):
+                nginx_restart()
             return True
         return False
 
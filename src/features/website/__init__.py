@@ -5,58 +5,36 @@ This package provides functionality for managing websites,
 including creating, deleting, and configuring websites.
 """
 
-# Core utility functions
-from src.features.website.utils import (
-    website_list,
-    is_website_exists,
-    is_website_running,
-    get_site_config,
-    set_site_config,
-    delete_site_config,
-    select_website,
-    get_sites_dir,
-    calculate_php_fpm_values
-)
+from src.common.utils.lazy import lazy_exports
 
-# Site management operations
-from src.features.website.manager import (
-    create_website,
-    delete_website,
-    restart_website
-)
-
-# CLI interfaces
-from src.features.website.cli import (
-    cli_create_website,
-    cli_delete_website,
-    cli_restart_website,
-    cli_website_info,
-    cli_list_websites,
-    cli_view_logs
-)
-
-__all__ = [
-    # Core utilities
-    'website_list',
-    'is_website_exists',
-    'is_website_running',
-    'get_site_config',
-    'set_site_config',
-    'delete_site_config',
-    'select_website',
-    'get_sites_dir',
-    'calculate_php_fpm_values',
-    
-    # Manager operations
-    'create_website',
-    'delete_website',
-    'restart_website',
-    
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    # Core utility functions
+    "src.features.website.utils": [
+        "website_list",
+        "is_website_exists",
+        "is_website_running",
+        "get_site_config",
+        "set_site_config",
+        "delete_site_config",
+        "select_website",
+        "get_sites_dir",
+        "calculate_php_fpm_values",
+        "get_resource_profile",
+        "calculate_spare_servers",
+    ],
+    # Site management operations
+    "src.features.website.manager": ["create_website", "delete_website", "restart_website"],
+    # Batch creation
+    "src.features.website.batch": ["BatchSite", "load_site_manifest", "create_websites"],
     # CLI interfaces
-    'cli_create_website',
-    'cli_delete_website',
-    'cli_restart_website',
-    'cli_website_info',
-    'cli_list_websites',
-    'cli_view_logs'
-]
\ No newline at end of file
+    "src.features.website.cli": [
+        "cli_create_website",
+        "cli_create_websites_batch",
+        "cli_delete_website",
+        "cli_restart_website",
+        "cli_website_info",
+        "cli_list_websites",
+        "cli_view_logs",
+        "cli_rotate_logs",
+    ],
+})
@@ -9,12 +9,15 @@ database setup, and NGINX configuration.
 import os
 import inspect
 import shutil
+import threading
+from dataclasses import dataclass
 from typing import List, Tuple, Dict, Any, Optional, Callable
 
 from src.common.logging import log_call, info, warn, error, success, debug
 from src.common.utils.environment import env
 from src.core.containers.compose import Compose
 from src.common.containers.container import Container
+from src.common.containers.ownership import fix_ownership
 from src.common.config.manager import ConfigManager
 
 from src.features.website.utils import (
@@ -22,6 +25,7 @@ from src.features.website.utils import (
     get_site_config, 
     set_site_config, 
     delete_site_config,
+    website_list,
     calculate_php_fpm_values
 )
 from src.features.website.models.site_config import (
@@ -39,6 +43,7 @@ from src.features.mysql.database import (
 from src.features.nginx.manager import restart as nginx_restart
 from src.features.ssl.installer import install_selfsigned_ssl
 from src.features.php.client import init_php_client
+from src.features.php.images import PhpImageManager
 from src.common.utils.crypto import encrypt
 from src.features.webserver.site_manager_factory import get_site_manager
 
@@ -113,7 +118,9 @@ def setup_config(domain: str, php_version: str) -> None:
         cache="no-cache",
     )
 
-    db_info = setup_database_for_website(domain)
+    with _database_lock:
+        db_info = _database_credentials.pop(domain, None)
+    db_info = db_info or setup_database_for_website(domain)
     if not db_info:
         error("❌ Could not create database for website.")
         return
@@ -136,6 +143,26 @@ def setup_config(domain: str, php_version: str) -> None:
     info(f"✅ Saved website {domain} information to configuration")
 
 
+# Credentials created by setup_database, kept until setup_config saves them
+_database_credentials: Dict[str, Dict[str, str]] = {}
+_database_lock = threading.Lock()
+
+
+@log_call
+def setup_database(domain: str) -> None:
+    """
+    Create the database and database user for the website.
+    
+    Args:
+        domain: Website domain name
+    """
+    db_info = setup_database_for_website(domain)
+    if not db_info:
+        raise RuntimeError(f"Could not create database for website {domain}")
+    with _database_lock:
+        _database_credentials[domain] = db_info
+
+
 def cleanup_config(domain: str) -> None:
     """
     Remove the website configuration from the global config store.
@@ -171,10 +198,14 @@ def setup_php_configs(domain: str, php_version: str) -> None:
         with open(php_ini_target, "w") as f:
             f.write(content)
 
-    fpm_values = calculate_php_fpm_values()
+    other_sites = [d for d in website_list() if d != domain]
+    fpm_values = calculate_php_fpm_values(site_count=len(other_sites) + 1)
     php_fpm_conf_path = os.path.join(site_dir, "php", "php-fpm.conf")
     with open(php_fpm_conf_path, "w") as f:
-        f.write(f"""[www]
+        f.write(f"""[global]
+process_control_timeout = 30s
+
+[www]
 user = www-data
 group = www-data
 listen = 9000
@@ -191,6 +222,19 @@ request_terminate_timeout = 60
 """)
 
 
+@log_call
+def setup_php_image(domain: str, php_version: str) -> None:
+    """
+    Pull the PHP-FPM image used by the website's container.
+    
+    Args:
+        domain: Website domain name
+        php_version: PHP version to use for the website
+    """
+    if not PhpImageManager().ensure(php_version):
+        raise RuntimeError(f"Could not pull PHP {php_version} image for {domain}")
+
+
 @log_call
 def setup_compose_php(domain: str, php_version: str) -> Dict[str, str]:
     """
@@ -228,8 +272,7 @@ def setup_compose_php(domain: str, php_version: str) -> Dict[str, str]:
     compose.ensure_ready()
 
     # Ensure www-data ownership for /var/www/html in the PHP container
-    container = Container(name=php_container)
-    container.exec(["chown", "-R", "www-data:www-data", f"/var/www/html"], user="root")
+    fix_ownership(php_container, "/var/www/html")
     debug(f"✅ Set www-data ownership for /var/www/html in container {php_container}")
 
     return {
@@ -263,9 +306,9 @@ def cleanup_compose_php(domain: str) -> None:
         info(f"🗑️ Removed PHP docker-compose file for {domain}")
 
 
-def setup_webserver_vhost(domain: str) -> None:
+def setup_webserver_vhost(domain: str, reload: bool = True) -> None:
     manager = get_site_manager()
-    manager.create_website(domain)
+    manager.create_website(domain, reload=reload)
 
 
 def cleanup_webserver_vhost(domain: str) -> None:
@@ -282,13 +325,25 @@ def setup_ssl(domain: str, php_version: str = None) -> None:
         domain: The domain name
         php_version: Not used for SSL setup, included for action signature compatibility
     """
-    success = install_selfsigned_ssl(domain)
+    # The webserver is reloaded once the vhost using the certificate exists
+    success = install_selfsigned_ssl(domain, reload=False)
     if success:
         info(f"✅ Self-signed SSL certificate installed for {domain}")
     else:
         warn(f"⚠️ Failed to install self-signed SSL certificate for {domain}")
 
 
+def cleanup_redis_cache(domain: str) -> None:
+    """
+    Delete the website's Redis object cache keys and free its database.
+
+    Args:
+        domain: Website domain name
+    """
+    from src.features.cache.core.redis_manager import release_site_redis
+    release_site_redis(domain)
+
+
 def cleanup_database(domain: str) -> None:
     """
     Remove database and database user for the website.
@@ -300,14 +355,32 @@ def cleanup_database(domain: str) -> None:
     delete_database_user(domain)
 
 
-# Setup and cleanup action pairs for website creation
-WEBSITE_SETUP_ACTIONS = [
-    (setup_directories, cleanup_directories),
-    (setup_php_configs, None),
-    (setup_compose_php, cleanup_compose_php),
-    (setup_ssl, None),
-    (setup_webserver_vhost, cleanup_webserver_vhost),
-    (setup_config, cleanup_config),  # Keep this last
+@dataclass(frozen=True)
+class SetupStep:
+    """A website setup step and the steps it depends on."""
+
+    name: str
+    setup: Callable
+    cleanup: Optional[Callable] = None
+    requires: Tuple[str, ...] = ()
+    # Steps writing shared state (the global config) never run concurrently
+    exclusive: bool = False
+
+
+# Website setup steps; steps whose requirements are met run concurrently
+WEBSITE_SETUP_STEPS = [
+    SetupStep("directories", setup_directories, cleanup_directories),
+    SetupStep("php_image", setup_php_image),
+    SetupStep("database", setup_database, cleanup_database),
+    SetupStep("php_configs", setup_php_configs, requires=("directories",)),
+    SetupStep("ssl", setup_ssl, requires=("directories",)),
+    SetupStep("compose_php", setup_compose_php, cleanup_compose_php,
+              requires=("php_configs", "php_image")),
+    SetupStep("webserver_vhost", setup_webserver_vhost, cleanup_webserver_vhost,
+              requires=("ssl",)),
+    # Saving the config marks the website as existing, so it comes last
+    SetupStep("config", setup_config, cleanup_config,
+              requires=("compose_php", "database", "webserver_vhost"), exclusive=True),
 ]
 
 # Actions for website cleanup/deletion
@@ -315,6 +388,7 @@ WEBSITE_CLEANUP_ACTIONS = [
     cleanup_webserver_vhost,
     cleanup_compose_php,
     cleanup_database,
+    cleanup_redis_cache,
     cleanup_config,
     cleanup_directories
 ]
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Batch website creation.
+
+This module creates many websites from a manifest file. Each distinct PHP
+image is pulled once up front, several websites are set up at the same
+time, and the webserver is reloaded once at the end instead of once per
+website.
+
+A manifest is a JSON file, either a list of sites or an object with a
+default PHP version::
+
+    {
+        "php_version": "8.2",
+        "sites": [
+            "example.com",
+            {"domain": "shop.example.com", "php_version": "8.3"}
+        ]
+    }
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List
+
+from src.common.logging import log_call, info, warn, error, success
+from src.common.utils.validation import is_valid_domain
+from src.features.php.images import PhpImageManager
+from src.features.php.utils import AVAILABLE_PHP_VERSIONS
+from src.features.website.utils import is_website_exists
+from src.features.website.manager import create_website
+
+# Websites set up at the same time
+MAX_PARALLEL_SITES = 3
+
+DEFAULT_PHP_VERSION = "8.2"
+
+
+@dataclass
+class BatchSite:
+    """A website to create in a batch."""
+
+    domain: str
+    php_version: str
+
+
+def load_site_manifest(path: str) -> List[BatchSite]:
+    """
+    Load the websites to create from a manifest file.
+
+    Args:
+        path: Path to the JSON manifest
+
+    Returns:
+        List[BatchSite]: Websites in manifest order
+
+    Raises:
+        ValueError: If the manifest is malformed or lists invalid websites
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read manifest {path}: {e}")
+
+    default_version = DEFAULT_PHP_VERSION
+    if isinstance(data, dict):
+        default_version = str(data.get("php_version", default_version))
+        data = data.get("sites")
+    if not isinstance(data, list):
+        raise ValueError("Manifest must be a list of sites or contain a 'sites' list")
+
+    sites = []
+    seen = set()
+    for item in data:
+        if isinstance(item, str):
+            item = {"domain": item}
+        if not isinstance(item, dict) or not item.get("domain"):
+            raise ValueError(f"Invalid manifest entry: {item!r}")
+        domain = item["domain"].strip().lower()
+        php_version = str(item.get("php_version", default_version))
+        if not is_valid_domain(domain):
+            raise ValueError(f"Invalid domain in manifest: {domain}")
+        if php_version not in AVAILABLE_PHP_VERSIONS:
+            raise ValueError(f"Unsupported PHP version {php_version} for {domain}")
+        if domain in seen:
+            raise ValueError(f"Duplicate domain in manifest: {domain}")
+        seen.add(domain)
+        sites.append(BatchSite(domain=domain, php_version=php_version))
+    return sites
+
+
+@log_call
+def create_websites(sites: List[BatchSite], parallel: int = MAX_PARALLEL_SITES) -> Dict[str, bool]:
+    """
+    Create several websites, sharing image pulls and the webserver reload.
+
+    Args:
+        sites: Websites to create
+        parallel: Maximum number of websites set up at the same time
+
+    Returns:
+        Dict[str, bool]: Whether each website was created
+    """
+    from src.features.webserver.webserver_reload import WebserverReload
+
+    results: Dict[str, bool] = {}
+    todo = []
+    for site in sites:
+        if is_website_exists(site.domain):
+            warn(f"⚠️ Website {site.domain} already exists, skipping.")
+            results[site.domain] = False
+        else:
+            todo.append(site)
+    if not todo:
+        return results
+
+    versions = sorted({site.php_version for site in todo})
+    images = PhpImageManager()
+    with ThreadPoolExecutor(max_workers=len(versions)) as executor:
+        pulled = dict(zip(versions, executor.map(images.ensure, versions)))
+    for site in [s for s in todo if not pulled[s.php_version]]:
+        error(f"❌ Skipping {site.domain}: PHP {site.php_version} image is not available")
+        results[site.domain] = False
+    todo = [s for s in todo if pulled[s.php_version]]
+
+    info(f"🚀 Creating {len(todo)} website(s), {max(1, parallel)} at a time...")
+    with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix="create") as executor:
+        created = executor.map(
+            lambda site: create_website(site.domain, site.php_version, reload_webserver=False),
+            todo)
+        results.update(zip((s.domain for s in todo), created))
+
+    if any(results[s.domain] for s in todo):
+        try:
+            WebserverReload.webserver_reload()
+        except Exception as e:
+            error(f"❌ Error reloading the webserver: {e}")
+
+    created_count = sum(1 for ok in results.values() if ok)
+    if created_count == len(sites):
+        success(f"✅ Created {created_count} website(s).")
+    else:
+        warn(f"⚠️ Created {created_count} of {len(sites)} website(s).")
+    return results
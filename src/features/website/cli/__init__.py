@@ -5,20 +5,13 @@ This package provides command-line interfaces for managing websites,
 including creation, deletion, restart, information display, and log viewing.
 """
 
-from src.features.website.cli.create import cli_create_website
-from src.features.website.cli.delete import cli_delete_website
-from src.features.website.cli.restart import cli_restart_website
-from src.features.website.cli.info import cli_website_info, get_website_info
-from src.features.website.cli.list import cli_list_websites, list_websites
-from src.features.website.cli.logs import cli_view_logs
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'cli_create_website',
-    'cli_delete_website',
-    'cli_restart_website',
-    'cli_website_info',
-    'get_website_info',
-    'cli_list_websites',
-    'list_websites',
-    'cli_view_logs'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.website.cli.create": ["cli_create_website", "cli_create_websites_batch"],
+    "src.features.website.cli.delete": ["cli_delete_website"],
+    "src.features.website.cli.restart": ["cli_restart_website"],
+    "src.features.website.cli.info": ["cli_website_info", "get_website_info"],
+    "src.features.website.cli.list": ["cli_list_websites", "list_websites"],
+    "src.features.website.cli.logs": ["cli_view_logs", "cli_rotate_logs"],
+})
@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any, Tuple
 from src.common.logging import log_call, info, warn, error, success
 from src.features.website.utils import is_website_exists
 from src.features.website.manager import create_website
+from src.features.website.batch import MAX_PARALLEL_SITES, create_websites, load_site_manifest
 from src.features.wordpress.cli.install import cli_install_wordpress
 from src.common.utils.validation import is_valid_domain
 
@@ -106,6 +107,36 @@ def cli_create_website() -> bool:
     return creation_success
 
 
+@log_call
+def cli_create_websites_batch(manifest_path: str, parallel: int = MAX_PARALLEL_SITES) -> bool:
+    """
+    CLI entry point for creating several websites from a manifest file.
+
+    Args:
+        manifest_path: Path to the JSON manifest
+        parallel: Maximum number of websites set up at the same time
+
+    Returns:
+        bool: True if every website was created, False otherwise
+    """
+    try:
+        sites = load_site_manifest(manifest_path)
+    except ValueError as e:
+        error(f"❌ {e}")
+        return False
+    if not sites:
+        warn("⚠️ Manifest does not list any website.")
+        return False
+
+    results = create_websites(sites, parallel)
+    for domain, created in results.items():
+        if created:
+            info(f"✅ {domain}")
+        else:
+            error(f"❌ {domain}")
+    return all(results.values())
+
+
 if __name__ == "__main__":
     success = cli_create_website()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,16 +3,28 @@ CLI interface for viewing website logs.
 
 This module provides a command-line interface for viewing and managing
 website logs, including NGINX access and error logs and PHP error logs.
+Lines are read with features/website/log_reader, which supports filtering
+and seeking to a time range without scanning the whole file.
 """
 
 import os
+import re
 import sys
-import subprocess
-from questionary import select
+from questionary import select, text
 from typing import Optional, Dict, Any, List
 
 from src.common.logging import log_call, info, warn, error, success
 from src.features.website.utils import select_website, get_site_config
+from src.features.website.log_reader import (
+    LogFilter,
+    read_log,
+    tail_log,
+    follow_log,
+    parse_time_arg,
+    format_access_entry
+)
+from src.features.website.log_rotate import rotate_logs
+from src.features.nginx.analytics.access_log import AccessLogEntry
 
 
 @log_call
@@ -49,15 +61,28 @@ def get_log_options(domain: str) -> Optional[Dict[str, str]]:
     return logs if logs else None
 
 
+def print_log_line(line: str, entry: Optional[AccessLogEntry]) -> None:
+    """
+    Print a log line, formatting access log entries for readability.
+    
+    Args:
+        line: Raw log line
+        entry: Parsed access log entry, if the line is one
+    """
+    print(format_access_entry(entry) if entry is not None else line)
+
+
 @log_call
-def view_log(log_path: str, lines: int = 100, follow: bool = False) -> bool:
+def view_log(log_path: str, lines: int = 100, follow: bool = False,
+             log_filter: Optional[LogFilter] = None) -> bool:
     """
-    View a log file using the tail command.
+    View a log file, optionally filtered, limited to a time range or followed.
     
     Args:
         log_path: Path to the log file
-        lines: Number of lines to display
-        follow: Whether to follow the log (tail -f)
+        lines: Number of lines to display (maximum matches for a time range)
+        follow: Whether to follow the log for new lines
+        log_filter: Filter to apply to the lines
         
     Returns:
         bool: True if log viewing was successful, False otherwise
@@ -67,19 +92,27 @@ def view_log(log_path: str, lines: int = 100, follow: bool = False) -> bool:
         return False
     
     try:
-        cmd = ["tail", f"-n{lines}"]
-        if follow:
-            cmd.append("-f")
-        cmd.append(log_path)
+        if log_filter and log_filter.has_time_range and not follow:
+            shown = 0
+            for line, entry in read_log(log_path, log_filter):
+                print_log_line(line, entry)
+                shown += 1
+                if shown >= lines:
+                    warn(f"Stopped after {lines} matching lines, narrow the filter to see more.")
+                    break
+            if shown == 0:
+                info("No matching log lines.")
+            return True
+        
+        for line, entry in tail_log(log_path, lines, log_filter):
+            print_log_line(line, entry)
         
-        # When running tail -f, we need to handle keyboard interrupt
         if follow:
             try:
-                subprocess.run(cmd)
+                for line, entry in follow_log(log_path, log_filter):
+                    print_log_line(line, entry)
             except KeyboardInterrupt:
                 info("\nLog viewing stopped.")
-        else:
-            subprocess.run(cmd)
         
         return True
     except Exception as e:
@@ -87,6 +120,45 @@ def view_log(log_path: str, lines: int = 100, follow: bool = False) -> bool:
         return False
 
 
+def prompt_log_filter() -> Optional[LogFilter]:
+    """
+    Prompt the user for log filter criteria. Empty answers are ignored.
+    
+    Returns:
+        Optional[LogFilter]: Filter to apply, or None if cancelled
+    """
+    info("Leave a field empty to skip it. Times accept 14:00, 2026-10-18 14:00 or -15m.")
+    answers = {}
+    questions = [
+        ("since", "From time:"),
+        ("until", "To time:"),
+        ("status", "Status (e.g. 404, 5xx, 4xx,5xx):"),
+        ("path_regex", "Path regex:"),
+        ("ip", "Client IP:"),
+        ("min_request_time", "Slower than (seconds):"),
+        ("search", "Text search (regex):"),
+    ]
+    for key, message in questions:
+        value = text(message).ask()
+        if value is None:
+            return None
+        answers[key] = value.strip() or None
+    
+    try:
+        return LogFilter(
+            since=parse_time_arg(answers["since"]) if answers["since"] else None,
+            until=parse_time_arg(answers["until"]) if answers["until"] else None,
+            status=answers["status"],
+            path_regex=answers["path_regex"],
+            ip=answers["ip"],
+            min_request_time=float(answers["min_request_time"]) if answers["min_request_time"] else None,
+            search=answers["search"],
+        )
+    except (ValueError, re.error) as e:
+        error(f"Invalid filter: {e}")
+        return None
+
+
 @log_call
 def prompt_log_options(domain: str) -> Optional[Dict[str, Any]]:
     """
@@ -122,7 +194,8 @@ def prompt_log_options(domain: str) -> Optional[Dict[str, Any]]:
             "View last 100 lines",
             "View last 500 lines",
             "View last 1000 lines",
-            "Follow log (live updates, Ctrl+C to stop)"
+            "Follow log (live updates, Ctrl+C to stop)",
+            "Filter / search (time range, status, path, IP, slow requests)"
         ]
         
         view_option = select(
@@ -134,6 +207,12 @@ def prompt_log_options(domain: str) -> Optional[Dict[str, Any]]:
             return None
         
         # Parse options
+        log_filter = None
+        if "Filter" in view_option:
+            log_filter = prompt_log_filter()
+            if log_filter is None:
+                return None
+        
         follow = "Follow" in view_option
         if "100" in view_option:
             lines = 100
@@ -141,13 +220,16 @@ def prompt_log_options(domain: str) -> Optional[Dict[str, Any]]:
             lines = 500
         elif "1000" in view_option:
             lines = 1000
+        elif log_filter is not None:
+            lines = 1000  # Maximum matches shown for a filter
         else:
             lines = 50  # Default for follow mode
         
         return {
             "log_path": log_path,
             "lines": lines,
-            "follow": follow
+            "follow": follow,
+            "filter": log_filter
         }
     except (KeyboardInterrupt, EOFError):
         info("\nOperation cancelled.")
@@ -155,14 +237,34 @@ def prompt_log_options(domain: str) -> Optional[Dict[str, Any]]:
 
 
 @log_call
-def cli_view_logs() -> bool:
+def cli_view_logs(domain: Optional[str] = None, log_type: Optional[str] = None,
+                  lines: int = 100, follow: bool = False,
+                  log_filter: Optional[LogFilter] = None) -> bool:
     """
     CLI entry point for viewing website logs.
     
+    When domain and log_type are given the log is shown directly,
+    otherwise the user is prompted for them.
+    
+    Args:
+        domain: Website domain name
+        log_type: One of access, error, php_error, php_slow
+        lines: Number of lines to display
+        follow: Whether to follow the log
+        log_filter: Filter to apply to the lines
+    
     Returns:
         bool: True if log viewing was successful, False otherwise
     """
-    domain = select_website("Select website to view logs:")
+    if domain and log_type:
+        site_config = get_site_config(domain)
+        log_path = getattr(site_config.logs, log_type, None) if site_config and site_config.logs else None
+        if not log_path:
+            error(f"No {log_type} log configured for website {domain}")
+            return False
+        return view_log(log_path, lines, follow, log_filter)
+    
+    domain = domain or select_website("Select website to view logs:")
     
     if not domain:
         warn("No website selected or no websites available.")
@@ -175,10 +277,36 @@ def cli_view_logs() -> bool:
     return view_log(
         log_options["log_path"],
         log_options["lines"],
-        log_options["follow"]
+        log_options["follow"],
+        log_options.get("filter")
     )
 
 
+@log_call
+def cli_rotate_logs(domain: Optional[str] = None, force: bool = False) -> bool:
+    """
+    CLI entry point for rotating website logs.
+    
+    Args:
+        domain: Website domain name, or None for all websites
+        force: Rotate every non-empty log regardless of size and age
+    
+    Returns:
+        bool: True if no log failed to rotate, False otherwise
+    """
+    results = rotate_logs([domain] if domain else None, force=force)
+    
+    failed = [r for r in results if r.error]
+    for result in results:
+        if result.rotated:
+            info(f"🔄 {result.domain}/{result.log}: rotated ({result.reason}, {result.size} bytes)")
+    for result in failed:
+        error(f"❌ {result.domain}/{result.log}: {result.error}")
+    
+    if not any(r.rotated for r in results) and not failed:
+        info("No log files were due for rotation.")
+    return not failed
+
 if __name__ == "__main__":
     success = cli_view_logs()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -5,19 +5,24 @@ This module provides a centralized command-line interface for all website
 management operations, including subcommands for various actions.
 """
 
+import re
 import sys
 import argparse
 from typing import List, Optional
 
 from src.common.logging import log_call, info, warn, error, success
+from src.common.profiling import profiled
 from src.features.website.cli import (
     cli_create_website,
+    cli_create_websites_batch,
     cli_delete_website,
     cli_restart_website,
     cli_website_info,
     cli_list_websites,
-    cli_view_logs
+    cli_view_logs,
+    cli_rotate_logs
 )
+from src.features.website.log_reader import LogFilter, parse_time_arg
 
 
 @log_call
@@ -47,6 +52,16 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         "create",
         help="Create a new website"
     )
+    create_parser.add_argument(
+        "--manifest",
+        help="Create every website listed in a JSON manifest file"
+    )
+    create_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=3,
+        help="Websites set up at the same time with --manifest (default: 3)"
+    )
     
     # Delete website
     delete_parser = subparsers.add_parser(
@@ -87,10 +102,39 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         "logs",
         help="View website logs"
     )
+    logs_parser.add_argument("--domain", help="Website domain (prompted if omitted)")
+    logs_parser.add_argument(
+        "--log",
+        choices=["access", "error", "php_error", "php_slow"],
+        default="access",
+        help="Log file to view"
+    )
+    logs_parser.add_argument("-n", "--lines", type=int, default=100, help="Number of lines to show")
+    logs_parser.add_argument("-f", "--follow", action="store_true", help="Follow the log for new lines")
+    logs_parser.add_argument("--since", help="Start time (14:00, 2026-10-18 14:00 or -15m)")
+    logs_parser.add_argument("--until", help="End time (same formats as --since)")
+    logs_parser.add_argument("--status", help="Status filter, e.g. 404, 5xx or 4xx,5xx")
+    logs_parser.add_argument("--path", help="Regex the request path must match")
+    logs_parser.add_argument("--ip", help="Client IP address")
+    logs_parser.add_argument("--slow", type=float, help="Only requests slower than this many seconds")
+    logs_parser.add_argument("--grep", help="Regex the raw line must match")
+    
+    # Rotate logs
+    rotate_parser = subparsers.add_parser(
+        "rotate-logs",
+        help="Rotate and compress website logs"
+    )
+    rotate_parser.add_argument("--domain", help="Website domain (all websites if omitted)")
+    rotate_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rotate every non-empty log regardless of size and age"
+    )
     
     return parser.parse_args(args)
 
 
+@profiled("website")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -112,6 +156,8 @@ def main(args: Optional[List[str]] = None) -> int:
         return 0 if cli_list_websites() else 1
     
     if parsed_args.command == "create":
+        if parsed_args.manifest:
+            return 0 if cli_create_websites_batch(parsed_args.manifest, parsed_args.parallel) else 1
         return 0 if cli_create_website() else 1
     
     elif parsed_args.command == "delete":
@@ -127,7 +173,31 @@ def main(args: Optional[List[str]] = None) -> int:
         return 0 if cli_list_websites() else 1
     
     elif parsed_args.command == "logs":
-        return 0 if cli_view_logs() else 1
+        if not parsed_args.domain:
+            return 0 if cli_view_logs() else 1
+        try:
+            log_filter = LogFilter(
+                since=parse_time_arg(parsed_args.since) if parsed_args.since else None,
+                until=parse_time_arg(parsed_args.until) if parsed_args.until else None,
+                status=parsed_args.status,
+                path_regex=parsed_args.path,
+                ip=parsed_args.ip,
+                min_request_time=parsed_args.slow,
+                search=parsed_args.grep
+            )
+        except (ValueError, re.error) as e:
+            error(f"Invalid log filter: {e}")
+            return 1
+        return 0 if cli_view_logs(
+            parsed_args.domain,
+            parsed_args.log,
+            parsed_args.lines,
+            parsed_args.follow,
+            log_filter
+        ) else 1
+    
+    elif parsed_args.command == "rotate-logs":
+        return 0 if cli_rotate_logs(parsed_args.domain, parsed_args.force) else 1
     
     else:
         error(f"Unknown command: {parsed_args.command}")
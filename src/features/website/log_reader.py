@@ -0,0 +1,424 @@
+"""
+Website log reader.
+
+This module reads per-site logs without shelling out to ``tail``. It seeks to
+a time window with a binary search over byte offsets, streams lines through a
+filter pipeline (status, path, IP, slow requests, free-text search) and reads
+rotated ``.gz`` generations transparently, so finding "all 5xx between 14:00
+and 14:05" only touches the part of the logs that covers that window.
+"""
+
+import glob
+import gzip
+import os
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, Iterator, List, Optional, Tuple
+
+from src.common.logging import debug
+from src.features.nginx.analytics.access_log import AccessLogEntry, parse_access_line
+
+# Timestamp formats of the non-access logs kept in each site's logs directory
+ERROR_LOG_PATTERNS = [
+    # NGINX error.log: 2026/10/18 14:00:01 [error] ...
+    (re.compile(r"^(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})"), "%Y/%m/%d %H:%M:%S"),
+    # PHP error and slow logs: [18-Oct-2026 14:00:01 UTC] / [18-Oct-2026 14:00:01]
+    (re.compile(r"^\[(\d{2}-\w{3}-\d{4} \d{2}:\d{2}:\d{2})"), "%d-%b-%Y %H:%M:%S"),
+]
+
+# Bytes read per step when scanning a file backwards
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass
+class LogFilter:
+    """Criteria a log line must match to be shown."""
+
+    since: Optional[float] = None
+    until: Optional[float] = None
+    status: Optional[str] = None          # "500", "5xx" or "4xx,5xx"
+    path_regex: Optional[str] = None
+    ip: Optional[str] = None
+    min_request_time: Optional[float] = None  # seconds
+    search: Optional[str] = None          # regex over the raw line
+
+    def __post_init__(self):
+        self._path_re = re.compile(self.path_regex) if self.path_regex else None
+        self._search_re = re.compile(self.search, re.IGNORECASE) if self.search else None
+        self._statuses = [s.strip().lower() for s in self.status.split(",")] if self.status else []
+
+    @property
+    def needs_access_entry(self) -> bool:
+        """Whether the filter uses fields only access log lines have."""
+        return bool(self._statuses or self._path_re or self.ip or self.min_request_time is not None)
+
+    @property
+    def has_time_range(self) -> bool:
+        return self.since is not None or self.until is not None
+
+    def _match_status(self, status: int) -> bool:
+        for wanted in self._statuses:
+            if wanted.endswith("xx"):
+                if str(status)[0] == wanted[0]:
+                    return True
+            elif wanted == str(status):
+                return True
+        return False
+
+    def matches(self, line: str, entry: Optional[AccessLogEntry], timestamp: Optional[float]) -> bool:
+        """
+        Check whether a line passes every filter.
+
+        Args:
+            line: Raw log line
+            entry: Parsed access log entry, if the line is one
+            timestamp: Timestamp of the line, if known
+
+        Returns:
+            bool: True if the line should be shown
+        """
+        if timestamp is not None:
+            if self.since is not None and timestamp < self.since:
+                return False
+            if self.until is not None and timestamp > self.until:
+                return False
+        if self._search_re and not self._search_re.search(line):
+            return False
+        if not self.needs_access_entry:
+            return True
+        if entry is None:
+            return False
+        if self._statuses and not self._match_status(entry.status):
+            return False
+        if self._path_re and not self._path_re.search(entry.uri):
+            return False
+        if self.ip and entry.remote_addr != self.ip:
+            return False
+        if self.min_request_time is not None:
+            if entry.request_time is None or entry.request_time < self.min_request_time:
+                return False
+        return True
+
+
+def parse_time_arg(value: str, now: Optional[datetime] = None) -> float:
+    """
+    Parse a user-supplied time such as ``14:00``, ``2026-10-18 14:00`` or ``-15m``.
+
+    Args:
+        value: Time string
+        now: Reference time for relative and time-only values
+
+    Returns:
+        float: Unix timestamp
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    value = value.strip()
+    now = now or datetime.now()
+
+    relative = re.match(r"^-(\d+)([smhd])$", value)
+    if relative:
+        amount = int(relative.group(1))
+        unit = {"s": 1, "m": 60, "h": 3600, "d": 86400}[relative.group(2)]
+        return now.timestamp() - amount * unit
+
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).timestamp()
+        except ValueError:
+            continue
+    for fmt in ("%H:%M:%S", "%H:%M"):
+        try:
+            parsed = datetime.strptime(value, fmt)
+            return now.replace(hour=parsed.hour, minute=parsed.minute,
+                               second=parsed.second, microsecond=0).timestamp()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised time: {value}")
+
+
+def parse_line(line: str) -> Tuple[Optional[AccessLogEntry], Optional[float]]:
+    """
+    Parse a line from any of the site logs.
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        Tuple of the access log entry (or None) and the line's timestamp (or None)
+    """
+    entry = parse_access_line(line)
+    if entry is not None:
+        return entry, entry.timestamp
+    for pattern, fmt in ERROR_LOG_PATTERNS:
+        match = pattern.match(line)
+        if match:
+            try:
+                return None, datetime.strptime(match.group(1), fmt).timestamp()
+            except ValueError:
+                return None, None
+    return None, None
+
+
+def line_timestamp(line: str) -> Optional[float]:
+    return parse_line(line)[1]
+
+
+def format_access_entry(entry: AccessLogEntry) -> str:
+    """
+    Format an access log entry as a single readable line.
+
+    Args:
+        entry: Parsed entry
+
+    Returns:
+        str: Human readable line
+    """
+    when = datetime.fromtimestamp(entry.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    took = f"{entry.request_time:.3f}s" if entry.request_time is not None else "-"
+    cache = entry.cache_status or "-"
+    return f"{when} {entry.remote_addr} {entry.method} {entry.uri} {entry.status} {entry.bytes}B {took} {cache}"
+
+
+def get_log_generations(log_path: str) -> List[str]:
+    """
+    List a log and its rotated generations, oldest first.
+
+    Rotated files are ``<log>.1``, ``<log>.2.gz`` and so on; they are ordered
+    by modification time so other naming schemes also work.
+
+    Args:
+        log_path: Path of the current log file
+
+    Returns:
+        List[str]: Paths ordered from oldest to newest
+    """
+    rotated = [p for p in glob.glob(f"{glob.escape(log_path)}.*") if not p.endswith(".tmp")]
+    rotated.sort(key=lambda p: os.path.getmtime(p))
+    if os.path.exists(log_path):
+        rotated.append(log_path)
+    return rotated
+
+
+def _open_text(path: str) -> IO[bytes]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _first_timestamp(path: str, max_lines: int = 50) -> Optional[float]:
+    """Timestamp of the first parseable line in a (possibly gzipped) file."""
+    try:
+        with _open_text(path) as f:
+            for _ in range(max_lines):
+                raw = f.readline()
+                if not raw:
+                    break
+                ts = line_timestamp(raw.decode("utf-8", errors="replace"))
+                if ts is not None:
+                    return ts
+    except (IOError, EOFError, gzip.BadGzipFile) as e:
+        debug(f"Could not read {path}: {e}")
+    return None
+
+
+def _line_start_at_or_after(f: IO[bytes], pos: int) -> int:
+    if pos <= 0:
+        return 0
+    f.seek(pos - 1)
+    f.readline()
+    return f.tell()
+
+
+def _next_timestamp(f: IO[bytes], start: int, limit: int) -> Tuple[Optional[float], int]:
+    """
+    Find the first timestamped line starting at ``start``.
+
+    Returns:
+        Tuple of the timestamp (or None) and the offset just after that line
+    """
+    f.seek(start)
+    while f.tell() < limit:
+        raw = f.readline()
+        if not raw:
+            break
+        ts = line_timestamp(raw.decode("utf-8", errors="replace"))
+        if ts is not None:
+            return ts, f.tell()
+    return None, f.tell()
+
+
+def seek_to_time(f: IO[bytes], target: float, size: int) -> int:
+    """
+    Binary search for the first line logged at or after a timestamp.
+
+    Lines without a timestamp (stack traces, continuation lines) are skipped
+    over while probing. Log lines are assumed to be in time order.
+
+    Args:
+        f: File opened in binary mode
+        target: Unix timestamp to find
+        size: Size of the file in bytes
+
+    Returns:
+        int: Byte offset of the start of the first line at or after target
+    """
+    lo, hi = 0, size
+    probes = 0
+    while lo < hi:
+        probes += 1
+        mid = (lo + hi) // 2
+        start = _line_start_at_or_after(f, mid)
+        if start >= hi:
+            hi = mid
+            continue
+        ts, after = _next_timestamp(f, start, hi)
+        if ts is None:
+            hi = mid
+        elif ts < target:
+            lo = after
+        else:
+            hi = mid
+    debug(f"Seek to {target} done in {probes} probes")
+    return _line_start_at_or_after(f, lo)
+
+
+def _iter_file(path: str, log_filter: LogFilter) -> Iterator[Tuple[str, Optional[AccessLogEntry]]]:
+    """Stream matching lines from one file, seeking when possible."""
+    with _open_text(path) as f:
+        if log_filter.since is not None and not path.endswith(".gz"):
+            f.seek(seek_to_time(f, log_filter.since, os.path.getsize(path)))
+        for raw in f:
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            entry, ts = parse_line(line)
+            if ts is not None and log_filter.until is not None and ts > log_filter.until:
+                return
+            if log_filter.matches(line, entry, ts):
+                yield line, entry
+
+
+def read_log(log_path: str, log_filter: Optional[LogFilter] = None) -> Iterator[Tuple[str, Optional[AccessLogEntry]]]:
+    """
+    Stream lines matching a filter from a log and its rotated generations.
+
+    Generations that end before ``since`` or start after ``until`` are skipped
+    without being read.
+
+    Args:
+        log_path: Path of the current log file
+        log_filter: Filter to apply (everything if None)
+
+    Yields:
+        Tuples of (raw line, parsed access entry or None)
+    """
+    log_filter = log_filter or LogFilter()
+    files = get_log_generations(log_path)
+    if not log_filter.has_time_range:
+        # Without a time range only the current file is searched
+        files = files[-1:]
+
+    starts = [_first_timestamp(p) if log_filter.has_time_range else None for p in files]
+    for index, path in enumerate(files):
+        if log_filter.until is not None and starts[index] is not None and starts[index] > log_filter.until:
+            break
+        next_start = starts[index + 1] if index + 1 < len(starts) else None
+        if log_filter.since is not None and next_start is not None and next_start <= log_filter.since:
+            continue
+        yield from _iter_file(path, log_filter)
+
+
+def tail_log(log_path: str, lines: int = 100,
+             log_filter: Optional[LogFilter] = None) -> List[Tuple[str, Optional[AccessLogEntry]]]:
+    """
+    Get the last matching lines of a log by reading it backwards in blocks.
+
+    Args:
+        log_path: Path of the log file
+        lines: Number of lines to return
+        log_filter: Filter to apply (everything if None)
+
+    Returns:
+        List of (raw line, parsed access entry or None), oldest first
+    """
+    log_filter = log_filter or LogFilter()
+    if log_filter.has_time_range:
+        matches = []
+        for item in read_log(log_path, log_filter):
+            matches.append(item)
+            if len(matches) > lines:
+                matches.pop(0)
+        return matches
+
+    if not os.path.exists(log_path):
+        return []
+
+    matches: List[Tuple[str, Optional[AccessLogEntry]]] = []
+    with open(log_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        remainder = b""
+        while pos > 0 and len(matches) < lines:
+            read_size = min(TAIL_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size) + remainder
+            parts = chunk.split(b"\n")
+            # The first part may be the tail of an earlier line
+            remainder = parts.pop(0) if pos > 0 else b""
+            for raw in reversed(parts):
+                if not raw:
+                    continue
+                line = raw.decode("utf-8", errors="replace")
+                entry, ts = parse_line(line)
+                if log_filter.matches(line, entry, ts):
+                    matches.append((line, entry))
+                    if len(matches) >= lines:
+                        break
+    matches.reverse()
+    return matches
+
+
+def follow_log(log_path: str, log_filter: Optional[LogFilter] = None,
+               interval: float = 0.5) -> Iterator[Tuple[str, Optional[AccessLogEntry]]]:
+    """
+    Yield matching lines as they are appended, reopening the file on rotation.
+
+    Args:
+        log_path: Path of the log file
+        log_filter: Filter to apply (everything if None)
+        interval: Seconds between polls
+
+    Yields:
+        Tuples of (raw line, parsed access entry or None)
+    """
+    log_filter = log_filter or LogFilter()
+    f = open(log_path, "rb")
+    f.seek(0, os.SEEK_END)
+    inode = os.fstat(f.fileno()).st_ino
+    buffer = b""
+    try:
+        while True:
+            chunk = f.read()
+            if chunk:
+                buffer += chunk
+                *complete, buffer = buffer.split(b"\n")
+                for raw in complete:
+                    line = raw.decode("utf-8", errors="replace")
+                    entry, ts = parse_line(line)
+                    if log_filter.matches(line, entry, ts):
+                        yield line, entry
+                continue
+            time.sleep(interval)
+            try:
+                if os.stat(log_path).st_ino != inode:
+                    f.close()
+                    f = open(log_path, "rb")
+                    inode = os.fstat(f.fileno()).st_ino
+                    buffer = b""
+            except FileNotFoundError:
+                continue
+    finally:
+        f.close()
@@ -0,0 +1,332 @@
+"""
+Website log rotation.
+
+This module rotates the per-site logs created by ``setup_directories`` when
+they grow past a size limit or when the rotation interval has passed, keeps
+a configurable number of generations and gzips all but the newest one.
+
+Generations are named ``<log>.1`` (plain, may still receive a few writes
+until the daemon reopens it) and ``<log>.2.gz`` onwards, the layout the log
+reader and the incremental access log reader expect.
+
+NGINX sees the whole sites directory, so its logs are renamed and NGINX is
+told to reopen them. The PHP logs are bind-mounted into the PHP container
+file by file: a renamed file stays mounted, so they are copied and then
+truncated in place instead. PHP-FPM appends to them, so no signal is needed.
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.common.logging import log_call, debug, info, warn, error
+from src.common.utils.environment import env
+from src.features.website.models.site_config import SiteLogRotate
+
+# Log files of a website and how each one is rotated
+SITE_LOG_FILES = {
+    "access.log": "rename",
+    "error.log": "rename",
+    "php_error.log": "copytruncate",
+    "php_slow.log": "copytruncate",
+}
+
+GENERATION_PATTERN = re.compile(r"\.(\d+)(\.gz)?$")
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass
+class RotateResult:
+    """Outcome of rotating one log file."""
+
+    domain: str
+    log: str
+    rotated: bool = False
+    reason: Optional[str] = None
+    size: int = 0
+    removed: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "log": self.log,
+            "rotated": self.rotated,
+            "reason": self.reason,
+            "size": self.size,
+            "removed": len(self.removed),
+            "error": self.error,
+        }
+
+
+def get_logs_dir(domain: str) -> str:
+    return os.path.join(env["SITES_DIR"], domain, "logs")
+
+
+def get_rotate_policy(domain: str, overrides: Optional[Dict[str, Any]] = None) -> SiteLogRotate:
+    """
+    Get the rotation policy of a website.
+
+    The policy saved in the site config takes precedence over defaults;
+    overrides (e.g. cron job parameters) take precedence over both.
+
+    Args:
+        domain: Website domain name
+        overrides: Policy fields to override
+
+    Returns:
+        SiteLogRotate: Effective policy
+    """
+    from src.features.website.utils import get_site_config
+
+    policy = SiteLogRotate()
+    site_config = get_site_config(domain)
+    if site_config and site_config.log_rotate:
+        policy = site_config.log_rotate
+
+    for key, value in (overrides or {}).items():
+        if value is not None and hasattr(policy, key):
+            setattr(policy, key, value)
+    policy.keep = max(1, int(policy.keep))
+    return policy
+
+
+def list_generations(log_path: str) -> Dict[int, str]:
+    """
+    List the rotated generations of a log file.
+
+    Args:
+        log_path: Path of the current log file
+
+    Returns:
+        Dict[int, str]: Generation number to file path
+    """
+    directory, name = os.path.split(log_path)
+    generations = {}
+    if not os.path.isdir(directory):
+        return generations
+    for entry in os.listdir(directory):
+        if not entry.startswith(f"{name}."):
+            continue
+        match = GENERATION_PATTERN.fullmatch(entry[len(name):])
+        if match:
+            generations[int(match.group(1))] = os.path.join(directory, entry)
+    return generations
+
+
+def _gzip_file(source: str, target: str) -> None:
+    """Compress a file, keeping its modification time, and remove the source."""
+    tmp_target = f"{target}.tmp"
+    with open(source, "rb") as src, gzip.open(tmp_target, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    stat = os.stat(source)
+    os.utime(tmp_target, (stat.st_atime, stat.st_mtime))
+    os.replace(tmp_target, target)
+    os.remove(source)
+
+
+def _copy_truncate(log_path: str, target: str) -> None:
+    """Copy a log that is held open elsewhere, then empty it in place."""
+    with open(log_path, "rb+") as src:
+        with open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            # Pick up lines written while copying before truncating
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        src.truncate(0)
+
+
+class LogRotator:
+    """Rotates website logs according to per-site policies."""
+
+    def __init__(self, state_file: Optional[str] = None):
+        """
+        Initialize the rotator.
+
+        Args:
+            state_file: JSON file recording when each log was last rotated
+        """
+        self.state_file = state_file or os.path.join(env["DATA_DIR"], "log_rotate.json")
+        self.state: Dict[str, float] = self._load()
+
+    def _load(self) -> Dict[str, float]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            warn(f"⚠️ Could not read log rotation state: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist the last rotation times."""
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def should_rotate(self, log_path: str, policy: SiteLogRotate,
+                      now: Optional[float] = None) -> Optional[str]:
+        """
+        Decide whether a log file is due for rotation.
+
+        Args:
+            log_path: Path of the log file
+            policy: Rotation policy
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Optional[str]: "size" or "interval" when due, None otherwise
+        """
+        now = now or time.time()
+        try:
+            size = os.path.getsize(log_path)
+        except OSError:
+            return None
+        if size == 0:
+            return None
+        if policy.max_size_mb and size >= policy.max_size_mb * 1024 * 1024:
+            return "size"
+
+        last_rotated = self.state.setdefault(log_path, now)
+        if policy.interval_days and now - last_rotated >= policy.interval_days * 86400:
+            return "interval"
+        return None
+
+    def _shift_generations(self, log_path: str, policy: SiteLogRotate) -> List[str]:
+        """
+        Make room for a new ``<log>.1`` and drop generations beyond retention.
+
+        Returns:
+            List[str]: Paths of removed generations
+        """
+        removed = []
+        generations = list_generations(log_path)
+
+        for number in sorted(generations, reverse=True):
+            path = generations[number]
+            if number >= policy.keep:
+                os.remove(path)
+                removed.append(path)
+                continue
+
+            target_number = number + 1
+            if path.endswith(".gz"):
+                os.replace(path, f"{log_path}.{target_number}.gz")
+            elif policy.compress:
+                _gzip_file(path, f"{log_path}.{target_number}.gz")
+            else:
+                os.replace(path, f"{log_path}.{target_number}")
+        return removed
+
+    def rotate_file(self, domain: str, log_name: str, policy: SiteLogRotate,
+                    force: bool = False) -> RotateResult:
+        """
+        Rotate one log file of a website if it is due.
+
+        Args:
+            domain: Website domain name
+            log_name: Log file name, e.g. "access.log"
+            policy: Rotation policy
+            force: Rotate any non-empty log regardless of size and age
+
+        Returns:
+            RotateResult: What was done
+        """
+        result = RotateResult(domain=domain, log=log_name)
+        log_path = os.path.join(get_logs_dir(domain), log_name)
+        if not os.path.isfile(log_path):
+            return result
+
+        now = time.time()
+        reason = self.should_rotate(log_path, policy, now)
+        if force and reason is None and os.path.getsize(log_path) > 0:
+            reason = "forced"
+        if reason is None:
+            return result
+
+        result.reason = reason
+        result.size = os.path.getsize(log_path)
+        try:
+            result.removed = self._shift_generations(log_path, policy)
+            if SITE_LOG_FILES.get(log_name) == "copytruncate":
+                _copy_truncate(log_path, f"{log_path}.1")
+            else:
+                os.replace(log_path, f"{log_path}.1")
+                open(log_path, "a").close()
+                os.chmod(log_path, 0o666)
+        except OSError as e:
+            result.error = str(e)
+            error(f"❌ Could not rotate {log_path}: {e}")
+            return result
+
+        self.state[log_path] = now
+        result.rotated = True
+        debug(f"Rotated {log_path} ({reason}, {result.size} bytes, "
+              f"{len(result.removed)} old generation(s) removed)")
+        return result
+
+    def rotate_site(self, domain: str, overrides: Optional[Dict[str, Any]] = None,
+                    force: bool = False) -> List[RotateResult]:
+        """
+        Rotate all logs of a website that are due.
+
+        Args:
+            domain: Website domain name
+            overrides: Policy fields to override
+            force: Rotate every non-empty log
+
+        Returns:
+            List[RotateResult]: One result per log file
+        """
+        policy = get_rotate_policy(domain, overrides)
+        if not policy.enabled and not force:
+            debug(f"Log rotation disabled for {domain}")
+            return []
+        return [self.rotate_file(domain, log_name, policy, force)
+                for log_name in SITE_LOG_FILES]
+
+
+@log_call
+def rotate_logs(domains: Optional[List[str]] = None,
+                overrides: Optional[Dict[str, Any]] = None,
+                force: bool = False) -> List[RotateResult]:
+    """
+    Rotate website logs and make NGINX reopen the renamed files.
+
+    Args:
+        domains: Websites to rotate (defaults to all websites)
+        overrides: Policy fields to override for every website
+        force: Rotate every non-empty log regardless of policy thresholds
+
+    Returns:
+        List[RotateResult]: Results for every log file checked
+    """
+    if domains is None:
+        from src.features.website.utils import website_list
+        domains = website_list()
+
+    rotator = LogRotator()
+    results: List[RotateResult] = []
+    for domain in domains:
+        results.extend(rotator.rotate_site(domain, overrides, force))
+    rotator.save()
+
+    renamed = [r for r in results if r.rotated and SITE_LOG_FILES.get(r.log) == "rename"]
+    if renamed:
+        from src.features.nginx.manager import reopen_logs
+        if not reopen_logs():
+            warn("⚠️ NGINX keeps writing to the rotated files until it is reloaded")
+
+    rotated = [r for r in results if r.rotated]
+    if rotated:
+        info(f"🔄 Rotated {len(rotated)} log file(s) across {len(domains)} website(s)")
+    else:
+        debug("No log files were due for rotation")
+    return results
@@ -6,27 +6,153 @@ about websites in the system.
 """
 
 import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import List, Dict, Any, Optional, Tuple, Callable
 
 from src.common.logging import log_call, info, warn, error, success, debug
+from src.common.tracing import span
 from src.features.website.utils import is_website_exists
 from src.features.website.actions import (
-    WEBSITE_SETUP_ACTIONS,
+    SetupStep,
+    WEBSITE_SETUP_STEPS,
     WEBSITE_CLEANUP_ACTIONS
 )
 
+# Setup steps of one website running at the same time
+MAX_PARALLEL_STEPS = 4
+
+# Held by steps marked exclusive, across all websites being created
+_exclusive_lock = threading.Lock()
+
+
+class StepFailed(Exception):
+    """Raised by run_setup_steps with the steps that completed before the failure."""
+
+    def __init__(self, completed: List[SetupStep], cause: BaseException):
+        super().__init__(str(cause))
+        self.completed = completed
+        self.cause = cause
+
+
+def _call_step(func: Callable, **kwargs: Any) -> Any:
+    """Call a setup step with the keyword arguments its signature accepts."""
+    params = inspect.signature(func).parameters
+    return func(**{name: value for name, value in kwargs.items() if name in params})
+
+
+def validate_setup_steps(steps: List[SetupStep]) -> None:
+    """
+    Check that every step dependency exists and that there are no cycles.
+    
+    Args:
+        steps: Setup steps to check
+        
+    Raises:
+        ValueError: If the dependency graph is invalid
+    """
+    names = {step.name for step in steps}
+    for step in steps:
+        unknown = set(step.requires) - names
+        if unknown:
+            raise ValueError(f"Step {step.name} requires unknown steps: {', '.join(sorted(unknown))}")
+
+    done: set = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if set(step.requires) <= done]
+        if not ready:
+            raise ValueError(f"Circular step dependencies: {', '.join(s.name for s in remaining)}")
+        done.update(step.name for step in ready)
+        remaining = [step for step in remaining if step.name not in done]
+
+
+def run_setup_steps(domain: str, php_version: str, steps: List[SetupStep],
+                    reload_webserver: bool = True,
+                    max_workers: int = MAX_PARALLEL_STEPS) -> List[SetupStep]:
+    """
+    Run setup steps in dependency order, running independent steps concurrently.
+    
+    When a step fails, no new step is started; steps already running are
+    allowed to finish so they can be rolled back too.
+    
+    Args:
+        domain: Website domain name
+        php_version: PHP version to use for the website
+        steps: Setup steps to run
+        reload_webserver: Whether steps may reload the webserver
+        max_workers: Maximum number of steps running at the same time
+        
+    Returns:
+        List[SetupStep]: Completed steps in completion order
+        
+    Raises:
+        StepFailed: If a step failed or the run was interrupted
+    """
+    validate_setup_steps(steps)
+    kwargs = {"domain": domain, "php_version": php_version, "reload": reload_webserver}
+
+    def run(step: SetupStep) -> None:
+        debug(f"▶️ {domain}: {step.name}")
+        with span(f"step {step.name}", "step"):
+            if step.exclusive:
+                with _exclusive_lock:
+                    _call_step(step.setup, **kwargs)
+            else:
+                _call_step(step.setup, **kwargs)
+
+    completed: List[SetupStep] = []
+    pending = list(steps)
+    running: Dict[Any, SetupStep] = {}
+    failure: Optional[BaseException] = None
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix=f"setup-{domain}") as executor:
+        try:
+            while pending or running:
+                done_names = {step.name for step in completed}
+                if failure is None:
+                    for step in [s for s in pending if set(s.requires) <= done_names]:
+                        pending.remove(step)
+                        running[executor.submit(run, step)] = step
+                if not running:
+                    break
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    exc = future.exception()
+                    if exc is None:
+                        completed.append(step)
+                    elif failure is None:
+                        error(f"❌ Step {step.name} failed for {domain}: {exc}")
+                        failure = exc
+        except (KeyboardInterrupt, EOFError) as e:
+            failure = e
+            # Let running steps finish so they can be rolled back
+            for future, step in running.items():
+                if future.exception() is None:
+                    completed.append(step)
+
+    if failure is not None:
+        raise StepFailed(completed, failure)
+    return completed
+
 
 @log_call
-def create_website(domain: str, php_version: str) -> bool:
+def create_website(domain: str, php_version: str, reload_webserver: bool = True) -> bool:
     """
     Create a new website with the specified domain and PHP version.
     
     This function orchestrates all the steps needed to create a fully functional
     website, including directory structure, PHP container, database, and NGINX configuration.
+    Independent steps such as the image pull, database creation and SSL
+    certificate run concurrently.
     
     Args:
         domain: Website domain name
         php_version: PHP version to use for the website
+        reload_webserver: Whether to reload the webserver for the new vhost
+            (batch creation reloads once at the end instead)
         
     Returns:
         bool: True if website creation was successful, False otherwise
@@ -35,26 +161,19 @@ def create_website(domain: str, php_version: str) -> bool:
         warn(f"⚠️ Website {domain} already exists.")
         return False
 
-    completed_steps = []
     try:
-        for setup_func, cleanup_func in WEBSITE_SETUP_ACTIONS:
-            sig = inspect.signature(setup_func)
-            if len(sig.parameters) == 2:
-                setup_func(domain, php_version)
-            elif len(sig.parameters) == 1:
-                setup_func(domain)
-            else:
-                raise ValueError(f"Unexpected number of parameters for {setup_func.__name__}")
-            completed_steps.append((setup_func, cleanup_func))
+        run_setup_steps(domain, php_version, WEBSITE_SETUP_STEPS, reload_webserver)
         success(f"✅ Website {domain} has been created successfully.")
         return True
-    except (KeyboardInterrupt, EOFError):
-        error("❌ Website creation cancelled (Ctrl+C or Ctrl+Z).")
-        cleanup_website_partial(domain, completed_steps)
+    except StepFailed as e:
+        if isinstance(e.cause, (KeyboardInterrupt, EOFError)):
+            error("❌ Website creation cancelled (Ctrl+C or Ctrl+Z).")
+        else:
+            error(f"❌ Error creating website: {e}")
+        cleanup_website_partial(domain, [(step.setup, step.cleanup) for step in e.completed])
         return False
     except Exception as e:
         error(f"❌ Error creating website: {e}")
-        cleanup_website_partial(domain, completed_steps)
         return False
 
 
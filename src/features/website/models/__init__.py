@@ -8,6 +8,7 @@ including site details, database settings, and backup information.
 from src.features.website.models.site_config import (
     SiteConfig,
     SiteLogs,
+    SiteLogRotate,
     SiteMySQL,
     SitePHP,
     SiteBackup,
@@ -19,6 +20,7 @@ from src.features.website.models.site_config import (
 __all__ = [
     'SiteConfig',
     'SiteLogs',
+    'SiteLogRotate',
     'SiteMySQL',
     'SitePHP',
     'SiteBackup',
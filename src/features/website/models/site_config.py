@@ -19,6 +19,17 @@ class SiteLogs:
     php_slow: Optional[str] = None
 
 
+@dataclass
+class SiteLogRotate:
+    """Log rotation policy for a website."""
+
+    enabled: bool = True
+    max_size_mb: int = 50         # Rotate once a log grows past this size
+    interval_days: int = 1        # Rotate non-empty logs at least this often
+    keep: int = 7                 # Number of rotated generations to keep
+    compress: bool = True         # Gzip generations older than <log>.1
+
+
 @dataclass
 class SiteMySQL:
     """MySQL database configuration for a website."""
@@ -35,6 +46,7 @@ class SitePHP:
     php_version: str
     php_container: Optional[str] = None
     php_installed_extensions: Optional[List[str]] = None
+    php_previous_version: Optional[str] = None
 
 
 @dataclass
@@ -99,3 +111,4 @@ class SiteConfig:
     php: Optional[SitePHP] = None
     backup: Optional[SiteBackup] = None
     wordpress: Optional[WordPressConfig] = None
+    log_rotate: Optional[SiteLogRotate] = None
@@ -9,8 +9,6 @@ import os
 import jsons
 from typing import Dict, List, Optional, Any
 
-from questionary import select
-
 from src.common.logging import log_call, debug, info, warn, error
 from src.common.config.manager import ConfigManager
 from src.common.containers.container import Container
@@ -74,44 +72,44 @@ def is_website_running(domain: str) -> str:
     return "✅ Running"
 
 
-def calculate_php_fpm_values() -> Dict[str, Any]:
+def get_resource_profile(total_ram: int, total_cpu: int) -> Dict[str, Any]:
     """
-    Calculate PHP-FPM settings based on server resources.
+    Get PHP-FPM sizing parameters for a server resource group.
     
+    Args:
+        total_ram: Total RAM in MB
+        total_cpu: Number of CPU cores
+        
     Returns:
-        Dictionary with calculated PHP-FPM configuration values
+        Dictionary with reserved RAM, average worker size, pm mode and CPU multiplier
     """
-    total_ram = get_total_ram_mb()  # MB
-    total_cpu = get_total_cpu_cores()  # Number of cores
-
     # Determine server resource group
     is_low = total_cpu < 2 or total_ram < 2048
     is_high = total_cpu >= 8 and total_ram >= 8192
-    is_medium = not is_low and not is_high
 
     # Set parameters according to resource group
     if is_low:
-        reserved_ram = 384
-        avg_process_size = 40
-        pm_mode = "ondemand"
-        cpu_multiplier = 3
-    elif is_medium:
-        reserved_ram = 512
-        avg_process_size = 50
-        pm_mode = "ondemand"
-        cpu_multiplier = 5
-    else:  # is_high
-        reserved_ram = 1024
-        avg_process_size = 60
-        pm_mode = "dynamic"
-        cpu_multiplier = 8
-
-    available_ram = total_ram - reserved_ram
-    ram_based_max = available_ram // avg_process_size
-    cpu_based_max = total_cpu * cpu_multiplier
-    max_children = min(ram_based_max, cpu_based_max)
-    max_children = max(max_children, 4)
+        return {"reserved_ram": 384, "avg_process_size": 40,
+                "pm_mode": "ondemand", "cpu_multiplier": 3}
+    if not is_high:
+        return {"reserved_ram": 512, "avg_process_size": 50,
+                "pm_mode": "ondemand", "cpu_multiplier": 5}
+    return {"reserved_ram": 1024, "avg_process_size": 60,
+            "pm_mode": "dynamic", "cpu_multiplier": 8}
 
+
+def calculate_spare_servers(pm_mode: str, max_children: int, total_cpu: int) -> Dict[str, int]:
+    """
+    Calculate PHP-FPM spare server settings for a pool size.
+    
+    Args:
+        pm_mode: Process manager mode
+        max_children: Maximum number of workers
+        total_cpu: Number of CPU cores
+        
+    Returns:
+        Dictionary with start_servers, min_spare_servers and max_spare_servers
+    """
     if pm_mode == "dynamic":
         start_servers = min(total_cpu + 2, max_children)
         min_spare_servers = min(total_cpu, start_servers)
@@ -121,15 +119,52 @@ def calculate_php_fpm_values() -> Dict[str, Any]:
         min_spare_servers = 0
         max_spare_servers = min(total_cpu * 2, max_children)
 
-    min_spare_servers = max(min_spare_servers, 1)
-    max_spare_servers = max(max_spare_servers, 2)
+    return {
+        "start_servers": start_servers,
+        "min_spare_servers": max(min_spare_servers, 1),
+        "max_spare_servers": max(max_spare_servers, 2),
+    }
+
+
+def calculate_php_fpm_values(site_count: int = 1) -> Dict[str, Any]:
+    """
+    Calculate PHP-FPM settings based on server resources.
+    
+    The RAM available to PHP is shared between all websites, so each one is
+    sized against an equal share. Workers are assumed to be the size measured
+    on this host by the worker memory sampler, falling back to the resource
+    group default before anything was sampled. The capacity planner in
+    src.features.php.capacity later rebalances the shares by traffic.
+    
+    Args:
+        site_count: Number of websites sharing the server, including the new one
+        
+    Returns:
+        Dictionary with calculated PHP-FPM configuration values
+    """
+    total_ram = get_total_ram_mb()  # MB
+    total_cpu = get_total_cpu_cores()  # Number of cores
+    profile = get_resource_profile(total_ram, total_cpu)
+    pm_mode = profile["pm_mode"]
+
+    # Import here to avoid circular imports
+    from src.features.php.worker_memory import get_measured_worker_mb
+    avg_process_size = get_measured_worker_mb() or profile["avg_process_size"]
+
+    available_ram = (total_ram - profile["reserved_ram"]) // max(site_count, 1)
+    ram_based_max = int(available_ram // avg_process_size)
+    cpu_based_max = total_cpu * profile["cpu_multiplier"]
+    max_children = min(ram_based_max, cpu_based_max)
+    max_children = max(max_children, 4 if site_count <= 1 else 2)
+    if site_count > 1:
+        # Shared servers keep idle sites from holding workers
+        pm_mode = "ondemand"
 
     return {
         "pm_mode": pm_mode,
         "max_children": max_children,
-        "start_servers": start_servers,
-        "min_spare_servers": min_spare_servers,
-        "max_spare_servers": max_spare_servers,
+        **calculate_spare_servers(pm_mode, max_children, total_cpu),
+        "avg_process_size": round(avg_process_size),
         "total_cpu": total_cpu,
         "total_ram": total_ram,
     }
@@ -163,10 +198,11 @@ def ensure_www_data_ownership(container_name: str, path_in_container: str) -> No
         container_name: Name of the container
         path_in_container: Path inside the container
     """
-    container = Container(name=container_name)
+    from src.common.containers.ownership import fix_ownership
+
     debug(f"🔍 Checking ownership at {path_in_container} in container {container_name}")
-    container.exec(["chown", "-R", "www-data:www-data", path_in_container], user="root")
-    info(f"✅ Ensured www-data ownership for {path_in_container} in container {container_name}")
+    if fix_ownership(container_name, path_in_container) is not None:
+        info(f"✅ Ensured www-data ownership for {path_in_container} in container {container_name}")
 
 
 def get_site_config(domain: str) -> Optional[Any]:
@@ -251,6 +287,8 @@ def select_website(message: str = "Select website:", default: Optional[str] = No
     Returns:
         Selected domain name or None if cancelled
     """
+    from questionary import select
+
     websites = website_list()
     if not websites:
         warn("No websites found.")
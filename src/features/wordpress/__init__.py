@@ -5,43 +5,30 @@ This package provides functionality for managing WordPress installations,
 including installation, configuration, and plugin/theme management.
 """
 
-# Core utilities
-from src.features.wordpress.utils import run_wp_cli, get_php_container_name, run_wpcli_in_wpcli_container
+from src.common.utils.lazy import lazy_exports
 
-# Installation and management
-from src.features.wordpress.installer import install_wordpress, uninstall_wordpress
-from src.features.wordpress.actions import (
-    download_core,
-    configure_db,
-    core_install,
-    fix_permissions,
-    verify_installation
-)
-
-# CLI interfaces
-from src.features.wordpress.cli import (
-    cli_install_wordpress,
-    cli_run_wp_command,
-    cli_uninstall_wordpress
-)
-
-__all__ = [
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
     # Core utilities
-    'run_wp_cli',
-    'get_php_container_name',
-    'run_wpcli_in_wpcli_container',
-    
+    "src.features.wordpress.utils": [
+        "run_wp_cli",
+        "get_php_container_name",
+        "run_wpcli_in_wpcli_container",
+    ],
+    "src.features.wordpress.batch": ["WpCliResult", "run_wpcli_batch", "run_wpcli_commands"],
     # Installation and management
-    'install_wordpress',
-    'uninstall_wordpress',
-    'download_core',
-    'configure_db',
-    'core_install',
-    'fix_permissions',
-    'verify_installation',
-    
+    "src.features.wordpress.installer": ["install_wordpress", "uninstall_wordpress"],
+    "src.features.wordpress.actions": [
+        "download_core",
+        "configure_db",
+        "core_install",
+        "fix_permissions",
+        "verify_installation",
+    ],
     # CLI interfaces
-    'cli_install_wordpress',
-    'cli_run_wp_command',
-    'cli_uninstall_wordpress'
-]
\ No newline at end of file
+    "src.features.wordpress.cli": [
+        "cli_install_wordpress",
+        "cli_run_wp_command",
+        "cli_uninstall_wordpress",
+        "cli_wp_batch",
+    ],
+})
@@ -0,0 +1,276 @@
+"""
+Run WP-CLI commands across many websites.
+
+Each WP-CLI call is one ``docker exec`` into the shared WP-CLI container,
+so running a command on every website one after another takes as long as
+all of them together. The batch runner here sends the same command to
+several websites at a time, prints each website's output as soon as it
+finishes and returns one structured result per website.
+
+Every WP-CLI call also starts PHP and loads WordPress from scratch, which
+is most of its run time. run_wpcli_commands runs several commands for one
+website in a single ``wp eval`` process, so a multi-step flow pays for
+that bootstrap once.
+"""
+
+import base64
+import json
+import os
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+from src.common.logging import log_call, debug, info, warn, error
+from src.common.containers.container import Container
+from src.common.tracing import span
+from src.common.utils.environment import env
+from src.features.website.utils import website_list
+
+# Websites a command runs on at the same time
+MAX_PARALLEL_SITES = 4
+
+# Runs each command inside the already bootstrapped WP-CLI process and
+# prints the results as JSON after a marker, past any output WordPress
+# itself produced while loading
+EVAL_BATCH_CODE = """
+$results = [];
+foreach (json_decode(base64_decode('__COMMANDS__'), true) as $command) {
+    $r = WP_CLI::runcommand($command, ['return' => 'all', 'launch' => false, 'exit_error' => false]);
+    $results[] = ['stdout' => $r->stdout, 'stderr' => $r->stderr, 'return_code' => $r->return_code];
+    if ($r->return_code && __STOP_ON_ERROR__) { break; }
+}
+echo "\\n__WPDOCKER_BATCH__" . json_encode($results);
+"""
+EVAL_BATCH_MARKER = "__WPDOCKER_BATCH__"
+
+
+@dataclass
+class WpCliResult:
+    """Outcome of a WP-CLI command on one website."""
+
+    domain: str
+    command: List[str]
+    ok: bool
+    output: str = ""
+    error: str = ""
+    exit_code: Optional[int] = None
+    duration: float = 0.0
+    skipped: bool = False
+    dry_run: bool = False
+
+    @property
+    def data(self) -> Any:
+        """The output parsed as JSON, for commands run with --format=json."""
+        try:
+            return json.loads(self.output) if self.output else None
+        except json.JSONDecodeError:
+            return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "domain": self.domain,
+            "command": "wp " + shlex.join(self.command),
+            "ok": self.ok,
+            "exit_code": self.exit_code,
+            "duration": round(self.duration, 2),
+            "skipped": self.skipped,
+            "dry_run": self.dry_run,
+            "output": self.output,
+            "error": self.error,
+        }
+        data = self.data
+        if data is not None:
+            result["data"] = data
+        return result
+
+
+def get_wpcli_path(domain: str) -> str:
+    """Get the WordPress directory of a website inside the WP-CLI container."""
+    return f"/var/www/html/{domain}/wordpress"
+
+
+def is_wordpress_installed(domain: str) -> bool:
+    """Check whether a website has a configured WordPress install."""
+    return os.path.isfile(os.path.join(env["SITES_DIR"], domain, "wordpress", "wp-config.php"))
+
+
+def exec_wpcli(domain: str, args: List[str]) -> WpCliResult:
+    """
+    Run one WP-CLI command for a website and capture its outcome.
+
+    Unlike run_wpcli_in_wpcli_container, failures keep WP-CLI's error
+    message and exit code.
+
+    Args:
+        domain: Website domain name
+        args: WP-CLI arguments, without the leading "wp"
+
+    Returns:
+        WpCliResult: Outcome of the command
+    """
+    from python_on_whales import DockerClient, DockerException
+
+    started = time.time()
+    result = WpCliResult(domain=domain, command=list(args), ok=False)
+    try:
+        with span(f"wp {args[0] if args else ''}".strip(), "wpcli"):
+            result.output = DockerClient().container.execute(
+                env["WPCLI_CONTAINER_NAME"],
+                ["wp"] + list(args),
+                workdir=get_wpcli_path(domain),
+                tty=False,
+                interactive=False,
+            ) or ""
+        result.ok = True
+        result.exit_code = 0
+    except DockerException as e:
+        result.exit_code = e.return_code
+        result.output = (e.stdout or "").strip()
+        result.error = (e.stderr or "").strip() or str(e)
+    except Exception as e:
+        result.error = str(e)
+    result.duration = time.time() - started
+    debug(f"WP-CLI on {domain} finished in {result.duration:.1f}s (ok={result.ok})")
+    return result
+
+
+def print_wpcli_result(result: WpCliResult, console: Optional[Console] = None) -> None:
+    """
+    Print the outcome of a WP-CLI command on one website.
+
+    Args:
+        result: Result to print
+        console: Console to print to
+    """
+    console = console or Console()
+    if result.skipped:
+        console.print(f"[yellow]⏭  {result.domain}[/yellow] {result.error}")
+        return
+    if result.dry_run:
+        console.print(f"[cyan]🔍 {result.domain}[/cyan] would run: wp {shlex.join(result.command)}")
+        return
+
+    mark = "[green]✔[/green]" if result.ok else "[red]✘[/red]"
+    console.print(f"{mark} [bold]{result.domain}[/bold] [dim]({result.duration:.1f}s)[/dim]")
+    if result.output:
+        console.print(result.output, markup=False, highlight=False)
+    if result.error:
+        console.print(result.error, style="red", markup=False, highlight=False)
+
+
+@log_call
+def run_wpcli_batch(args: List[str], domains: Optional[List[str]] = None,
+                    parallel: int = MAX_PARALLEL_SITES, dry_run: bool = False,
+                    on_result: Optional[Callable[[WpCliResult], None]] = None) -> List[WpCliResult]:
+    """
+    Run a WP-CLI command on many websites with bounded concurrency.
+
+    Websites without a WordPress install are skipped.
+
+    Args:
+        args: WP-CLI arguments, without the leading "wp"
+        domains: Websites to run on (all websites if None)
+        parallel: Maximum number of websites the command runs on at the same time
+        dry_run: Whether to only report what would run
+        on_result: Called with each result as soon as it is available
+
+    Returns:
+        List[WpCliResult]: One result per website, in the order of domains
+    """
+    domains = list(domains) if domains is not None else website_list()
+    results: Dict[str, WpCliResult] = {}
+    todo = []
+    for domain in domains:
+        if not is_wordpress_installed(domain):
+            results[domain] = WpCliResult(domain=domain, command=list(args), ok=False,
+                                          skipped=True, error="WordPress is not installed")
+        elif dry_run:
+            results[domain] = WpCliResult(domain=domain, command=list(args), ok=True,
+                                          dry_run=True)
+        else:
+            todo.append(domain)
+        if domain in results and on_result:
+            on_result(results[domain])
+
+    if todo:
+        container_name = env["WPCLI_CONTAINER_NAME"]
+        if not Container(name=container_name).running():
+            error(f"❌ WP-CLI container {container_name} is not running.")
+            for domain in todo:
+                results[domain] = WpCliResult(domain=domain, command=list(args), ok=False,
+                                              error=f"{container_name} is not running")
+            return [results[domain] for domain in domains]
+
+        info(f"🚀 Running 'wp {shlex.join(args)}' on {len(todo)} website(s), "
+             f"{max(1, parallel)} at a time...")
+        with ThreadPoolExecutor(max_workers=max(1, parallel), thread_name_prefix="wpcli") as executor:
+            futures = {executor.submit(exec_wpcli, domain, args): domain for domain in todo}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.domain] = result
+                if on_result:
+                    on_result(result)
+
+    ordered = [results[domain] for domain in domains]
+    failed = [r.domain for r in ordered if not r.ok and not r.skipped]
+    if failed:
+        warn(f"⚠️ WP-CLI failed on {len(failed)} website(s): {', '.join(failed)}")
+    return ordered
+
+
+@log_call
+def run_wpcli_commands(domain: str, commands: List[List[str]],
+                       stop_on_error: bool = True) -> Optional[List[WpCliResult]]:
+    """
+    Run several WP-CLI commands for a website in one WP-CLI process.
+
+    WordPress is loaded once and every command runs against it, so commands
+    that must run before WordPress loads (e.g. "core download") and commands
+    added by a plugin activated earlier in the same batch are not supported.
+
+    Args:
+        domain: Website domain name
+        commands: WP-CLI commands, each a list of arguments without the leading "wp"
+        stop_on_error: Whether to skip the remaining commands after one fails
+
+    Returns:
+        Optional[List[WpCliResult]]: One result per command that ran, or None
+        if WP-CLI itself could not run
+    """
+    if not commands:
+        return []
+    encoded = base64.b64encode(json.dumps([shlex.join(c) for c in commands]).encode()).decode()
+    code = (EVAL_BATCH_CODE.replace("__COMMANDS__", encoded)
+            .replace("__STOP_ON_ERROR__", "true" if stop_on_error else "false"))
+
+    batch = exec_wpcli(domain, ["eval", code])
+    _, marker, payload = batch.output.rpartition(EVAL_BATCH_MARKER)
+    if not marker:
+        error(f"❌ WP-CLI batch failed for {domain}: {batch.error or batch.output}")
+        return None
+    try:
+        raw_results = json.loads(payload)
+    except json.JSONDecodeError as e:
+        error(f"❌ Unexpected WP-CLI batch output for {domain}: {e}")
+        return None
+
+    share = batch.duration / max(1, len(raw_results))
+    results = []
+    for command, raw in zip(commands, raw_results):
+        exit_code = raw.get("return_code") or 0
+        results.append(WpCliResult(
+            domain=domain,
+            command=list(command),
+            ok=exit_code == 0,
+            output=(raw.get("stdout") or "").strip(),
+            error=(raw.get("stderr") or "").strip(),
+            exit_code=exit_code,
+            duration=share,
+        ))
+    debug(f"Ran {len(results)} of {len(commands)} WP-CLI command(s) for {domain} "
+          f"in {batch.duration:.1f}s")
+    return results
@@ -5,13 +5,10 @@ This package provides command-line interfaces for installing, managing,
 and uninstalling WordPress installations.
 """
 
-from src.features.wordpress.cli.install import cli_install_wordpress
-from src.features.wordpress.cli.manage import cli_run_wp_command, cli_uninstall_wordpress
-from src.features.wordpress.cli.main import main
+from src.common.utils.lazy import lazy_exports
 
-__all__ = [
-    'cli_install_wordpress',
-    'cli_run_wp_command',
-    'cli_uninstall_wordpress',
-    'main'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "src.features.wordpress.cli.install": ["cli_install_wordpress"],
+    "src.features.wordpress.cli.manage": ["cli_run_wp_command", "cli_uninstall_wordpress"],
+    "src.features.wordpress.cli.batch": ["cli_wp_batch"],
+})
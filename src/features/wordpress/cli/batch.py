@@ -0,0 +1,70 @@
+"""
+CLI interface for running WP-CLI commands on many websites.
+
+This module provides a command-line interface for fanning a WP-CLI command
+out across several websites, with streamed output and JSON results.
+"""
+
+import json
+import shlex
+from typing import List, Optional
+
+from rich.console import Console
+
+from src.common.logging import log_call, info, error, success
+from src.features.wordpress.batch import (
+    MAX_PARALLEL_SITES,
+    print_wpcli_result,
+    run_wpcli_batch
+)
+
+
+@log_call
+def cli_wp_batch(args: List[str], domains: Optional[List[str]] = None,
+                 parallel: int = MAX_PARALLEL_SITES, dry_run: bool = False,
+                 json_output: bool = False) -> bool:
+    """
+    Run a WP-CLI command on several websites.
+
+    Args:
+        args: WP-CLI arguments, without the leading "wp"
+        domains: Websites to run on (all websites if None)
+        parallel: Maximum number of websites the command runs on at the same time
+        dry_run: Whether to only report what would run
+        json_output: Whether to print JSON results instead of streaming output
+
+    Returns:
+        bool: True if the command succeeded on every website it ran on
+    """
+    if args and args[0] == "wp":
+        args = args[1:]
+    if not args:
+        error("❌ No WP-CLI command given.")
+        return False
+
+    try:
+        console = Console()
+        results = run_wpcli_batch(
+            args, domains, parallel, dry_run,
+            on_result=None if json_output else lambda r: print_wpcli_result(r, console))
+    except Exception as e:
+        error(f"❌ Error running WP-CLI batch: {e}")
+        return False
+
+    if json_output:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+
+    ran = [r for r in results if not r.skipped]
+    failed = [r for r in ran if not r.ok]
+    if not json_output:
+        skipped = len(results) - len(ran)
+        summary = f"{len(ran) - len(failed)}/{len(ran)} succeeded"
+        if skipped:
+            summary += f", {skipped} skipped"
+        if failed:
+            error(f"❌ wp {shlex.join(args)}: {summary}")
+        elif dry_run:
+            info(f"🔍 Dry run: {len(ran)} website(s) would run wp {shlex.join(args)}")
+        else:
+            success(f"✅ wp {shlex.join(args)}: {summary}")
+    return not failed
@@ -10,9 +10,12 @@ import argparse
 from typing import List, Optional
 
 from src.common.logging import log_call, info, warn, error, success
+from src.common.profiling import profiled
 from src.features.wordpress.cli.install import cli_install_wordpress
 from src.features.wordpress.cli.manage import cli_run_wp_command, cli_uninstall_wordpress
 from src.features.wordpress.cli.protect import cli_toggle_wp_login_protection
+from src.features.wordpress.cli.batch import cli_wp_batch
+from src.features.wordpress.batch import MAX_PARALLEL_SITES
 from src.features.wordpress.utils import show_wp_user_list, reset_wp_user_password, get_wp_user_info, get_wp_roles, reset_wp_user_role
 
 
@@ -89,9 +92,50 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         help="Website domain (nếu bỏ trống sẽ chọn từ danh sách)"
     )
 
+    # Run a WP-CLI command on many websites
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run a WP-CLI command on several websites at once",
+        description="Run a WP-CLI command on several websites at once, "
+                    "e.g.: wordpress batch --all plugin update --all"
+    )
+    batch_target = batch_parser.add_mutually_exclusive_group(required=True)
+    batch_target.add_argument(
+        "--sites",
+        help="Comma-separated list of website domains"
+    )
+    batch_target.add_argument(
+        "--all",
+        dest="all_sites",
+        action="store_true",
+        help="Run on every website"
+    )
+    batch_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=MAX_PARALLEL_SITES,
+        help=f"Websites processed at the same time (default: {MAX_PARALLEL_SITES})"
+    )
+    batch_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would run without running it"
+    )
+    batch_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON"
+    )
+    batch_parser.add_argument(
+        "wp_args",
+        nargs=argparse.REMAINDER,
+        help="WP-CLI command, without the leading 'wp'"
+    )
+
     return parser.parse_args(args)
 
 
+@profiled("wordpress")
 @log_call
 def main(args: Optional[List[str]] = None) -> int:
     """
@@ -119,6 +163,13 @@ def main(args: Optional[List[str]] = None) -> int:
     elif parsed_args.command == "wp":
         return 0 if cli_run_wp_command() else 1
 
+    elif parsed_args.command == "batch":
+        domains = None
+        if parsed_args.sites:
+            domains = [d.strip() for d in parsed_args.sites.split(",") if d.strip()]
+        return 0 if cli_wp_batch(parsed_args.wp_args, domains, parsed_args.parallel,
+                                 parsed_args.dry_run, parsed_args.json) else 1
+
     elif parsed_args.command == "uninstall":
         return 0 if cli_uninstall_wordpress() else 1
 
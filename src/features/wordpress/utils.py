@@ -11,6 +11,7 @@ from passlib.hash import apr_md5_crypt
 
 from src.common.logging import log_call, debug, info, error, success
 from src.common.containers.container import Container
+from src.common.tracing import span
 from src.common.utils.environment import env
 from src.common.utils.password import strong_password
 from src.features.cache.constants import CACHE_PLUGINS as CACHE_PLUGINS_DICT
@@ -116,7 +117,8 @@ def run_wpcli_in_wpcli_container(domain: str, args: List[str]) -> Optional[str]:
     wp_path = f"/var/www/html/{domain}/wordpress"
     try:
         cmd = ["wp"] + args
-        result = container.exec(cmd, workdir=wp_path)
+        with span(f"wp {args[0] if args else ''}".strip(), "wpcli"):
+            result = container.exec(cmd, workdir=wp_path)
         debug(f"WP CLI (WPCLI container) Output: {result}")
         return result
     except Exception as e:
@@ -124,33 +126,80 @@ def run_wpcli_in_wpcli_container(domain: str, args: List[str]) -> Optional[str]:
         return None
 
 
-def deactivate_all_cache_plugins(domain: str) -> bool:
+def get_active_cache_plugins(domain: str) -> List[str]:
     """
-    Deactivate all common cache plugins for a given WordPress domain using WP CLI container.
-    Chỉ deactivate nếu plugin cache thực sự đang active.
+    Get the cache plugins that are active on a website.
     """
-    # Lấy danh sách plugin cache từ constants (dạng dict)
     cache_plugin_slugs = set()
     for v in CACHE_PLUGINS_DICT.values():
         cache_plugin_slugs.update(v)
-    # Lấy danh sách plugin đang active
-    active_plugins = set(get_active_plugins(domain))
-    # Lọc ra các plugin cache đang active
-    active_cache_plugins = active_plugins.intersection(cache_plugin_slugs)
+    return sorted(set(get_active_plugins(domain)).intersection(cache_plugin_slugs))
+
+
+def deactivate_all_cache_plugins(domain: str) -> bool:
+    """
+    Deactivate all common cache plugins for a given WordPress domain using WP CLI container.
+    Chỉ deactivate nếu plugin cache thực sự đang active.
+    """
+    active_cache_plugins = get_active_cache_plugins(domain)
     if not active_cache_plugins:
         info(f"Không có plugin cache nào đang active cho {domain}")
         return True
-    for plugin in active_cache_plugins:
-        result = run_wpcli_in_wpcli_container(
-            domain, ["plugin", "deactivate", plugin])
-        if result is None:
-            error(
-                f"Failed to deactivate {plugin} (may not be installed or another error)")
+    result = run_wpcli_in_wpcli_container(
+        domain, ["plugin", "deactivate"] + active_cache_plugins)
+    if result is None:
+        error(
+            f"Failed to deactivate {', '.join(active_cache_plugins)} (may not be installed or another error)")
     info(
         f"Đã deactivate các plugin cache đang active cho {domain}: {', '.join(active_cache_plugins)}")
     return True
 
 
+@log_call
+def switch_cache_plugins(domain: str, plugin_slugs: List[str]) -> bool:
+    """
+    Replace the active cache plugins of a website with the given ones.
+
+    The active cache plugins are deactivated and the new ones installed and
+    activated in a single WP-CLI process.
+
+    Args:
+        domain: Website domain name
+        plugin_slugs: Plugins to install and activate (none to only deactivate)
+
+    Returns:
+        bool: True if every new plugin is active, False otherwise
+    """
+    from src.features.wordpress.batch import run_wpcli_commands
+
+    commands = []
+    active_cache_plugins = [p for p in get_active_cache_plugins(domain) if p not in plugin_slugs]
+    if active_cache_plugins:
+        commands.append(["plugin", "deactivate"] + active_cache_plugins)
+    commands.extend(["plugin", "install", slug, "--activate"] for slug in plugin_slugs)
+    if not commands:
+        return True
+
+    results = run_wpcli_commands(domain, commands, stop_on_error=False)
+    if results is None:
+        return False
+    if active_cache_plugins:
+        deactivated = results.pop(0)
+        if deactivated.ok:
+            info(f"Đã deactivate các plugin cache đang active cho {domain}: "
+                 f"{', '.join(active_cache_plugins)}")
+        else:
+            error(f"Failed to deactivate {', '.join(active_cache_plugins)}: {deactivated.error}")
+    ok = True
+    for slug, result in zip(plugin_slugs, results):
+        if result.ok:
+            info(f"Installed and activated plugin: {slug}")
+        else:
+            error(f"Failed to install/activate {slug}: {result.error}")
+            ok = False
+    return ok
+
+
 def install_and_activate_plugin(domain: str, plugin_slug: str) -> bool:
     """
     Install and activate a plugin for a given WordPress domain using WP CLI container.
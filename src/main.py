@@ -9,6 +9,7 @@ initializing the environment and starting the menu system.
 import sys
 
 from src.common.logging import info, error, debug, enable_exception_hook, success
+from src.common.profiling import profile_command
 from src.common.utils.environment import env, env_required
 from src.core.init import initialize_system
 from src.core.loader import load_core
@@ -222,29 +223,24 @@ def show_main_menu() -> bool:
     ).ask()
 
     # Handle the selection
-    if answer == "1":
-        handle_website_menu()
-    elif answer == "2":
-        handle_ssl_menu()
-    elif answer == "3":
-        handle_system_menu()
-    elif answer == "4":
-        handle_cloud_menu()
-    elif answer == "5":
-        handle_wordpress_menu()
-    elif answer == "6":
-        handle_backup_menu()
-    elif answer == "7":
-        handle_wp_cache_menu()
-    elif answer == "8":
-        handle_php_menu()
-    elif answer == "9":
-        handle_mysql_menu()
-    elif answer == "10":
-        handle_update_menu()
-    elif answer == "0":
+    handlers = {
+        "1": handle_website_menu,
+        "2": handle_ssl_menu,
+        "3": handle_system_menu,
+        "4": handle_cloud_menu,
+        "5": handle_wordpress_menu,
+        "6": handle_backup_menu,
+        "7": handle_wp_cache_menu,
+        "8": handle_php_menu,
+        "9": handle_mysql_menu,
+        "10": handle_update_menu,
+    }
+    if answer == "0":
         success("Exiting WP Docker. Goodbye!")
         return False
+    if answer in handlers:
+        with profile_command(f"menu {handlers[answer].__name__}"):
+            handlers[answer]()
 
     return True
 
@@ -284,7 +280,9 @@ def main() -> None:
     debug(f"Debug mode: {env['DEBUG_MODE']}")
 
     # Step 2: Initialize the system (run bootstraps)
-    if not initialize_system():
+    with profile_command("startup"):
+        initialized = initialize_system()
+    if not initialized:
         error("System initialization failed")
         sys.exit(1)
 
@@ -19,6 +19,7 @@ try:
     from src.common.logging import info, error, success, debug
     from src.common.utils.environment import env, load_environment
     from src.core.containers.compose import Compose
+    from src.core.bootstrap.state import get_latest_snapshot
 except ImportError as e:
     error(f"Error importing project modules: {e}")
     info("Make sure you're running this script from the project root directory")
@@ -63,8 +64,14 @@ def check_and_restart_containers() -> bool:
         
     info("Checking container status...")
     
-    running_containers = get_running_containers()
-    stopped_containers = get_stopped_containers()
+    # Reuse the container list taken during bootstrap when it is recent
+    snapshot = get_latest_snapshot()
+    if snapshot is not None:
+        running_containers = snapshot.running()
+        stopped_containers = snapshot.stopped()
+    else:
+        running_containers = get_running_containers()
+        stopped_containers = get_stopped_containers()
     
     all_running = True
     for container_var in CONTAINERS:
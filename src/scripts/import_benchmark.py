@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Import time benchmark script.
+
+This script imports the modules that cron and the menu start from, each in
+a fresh interpreter with ``python -X importtime``, and checks their
+cumulative import time against a budget. Every cron job starts a new
+process, so a feature package that loads docker, prompt or HTTP libraries
+at import time slows down every job. The script exits with status 1 when a
+module is over its budget or cannot be imported; the nightly workflow runs
+it as a separate job. Wall-clock numbers vary between machines, so it is
+not part of the test suite.
+
+Usage:
+    python3 -m src.scripts.import_benchmark
+    python3 -m src.scripts.import_benchmark --module src.features.ssl.cli.main --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from src.features.cron.job_registry import RUNNER_CLASSES
+
+# Budgets in milliseconds of cumulative import time
+CRON_CLI_BUDGET_MS = 300
+CRON_RUNNER_BUDGET_MS = 400
+MENU_BUDGET_MS = 1000
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@dataclass
+class ImportTiming:
+    """Import time of one module against its budget."""
+
+    module: str
+    budget_ms: int
+    time_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.time_ms is not None and self.time_ms <= self.budget_ms
+
+
+def get_default_budgets() -> Dict[str, int]:
+    """
+    Get the import time budget of the cron entry point, each cron runner and the menu.
+
+    Returns:
+        Dict[str, int]: Budget in milliseconds, by module
+    """
+    budgets = {"src.features.cron.cli": CRON_CLI_BUDGET_MS}
+    for path in RUNNER_CLASSES.values():
+        budgets[path.rsplit(".", 1)[0]] = CRON_RUNNER_BUDGET_MS
+    budgets["src.main"] = MENU_BUDGET_MS
+    return budgets
+
+
+def measure_import_time(module: str, runs: int = 3) -> float:
+    """
+    Measure the cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module: Module to import
+        runs: Number of measurements; the fastest one is kept
+
+    Returns:
+        float: Import time in milliseconds
+
+    Raises:
+        RuntimeError: If the module cannot be imported
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    best = None
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env)
+        if result.returncode != 0:
+            last_lines = result.stderr.strip().splitlines()[-1:]
+            raise RuntimeError(last_lines[0] if last_lines else f"exit code {result.returncode}")
+        # Lines look like "import time: <self us> | <cumulative us> | <indent><module>"
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module and not parts[2][1:].startswith(" "):
+                cumulative = int(parts[1]) / 1000
+                best = cumulative if best is None else min(best, cumulative)
+                break
+    if best is None:
+        raise RuntimeError(f"{module} was already imported by the interpreter")
+    return best
+
+
+def run_benchmark(budgets: Dict[str, int], runs: int = 3) -> List[ImportTiming]:
+    """
+    Measure every module against its budget.
+
+    Args:
+        budgets: Budget in milliseconds, by module
+        runs: Measurements per module
+
+    Returns:
+        List[ImportTiming]: One timing per module
+    """
+    timings = []
+    for module, budget in budgets.items():
+        timing = ImportTiming(module=module, budget_ms=budget)
+        try:
+            timing.time_ms = measure_import_time(module, runs)
+        except RuntimeError as e:
+            timing.error = str(e)
+        timings.append(timing)
+    return timings
+
+
+def print_benchmark(timings: List[ImportTiming]) -> None:
+    """Print the timings as a table."""
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="⏱️ Import time budget", header_style="bold cyan")
+    table.add_column("Module", style="bold white")
+    table.add_column("Import ms", justify="right")
+    table.add_column("Budget ms", justify="right")
+    table.add_column("Status")
+    for timing in timings:
+        if timing.error:
+            status = f"[red]error: {timing.error}[/red]"
+        elif timing.ok:
+            status = "[green]ok[/green]"
+        else:
+            status = "[red]over budget[/red]"
+        table.add_row(timing.module,
+                      f"{timing.time_ms:.0f}" if timing.time_ms is not None else "-",
+                      str(timing.budget_ms), status)
+    Console().print(table)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check import times against their budget")
+    parser.add_argument("--module", action="append",
+                        help="Module to measure (default: cron entry point, cron runners and menu)")
+    parser.add_argument("--budget", type=int, help="Budget in ms for modules given with --module")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Measurements per module, the fastest is kept (default: 3)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply every budget, e.g. 2 on a slow machine (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Print the timings as JSON")
+    args = parser.parse_args()
+
+    if args.module:
+        defaults = get_default_budgets()
+        budgets = {m: args.budget or defaults.get(m, CRON_RUNNER_BUDGET_MS) for m in args.module}
+    else:
+        budgets = get_default_budgets()
+    budgets = {m: int(budget * args.scale) for m, budget in budgets.items()}
+
+    timings = run_benchmark(budgets, args.runs)
+    if args.json:
+        print(json.dumps([dict(asdict(t), ok=t.ok) for t in timings], indent=2))
+    else:
+        print_benchmark(timings)
+    return 0 if all(t.ok for t in timings) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
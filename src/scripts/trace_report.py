@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Trace report script.
+
+This script reads a trace file written with WPDOCKER_TRACE (or TRACE_FILE
+in core.env) set and prints where the time of each traced command went.
+
+Usage:
+    WPDOCKER_TRACE=/tmp/trace.jsonl python3 -m src.features.ssl.cli.main scan
+    python3 -m src.scripts.trace_report /tmp/trace.jsonl --top 15
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+
+from src.common.logging import error
+from src.common.tracing import load_spans, summarize_trace, print_trace_report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-command time breakdown of a trace file")
+    parser.add_argument("trace_file", help="Trace file (JSON lines)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Functions listed per command, by self time (default: 10)")
+    parser.add_argument("--last", type=int, help="Only report the last N commands")
+    parser.add_argument("--json", action="store_true", help="Print the breakdown as JSON")
+    args = parser.parse_args()
+
+    try:
+        commands = summarize_trace(load_spans(args.trace_file))
+    except OSError as e:
+        error(f"Cannot read trace file: {e}")
+        return 1
+
+    if args.last:
+        commands = commands[-args.last:]
+    if args.json:
+        print(json.dumps([asdict(c) for c in commands], indent=2))
+    else:
+        print_trace_report(commands, top=args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src.common.utils.environment import env
+from src.common.utils.incremental_reader import IncrementalReader
+from src.features.nginx.analytics.access_log import parse_access_line
+from src.features.nginx.analytics.cache_stats import AccessLogAnalyzer, LatencyHistogram
+
+
+def json_line(**fields):
+    entry = {"msec": "1792000000.123", "remote_addr": "203.0.113.5", "method": "GET",
+             "uri": "/blog/?page=2", "status": "200", "bytes": "5120", "host": "example.com",
+             "request_time": "0.120", "upstream_response_time": "0.100", "cache": "MISS"}
+    entry.update(fields)
+    return json.dumps(entry) + "\n"
+
+
+def test_parse_json_line():
+    entry = parse_access_line(json_line(upstream_response_time="0.050, 0.025"))
+
+    assert entry.timestamp == pytest.approx(1792000000.123)
+    assert entry.method == "GET"
+    assert entry.path == "/blog/"
+    assert entry.status == 200
+    assert entry.bytes == 5120
+    assert entry.request_time == pytest.approx(0.12)
+    assert entry.upstream_response_time == pytest.approx(0.075)
+    assert entry.cache_status == "MISS"
+    assert not entry.is_cached
+
+
+def test_parse_json_line_without_upstream():
+    entry = parse_access_line(json_line(upstream_response_time="-", cache="HIT"))
+
+    assert entry.upstream_response_time is None
+    assert entry.is_cached
+
+
+def test_parse_combined_line():
+    line = ('198.51.100.7 - - [18/Oct/2026:14:00:01 +0000] "GET /about HTTP/1.1" 404 - '
+            '"https://example.com/" "curl/8.0"\n')
+
+    entry = parse_access_line(line)
+
+    assert entry.timestamp == datetime(2026, 10, 18, 14, 0, 1, tzinfo=timezone.utc).timestamp()
+    assert entry.remote_addr == "198.51.100.7"
+    assert entry.uri == "/about"
+    assert entry.status == 404
+    assert entry.bytes == 0
+    assert entry.referer == "https://example.com/"
+    assert entry.user_agent == "curl/8.0"
+    assert entry.cache_status is None
+
+
+@pytest.mark.parametrize("line", ["", "not a log line", "{broken json", '{"status": "200"}'])
+def test_parse_invalid_line(line):
+    assert parse_access_line(line) is None
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in [10] * 90 + [1000] * 10:
+        histogram.add(ms / 1000)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(10, rel=0.1)
+    assert histogram.percentile(95) == pytest.approx(1000, rel=0.1)
+
+
+@pytest.fixture
+def sites_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(env, "SITES_DIR", str(tmp_path / "sites"))
+    os.makedirs(tmp_path / "sites" / "example.com" / "logs")
+    return tmp_path / "sites"
+
+
+def test_analyzer_counts_only_new_lines(sites_dir, tmp_path):
+    log_path = sites_dir / "example.com" / "logs" / "access.log"
+    log_path.write_text(json_line(cache="HIT") + json_line() + "garbage\n")
+
+    analyzer = AccessLogAnalyzer(data_dir=str(tmp_path / "analytics"))
+    stats = analyzer.update_site("example.com")
+    analyzer.save()
+
+    assert stats.requests == 2
+    assert stats.hit_ratio == 0.5
+    assert stats.statuses == {"2xx": 2}
+    assert stats.uncached == {"/blog/": 1}
+
+    with open(log_path, "a") as f:
+        f.write(json_line(cache="HIT", status="304"))
+    analyzer = AccessLogAnalyzer(data_dir=str(tmp_path / "analytics"))
+    stats = analyzer.update_site("example.com")
+
+    assert stats.requests == 3
+    assert stats.cache == {"HIT": 2, "MISS": 1}
+    assert stats.statuses == {"2xx": 2, "3xx": 1}
+
+
+def test_reader_finishes_renamed_file(tmp_path):
+    path = tmp_path / "access.log"
+    path.write_text("a\nb\n")
+    reader = IncrementalReader(str(tmp_path / "offsets.json"))
+    assert list(reader.read_lines(str(path))) == ["a\n", "b\n"]
+
+    with open(path, "a") as f:
+        f.write("c\n")
+    os.rename(path, f"{path}.1")
+    path.write_text("d\n")
+
+    assert list(reader.read_lines(str(path))) == ["c\n", "d\n"]
+
+
+def test_reader_finishes_copytruncated_file(tmp_path):
+    path = tmp_path / "php_error.log"
+    path.write_text("a\nb\n")
+    reader = IncrementalReader(str(tmp_path / "offsets.json"))
+    assert list(reader.read_lines(str(path))) == ["a\n", "b\n"]
+
+    with open(path, "a") as f:
+        f.write("c\n")
+    with open(path, "rb") as src, open(f"{path}.1", "wb") as dst:
+        dst.write(src.read())
+    with open(path, "w") as f:
+        f.write("d\n")
+
+    assert list(reader.read_lines(str(path))) == ["c\n", "d\n"]
+
+
+def test_reader_skips_partial_line(tmp_path):
+    path = tmp_path / "access.log"
+    path.write_text("a\npart")
+    reader = IncrementalReader(str(tmp_path / "offsets.json"))
+    assert list(reader.read_lines(str(path))) == ["a\n"]
+
+    with open(path, "a") as f:
+        f.write("ial\n")
+
+    assert list(reader.read_lines(str(path))) == ["partial\n"]
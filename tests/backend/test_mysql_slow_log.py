@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import pytest
+
+import python_on_whales
+from src.common.utils.environment import env
+from src.features.mysql.analytics.slow_digest import SlowQueryDigest
+from src.features.mysql.analytics.slow_log import fingerprint_query, parse_slow_query_log
+
+MYSQL_LOG = """\
+/usr/sbin/mysqld, Version: 8.0.36 (MySQL Community Server - GPL). started with:
+Tcp port: 3306  Unix socket: /var/run/mysqld/mysqld.sock
+Time                 Id Command    Argument
+# Time: 2026-10-18T14:00:01.123456Z
+# User@Host: wp_user[wp_user] @  [172.18.0.5]  Id:    12
+# Query_time: 2.500000  Lock_time: 0.000100 Rows_sent: 10  Rows_examined: 250000
+use wp_example;
+SET timestamp=1792332001;
+SELECT * FROM wp_posts
+WHERE post_status = 'publish' LIMIT 10;
+# Time: 2026-10-18T14:00:05.000000Z
+# User@Host: wp_user[wp_user] @  [172.18.0.5]  Id:    12
+# Query_time: 1.500000  Lock_time: 0.000000 Rows_sent: 1  Rows_examined: 1000
+SET timestamp=1792332005;
+SELECT option_value FROM wp_options WHERE option_name = 'siteurl';
+"""
+
+MARIADB_LOG = """\
+# User@Host: shop[shop] @  [172.18.0.6]
+# Thread_id: 8  Schema: wp_shop  QC_hit: No
+# Query_time: 3.000000  Lock_time: 0.000050  Rows_sent: 0  Rows_examined: 90000
+SET timestamp=1792332010;
+DELETE FROM wp_options WHERE option_name LIKE '_transient_%';
+"""
+
+
+def test_parse_mysql_log():
+    entries = list(parse_slow_query_log(MYSQL_LOG.splitlines(True)))
+
+    assert len(entries) == 2
+    first, second = entries
+    assert first.start_line == 3
+    assert first.user == "wp_user"
+    assert first.database == "wp_example"
+    assert first.timestamp == 1792332001
+    assert first.query_time == 2.5
+    assert first.rows_examined == 250000
+    assert first.query == "SELECT * FROM wp_posts\nWHERE post_status = 'publish' LIMIT 10;"
+    # The server only writes "use" when the database changes
+    assert second.database == "wp_example"
+    assert second.start_line == 10
+
+
+def test_parse_mariadb_log():
+    entry, = parse_slow_query_log(MARIADB_LOG.splitlines(True), database="wp_other")
+
+    assert entry.user == "shop"
+    assert entry.database == "wp_shop"
+    assert entry.query_time == 3.0
+    assert entry.fingerprint == "delete from wp_options where option_name like ?"
+
+
+@pytest.mark.parametrize("query,fingerprint", [
+    ("SELECT * FROM wp_posts WHERE ID = 42", "select * from wp_posts where id = ?"),
+    ("select a from b where c=-1 and d = -2.5", "select a from b where c=? and d = ?"),
+    ("SELECT x-1 FROM t", "select x-? from t"),
+    ("SELECT * FROM t WHERE id IN (1, 2, 3)", "select * from t where id in (?+)"),
+    ("INSERT INTO t (a, b) VALUES (1, 'x'), (2, 'y');", "insert into t (a, b) values (?+)"),
+    ("SELECT /* cache */ 1 FROM wp_12_posts -- tail", "select ? from wp_?_posts"),
+    ("SELECT   *\n  FROM t WHERE s = \"it's\"", "select * from t where s = ?"),
+])
+def test_fingerprint_query(query, fingerprint):
+    assert fingerprint_query(query) == fingerprint
+
+
+@pytest.fixture
+def slow_log(monkeypatch):
+    log = {"data": b""}
+
+    def execute(container, command, user=None, stream=False):
+        offset = int(command[2].lstrip("+")) - 1
+        return [("stdout", log["data"][offset:])]
+
+    client = SimpleNamespace(container=SimpleNamespace(execute=execute))
+    monkeypatch.setattr(python_on_whales, "DockerClient", lambda: client)
+    monkeypatch.setattr(SlowQueryDigest, "_log_size", lambda self: len(log["data"]))
+    monkeypatch.setitem(env, "MYSQL_CONTAINER_NAME", "mysql")
+    return log
+
+
+def test_digest_waits_for_the_query_of_the_last_entry(slow_log, tmp_path):
+    header, rest = MYSQL_LOG.split("SET timestamp=1792332005;\n")
+    slow_log["data"] = header.encode()
+
+    digest = SlowQueryDigest(data_dir=str(tmp_path))
+    # Only the first entry is known to be complete
+    assert digest.update() == 1
+    assert digest.offset == MYSQL_LOG.index("# Time: 2026-10-18T14:00:05")
+
+    slow_log["data"] = (MYSQL_LOG + MARIADB_LOG).encode()
+    digest = SlowQueryDigest(data_dir=str(tmp_path))
+    assert digest.update() == 1
+
+    options, = [q for q in digest.queries.values() if q.fingerprint.startswith("select option_value")]
+    assert options.count == 1
+    assert options.database == "wp_example"
+    assert options.rows_examined == 1000
+    assert digest.offset == len(MYSQL_LOG)
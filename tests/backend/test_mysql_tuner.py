@@ -0,0 +1,77 @@
+from src.features.mysql.tuner import MB, parse_show_output, recommend_mysql_config
+
+VARIABLES = {
+    "max_connections": "151",
+    "innodb_buffer_pool_size": str(128 * MB),
+    "innodb_log_file_size": str(48 * MB),
+    "tmp_table_size": str(16 * MB),
+    "max_heap_table_size": str(16 * MB),
+    "thread_cache_size": "8",
+    "table_open_cache": "400",
+    "query_cache_size": str(1 * MB),
+    "sort_buffer_size": "262144",
+    "join_buffer_size": "262144",
+    "read_buffer_size": "131072",
+    "read_rnd_buffer_size": "262144",
+    "thread_stack": "262144",
+}
+
+STATUS = {
+    "uptime": "86400",
+    "innodb_buffer_pool_read_requests": "1000000",
+    "innodb_buffer_pool_reads": "5000",
+    "created_tmp_tables": "1000",
+    "created_tmp_disk_tables": "400",
+    "connections": "10000",
+    "threads_created": "500",
+    "max_used_connections": "60",
+    "open_tables": "400",
+    "opened_tables": "2500",
+}
+
+
+def test_parse_show_output():
+    output = "Variable_name\tValue\nMax_connections\t151\nInnodb_buffer_pool_size\t134217728\n"
+
+    assert parse_show_output(output) == {
+        "max_connections": "151",
+        "innodb_buffer_pool_size": "134217728",
+    }
+
+
+def test_recommend_mysql_config():
+    tuning = recommend_mysql_config(VARIABLES, STATUS, total_ram_mb=4096, php_mb=1536,
+                                    php_children=40, redis_mb=256, data_mb=500)
+
+    # 4096 - 1536 PHP - 256 Redis - 256 OS
+    assert tuning.mysql_mb == 2048
+    assert tuning.warnings == []
+    assert tuning.metrics["buffer_pool_hit_rate"] == 0.995
+    assert tuning.metrics["tmp_disk_ratio"] == 0.4
+    recommended = {item.name: item.recommended for item in tuning.items}
+    assert recommended == {
+        "max_connections": 75,                      # 1.25 x peak of 60
+        "innodb_buffer_pool_size": 640 * MB,        # 500MB data + 25%, in 128MB chunks
+        "innodb_log_file_size": 160 * MB,           # a quarter of the buffer pool
+        "tmp_table_size": 32 * MB,                  # doubled, 40% spill to disk
+        "max_heap_table_size": 32 * MB,
+        "thread_cache_size": 30,                    # half the peak, 5% thread misses
+        "table_open_cache": 800,                    # every slot in use
+        "query_cache_size": 0,
+    }
+    static = [item.name for item in tuning.items if not item.dynamic]
+    assert static == ["innodb_log_file_size"]
+
+
+def test_recommend_mysql_config_when_php_takes_the_memory():
+    status = dict(STATUS, uptime="600")
+
+    tuning = recommend_mysql_config(VARIABLES, status, total_ram_mb=2048, php_mb=1800,
+                                    php_children=30)
+
+    assert tuning.mysql_mb == 256
+    assert len(tuning.warnings) == 2
+    recommended = {item.name: item.recommended for item in tuning.items}
+    assert recommended["innodb_buffer_pool_size"] == 128 * MB
+    # 256MB x 25% / 1.125MB session buffers
+    assert recommended["max_connections"] == 56
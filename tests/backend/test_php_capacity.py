@@ -0,0 +1,91 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.common.utils.environment import env
+from src.features.php.capacity import (
+    CapacityPlanner,
+    SiteCapacity,
+    read_fpm_pool,
+    write_fpm_pool
+)
+
+POOL = """[www]
+user = daemon
+pm = ondemand
+pm.max_children = 5
+; tuned by wpdocker
+"""
+
+
+@pytest.fixture
+def planner():
+    # 2 GB / 4 cores is the middle resource group: 5 workers per core at most
+    return CapacityPlanner(total_ram_mb=2048, total_cpu=4, reserved_mb=1024, sampler=MagicMock())
+
+
+def test_plan_shares_ram_by_traffic(planner):
+    busy = SiteCapacity(domain="busy.com", worker_mb=60, busy_seconds=900,
+                        current={"pm": "dynamic", "pm.max_children": "12"})
+    idle = SiteCapacity(domain="idle.com", worker_mb=50)
+
+    planner.plan([busy, idle])
+
+    assert busy.weight == pytest.approx(0.8889, abs=1e-4)
+    assert busy.plan["pm"] == "dynamic"
+    assert busy.plan["pm.max_children"] == 13
+    assert idle.plan["pm"] == "ondemand"
+    assert idle.plan["pm.max_children"] == 3
+    assert busy.budget_mb + idle.budget_mb <= planner.pool_mb + 1e-6
+    # 12 -> 13 workers is below the rebalance threshold
+    assert not busy.changed
+    assert idle.changed
+
+
+def test_plan_caps_workers_per_pool(planner):
+    planner.total_ram_mb = 16384
+    site = SiteCapacity(domain="example.com", worker_mb=40)
+
+    planner.plan([site])
+
+    assert site.plan["pm.max_children"] == planner.max_children_cap == 20
+
+
+def test_plan_keeps_minimum_when_overcommitted(planner):
+    sites = [SiteCapacity(domain=f"site{i}.com", worker_mb=100) for i in range(8)]
+
+    planner.plan(sites)
+
+    assert all(s.plan["pm.max_children"] == 2 for s in sites)
+
+
+@pytest.fixture
+def pool_file(tmp_path, monkeypatch):
+    monkeypatch.setitem(env, "SITES_DIR", str(tmp_path))
+    os.makedirs(tmp_path / "example.com" / "php")
+    path = tmp_path / "example.com" / "php" / "php-fpm.conf"
+    path.write_text(POOL)
+    return path
+
+
+def test_write_fpm_pool_keeps_inode(pool_file):
+    inode = os.stat(pool_file).st_ino
+
+    assert write_fpm_pool("example.com", {"pm": "dynamic", "pm.max_children": 13,
+                                          "pm.start_servers": 6})
+
+    assert os.stat(pool_file).st_ino == inode
+    values = read_fpm_pool("example.com")
+    assert values["pm"] == "dynamic"
+    assert values["pm.max_children"] == "13"
+    assert values["pm.start_servers"] == "6"
+    assert values["user"] == "daemon"
+    assert "; tuned by wpdocker" in pool_file.read_text()
+
+
+def test_write_fpm_pool_rejects_invalid_content(pool_file):
+    pool_file.write_text(POOL + "garbage line\n")
+
+    assert not write_fpm_pool("example.com", {"pm.max_children": 13})
+    assert "pm.max_children = 5" in pool_file.read_text()
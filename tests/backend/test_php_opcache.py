@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from src.common.utils.environment import env
+from src.features.php.cli import opcache as opcache_cli
+from src.features.php.opcache import (
+    CONTAINER_WEB_ROOT,
+    effective_max_files,
+    get_preload_path,
+    read_opcache_ini,
+    select_preload_files,
+    write_php_ini
+)
+
+PHP_INI = """[PHP]
+memory_limit = 256M
+; OPcache
+opcache.memory_consumption=128
+"""
+
+
+@pytest.fixture
+def php_ini(tmp_path, monkeypatch):
+    monkeypatch.setitem(env, "SITES_DIR", str(tmp_path))
+    os.makedirs(tmp_path / "example.com" / "php")
+    path = tmp_path / "example.com" / "php" / "php.ini"
+    path.write_text(PHP_INI)
+    return path
+
+
+@pytest.mark.parametrize("value,expected", [(10000, 16229), (16229, 16229), (5000000, 1048793)])
+def test_effective_max_files(value, expected):
+    assert effective_max_files(value) == expected
+
+
+def test_write_php_ini_keeps_inode(php_ini):
+    inode = os.stat(php_ini).st_ino
+
+    assert write_php_ini("example.com", {"opcache.memory_consumption": 256,
+                                         "opcache.max_accelerated_files": 32531})
+
+    assert os.stat(php_ini).st_ino == inode
+    values = read_opcache_ini("example.com")
+    assert values["opcache.memory_consumption"] == "256"
+    assert values["opcache.max_accelerated_files"] == "32531"
+    assert "memory_limit = 256M" in php_ini.read_text()
+
+
+def test_write_php_ini_rejects_invalid_content(php_ini):
+    php_ini.write_text(PHP_INI + "broken\n")
+
+    assert not write_php_ini("example.com", {"opcache.memory_consumption": 256})
+    assert "opcache.memory_consumption=128" in php_ini.read_text()
+
+
+STATUS = {"status": {"scripts": {
+    "a": {"full_path": f"{CONTAINER_WEB_ROOT}/wp-load.php", "hits": 50},
+    "b": {"full_path": f"{CONTAINER_WEB_ROOT}/index.php", "hits": 90},
+    "c": {"full_path": "/usr/local/lib/php/PEAR.php", "hits": 500},
+}}}
+
+
+def test_select_preload_files_ranks_website_files():
+    assert select_preload_files(STATUS, limit=1) == [f"{CONTAINER_WEB_ROOT}/index.php"]
+    assert select_preload_files(STATUS) == [f"{CONTAINER_WEB_ROOT}/index.php",
+                                            f"{CONTAINER_WEB_ROOT}/wp-load.php"]
+
+
+def test_preload_advice_does_not_write_without_apply(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(env, "SITES_DIR", str(tmp_path))
+    os.makedirs(tmp_path / "example.com" / "wordpress")
+    monkeypatch.setattr(opcache_cli, "get_opcache_status", lambda domain, scripts: STATUS)
+
+    assert opcache_cli.cli_opcache_advisor("example.com", preload=True, json_output=True)
+
+    assert not os.path.exists(get_preload_path("example.com"))
+    assert "index.php" in capsys.readouterr().out
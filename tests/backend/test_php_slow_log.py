@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from src.common.utils.environment import env
+from src.features.php.analytics.slow_log import classify_component, parse_slow_log
+from src.features.php.analytics.slow_profile import SiteSlowProfile, SlowLogAnalyzer
+
+SLOW_LOG = """\
+[0x00007f1c3e613e40] leftover() /var/www/html/wp-includes/load.php:10
+
+[18-Oct-2026 14:00:01]  [pool www] pid 1234
+script_filename = /var/www/html/index.php
+[0x00007f1c3e613e40] curl_exec() /var/www/html/wp-content/plugins/foo/http.php:123
+[0x00007f1c3e613d80] request() /var/www/html/wp-includes/class-http.php:45
+[0x00007f1c3e613c00] {main}() /var/www/html/index.php:17
+
+[18-Oct-2026 14:00:09]  [pool www] pid 1235
+script_filename = /var/www/html/wp-admin/admin-ajax.php
+[0x00007f1c3e613e40] mysqli_query() /var/www/html/wp-includes/class-wpdb.php:2056
+[0x00007f1c3e613d80] get_posts() /var/www/html/wp-content/themes/astra/functions.php:88
+"""
+
+
+@pytest.mark.parametrize("path,component", [
+    ("/var/www/html/wp-content/plugins/woocommerce/includes/a.php", "plugin:woocommerce"),
+    ("/var/www/html/wp-content/mu-plugins/cache/x.php", "mu-plugin:cache"),
+    ("/var/www/html/wp-content/themes/astra/functions.php", "theme:astra"),
+    ("/var/www/html/wp-includes/class-wpdb.php", "core"),
+    ("/var/www/html/index.php", "other"),
+])
+def test_classify_component(path, component):
+    assert classify_component(path) == component
+
+
+def test_parse_slow_log_groups_frames():
+    entries = list(parse_slow_log(SLOW_LOG.splitlines(True)))
+
+    assert len(entries) == 2
+    first, second = entries
+    assert first.pid == 1234
+    assert first.pool == "www"
+    assert first.script == "/var/www/html/index.php"
+    assert [f.function for f in first.frames] == ["curl_exec", "request", "{main}"]
+    assert first.frames[0].line == 123
+    assert first.culprit == "plugin:foo"
+    assert first.folded_stack() == "{main}();request();curl_exec()"
+    assert first.complete
+    assert second.culprit == "theme:astra"
+    # Nothing follows the second trace, so it may still be written to
+    assert not second.complete
+
+
+def test_profile_ranks_culprits():
+    profile = SiteSlowProfile(domain="example.com", timeout=5)
+    for entry in parse_slow_log(SLOW_LOG.splitlines(True)):
+        profile.add(entry)
+
+    assert profile.requests == 2
+    # The first trace is counted once, with all of its frames
+    assert profile.stacks["{main}();request();curl_exec()"] == 1
+    assert profile.functions_self == {
+        "curl_exec() [plugin:foo]": 1,
+        "mysqli_query() [core]": 1,
+    }
+    ranking = {row["component"]: row for row in profile.ranking()}
+    assert ranking["plugin:foo"]["slow_requests"] == 1
+    assert ranking["plugin:foo"]["share"] == 0.5
+    assert ranking["plugin:foo"]["min_seconds"] == 5
+    assert ranking["theme:astra"]["on_stack"] == 1
+
+
+def test_parse_slow_log_yields_trace_without_frames_at_end():
+    *_, last = parse_slow_log(SLOW_LOG.splitlines(True) + ["[18-Oct-2026 14:00:12]  [pool www] pid 1236\n"])
+
+    assert last.pid == 1236
+    assert last.frames == []
+    assert not last.complete
+
+
+def test_analyzer_waits_for_trace_being_written(tmp_path, monkeypatch):
+    monkeypatch.setitem(env, "SITES_DIR", str(tmp_path / "sites"))
+    os.makedirs(tmp_path / "sites" / "example.com" / "logs")
+    log_path = tmp_path / "sites" / "example.com" / "logs" / "php_slow.log"
+    trace = SLOW_LOG.split("\n\n", 1)[1].splitlines(True)
+    # The header and the first frame of the trace have been written
+    log_path.write_text("".join(trace[:3]))
+
+    analyzer = SlowLogAnalyzer(data_dir=str(tmp_path / "analytics"))
+    assert analyzer.update_site("example.com").requests == 0
+    analyzer.save()
+
+    with open(log_path, "a") as f:
+        f.writelines(trace[3:] + ["[0x00007f1c3e613c00] {main}() /var/www/html/index.php:17\n", "\n"])
+    analyzer = SlowLogAnalyzer(data_dir=str(tmp_path / "analytics"))
+    profile = analyzer.update_site("example.com")
+
+    assert profile.requests == 2
+    # The first trace is counted once, with all of its frames
+    assert profile.stacks["{main}();request();curl_exec()"] == 1
+    assert profile.functions_self == {
+        "curl_exec() [plugin:foo]": 1,
+        "mysqli_query() [core]": 1,
+    }
+    ranking = {row["component"]: row for row in profile.ranking()}
+    assert ranking["theme:astra"]["slow_requests"] == 1
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.features.cache.core.redis_manager import (
+    RedisAllocator,
+    format_server_command,
+    recommend_maxmemory_mb
+)
+
+
+@pytest.fixture
+def allocator(tmp_path):
+    return RedisAllocator(state_file=str(tmp_path / "redis_allocations.json"))
+
+
+def test_allocate_assigns_free_databases(allocator, tmp_path):
+    first = allocator.allocate("a.com", databases=4)
+    second = allocator.allocate("b.com", databases=4)
+
+    assert (first.database, first.prefix) == (1, "a.com:")
+    assert second.database == 2
+    # Allocations are stable and persisted
+    assert allocator.allocate("a.com", databases=4) == first
+    assert RedisAllocator(state_file=str(tmp_path / "redis_allocations.json")).get("b.com") == second
+
+
+def test_allocate_reuses_released_database(allocator):
+    for domain in ("a.com", "b.com", "c.com"):
+        allocator.allocate(domain, databases=4)
+
+    allocator.release("b.com", flush=False)
+
+    assert allocator.allocate("d.com", databases=4).database == 2
+
+
+def test_allocate_falls_back_to_shared_database(allocator):
+    allocator.allocate("a.com", databases=2)
+
+    shared = allocator.allocate("b.com", databases=2)
+
+    assert shared.database == 0
+    assert shared.shared
+    assert shared.prefix == "b.com:"
+
+
+def test_release_flushes_keys(allocator):
+    allocation = allocator.allocate("a.com", databases=4)
+
+    with patch("src.features.cache.core.redis_manager.flush_site_cache") as flush:
+        allocator.release("a.com")
+
+    flush.assert_called_once_with(allocation)
+    assert allocator.get("a.com") is None
+
+
+@pytest.mark.parametrize("sites,ram,expected", [
+    (1, 8192, 128),     # floor
+    (10, 8192, 640),    # 64 MB per site
+    (50, 8192, 1228),   # 15% of RAM
+    (50, 512, 128),     # floor wins over the RAM share
+])
+def test_recommend_maxmemory(sites, ram, expected):
+    assert recommend_maxmemory_mb(sites, total_ram_mb=ram) == expected
+
+
+def test_format_server_command():
+    command = format_server_command({"maxmemory": "256mb", "save": ""}, databases=64)
+
+    assert command == 'redis-server --databases 64 --maxmemory 256mb --save ""'
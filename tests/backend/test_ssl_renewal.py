@@ -0,0 +1,67 @@
+import pytest
+
+from src.features.ssl.renewal import RenewalHistory, get_registered_domain
+
+NOW = 1792332000.0
+HOUR = 3600
+DAY = 86400
+
+
+@pytest.fixture
+def history(tmp_path):
+    return RenewalHistory(history_file=str(tmp_path / "ssl_renewals.json"))
+
+
+@pytest.mark.parametrize("domain,registered", [
+    ("example.com", "example.com"),
+    ("www.blog.example.com", "example.com"),
+    ("shop.example.co.uk", "example.co.uk"),
+    ("Example.COM.", "example.com"),
+])
+def test_get_registered_domain(domain, registered):
+    assert get_registered_domain(domain) == registered
+
+
+def test_not_blocked_without_orders(history):
+    assert history.blocked_reason("example.com", now=NOW) is None
+
+
+def test_blocked_after_failed_validations(history):
+    for minutes in (50, 30, 10):
+        history.record("example.com", ok=False, now=NOW - minutes * 60)
+
+    assert history.blocked_reason("example.com", now=NOW) == "3 failed validations in the last hour"
+    # Other domains and a later hour are not affected
+    assert history.blocked_reason("other.com", now=NOW) is None
+    assert history.blocked_reason("example.com", now=NOW + HOUR) is None
+
+
+def test_blocked_after_duplicate_certificates(history):
+    for days in range(5):
+        history.record("example.com", ok=True, now=NOW - days * DAY)
+
+    assert history.blocked_reason("example.com", now=NOW) == "5 certificates for example.com this week"
+    assert history.blocked_reason("www.example.com", now=NOW) is None
+    # The block lifts once the oldest order is a week old
+    assert history.blocked_reason("example.com", now=NOW + 3 * DAY) is not None
+    assert history.blocked_reason("example.com", now=NOW + 3 * DAY + 1) is None
+
+
+def test_blocked_per_registered_domain(history):
+    for i in range(45):
+        history.record(f"site{i}.example.co.uk", ok=True, now=NOW - i * HOUR)
+
+    assert (history.blocked_reason("new.example.co.uk", now=NOW)
+            == "45 certificates for example.co.uk this week")
+    assert history.blocked_reason("new.example.org.uk", now=NOW) is None
+
+
+def test_save_keeps_last_week(history, tmp_path):
+    history.record("old.com", ok=True, now=1.0)
+    history.record("example.com", ok=True)
+    history.save()
+
+    orders = RenewalHistory(history_file=str(tmp_path / "ssl_renewals.json")).orders
+
+    assert [o["domain"] for o in orders] == ["example.com"]
+    assert orders[0]["registered_domain"] == "example.com"